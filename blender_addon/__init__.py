@@ -37,6 +37,10 @@ LatticeHandler: Any = None
 ExtractionHandler: Any = None
 TextHandler: Any = None
 ArmatureHandler: Any = None
+register_mesh_cache_handlers: Any = None
+unregister_mesh_cache_handlers: Any = None
+register_scene_revision_handlers: Any = None
+unregister_scene_revision_handlers: Any = None
 
 # Import Application Handlers
 try:
@@ -48,8 +52,13 @@ try:
     from .application.handlers.lattice import LatticeHandler
     from .application.handlers.material import MaterialHandler
     from .application.handlers.mesh import MeshHandler
+    from .application.handlers.mesh_cache import register_mesh_cache_handlers, unregister_mesh_cache_handlers
     from .application.handlers.modeling import ModelingHandler
     from .application.handlers.scene import SceneHandler
+    from .application.handlers.scene_revision import (
+        register_scene_revision_handlers,
+        unregister_scene_revision_handlers,
+    )
     from .application.handlers.sculpt import SculptHandler
     from .application.handlers.system import SystemHandler
     from .application.handlers.text import TextHandler
@@ -87,6 +96,7 @@ def register():
         rpc_server.register_handler("scene.set_active_object", scene_handler.set_active_object)
         rpc_server.register_handler("scene.get_mode", scene_handler.get_mode)
         rpc_server.register_handler("scene.list_selection", scene_handler.list_selection)
+        rpc_server.register_handler("scene.router_context", scene_handler.router_context)
         rpc_server.register_handler("scene.inspect_object", scene_handler.inspect_object)
         rpc_server.register_handler("scene.snapshot_state", scene_handler.snapshot_state)
         rpc_server.register_handler("scene.inspect_material_slots", scene_handler.inspect_material_slots)
@@ -101,6 +111,8 @@ def register():
         rpc_server.register_handler("scene.get_constraints", scene_handler.get_constraints)
         rpc_server.register_handler("scene.get_viewport", scene_handler.get_viewport)
         rpc_server.register_background_handler("scene.get_viewport", scene_handler.get_viewport)
+        rpc_server.register_handler("scene.capture_view_set", scene_handler.capture_view_set)
+        rpc_server.register_background_handler("scene.capture_view_set", scene_handler.capture_view_set)
         rpc_server.register_handler("scene.create_light", scene_handler.create_light)
         rpc_server.register_handler("scene.create_camera", scene_handler.create_camera)
         rpc_server.register_handler("scene.create_empty", scene_handler.create_empty)
@@ -127,6 +139,8 @@ def register():
         rpc_server.register_handler("scene.measure_gap", scene_handler.measure_gap)
         rpc_server.register_handler("scene.measure_alignment", scene_handler.measure_alignment)
         rpc_server.register_handler("scene.measure_overlap", scene_handler.measure_overlap)
+        rpc_server.register_handler("scene.measure_relations_bulk", scene_handler.measure_relations_bulk)
+        rpc_server.register_handler("scene.get_mesh_cache_stats", scene_handler.get_mesh_cache_stats)
         rpc_server.register_handler("scene.assert_contact", scene_handler.assert_contact)
         rpc_server.register_handler("scene.assert_dimensions", scene_handler.assert_dimensions)
         rpc_server.register_handler("scene.assert_containment", scene_handler.assert_containment)
@@ -345,6 +359,11 @@ def register():
         rpc_server.register_handler("armature.weight_paint_assign", armature_handler.weight_paint_assign)
         rpc_server.register_handler("armature.get_data", armature_handler.get_data)
 
+        # Evaluated mesh/BVH cache invalidation for mesh-aware truth checks
+        register_mesh_cache_handlers()
+        # Scene revision counter for router context change detection
+        register_scene_revision_handlers()
+
         rpc_server.start()
         rpc_server.start_watchdog()
     else:
@@ -356,6 +375,8 @@ def unregister():
         print("[Blender AI MCP] Unregistering addon...")
         rpc_server.stop_watchdog()
         rpc_server.stop()
+        unregister_mesh_cache_handlers()
+        unregister_scene_revision_handlers()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+"""Registration of persistent `bpy.app.handlers` callbacks that can be removed as a group."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+
+class PersistentAppHandlers:
+    """Callbacks appended to `bpy.app.handlers` lists by one addon module.
+
+    Callbacks are tagged `persistent` so they survive file loads, and are
+    tracked so `unregister()` removes exactly the ones this group added.
+    """
+
+    def __init__(self) -> None:
+        self._registered: list[tuple[Any, Any]] = []
+
+    def register(self, callbacks: Iterable[tuple[str, Callable[..., Any]]]) -> None:
+        """Append each `(handler_list_name, callback)`, e.g. `("load_post", cache.on_load_post)`."""
+
+        import bpy
+
+        handlers = bpy.app.handlers
+        for handler_name, callback in callbacks:
+            handler_list = getattr(handlers, handler_name)
+            persistent_callback = handlers.persistent(_bind(callback))
+            handler_list.append(persistent_callback)
+            self._registered.append((handler_list, persistent_callback))
+
+    def unregister(self) -> None:
+        """Remove every callback added through `register()`."""
+
+        while self._registered:
+            handler_list, callback = self._registered.pop()
+            try:
+                handler_list.remove(callback)
+            except ValueError:
+                pass
+
+
+def _bind(callback: Callable[..., Any]) -> Callable[..., None]:
+    # `persistent` tags a plain function; bound methods cannot carry the attribute.
+    def _callback(*args):
+        callback(*args)
+
+    return _callback
@@ -1,6 +1,18 @@
 import bmesh
 import bpy
 
+from .mesh_arrays import (
+    attribute_columns,
+    edge_columns,
+    face_columns,
+    loop_normal_columns,
+    mesh_for_columns,
+    normalize_layout,
+    shape_key_columns,
+    uv_columns,
+    vertex_columns,
+)
+
 
 class MeshHandler:
     """Application service for Edit Mode mesh operations."""
@@ -35,6 +47,10 @@ class MeshHandler:
         safe_limit = max(int(limit), 0)
         return safe_offset, safe_limit
 
+    def _columns_payload(self, object_name, payload):
+        """Wraps a vectorized column payload read in object mode (no Edit Mode switch)."""
+        return {"object_name": object_name, "layout": "columns", **payload}
+
     def _get_auto_smooth_state(self, obj):
         """
         Blender 5.0+: Auto Smooth is represented by the Smooth by Angle modifier.
@@ -611,9 +627,10 @@ class MeshHandler:
 
         return f"Shrunk selection by one step ({initial_count} -> {final_count} vertices)"
 
-    def get_vertex_data(self, object_name, selected_only=False, offset=None, limit=None):
+    def get_vertex_data(self, object_name, selected_only=False, offset=None, limit=None, layout="rows"):
         """
         [EDIT MODE][READ-ONLY][SAFE] Returns vertex positions and selection states.
+        layout="columns" reads vectorized in object mode and returns parallel arrays.
         """
         obj = bpy.data.objects.get(object_name)
         if not obj:
@@ -621,6 +638,12 @@ class MeshHandler:
         if obj.type != "MESH":
             raise ValueError(f"Object '{object_name}' is not a MESH (type: {obj.type})")
 
+        if normalize_layout(layout) == "columns":
+            offset, limit = self._normalize_paging(offset, limit)
+            return self._columns_payload(
+                object_name, vertex_columns(mesh_for_columns(obj), selected_only, offset, limit)
+            )
+
         # Ensure we're in EDIT mode to read bmesh data
         prev_mode = obj.mode
         bpy.context.view_layer.objects.active = obj
@@ -676,9 +699,10 @@ class MeshHandler:
             "vertices": vertices,
         }
 
-    def get_edge_data(self, object_name, selected_only=False, offset=None, limit=None):
+    def get_edge_data(self, object_name, selected_only=False, offset=None, limit=None, layout="rows"):
         """
         [EDIT MODE][READ-ONLY][SAFE] Returns edge connectivity and attributes.
+        layout="columns" reads vectorized in object mode and returns parallel arrays.
         """
         obj = bpy.data.objects.get(object_name)
         if not obj:
@@ -686,6 +710,10 @@ class MeshHandler:
         if obj.type != "MESH":
             raise ValueError(f"Object '{object_name}' is not a MESH (type: {obj.type})")
 
+        if normalize_layout(layout) == "columns":
+            offset, limit = self._normalize_paging(offset, limit)
+            return self._columns_payload(object_name, edge_columns(mesh_for_columns(obj), selected_only, offset, limit))
+
         prev_mode = obj.mode
         bpy.context.view_layer.objects.active = obj
         if prev_mode != "EDIT":
@@ -746,9 +774,10 @@ class MeshHandler:
             "edges": edges,
         }
 
-    def get_face_data(self, object_name, selected_only=False, offset=None, limit=None):
+    def get_face_data(self, object_name, selected_only=False, offset=None, limit=None, layout="rows"):
         """
         [EDIT MODE][READ-ONLY][SAFE] Returns face connectivity and attributes.
+        layout="columns" reads vectorized in object mode and returns parallel arrays.
         """
         obj = bpy.data.objects.get(object_name)
         if not obj:
@@ -756,6 +785,10 @@ class MeshHandler:
         if obj.type != "MESH":
             raise ValueError(f"Object '{object_name}' is not a MESH (type: {obj.type})")
 
+        if normalize_layout(layout) == "columns":
+            offset, limit = self._normalize_paging(offset, limit)
+            return self._columns_payload(object_name, face_columns(mesh_for_columns(obj), selected_only, offset, limit))
+
         prev_mode = obj.mode
         bpy.context.view_layer.objects.active = obj
         if prev_mode != "EDIT":
@@ -816,9 +849,10 @@ class MeshHandler:
             "faces": faces,
         }
 
-    def get_uv_data(self, object_name, uv_layer=None, selected_only=False, offset=None, limit=None):
+    def get_uv_data(self, object_name, uv_layer=None, selected_only=False, offset=None, limit=None, layout="rows"):
         """
         [EDIT MODE][READ-ONLY][SAFE] Returns UVs per face loop.
+        layout="columns" reads vectorized in object mode and returns parallel arrays.
         """
         obj = bpy.data.objects.get(object_name)
         if not obj:
@@ -826,6 +860,17 @@ class MeshHandler:
         if obj.type != "MESH":
             raise ValueError(f"Object '{object_name}' is not a MESH (type: {obj.type})")
 
+        if normalize_layout(layout) == "columns":
+            mesh = mesh_for_columns(obj)
+            uv_layer_ref = mesh.uv_layers.get(uv_layer) if uv_layer else mesh.uv_layers.active
+            if uv_layer_ref is None:
+                if uv_layer:
+                    raise ValueError(f"UV layer '{uv_layer}' not found")
+                raise ValueError(f"Object '{object_name}' has no UV layers")
+            offset, limit = self._normalize_paging(offset, limit)
+            payload = uv_columns(mesh, uv_layer_ref, selected_only, offset, limit)
+            return self._columns_payload(object_name, {"uv_layer": uv_layer_ref.name, **payload})
+
         prev_mode = obj.mode
         bpy.context.view_layer.objects.active = obj
         if prev_mode != "EDIT":
@@ -896,9 +941,10 @@ class MeshHandler:
             "faces": faces,
         }
 
-    def get_loop_normals(self, object_name, selected_only=False, offset=None, limit=None):
+    def get_loop_normals(self, object_name, selected_only=False, offset=None, limit=None, layout="rows"):
         """
         [EDIT MODE][READ-ONLY][SAFE] Returns per-loop normals (split/custom).
+        layout="columns" reads vectorized in object mode and returns parallel arrays.
         """
         obj = bpy.data.objects.get(object_name)
         if not obj:
@@ -906,6 +952,22 @@ class MeshHandler:
         if obj.type != "MESH":
             raise ValueError(f"Object '{object_name}' is not a MESH (type: {obj.type})")
 
+        if normalize_layout(layout) == "columns":
+            mesh = mesh_for_columns(obj)
+            offset, limit = self._normalize_paging(offset, limit)
+            payload = loop_normal_columns(mesh, selected_only, offset, limit)
+            auto_smooth, auto_smooth_angle, auto_smooth_source = self._get_auto_smooth_state(obj)
+            return self._columns_payload(
+                object_name,
+                {
+                    **payload,
+                    "auto_smooth": auto_smooth,
+                    "auto_smooth_angle": None if auto_smooth_angle is None else round(float(auto_smooth_angle), 6),
+                    "auto_smooth_source": auto_smooth_source,
+                    "custom_normals": bool(mesh.has_custom_normals),
+                },
+            )
+
         prev_mode = obj.mode
         bpy.context.view_layer.objects.active = obj
         if prev_mode != "EDIT":
@@ -1083,9 +1145,12 @@ class MeshHandler:
             "groups": paged_groups,
         }
 
-    def get_attributes(self, object_name, attribute_name=None, selected_only=False, offset=None, limit=None):
+    def get_attributes(
+        self, object_name, attribute_name=None, selected_only=False, offset=None, limit=None, layout="rows"
+    ):
         """
         [EDIT MODE][READ-ONLY][SAFE] Returns mesh attribute data.
+        layout="columns" reads vectorized in object mode and returns parallel arrays.
         """
         obj = bpy.data.objects.get(object_name)
         if not obj:
@@ -1093,6 +1158,18 @@ class MeshHandler:
         if obj.type != "MESH":
             raise ValueError(f"Object '{object_name}' is not a MESH (type: {obj.type})")
 
+        if normalize_layout(layout) == "columns" and attribute_name is not None:
+            mesh = mesh_for_columns(obj)
+            attr = mesh.attributes.get(attribute_name)
+            if attr is None:
+                raise ValueError(f"Attribute '{attribute_name}' not found")
+            offset, limit = self._normalize_paging(offset, limit)
+            payload = attribute_columns(mesh, attr, selected_only, offset, limit)
+            return self._columns_payload(
+                object_name,
+                {"attribute": {"name": attr.name, "data_type": attr.data_type, "domain": attr.domain}, **payload},
+            )
+
         prev_mode = obj.mode
         bpy.context.view_layer.objects.active = obj
         if prev_mode != "EDIT":
@@ -1245,9 +1322,10 @@ class MeshHandler:
             "values": values,
         }
 
-    def get_shape_keys(self, object_name, include_deltas=False, offset=None, limit=None):
+    def get_shape_keys(self, object_name, include_deltas=False, offset=None, limit=None, layout="rows"):
         """
         [OBJECT MODE][READ-ONLY][SAFE] Returns shape key data.
+        layout="columns" reads vectorized without a mode switch and returns parallel arrays.
         """
         obj = bpy.data.objects.get(object_name)
         if not obj:
@@ -1255,6 +1333,12 @@ class MeshHandler:
         if obj.type != "MESH":
             raise ValueError(f"Object '{object_name}' is not a MESH (type: {obj.type})")
 
+        if normalize_layout(layout) == "columns":
+            shape_keys = mesh_for_columns(obj).shape_keys
+            key_blocks = shape_keys.key_blocks if shape_keys else []
+            offset, limit = self._normalize_paging(offset, limit)
+            return self._columns_payload(object_name, shape_key_columns(key_blocks, include_deltas, offset, limit))
+
         prev_mode = obj.mode
         bpy.context.view_layer.objects.active = obj
         if prev_mode != "OBJECT":
@@ -0,0 +1,313 @@
+"""Vectorized mesh reads (`foreach_get` into NumPy arrays) for object-mode introspection.
+
+Column payloads keep one flat NumPy array per field instead of one dict per element.
+Vector fields are flattened; their component count is listed under `strides`.
+Variable-length face fields (`verts`, `uvs`) are flattened per face loop and
+split with the parallel `loop_total` column. The RPC server sends the arrays as
+raw buffers to clients that accept binary frames and as JSON lists (floats
+rounded to 6 digits) otherwise.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+LAYOUTS = ("rows", "columns")
+
+# attribute data_type -> (foreach property, component count, dtype)
+_ATTRIBUTE_LAYOUTS = {
+    "FLOAT": ("value", 1, np.float32),
+    "INT": ("value", 1, np.int32),
+    "INT8": ("value", 1, np.int32),
+    "BOOLEAN": ("value", 1, bool),
+    "FLOAT2": ("vector", 2, np.float32),
+    "FLOAT_VECTOR": ("vector", 3, np.float32),
+    "FLOAT_COLOR": ("color", 4, np.float32),
+    "BYTE_COLOR": ("color", 4, np.float32),
+    "INT32_2D": ("value", 2, np.int32),
+    "QUATERNION": ("value", 4, np.float32),
+}
+
+
+def normalize_layout(layout):
+    """Validates the requested payload layout."""
+    normalized = "rows" if layout is None else str(layout).lower()
+    if normalized not in LAYOUTS:
+        raise ValueError(f"layout must be one of: {', '.join(LAYOUTS)}")
+    return normalized
+
+
+def mesh_for_columns(obj):
+    """Returns mesh data readable without a mode switch (edit-mesh changes are synced first)."""
+    if obj.mode == "EDIT":
+        obj.update_from_editmode()
+    return obj.data
+
+
+def foreach_array(collection, prop, dtype, width=1):
+    """Reads one property of every element in `collection` into a NumPy array."""
+    count = len(collection)
+    values = np.empty(count * width, dtype=dtype)
+    if count:
+        collection.foreach_get(prop, values)
+    return values.reshape(count, width) if width > 1 else values
+
+
+def flat(values):
+    """Returns a flat (1-D) view of an element array."""
+    return np.asarray(values).reshape(-1)
+
+
+def gather_loops(loop_starts, loop_totals):
+    """Returns loop indices for faces given their `loop_start` / `loop_total` arrays."""
+    loop_totals = np.asarray(loop_totals, dtype=np.int64)
+    if not len(loop_totals):
+        return np.empty(0, dtype=np.int64)
+    run_starts = np.cumsum(loop_totals) - loop_totals
+    return np.repeat(np.asarray(loop_starts, dtype=np.int64) - run_starts, loop_totals) + np.arange(
+        int(loop_totals.sum())
+    )
+
+
+def loop_face_indices(mesh):
+    """Returns the owning face index of every loop."""
+    polygons = mesh.polygons
+    loop_starts = foreach_array(polygons, "loop_start", np.int32)
+    loop_totals = foreach_array(polygons, "loop_total", np.int32)
+    owners = np.zeros(len(mesh.loops), dtype=np.int64)
+    owners[gather_loops(loop_starts, loop_totals)] = np.repeat(np.arange(len(polygons)), loop_totals)
+    return owners
+
+
+def page(mask, count, offset, limit):
+    """Applies the optional selection mask and paging; returns (indices, filtered_count, paging fields)."""
+    indices = (np.flatnonzero(mask) if mask is not None else np.arange(count)).astype(np.int32)
+    filtered_count = int(len(indices))
+    end = None if limit is None else offset + limit
+    indices = indices[offset:end]
+    return (
+        indices,
+        filtered_count,
+        {
+            "filtered_count": filtered_count,
+            "returned_count": int(len(indices)),
+            "offset": offset,
+            "limit": limit,
+            "has_more": limit is not None and (offset + int(len(indices))) < filtered_count,
+        },
+    )
+
+
+def vertex_columns(mesh, selected_only, offset, limit):
+    vertices = mesh.vertices
+    positions = foreach_array(vertices, "co", np.float32, 3)
+    selected = foreach_array(vertices, "select", bool)
+    indices, _filtered, paging = page(selected if selected_only else None, len(vertices), offset, limit)
+    return {
+        "vertex_count": len(vertices),
+        "selected_count": int(selected.sum()),
+        **paging,
+        "strides": {"position": 3},
+        "columns": {
+            "index": indices,
+            "position": flat(positions[indices]),
+            "selected": selected[indices],
+        },
+    }
+
+
+def _edge_float_attribute(mesh, name, count):
+    attribute = mesh.attributes.get(name)
+    if attribute is None or len(attribute.data) != count:
+        return np.zeros(count, dtype=np.float32)
+    return foreach_array(attribute.data, "value", np.float32)
+
+
+def edge_columns(mesh, selected_only, offset, limit):
+    edges = mesh.edges
+    count = len(edges)
+    edge_verts = foreach_array(edges, "vertices", np.int32, 2)
+    selected = foreach_array(edges, "select", bool)
+    seams = foreach_array(edges, "use_seam", bool)
+    sharp = foreach_array(edges, "use_edge_sharp", bool)
+    face_counts = np.bincount(foreach_array(mesh.loops, "edge_index", np.int32), minlength=count)[:count]
+    crease = _edge_float_attribute(mesh, "crease_edge", count)
+    bevel_weight = _edge_float_attribute(mesh, "bevel_weight_edge", count)
+    indices, _filtered, paging = page(selected if selected_only else None, count, offset, limit)
+    return {
+        "edge_count": count,
+        "selected_count": int(selected.sum()),
+        **paging,
+        "strides": {"verts": 2},
+        "columns": {
+            "index": indices,
+            "verts": edge_verts[indices].reshape(-1),
+            "is_boundary": (face_counts[indices] == 1),
+            "is_manifold": (face_counts[indices] == 2),
+            "is_seam": seams[indices],
+            "is_sharp": sharp[indices],
+            "crease": flat(crease[indices]),
+            "bevel_weight": flat(bevel_weight[indices]),
+            "selected": selected[indices],
+        },
+    }
+
+
+def face_columns(mesh, selected_only, offset, limit):
+    polygons = mesh.polygons
+    count = len(polygons)
+    selected = foreach_array(polygons, "select", bool)
+    indices, _filtered, paging = page(selected if selected_only else None, count, offset, limit)
+    loop_starts = foreach_array(polygons, "loop_start", np.int32)[indices]
+    loop_totals = foreach_array(polygons, "loop_total", np.int32)[indices]
+    loop_verts = foreach_array(mesh.loops, "vertex_index", np.int32)
+    return {
+        "face_count": count,
+        "selected_count": int(selected.sum()),
+        **paging,
+        "strides": {"normal": 3, "center": 3},
+        "columns": {
+            "index": indices,
+            "loop_total": loop_totals,
+            "verts": loop_verts[gather_loops(loop_starts, loop_totals)],
+            "normal": flat(foreach_array(polygons, "normal", np.float32, 3)[indices]),
+            "center": flat(foreach_array(polygons, "center", np.float32, 3)[indices]),
+            "area": flat(foreach_array(polygons, "area", np.float32)[indices]),
+            "material_index": foreach_array(polygons, "material_index", np.int32)[indices],
+            "selected": selected[indices],
+        },
+    }
+
+
+def uv_columns(mesh, uv_layer_ref, selected_only, offset, limit):
+    polygons = mesh.polygons
+    count = len(polygons)
+    selected = foreach_array(polygons, "select", bool)
+    indices, _filtered, paging = page(selected if selected_only else None, count, offset, limit)
+    loop_starts = foreach_array(polygons, "loop_start", np.int32)[indices]
+    loop_totals = foreach_array(polygons, "loop_total", np.int32)[indices]
+    loops = gather_loops(loop_starts, loop_totals)
+    loop_verts = foreach_array(mesh.loops, "vertex_index", np.int32)
+    uvs = foreach_array(uv_layer_ref.data, "uv", np.float32, 2)
+    return {
+        "face_count": count,
+        "selected_count": int(selected.sum()),
+        **paging,
+        "strides": {"uvs": 2},
+        "columns": {
+            "face_index": indices,
+            "loop_total": loop_totals,
+            "verts": loop_verts[loops],
+            "uvs": flat(uvs[loops]),
+        },
+    }
+
+
+def corner_normal_array(mesh):
+    """Returns per-loop normals, using `corner_normals` (4.1+) or legacy split normals."""
+    corner_normals = getattr(mesh, "corner_normals", None)
+    if corner_normals is not None:
+        return foreach_array(corner_normals, "vector", np.float32, 3)
+    if hasattr(mesh, "calc_normals_split"):
+        mesh.calc_normals_split()
+    return foreach_array(mesh.loops, "normal", np.float32, 3)
+
+
+def loop_normal_columns(mesh, selected_only, offset, limit):
+    loop_count = len(mesh.loops)
+    face_selected = foreach_array(mesh.polygons, "select", bool)
+    loop_selected = face_selected[loop_face_indices(mesh)] if loop_count else np.zeros(0, dtype=bool)
+    indices, _filtered, paging = page(loop_selected if selected_only else None, loop_count, offset, limit)
+    loop_verts = foreach_array(mesh.loops, "vertex_index", np.int32)
+    return {
+        "loop_count": loop_count,
+        "selected_count": int(loop_selected.sum()),
+        **paging,
+        "strides": {"normal": 3},
+        "columns": {
+            "loop_index": indices,
+            "vert": loop_verts[indices],
+            "normal": flat(corner_normal_array(mesh)[indices]),
+        },
+    }
+
+
+def _domain_selection(mesh, domain):
+    if domain == "POINT":
+        return foreach_array(mesh.vertices, "select", bool)
+    if domain == "EDGE":
+        return foreach_array(mesh.edges, "select", bool)
+    if domain == "FACE":
+        return foreach_array(mesh.polygons, "select", bool)
+    if domain == "CORNER":
+        face_selected = foreach_array(mesh.polygons, "select", bool)
+        return face_selected[loop_face_indices(mesh)] if len(mesh.loops) else np.zeros(0, dtype=bool)
+    return None
+
+
+def attribute_columns(mesh, attr, selected_only, offset, limit):
+    layout = _ATTRIBUTE_LAYOUTS.get(attr.data_type)
+    if layout is None:
+        raise ValueError(f"Attribute data_type '{attr.data_type}' is not supported by layout='columns'")
+    prop, width, dtype = layout
+    values = foreach_array(attr.data, prop, dtype, width)
+    selection = _domain_selection(mesh, attr.domain)
+    if selection is not None and len(selection) != len(values):
+        selection = None
+    mask = selection if selected_only and selection is not None else None
+    indices, _filtered, paging = page(mask, len(values), offset, limit)
+    column = flat(values[indices])
+    return {
+        "element_count": len(values),
+        "selected_count": int(selection.sum()) if selection is not None else 0,
+        **paging,
+        "strides": {"value": width},
+        "columns": {"index": indices, "value": column},
+    }
+
+
+def shape_key_columns(key_blocks, include_deltas, offset, limit, threshold=1e-6):
+    count = len(key_blocks)
+    indices, _filtered, paging = page(None, count, offset, limit)
+    blocks = [key_blocks[int(index)] for index in indices]
+    columns = {
+        "name": [block.name for block in blocks],
+        "value": np.array([block.value for block in blocks], dtype=np.float32),
+    }
+    strides = {}
+    if include_deltas:
+        basis_co = foreach_array(key_blocks[0].data, "co", np.float32, 3) if count else None
+        delta_verts, deltas = [], []
+        for index, block in zip(indices, blocks):
+            if index == 0:
+                delta_verts.append(np.empty(0, dtype=np.int32))
+                deltas.append(np.empty((0, 3), dtype=np.float32))
+                continue
+            delta = foreach_array(block.data, "co", np.float32, 3) - basis_co
+            moved = np.flatnonzero(np.any(np.abs(delta) > threshold, axis=1)).astype(np.int32)
+            delta_verts.append(moved)
+            deltas.append(delta[moved])
+        columns["delta_total"] = np.array([len(verts) for verts in delta_verts], dtype=np.int32)
+        columns["delta_vert"] = np.concatenate(delta_verts) if delta_verts else np.empty(0, dtype=np.int32)
+        columns["delta"] = flat(np.concatenate(deltas)) if deltas else np.empty(0, dtype=np.float32)
+        strides["delta"] = 3
+    return {
+        "shape_key_count": count,
+        **paging,
+        "strides": strides,
+        "columns": {"index": indices, **columns},
+    }
+
+
+def world_space_mesh_arrays(mesh, matrix_world):
+    """Returns (world vertices, triangles, world polygon centers) as plain tuples for BVH construction."""
+    matrix = np.array(matrix_world, dtype=np.float64).reshape(4, 4)
+    rotation, translation = matrix[:3, :3].T, matrix[:3, 3]
+    vertices = foreach_array(mesh.vertices, "co", np.float32, 3).astype(np.float64) @ rotation + translation
+    triangles = foreach_array(mesh.loop_triangles, "vertices", np.int32, 3)
+    centers = foreach_array(mesh.polygons, "center", np.float32, 3).astype(np.float64) @ rotation + translation
+    return (
+        [tuple(vertex) for vertex in vertices.tolist()],
+        [tuple(triangle) for triangle in triangles.tolist()],
+        [tuple(center) for center in centers.tolist()],
+    )
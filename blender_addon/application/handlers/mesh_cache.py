@@ -0,0 +1,182 @@
+"""Addon-side cache of evaluated world-space mesh data and BVH trees for truth checks."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from .app_handlers import PersistentAppHandlers
+
+# Memory budget for cached evaluated meshes/BVH trees. 0 disables the cache.
+DEFAULT_MESH_CACHE_BUDGET_MB = max(0.0, float(os.environ.get("BLENDER_AI_MCP_MESH_CACHE_BUDGET_MB", "128")))
+
+# Rough per-element costs of the cached Python/mathutils structures.
+_VECTOR_BYTES = 96
+_TRIANGLE_BYTES = 80
+_BVH_TRIANGLE_BYTES = 64
+
+
+def estimate_mesh_data_bytes(mesh_data: dict[str, Any]) -> int:
+    """Approximate the resident size of one cached mesh payload (including its BVH tree)."""
+
+    vertex_count = len(mesh_data.get("vertices") or ())
+    sample_count = len(mesh_data.get("sample_points") or ())
+    triangle_count = len(mesh_data.get("triangles") or ())
+    return (vertex_count + sample_count) * _VECTOR_BYTES + triangle_count * (_TRIANGLE_BYTES + _BVH_TRIANGLE_BYTES)
+
+
+class EvaluatedMeshCache:
+    """LRU cache of evaluated mesh payloads keyed by object name plus a geometry/transform fingerprint.
+
+    Entries are dropped when `depsgraph_update_post` reports a geometry/transform
+    change for the object (or its mesh datablock), when the fingerprint no longer
+    matches, or when the memory budget forces LRU eviction.
+    """
+
+    def __init__(self, budget_bytes: int | None = None):
+        if budget_bytes is None:
+            budget_bytes = int(DEFAULT_MESH_CACHE_BUDGET_MB * 1024 * 1024)
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._entries: OrderedDict[str, tuple[Hashable, dict[str, Any], int]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0, "invalidations": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget_bytes > 0
+
+    def get(self, object_name: str, fingerprint: Hashable) -> dict[str, Any] | None:
+        """Return the cached payload for `object_name` if its fingerprint still matches."""
+
+        with self._lock:
+            entry = self._entries.get(object_name)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            cached_fingerprint, mesh_data, _size = entry
+            if cached_fingerprint != fingerprint:
+                self._drop_locked(object_name)
+                self._stats["stale"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(object_name)
+            self._stats["hits"] += 1
+            return mesh_data
+
+    def put(self, object_name: str, fingerprint: Hashable, mesh_data: dict[str, Any]) -> None:
+        """Store a payload, evicting least-recently-used entries to respect the budget."""
+
+        size = estimate_mesh_data_bytes(mesh_data)
+        with self._lock:
+            self._drop_locked(object_name)
+            if not self.enabled or size > self.budget_bytes:
+                return
+            self._entries[object_name] = (fingerprint, mesh_data, size)
+            self._total_bytes += size
+            while self._total_bytes > self.budget_bytes and self._entries:
+                evicted_name = next(iter(self._entries))
+                self._drop_locked(evicted_name)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, object_names=None, data_names=None) -> int:
+        """Drop entries by object name and/or mesh datablock name; no arguments clears everything."""
+
+        with self._lock:
+            if object_names is None and data_names is None:
+                names = list(self._entries)
+            else:
+                wanted_objects = set(object_names or ())
+                wanted_data = set(data_names or ())
+                names = [
+                    name
+                    for name, (_fingerprint, mesh_data, _size) in self._entries.items()
+                    if name in wanted_objects or mesh_data.get("data_name") in wanted_data
+                ]
+            for name in names:
+                self._drop_locked(name)
+            self._stats["invalidations"] += len(names)
+            return len(names)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "estimated_bytes": self._total_bytes,
+                "budget_bytes": self.budget_bytes,
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def on_depsgraph_update(self, scene=None, depsgraph=None) -> None:
+        """`bpy.app.handlers.depsgraph_update_post` callback that invalidates changed objects."""
+
+        object_names = set()
+        data_names = set()
+        for update in getattr(depsgraph, "updates", None) or ():
+            if not (getattr(update, "is_updated_geometry", False) or getattr(update, "is_updated_transform", False)):
+                continue
+            datablock = getattr(update, "id", None)
+            datablock = getattr(datablock, "original", None) or datablock
+            name = getattr(datablock, "name", None)
+            if not name:
+                continue
+            if getattr(datablock, "id_type", None) == "OBJECT":
+                object_names.add(name)
+            else:
+                data_names.add(name)
+        if object_names or data_names:
+            self.invalidate(object_names=object_names, data_names=data_names)
+
+    def on_load_post(self, *_args) -> None:
+        """`bpy.app.handlers.load_post` callback; object names are not stable across files."""
+
+        self.invalidate()
+
+    def on_undo_redo(self, *_args) -> None:
+        """`bpy.app.handlers.undo_post` / `redo_post` callback.
+
+        Undo/redo does not reliably emit depsgraph updates, and the cache
+        fingerprint misses edits that keep vertex/face counts, so drop everything.
+        """
+
+        self.invalidate()
+
+    def _drop_locked(self, object_name: str) -> None:
+        entry = self._entries.pop(object_name, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
+
+
+evaluated_mesh_cache = EvaluatedMeshCache()
+
+_app_handlers = PersistentAppHandlers()
+
+
+def register_mesh_cache_handlers(cache: EvaluatedMeshCache = evaluated_mesh_cache) -> None:
+    """Hook cache invalidation into Blender's depsgraph/load/undo handlers."""
+
+    _app_handlers.register(
+        (
+            ("depsgraph_update_post", cache.on_depsgraph_update),
+            ("load_post", cache.on_load_post),
+            ("undo_post", cache.on_undo_redo),
+            ("redo_post", cache.on_undo_redo),
+        )
+    )
+
+
+def unregister_mesh_cache_handlers(cache: EvaluatedMeshCache = evaluated_mesh_cache) -> None:
+    """Remove callbacks added by `register_mesh_cache_handlers` and clear the cache."""
+
+    _app_handlers.unregister()
+    cache.invalidate()
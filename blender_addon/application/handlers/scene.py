@@ -1,17 +1,29 @@
 import base64
+import hashlib
 import math
 import os
 import tempfile
+from contextlib import contextmanager
 from typing import Callable
 
 import bpy
 
 from .job_utils import raise_if_cancelled
+from .mesh_arrays import world_space_mesh_arrays
+from .mesh_cache import evaluated_mesh_cache
+from .scene_revision import scene_revision
 
 
 class SceneHandler:
     """Application service for scene operations."""
 
+    # Per-call evaluated-mesh / BVH sharing, active only inside `_shared_mesh_scope()`.
+    _mesh_scope = None
+
+    def __init__(self, mesh_cache=None, revision_counter=None):
+        self._mesh_cache = evaluated_mesh_cache if mesh_cache is None else mesh_cache
+        self._scene_revision = scene_revision if revision_counter is None else revision_counter
+
     def list_objects(self):
         """Returns a list of objects in the scene."""
         objects = []
@@ -168,6 +180,93 @@ class SceneHandler:
 
         return summary
 
+    def router_context(self, object_name=None, since_revision=None):
+        """Returns everything the router needs for one routed call in a single main-thread tick.
+
+        Hot state (mode, active object, selection, edit-mode selection counts) is
+        always included. When `since_revision` equals the current scene revision,
+        the heavier parts (object list, focus object details) are skipped and
+        `unchanged` is set.
+        """
+        revision = self._scene_revision.value
+        mode = getattr(bpy.context, "mode", "UNKNOWN")
+        active_obj = getattr(bpy.context, "active_object", None)
+        selected = getattr(bpy.context, "selected_objects", []) or []
+
+        context = {
+            "revision": revision,
+            "mode": mode,
+            "active_object": active_obj.name if active_obj else None,
+            "active_object_type": getattr(active_obj, "type", None) if active_obj else None,
+            "selected_object_names": [obj.name for obj in selected if hasattr(obj, "name")],
+        }
+
+        edit_bm = None
+        if mode.startswith("EDIT"):
+            edit_obj = getattr(bpy.context, "edit_object", None) or active_obj
+            if edit_obj is not None and edit_obj.type == "MESH":
+                try:
+                    import bmesh
+
+                    edit_bm = (edit_obj.name, bmesh.from_edit_mesh(edit_obj.data))
+                except Exception:
+                    edit_bm = None
+            if edit_bm is not None:
+                bm = edit_bm[1]
+                context["edit_mode_vertex_count"] = sum(1 for v in bm.verts if v.select)
+                context["edit_mode_edge_count"] = sum(1 for e in bm.edges if e.select)
+                context["edit_mode_face_count"] = sum(1 for f in bm.faces if f.select)
+
+        if since_revision is not None and since_revision == revision:
+            context["unchanged"] = True
+            return context
+
+        context["objects"] = self.list_objects()
+
+        focus_name = object_name or context["active_object"]
+        focus_obj = bpy.data.objects.get(focus_name) if focus_name else None
+        if focus_obj is not None:
+            focus = {
+                "name": focus_obj.name,
+                "type": focus_obj.type,
+                "dimensions": self._vec_to_list(getattr(focus_obj, "dimensions", (0.0, 0.0, 0.0))),
+                "material_names": [
+                    slot["material_name"] for slot in self._gather_material_slots(focus_obj) if slot["material_name"]
+                ],
+                "modifier_names": [mod["name"] for mod in self._gather_modifiers(focus_obj)],
+            }
+            if focus_obj.type == "MESH":
+                edit_mesh = edit_bm[1] if edit_bm is not None and edit_bm[0] == focus_obj.name else None
+                focus["topology"] = self._cheap_topology_counts(focus_obj, edit_mesh)
+            context["focus"] = focus
+
+        return context
+
+    @staticmethod
+    def _cheap_topology_counts(obj, edit_mesh=None):
+        """Element counts without copying the mesh into a new BMesh."""
+        if edit_mesh is not None:
+            return {
+                "vertex_count": len(edit_mesh.verts),
+                "edge_count": len(edit_mesh.edges),
+                "face_count": len(edit_mesh.faces),
+                "triangle_count": sum(1 for f in edit_mesh.faces if len(f.verts) == 3),
+            }
+
+        from array import array
+
+        mesh = obj.data
+        polygons = mesh.polygons
+        loop_totals = array("i", [0]) * len(polygons)
+        if loop_totals:
+            polygons.foreach_get("loop_total", loop_totals)
+        return {
+            "vertex_count": len(mesh.vertices),
+            "edge_count": len(mesh.edges),
+            "face_count": len(polygons),
+            "triangle_count": loop_totals.count(3),
+        }
+
     def inspect_object(self, name):
         """Returns a structured report containing object metadata."""
         obj = bpy.data.objects.get(name)
@@ -296,11 +395,23 @@ class SceneHandler:
         orbit_vertical=0.0,
         zoom_factor=None,
         persist_view=False,
+        output_path=None,
         progress_callback: Callable[[float, float | None, str | None], None] | None = None,
         is_cancelled: Callable[[], bool] | None = None,
     ):
-        """Returns a base64 encoded OpenGL render of the viewport."""
+        """Returns a base64 encoded OpenGL render of the viewport.
+
+        With `output_path` (a `.jpg` path inside an existing directory shared with
+        the MCP server) the render is written there and only
+        `{path, size, sha256, media_type, width, height}` is returned.
+        """
         scene = bpy.context.scene
+        if output_path is not None:
+            output_path = os.path.abspath(str(output_path))
+            if not output_path.lower().endswith(".jpg"):
+                raise ValueError("output_path must end with '.jpg'")
+            if not os.path.isdir(os.path.dirname(output_path)):
+                raise ValueError(f"output_path directory does not exist: {os.path.dirname(output_path)}")
         raise_if_cancelled(is_cancelled)
         if progress_callback is not None:
             progress_callback(0, 1, "Preparing viewport capture")
@@ -315,14 +426,20 @@ class SceneHandler:
                 except Exception:
                     pass
 
-        # Create a dedicated temp directory for this render to avoid filename collisions
-        temp_dir = tempfile.mkdtemp()
-        # Define the output path. Blender will append extensions based on format.
-        # We force JPEG.
-        render_filename = "viewport_render"
-        render_filepath_base = os.path.join(temp_dir, render_filename)
+        if output_path is not None:
+            # Shared-filesystem handoff: render straight into the server's output path.
+            temp_dir = None
+            render_filepath_base = output_path[: -len(".jpg")]
+        else:
+            # Create a dedicated temp directory for this render to avoid filename collisions
+            temp_dir = tempfile.mkdtemp()
+            # Define the output path. Blender will append extensions based on format.
+            # We force JPEG.
+            render_filename = "viewport_render"
+            render_filepath_base = os.path.join(temp_dir, render_filename)
         # Expected output file (Blender adds extension)
         expected_output = render_filepath_base + ".jpg"
+        handoff_complete = False
 
         try:
             # 1. Locate 3D View for context overrides (Used for OpenGL)
@@ -501,6 +618,21 @@ class SceneHandler:
                     )
                 raise_if_cancelled(is_cancelled)
 
+                if output_path is not None:
+                    with open(expected_output, "rb") as f:
+                        digest = hashlib.sha256(f.read()).hexdigest()
+                    handoff_complete = True
+                    if progress_callback is not None:
+                        progress_callback(1, 1, "Viewport capture complete")
+                    return {
+                        "path": expected_output,
+                        "size": os.path.getsize(expected_output),
+                        "sha256": digest,
+                        "media_type": "image/jpeg",
+                        "width": width,
+                        "height": height,
+                    }
+
                 b64_data = ""
                 with open(expected_output, "rb") as f:
                     data = f.read()
@@ -511,13 +643,14 @@ class SceneHandler:
                 return b64_data
 
             finally:
-                # 8. Cleanup Temp Files
-                if os.path.exists(expected_output):
+                # 8. Cleanup Temp Files (a completed handoff file belongs to the server)
+                if not handoff_complete and os.path.exists(expected_output):
                     os.remove(expected_output)
-                try:
-                    os.rmdir(temp_dir)
-                except Exception:
-                    pass
+                if temp_dir is not None:
+                    try:
+                        os.rmdir(temp_dir)
+                    except Exception:
+                        pass
 
                 # 9. Restore State
                 scene.render.resolution_x = original_res_x
@@ -564,6 +697,103 @@ class SceneHandler:
                     except Exception:
                         pass
 
+    def capture_view_set(
+        self,
+        presets,
+        target_object=None,
+        isolate_objects=None,
+        progress_callback: Callable[[float, float | None, str | None], None] | None = None,
+        is_cancelled: Callable[[], bool] | None = None,
+    ):
+        """Renders a list of viewport presets in one call and restores view/visibility once.
+
+        Each preset is a dict with `name`, `width`, `height`, `shading` and optional
+        `focus_target`, `isolate_target`, `focus_zoom_factor`, `standard_view`,
+        `orbit_horizontal`, `orbit_vertical` and `output_path`. Presets with an
+        `output_path` inside an existing directory are written there (see
+        `get_viewport`); the others come back as base64 JPEG data.
+        """
+        if not isinstance(presets, list) or not presets:
+            raise ValueError("presets must be a non-empty list")
+        isolate_names = [str(name) for name in (isolate_objects or []) if str(name).strip()]
+        if not isolate_names and target_object:
+            isolate_names = [target_object]
+
+        total = len(presets)
+        visibility = {obj.name: (obj.hide_viewport, obj.hide_render) for obj in bpy.data.objects}
+        view_state = self.get_view_state()
+
+        def restore():
+            if view_state.get("available"):
+                try:
+                    self.restore_view_state(view_state)
+                except Exception:
+                    pass
+            for name, (hide_viewport, hide_render) in visibility.items():
+                obj = bpy.data.objects.get(name)
+                if obj is not None:
+                    obj.hide_viewport = hide_viewport
+                    obj.hide_render = hide_render
+
+        captures = []
+        try:
+            for index, preset in enumerate(presets):
+                raise_if_cancelled(is_cancelled)
+                name = str(preset.get("name") or f"view_{index}")
+                if progress_callback is not None:
+                    progress_callback(index, total, f"Rendering view '{name}' ({index + 1}/{total})")
+                if index > 0:
+                    restore()
+
+                focus_target = target_object if preset.get("focus_target") else None
+                if isolate_names and preset.get("isolate_target"):
+                    try:
+                        self.isolate_object(isolate_names)
+                    except Exception:
+                        pass
+                if preset.get("standard_view"):
+                    try:
+                        self.set_standard_view(preset["standard_view"])
+                    except Exception:
+                        pass
+                if focus_target:
+                    try:
+                        self.camera_focus(focus_target, zoom_factor=float(preset.get("focus_zoom_factor") or 1.0))
+                    except Exception:
+                        pass
+                    if preset.get("orbit_horizontal") is not None or preset.get("orbit_vertical") is not None:
+                        try:
+                            self.camera_orbit(
+                                angle_horizontal=float(preset.get("orbit_horizontal") or 0.0),
+                                angle_vertical=float(preset.get("orbit_vertical") or 0.0),
+                                target_object=focus_target,
+                            )
+                        except Exception:
+                            pass
+
+                output_path = preset.get("output_path")
+                if output_path and not os.path.isdir(os.path.dirname(os.path.abspath(str(output_path)))):
+                    output_path = None
+                rendered = self.get_viewport(
+                    width=int(preset.get("width", 1024)),
+                    height=int(preset.get("height", 768)),
+                    shading=str(preset.get("shading") or "SOLID"),
+                    camera_name=None,
+                    focus_target=focus_target,
+                    output_path=output_path,
+                    is_cancelled=is_cancelled,
+                )
+                if isinstance(rendered, dict):
+                    captures.append({"name": name, **rendered})
+                else:
+                    captures.append({"name": name, "media_type": "image/jpeg", "image_base64": rendered})
+        finally:
+            restore()
+
+        if progress_callback is not None:
+            progress_callback(total, total, f"Captured {total} view(s)")
+        return {"view_count": len(captures), "captures": captures}
+
     def create_light(self, type="POINT", energy=1000.0, color=(1.0, 1.0, 1.0), location=(0.0, 0.0, 0.0), name=None):
         """Creates a light source."""
         # Create light data
@@ -2577,6 +2807,51 @@ class SceneHandler:
             },
         )
 
+    def measure_relations_bulk(self, pairs, tolerance=0.0001, max_gap=0.0001, allow_overlap=False):
+        """Measures gap, alignment, overlap, and contact for many object pairs in one call.
+
+        Evaluated meshes and BVH trees are built once per object and shared across
+        every pair (and across the gap/overlap/contact checks of one pair).
+        """
+        if not isinstance(pairs, list):
+            raise ValueError("pairs must be a list of {from_object, to_object} objects")
+
+        results = []
+        with self._shared_mesh_scope() as scope:
+            for pair in pairs:
+                if not isinstance(pair, dict):
+                    raise ValueError("pairs must be a list of {from_object, to_object} objects")
+                from_object = pair.get("from_object")
+                to_object = pair.get("to_object")
+                entry = {
+                    "from_object": from_object,
+                    "to_object": to_object,
+                    "gap": None,
+                    "alignment": None,
+                    "overlap": None,
+                    "contact_assertion": None,
+                    "error": None,
+                }
+                try:
+                    entry["gap"] = self.measure_gap(from_object, to_object, tolerance=tolerance)
+                    entry["alignment"] = self.measure_alignment(
+                        from_object, to_object, axes=["X", "Y", "Z"], reference="CENTER", tolerance=tolerance
+                    )
+                    entry["overlap"] = self.measure_overlap(from_object, to_object, tolerance=tolerance)
+                    entry["contact_assertion"] = self.assert_contact(
+                        from_object, to_object, max_gap=max_gap, allow_overlap=allow_overlap
+                    )
+                except Exception as exc:
+                    entry["error"] = str(exc)
+                results.append(entry)
+            evaluated_mesh_count = sum(1 for mesh_data in scope["mesh_data"].values() if mesh_data is not None)
+
+        return {
+            "pairs": results,
+            "pair_count": len(results),
+            "evaluated_mesh_count": evaluated_mesh_count,
+        }
+
     def assert_dimensions(self, object_name, expected_dimensions, tolerance=0.0001, world_space=True):
         """Asserts that object dimensions match the expected vector within tolerance."""
         if expected_dimensions is None or len(expected_dimensions) != 3:
@@ -2813,20 +3088,24 @@ class SceneHandler:
             return None
 
         try:
-            world_vertices = [obj_eval.matrix_world @ vertex.co for vertex in getattr(mesh, "vertices", [])]
-            if not world_vertices:
-                return None
             try:
                 mesh.calc_loop_triangles()
             except Exception:
                 pass
-            triangles = [tuple(tri.vertices) for tri in getattr(mesh, "loop_triangles", []) if len(tri.vertices) == 3]
-            if not triangles:
+            if hasattr(getattr(mesh, "vertices", None), "foreach_get"):
+                world_vertices, triangles, polygon_centers = world_space_mesh_arrays(mesh, obj_eval.matrix_world)
+            else:
+                world_vertices = [obj_eval.matrix_world @ vertex.co for vertex in getattr(mesh, "vertices", [])]
+                triangles = [
+                    tuple(tri.vertices) for tri in getattr(mesh, "loop_triangles", []) if len(tri.vertices) == 3
+                ]
+                polygon_centers = [obj_eval.matrix_world @ poly.center for poly in getattr(mesh, "polygons", [])]
+            if not world_vertices or not triangles:
                 return None
-            polygon_centers = [obj_eval.matrix_world @ poly.center for poly in getattr(mesh, "polygons", [])]
             release_evaluated_mesh = False
             return {
                 "object_name": obj.name,
+                "data_name": getattr(getattr(obj, "data", None), "name", None),
                 "vertices": world_vertices,
                 "triangles": triangles,
                 "sample_points": [*world_vertices, *polygon_centers],
@@ -2853,6 +3132,104 @@ class SceneHandler:
             except Exception:
                 pass
 
+    @contextmanager
+    def _shared_mesh_scope(self):
+        """Shares evaluated mesh data, BVH trees, and surface relations until the scope exits."""
+
+        if self._mesh_scope is not None:
+            yield self._mesh_scope
+            return
+
+        scope = {"mesh_data": {}, "surface_relations": {}}
+        self._mesh_scope = scope
+        try:
+            yield scope
+        finally:
+            self._mesh_scope = None
+            for mesh_data in scope["mesh_data"].values():
+                self._release_evaluated_mesh_data(mesh_data)
+
+    def _acquire_evaluated_mesh_data(self, obj):
+        """Returns evaluated mesh data, reusing the active shared scope when present."""
+
+        scope = self._mesh_scope
+        if scope is None:
+            return self._load_evaluated_mesh_data(obj)
+        key = getattr(obj, "name", None)
+        if key not in scope["mesh_data"]:
+            scope["mesh_data"][key] = self._load_evaluated_mesh_data(obj)
+        return scope["mesh_data"][key]
+
+    def _load_evaluated_mesh_data(self, obj):
+        """Returns evaluated mesh data from the persistent mesh cache, building it on a miss."""
+
+        cache = self._mesh_cache
+        fingerprint = self._mesh_cache_fingerprint(obj) if cache.enabled else None
+        if fingerprint is None:
+            return self._get_evaluated_mesh_data(obj)
+
+        cached = cache.get(obj.name, fingerprint)
+        if cached is not None:
+            return cached
+
+        mesh_data = self._get_evaluated_mesh_data(obj)
+        if mesh_data is None:
+            return None
+        # Vertices/sample points are already copied into world-space vectors, so the
+        # temporary evaluated mesh can be released before the payload is cached.
+        self._release_evaluated_mesh_data(mesh_data)
+        mesh_data = {key: value for key, value in mesh_data.items() if key != "cleanup_owner"}
+        cache.put(obj.name, fingerprint, mesh_data)
+        return mesh_data
+
+    def _mesh_cache_fingerprint(self, obj):
+        """Returns a geometry/transform fingerprint for the mesh cache, or None when not cacheable."""
+
+        if getattr(obj, "type", None) != "MESH" or getattr(obj, "mode", None) == "EDIT":
+            return None
+        try:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            obj_eval = obj.evaluated_get(depsgraph)
+            matrix = tuple(float(value) for row in obj_eval.matrix_world for value in row)
+            if len(matrix) != 16:
+                return None
+            evaluated_mesh = obj_eval.data
+            modifiers = tuple(
+                (modifier.name, modifier.type, bool(modifier.show_viewport)) for modifier in obj.modifiers
+            )
+            return (
+                matrix,
+                getattr(obj.data, "name", None),
+                len(evaluated_mesh.vertices),
+                len(evaluated_mesh.polygons),
+                modifiers,
+            )
+        except Exception:
+            return None
+
+    def get_mesh_cache_stats(self, reset=False):
+        """Returns hit/miss/eviction stats for the evaluated mesh/BVH cache."""
+
+        stats = self._mesh_cache.stats()
+        if reset:
+            self._mesh_cache.reset_stats()
+        return stats
+
+    def _release_unshared_mesh_data(self, mesh_data):
+        """Releases mesh data unless it is owned by the active shared scope."""
+
+        if self._mesh_scope is None:
+            self._release_evaluated_mesh_data(mesh_data)
+
+    def _build_mesh_bvh_tree(self, bvh_tree_type, mesh_data):
+        """Builds a BVH tree for evaluated mesh data, reusing one already attached to the payload."""
+
+        tree = mesh_data.get("bvh_tree")
+        if tree is None:
+            tree = bvh_tree_type.FromPolygons(mesh_data["vertices"], mesh_data["triangles"], all_triangles=True)
+            mesh_data["bvh_tree"] = tree
+        return tree
+
     def _find_closest_surface_pair(self, sample_points, target_tree, tolerance):
         """Find the closest sampled surface point against a target BVH tree."""
 
@@ -2889,21 +3266,39 @@ class SceneHandler:
     def _measure_mesh_surface_relation(self, source_obj, target_obj, tolerance, bbox_overlap_volume=0.0):
         """Returns mesh-aware contact/gap semantics for mesh-object pairs when possible."""
 
+        scope = self._mesh_scope
+        relation_key = (
+            getattr(source_obj, "name", None),
+            getattr(target_obj, "name", None),
+            float(tolerance),
+            float(bbox_overlap_volume),
+        )
+        if scope is not None and relation_key in scope["surface_relations"]:
+            return scope["surface_relations"][relation_key]
+
+        relation = self._compute_mesh_surface_relation(source_obj, target_obj, tolerance, bbox_overlap_volume)
+        if scope is not None:
+            scope["surface_relations"][relation_key] = relation
+        return relation
+
+    def _compute_mesh_surface_relation(self, source_obj, target_obj, tolerance, bbox_overlap_volume):
+        """Computes the mesh-aware relation behind `_measure_mesh_surface_relation`."""
+
         try:
             from mathutils.bvhtree import BVHTree
         except Exception:
             return None
 
-        source_mesh = self._get_evaluated_mesh_data(source_obj)
-        target_mesh = self._get_evaluated_mesh_data(target_obj)
+        source_mesh = self._acquire_evaluated_mesh_data(source_obj)
+        target_mesh = self._acquire_evaluated_mesh_data(target_obj)
         if source_mesh is None or target_mesh is None:
-            self._release_evaluated_mesh_data(source_mesh)
-            self._release_evaluated_mesh_data(target_mesh)
+            self._release_unshared_mesh_data(source_mesh)
+            self._release_unshared_mesh_data(target_mesh)
             return None
 
         try:
-            source_tree = BVHTree.FromPolygons(source_mesh["vertices"], source_mesh["triangles"], all_triangles=True)
-            target_tree = BVHTree.FromPolygons(target_mesh["vertices"], target_mesh["triangles"], all_triangles=True)
+            source_tree = self._build_mesh_bvh_tree(BVHTree, source_mesh)
+            target_tree = self._build_mesh_bvh_tree(BVHTree, target_mesh)
             if source_tree is None or target_tree is None:
                 return None
 
@@ -2959,8 +3354,8 @@ class SceneHandler:
                 },
             }
         finally:
-            self._release_evaluated_mesh_data(source_mesh)
-            self._release_evaluated_mesh_data(target_mesh)
+            self._release_unshared_mesh_data(source_mesh)
+            self._release_unshared_mesh_data(target_mesh)
 
     def _normalize_axes(self, axes):
         """Normalizes axis list input for alignment measurements."""
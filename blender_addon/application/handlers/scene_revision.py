@@ -0,0 +1,54 @@
+"""Monotonic scene revision counter for cheap change detection by the router."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from .app_handlers import PersistentAppHandlers
+
+
+class SceneRevisionCounter:
+    """Counter bumped on every depsgraph update, file load, and undo/redo.
+
+    Clients remember the revision they last read and can skip re-reading
+    scene state while it is unchanged. The counter starts at the wall-clock
+    millisecond of creation, so revisions seen before an addon reload or
+    Blender restart are not handed out again.
+    """
+
+    def __init__(self, start: int | None = None) -> None:
+        self._value = int(time.time() * 1000) if start is None else start
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            return self._value
+
+    def bump(self, *_args) -> int:
+        """Advance the revision; usable directly as a `bpy.app.handlers` callback."""
+
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+scene_revision = SceneRevisionCounter()
+
+_app_handlers = PersistentAppHandlers()
+
+
+def register_scene_revision_handlers(counter: SceneRevisionCounter = scene_revision) -> None:
+    """Hook the revision counter into Blender's depsgraph/load/undo handlers."""
+
+    _app_handlers.register(
+        (handler_name, counter.bump)
+        for handler_name in ("depsgraph_update_post", "load_post", "undo_post", "redo_post")
+    )
+
+
+def unregister_scene_revision_handlers() -> None:
+    """Remove callbacks added by `register_scene_revision_handlers`."""
+
+    _app_handlers.unregister()
@@ -0,0 +1,100 @@
+"""Binary response frames for array-heavy RPC payloads.
+
+A binary frame is sent inside the usual 4-byte length prefix and starts with
+`MAGIC` (JSON frames always start with `{`):
+
+    MAGIC | u32 header length (big-endian) | JSON header | pad | raw buffers
+
+The JSON header is `{"payload": ..., "arrays": [...]}`. Every NumPy array in the
+payload is replaced by `{"__array__": <index>}`. `arrays[index]` gives its
+`dtype` (little-endian `numpy.dtype.str`), `shape`, `offset` and `nbytes`.
+Offsets are relative to the first buffer, and every buffer is 8-byte aligned.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any
+
+import numpy as np
+
+MAGIC = b"BMB1"
+ENCODING = "binary"
+ALIGNMENT = 8
+JSON_FLOAT_PRECISION = 6
+
+
+def _align(value: int) -> int:
+    return (value + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def contains_arrays(value: Any) -> bool:
+    """Returns True when a NumPy array appears anywhere in the payload."""
+    if isinstance(value, np.ndarray):
+        return True
+    if isinstance(value, dict):
+        return any(contains_arrays(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(contains_arrays(item) for item in value)
+    return False
+
+
+def json_default(value: Any) -> Any:
+    """`json.dumps` fallback: NumPy arrays become lists (floats rounded), scalars become Python values."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f":
+            return np.round(value.astype(np.float64), JSON_FLOAT_PRECISION).tolist()
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encodes a response as a plain JSON frame body."""
+    return json.dumps(payload, default=json_default).encode("utf-8")
+
+
+def encode_frame(payload: Any) -> bytes:
+    """Encodes a response as a binary frame body, moving NumPy arrays into raw buffers."""
+    descriptors: list[dict[str, Any]] = []
+    buffers: list[bytes] = []
+    cursor = 0
+
+    def extract(value: Any) -> Any:
+        nonlocal cursor
+        if isinstance(value, np.ndarray):
+            array = np.ascontiguousarray(value)
+            if array.dtype.byteorder == ">":
+                array = array.astype(array.dtype.newbyteorder("<"))
+            raw = array.tobytes()
+            descriptors.append(
+                {"dtype": array.dtype.str, "shape": list(array.shape), "offset": cursor, "nbytes": len(raw)}
+            )
+            buffers.append(raw)
+            cursor = _align(cursor + len(raw))
+            return {"__array__": len(descriptors) - 1}
+        if isinstance(value, dict):
+            return {key: extract(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [extract(item) for item in value]
+        return value
+
+    header = json.dumps(
+        {"payload": extract(payload), "arrays": descriptors},
+        default=json_default,
+    ).encode("utf-8")
+    prefix = MAGIC + struct.pack(">I", len(header)) + header
+    chunks = [prefix, b"\0" * (_align(len(prefix)) - len(prefix))]
+    for raw in buffers:
+        chunks.append(raw)
+        chunks.append(b"\0" * (_align(len(raw)) - len(raw)))
+    return b"".join(chunks)
+
+
+def encode_response(payload: Any, accept_encoding: Any = None) -> bytes:
+    """Picks a binary frame when the client accepts it and the payload carries arrays."""
+    if accept_encoding == ENCODING and contains_arrays(payload):
+        return encode_frame(payload)
+    return encode_json(payload)
@@ -9,11 +9,13 @@ import threading
 import time
 import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict
 
 from ..application.handlers.job_utils import JobCancelledError
+from .binary_frames import encode_response
 
 # Try importing bpy, but allow running outside blender for testing
 try:
@@ -25,6 +27,10 @@ HOST = "0.0.0.0"  # Listen on all interfaces within container
 PORT = 8765
 DEFAULT_EXECUTION_TIMEOUT_SECONDS = float(os.environ.get("ADDON_EXECUTION_TIMEOUT_SECONDS", "30.0"))
 DEFAULT_WATCHDOG_INTERVAL_SECONDS = float(os.environ.get("BLENDER_AI_MCP_RPC_WATCHDOG_INTERVAL_SECONDS", "5.0"))
+# Upper bound on requests from one connection that may wait for the main thread concurrently.
+# Requests are still executed on Blender's main thread one at a time; this only bounds how
+# many can be in flight (and answered out of order) on the multiplexed socket.
+DEFAULT_MAX_INFLIGHT_REQUESTS = max(1, int(os.environ.get("BLENDER_AI_MCP_RPC_MAX_INFLIGHT", "16")))
 RPC_TRACE_DIR = Path(os.environ.get("BLENDER_AI_MCP_TRACE_DIR", Path(tempfile.gettempdir()) / "blender-ai-mcp"))
 
 # If enabled, the addon will push an explicit undo step after each mutating RPC command.
@@ -48,12 +54,16 @@ _NO_UNDO_PUSH_CMDS = {
     "scene.list_objects",
     "scene.get_mode",
     "scene.list_selection",
+    "scene.router_context",
     "scene.snapshot_state",
     "scene.get_viewport",
+    "scene.capture_view_set",
     "scene.get_custom_properties",
     "scene.get_hierarchy",
     "scene.get_bounding_box",
     "scene.get_origin_info",
+    "scene.measure_relations_bulk",
+    "scene.get_mesh_cache_stats",
     "scene.camera_orbit",
     "scene.camera_focus",
     "scene.get_view_state",
@@ -109,6 +119,13 @@ _NO_UNDO_PUSH_PREFIXES = (
 )
 
 
+# Control-plane verbs answered directly on the network thread (no main-thread hop).
+_INLINE_CMDS = {"ping", "rpc.launch_job", "rpc.get_job", "rpc.cancel_job", "rpc.collect_job"}
+_TERMINAL_JOB_STATUSES = {"completed", "failed", "cancelled"}
+# Unsolicited frames pushed to job subscribers carry this marker instead of a request_id.
+JOB_EVENT = "job_update"
+
+
 def _should_push_undo(cmd: str) -> bool:
     if not AUTO_UNDO_PUSH:
         return False
@@ -221,11 +238,15 @@ class BlenderRpcServer:
         self.watchdog_interval_seconds = DEFAULT_WATCHDOG_INTERVAL_SECONDS
         self._watchdog_callback: Callable[[], float | None] | None = None
         self._watchdog_enabled = False
+        self.max_inflight_requests = DEFAULT_MAX_INFLIGHT_REQUESTS
+        self._request_executor: ThreadPoolExecutor | None = None
 
         # Queue for results from main thread
         self.result_queues = {}  # request_id -> Queue
         self.background_jobs: Dict[str, BackgroundJob] = {}
         self._jobs_lock = threading.Lock()
+        # job_id -> {subscription_id: push callback bound to the subscribing connection}
+        self._job_subscribers: Dict[str, Dict[str, Callable[[Dict[str, Any]], None]]] = {}
         self.trace_file_path: Path | None = self._create_trace_file_path()
         self._record_trace_event(
             "server_initialized",
@@ -323,9 +344,13 @@ class BlenderRpcServer:
             except Exception:
                 pass
         self.server_thread = None
+        if self._request_executor is not None:
+            self._request_executor.shutdown(wait=False, cancel_futures=True)
+            self._request_executor = None
         if clear_background_jobs:
             with self._jobs_lock:
                 self.background_jobs.clear()
+                self._job_subscribers.clear()
         print("[BlenderRpc] Server stopped")
 
     def is_listener_healthy(self) -> bool:
@@ -434,7 +459,36 @@ class BlenderRpcServer:
                 if self.running:
                     print(f"[BlenderRpc] Accept loop error: {e}")
 
+    def _get_request_executor(self) -> ThreadPoolExecutor:
+        if self._request_executor is None:
+            self._request_executor = ThreadPoolExecutor(
+                max_workers=self.max_inflight_requests,
+                thread_name_prefix="BlenderRpcRequest",
+            )
+        return self._request_executor
+
     def _handle_client(self, conn):
+        """Serve one multiplexed connection.
+
+        Requests are read continuously and processed concurrently; every response
+        carries its ``request_id`` and is written as soon as it is ready, so
+        replies may arrive out of order relative to requests.
+        """
+
+        send_lock = threading.Lock()
+        subscriptions: list[tuple[str, str]] = []
+
+        def respond(payload: Dict[str, Any], accept_encoding: Any = None) -> None:
+            response_data = encode_response(payload, accept_encoding)
+            with send_lock:
+                send_msg(conn, response_data)
+
+        def process_and_respond(message: Dict[str, Any]) -> None:
+            try:
+                respond(self._process_request(message), message.get("accept_encoding"))
+            except Exception as e:
+                print(f"[BlenderRpc] Failed to send response: {e}")
+
         with conn:
             while self.running:
                 try:
@@ -444,19 +498,97 @@ class BlenderRpcServer:
 
                     try:
                         message = json.loads(data.decode("utf-8"))
-                        response = self._process_request(message)
-
-                        response_data = json.dumps(response).encode("utf-8")
-                        send_msg(conn, response_data)
-
                     except json.JSONDecodeError:
-                        err = {"status": "error", "error": "Invalid JSON"}
-                        send_msg(conn, json.dumps(err).encode("utf-8"))
+                        respond({"status": "error", "error": "Invalid JSON"})
+                        continue
+
+                    if not isinstance(message, dict):
+                        respond(self._process_request({}))
+                    elif message.get("cmd") == "rpc.subscribe_job":
+                        response = self._subscribe_background_job(message, respond)
+                        if response.get("status") == "ok":
+                            subscriptions.append((response["result"]["job_id"], message["request_id"]))
+                        respond(response)
+                    elif message.get("cmd") in _INLINE_CMDS:
+                        respond(self._process_request(message), message.get("accept_encoding"))
+                    else:
+                        self._get_request_executor().submit(process_and_respond, message)
 
                 except Exception as e:
                     print(f"[BlenderRpc] Client handler error: {e}")
                     break
 
+        for job_id, subscription_id in subscriptions:
+            self._unsubscribe_background_job(job_id, subscription_id)
+
+    def _subscribe_background_job(
+        self,
+        message: Dict[str, Any],
+        push: Callable[[Dict[str, Any]], None],
+    ) -> Dict[str, Any]:
+        """Register a connection to receive pushed snapshots for one background job.
+
+        The acknowledgement carries the current snapshot; every later state or
+        progress change is pushed as an unsolicited ``JOB_EVENT`` frame tagged with
+        the subscribing ``request_id`` until the job reaches a terminal status.
+        Pushes happen on whichever thread updates the job, so no main-thread
+        timer is needed to observe progress.
+        """
+
+        request_id = message.get("request_id")
+        args = message.get("args") or {}
+        job_id = args.get("job_id") if isinstance(args, dict) else None
+        if not request_id or not isinstance(job_id, str) or not job_id:
+            return {
+                "request_id": request_id,
+                "status": "error",
+                "error": "request_id and job_id required for rpc.subscribe_job",
+                "error_code": "missing_job_id",
+                "error_boundary": "addon_execution",
+            }
+
+        with self._jobs_lock:
+            job = self.background_jobs.get(job_id)
+            if job is not None:
+                snapshot = self._build_job_snapshot(job)
+                if job.status not in _TERMINAL_JOB_STATUSES:
+                    self._job_subscribers.setdefault(job_id, {})[request_id] = push
+        if job is None:
+            return {
+                "request_id": request_id,
+                "status": "error",
+                "error": f"Unknown background job: {job_id}",
+                "error_code": "unknown_job_id",
+                "error_boundary": "addon_execution",
+            }
+        self._record_trace_event(
+            "background_job_subscribed",
+            cmd=job.cmd,
+            request_id=job_id,
+            args=job.args,
+            detail={"status": snapshot["status"], "subscription_id": request_id},
+        )
+        return {"request_id": request_id, "status": "ok", "result": snapshot}
+
+    def _unsubscribe_background_job(self, job_id: str, subscription_id: str) -> None:
+        with self._jobs_lock:
+            subscribers = self._job_subscribers.get(job_id)
+            if subscribers is None:
+                return
+            subscribers.pop(subscription_id, None)
+            if not subscribers:
+                del self._job_subscribers[job_id]
+
+    def _publish_job_event(
+        self, job_id: str, subscribers: list[tuple[str, Callable[[Dict[str, Any]], None]]], snapshot: Dict[str, Any]
+    ) -> None:
+        for subscription_id, push in subscribers:
+            try:
+                push({"event": JOB_EVENT, "subscription_id": subscription_id, "result": snapshot})
+            except Exception as exc:
+                print(f"[BlenderRpc] Dropping job subscriber {subscription_id}: {exc}")
+                self._unsubscribe_background_job(job_id, subscription_id)
+
     def _build_job_snapshot(self, job: BackgroundJob, *, include_result: bool = False) -> Dict[str, Any]:
         """Serialize background job state for poll/collect RPC responses."""
 
@@ -493,7 +625,13 @@ class BlenderRpcServer:
             for key, value in changes.items():
                 setattr(job, key, value)
             job.updated_at = time.time()
-            return job
+            subscribers = list(self._job_subscribers.get(job_id, {}).items())
+            snapshot = self._build_job_snapshot(job) if subscribers else None
+            if job.status in _TERMINAL_JOB_STATUSES:
+                self._job_subscribers.pop(job_id, None)
+        if snapshot is not None:
+            self._publish_job_event(job_id, subscribers, snapshot)
+        return job
 
     def _schedule_background_job(self, job_id: str) -> None:
         """Schedule a background job without blocking the RPC network loop."""
@@ -850,6 +988,104 @@ class BlenderRpcServer:
             "error_boundary": "addon_execution",
         }
 
+    def _execute_command(
+        self,
+        cmd: str,
+        request_id: str,
+        args: Dict[str, Any],
+        *,
+        push_undo: bool,
+    ) -> Dict[str, Any]:
+        """Run one registered command on the current (main) thread and build its status payload."""
+
+        try:
+            if cmd in self.command_registry:
+                self._record_trace_event("rpc_handler_started", cmd=cmd, request_id=request_id, args=args)
+                res = self.command_registry[cmd](**args)
+                if push_undo:
+                    _safe_undo_push(f"MCP: {cmd}")
+                self._record_trace_event("rpc_handler_completed", cmd=cmd, request_id=request_id, args=args)
+                return {"status": "ok", "result": res}
+            self._record_trace_event(
+                "rpc_handler_failed",
+                cmd=cmd,
+                request_id=request_id,
+                args=args,
+                detail={"error": f"Unknown command: {cmd}"},
+            )
+            return {"status": "error", "error": f"Unknown command: {cmd}"}
+        except Exception as e:
+            traceback.print_exc()
+            self._record_trace_event(
+                "rpc_handler_failed",
+                cmd=cmd,
+                request_id=request_id,
+                args=args,
+                detail={"error": str(e)},
+            )
+            return {"status": "error", "error": str(e)}
+
+    def _validate_batch_args(self, args: Dict[str, Any]) -> str | None:
+        commands = args.get("commands")
+        if not isinstance(commands, list) or not commands:
+            return "rpc.batch requires a non-empty 'commands' list"
+        for index, item in enumerate(commands):
+            if not isinstance(item, dict) or not isinstance(item.get("cmd"), str) or not item.get("cmd"):
+                return f"rpc.batch item {index} must be an object with a 'cmd' string"
+            if item["cmd"] in _INLINE_CMDS or item["cmd"] == "rpc.batch":
+                return f"rpc.batch item {index} uses control-plane command '{item['cmd']}', which cannot be batched"
+            if not isinstance(item.get("args", {}) or {}, dict):
+                return f"rpc.batch item {index} 'args' must be an object"
+        return None
+
+    def _execute_batch(self, request_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Run an ordered list of commands inside one main-thread callback.
+
+        Every item gets its own status. With ``stop_on_error`` the remaining items
+        are reported as ``skipped`` after the first failure. Undo is pushed once for
+        the whole batch when at least one executed item would normally push it.
+        """
+
+        commands = args["commands"]
+        stop_on_error = bool(args.get("stop_on_error", False))
+        results: list[Dict[str, Any]] = []
+        needs_undo_push = False
+        stopped_early = False
+
+        for index, item in enumerate(commands):
+            item_cmd = item["cmd"]
+            if stopped_early:
+                results.append({"index": index, "cmd": item_cmd, "status": "skipped"})
+                continue
+            item_payload = self._execute_command(
+                item_cmd,
+                f"{request_id}:{index}",
+                item.get("args", {}) or {},
+                push_undo=False,
+            )
+            results.append({"index": index, "cmd": item_cmd, **item_payload})
+            if item_payload["status"] == "ok":
+                needs_undo_push = needs_undo_push or _should_push_undo(item_cmd)
+            elif stop_on_error:
+                stopped_early = True
+
+        if needs_undo_push:
+            undo_message = args.get("undo_message")
+            _safe_undo_push(
+                undo_message if isinstance(undo_message, str) and undo_message else f"MCP: batch ({len(commands)})"
+            )
+
+        return {
+            "status": "ok",
+            "result": {
+                "results": results,
+                "executed": sum(1 for item in results if item["status"] != "skipped"),
+                "failed": sum(1 for item in results if item["status"] == "error"),
+                "skipped": sum(1 for item in results if item["status"] == "skipped"),
+                "stopped_early": stopped_early,
+            },
+        }
+
     def _process_request(self, message: Dict[str, Any]) -> Dict[str, Any]:
         request_id = message.get("request_id")
         cmd = message.get("cmd")
@@ -876,39 +1112,44 @@ class BlenderRpcServer:
         if cmd in {"rpc.launch_job", "rpc.get_job", "rpc.cancel_job", "rpc.collect_job"}:
             return self._handle_background_rpc(cmd, request_id, args, timeout_seconds)
 
+        if cmd == "rpc.subscribe_job":
+            return {
+                "request_id": request_id,
+                "status": "error",
+                "error": "rpc.subscribe_job requires a streaming RPC connection",
+                "error_code": "subscription_unavailable",
+                "error_boundary": "addon_execution",
+            }
+
+        if cmd == "rpc.batch":
+            batch_error = self._validate_batch_args(args)
+            if batch_error is not None:
+                self._record_trace_event(
+                    "rpc_batch_rejected", cmd=cmd, request_id=request_id, args=args, detail={"error": batch_error}
+                )
+                return {
+                    "request_id": request_id,
+                    "status": "error",
+                    "error": batch_error,
+                    "error_code": "invalid_batch",
+                    "error_boundary": "addon_execution",
+                }
+
+            def execute() -> Dict[str, Any]:
+                return self._execute_batch(request_id, args)
+
+        else:
+
+            def execute() -> Dict[str, Any]:
+                return self._execute_command(cmd, request_id, args, push_undo=_should_push_undo(cmd))
+
         # Dispatch to Main Thread via Timer
         result_queue: queue.Queue[Dict[str, Any]] = queue.Queue()
         self.result_queues[request_id] = result_queue
 
         # Define the execution wrapper
         def main_thread_exec():
-            try:
-                if cmd in self.command_registry:
-                    self._record_trace_event("rpc_handler_started", cmd=cmd, request_id=request_id, args=args)
-                    res = self.command_registry[cmd](**args)
-                    if _should_push_undo(cmd):
-                        _safe_undo_push(f"MCP: {cmd}")
-                    self._record_trace_event("rpc_handler_completed", cmd=cmd, request_id=request_id, args=args)
-                    result_queue.put({"status": "ok", "result": res})
-                else:
-                    self._record_trace_event(
-                        "rpc_handler_failed",
-                        cmd=cmd,
-                        request_id=request_id,
-                        args=args,
-                        detail={"error": f"Unknown command: {cmd}"},
-                    )
-                    result_queue.put({"status": "error", "error": f"Unknown command: {cmd}"})
-            except Exception as e:
-                traceback.print_exc()
-                self._record_trace_event(
-                    "rpc_handler_failed",
-                    cmd=cmd,
-                    request_id=request_id,
-                    args=args,
-                    detail={"error": str(e)},
-                )
-                result_queue.put({"status": "error", "error": str(e)})
+            result_queue.put(execute())
 
         # Schedule on main thread
         if bpy:
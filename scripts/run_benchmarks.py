@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""Run the offline benchmark flows against a simulated Blender addon and check regression thresholds."""
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import math
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tests.benchmarks.fake_addon import DEFAULT_MAIN_THREAD_LATENCY_MS, simulated_addon
+from tests.benchmarks.flows import FLOWS, MeteredRpcClient, installed_rpc_client
+from tests.benchmarks.synthetic_scene import DEFAULT_MESH_RESOLUTION, DEFAULT_OBJECT_COUNT
+
+DEFAULT_THRESHOLDS_PATH = REPO_ROOT / "tests" / "benchmarks" / "thresholds.json"
+DEFAULT_TOLERANCE = {"p95_ms": 0.5, "p95_ms_slack": 5.0, "rpc_count": 0.1, "bytes": 0.1}
+ADDON_STARTUP_TIMEOUT_SECONDS = 30.0
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (no interpolation, so p95 is always an observed sample)."""
+    if not values:
+        raise ValueError("percentile() requires at least one value")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_flow(samples: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregates per-iteration samples into the reported per-flow metrics."""
+    latencies = [sample["elapsed_ms"] for sample in samples]
+    totals = [sample["bytes_sent"] + sample["bytes_received"] for sample in samples]
+    return {
+        "iterations": len(samples),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "max_ms": round(max(latencies), 3),
+        "rpc_count": int(statistics.median_low(sample["rpc_count"] for sample in samples)),
+        "bytes": int(statistics.median_low(totals)),
+        "bytes_sent": int(statistics.median_low(sample["bytes_sent"] for sample in samples)),
+        "bytes_received": int(statistics.median_low(sample["bytes_received"] for sample in samples)),
+        "commands": samples[-1]["commands"],
+    }
+
+
+def compare_to_thresholds(report: dict[str, Any], thresholds: dict[str, Any]) -> list[str]:
+    """Returns one message per metric that exceeds its baseline plus tolerance."""
+    tolerance = {**DEFAULT_TOLERANCE, **thresholds.get("tolerance", {})}
+    regressions = []
+    for name, result in report["flows"].items():
+        baseline = thresholds.get("flows", {}).get(name)
+        if baseline is None or result.get("status") != "ok":
+            continue
+        limits = {
+            "p95_ms": baseline["p95_ms"] * (1.0 + tolerance["p95_ms"]) + tolerance["p95_ms_slack"],
+            "rpc_count": baseline["rpc_count"] * (1.0 + tolerance["rpc_count"]),
+            "bytes": baseline["bytes"] * (1.0 + tolerance["bytes"]),
+        }
+        for metric, limit in limits.items():
+            if result[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {result[metric]} exceeds baseline {baseline[metric]} (limit {limit:.1f})"
+                )
+    return regressions
+
+
+def thresholds_from_report(report: dict[str, Any], previous: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Builds a thresholds document from a report, keeping an existing tolerance block."""
+    return {
+        "profile": report["profile"],
+        "tolerance": (previous or {}).get("tolerance", dict(DEFAULT_TOLERANCE)),
+        "flows": {
+            name: {metric: result[metric] for metric in ("p95_ms", "rpc_count", "bytes")}
+            for name, result in report["flows"].items()
+            if result.get("status") == "ok"
+        },
+    }
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind((host, 0))
+        return probe.getsockname()[1]
+
+
+def _wait_for_addon(host: str, port: int, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + ADDON_STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Simulated addon exited with code {process.returncode}")
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Simulated addon did not listen on {host}:{port} within {ADDON_STARTUP_TIMEOUT_SECONDS:.0f}s")
+
+
+@contextlib.contextmanager
+def _addon_subprocess(profile: dict[str, Any], host: str) -> Iterator[int]:
+    port = _free_port(host)
+    command = [
+        sys.executable,
+        "-m",
+        "tests.benchmarks.fake_addon",
+        "--host",
+        host,
+        "--port",
+        str(port),
+        "--main-thread-latency-ms",
+        str(profile["main_thread_latency_ms"]),
+        "--object-count",
+        str(profile["object_count"]),
+        "--mesh-resolution",
+        str(profile["mesh_resolution"]),
+    ]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")]))}
+    process = subprocess.Popen(command, cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL)
+    try:
+        _wait_for_addon(host, port, process)
+        yield port
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+@contextlib.contextmanager
+def _addon_in_process(profile: dict[str, Any], host: str) -> Iterator[int]:
+    # The in-process RPC server prints one line per request; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        with simulated_addon(
+            main_thread_latency_ms=profile["main_thread_latency_ms"],
+            object_count=profile["object_count"],
+            mesh_resolution=profile["mesh_resolution"],
+            host=host,
+        ) as server:
+            yield server.port
+
+
+def _run_flow(flow, client: MeteredRpcClient, iterations: int, warmup: int) -> dict[str, Any]:
+    for _ in range(warmup):
+        flow.run()
+    samples = []
+    for _ in range(iterations):
+        client.meter.reset()
+        started = time.perf_counter()
+        flow.run()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        samples.append({"elapsed_ms": elapsed_ms, **client.meter.snapshot()})
+    return {"status": "ok", "description": flow.description, **summarize_flow(samples)}
+
+
+def run_benchmarks(
+    flow_names: list[str],
+    *,
+    iterations: int = 20,
+    warmup: int = 2,
+    main_thread_latency_ms: float = DEFAULT_MAIN_THREAD_LATENCY_MS,
+    object_count: int = DEFAULT_OBJECT_COUNT,
+    mesh_resolution: int = DEFAULT_MESH_RESOLUTION,
+    in_process: bool = False,
+    host: str = "127.0.0.1",
+) -> dict[str, Any]:
+    """Runs the named flows and returns the report (`profile` plus per-flow metrics)."""
+    unknown = [name for name in flow_names if name not in FLOWS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark flow(s): {', '.join(unknown)}. Available: {', '.join(FLOWS)}")
+    profile = {
+        "main_thread_latency_ms": float(main_thread_latency_ms),
+        "object_count": int(object_count),
+        "mesh_resolution": int(mesh_resolution),
+    }
+    addon = _addon_in_process if in_process else _addon_subprocess
+    report: dict[str, Any] = {"profile": profile, "flows": {}}
+    with addon(profile, host) as port:
+        client = MeteredRpcClient(host, port)
+        try:
+            with installed_rpc_client(client):
+                for name in flow_names:
+                    try:
+                        report["flows"][name] = _run_flow(FLOWS[name], client, iterations, warmup)
+                    except Exception as e:
+                        report["flows"][name] = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+        finally:
+            client.close()
+    return report
+
+
+def _format_table(report: dict[str, Any]) -> str:
+    lines = [f"{'flow':<28}{'p50 ms':>10}{'p95 ms':>10}{'rpcs':>7}{'bytes':>12}"]
+    for name, result in report["flows"].items():
+        if result.get("status") != "ok":
+            lines.append(f"{name:<28}ERROR {result.get('error')}")
+            continue
+        lines.append(
+            f"{name:<28}{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}{result['rpc_count']:>7}{result['bytes']:>12}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--flows", default=",".join(FLOWS), help="Comma-separated flow names (default: all).")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--main-thread-latency-ms", type=float, default=DEFAULT_MAIN_THREAD_LATENCY_MS)
+    parser.add_argument("--object-count", type=int, default=DEFAULT_OBJECT_COUNT)
+    parser.add_argument("--mesh-resolution", type=int, default=DEFAULT_MESH_RESOLUTION)
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run the simulated addon in this interpreter instead of a subprocess.",
+    )
+    parser.add_argument("--thresholds", type=Path, default=DEFAULT_THRESHOLDS_PATH)
+    parser.add_argument("--update-thresholds", action="store_true", help="Write this run as the new baseline.")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the full report to this file.")
+    parser.add_argument("--verbose", action="store_true", help="Keep server-side logging.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+
+    report = run_benchmarks(
+        [name.strip() for name in args.flows.split(",") if name.strip()],
+        iterations=args.iterations,
+        warmup=args.warmup,
+        main_thread_latency_ms=args.main_thread_latency_ms,
+        object_count=args.object_count,
+        mesh_resolution=args.mesh_resolution,
+        in_process=args.in_process,
+    )
+    print(_format_table(report))
+
+    failed = [name for name, result in report["flows"].items() if result.get("status") != "ok"]
+    thresholds = json.loads(args.thresholds.read_text(encoding="utf-8")) if args.thresholds.exists() else None
+    if args.update_thresholds:
+        args.thresholds.write_text(
+            json.dumps(thresholds_from_report(report, thresholds), indent=2) + "\n", encoding="utf-8"
+        )
+        print(f"Thresholds written to {args.thresholds}")
+        regressions: list[str] = []
+    elif thresholds is None:
+        print(f"No thresholds at {args.thresholds}; run with --update-thresholds to record a baseline.")
+        regressions = []
+    elif thresholds.get("profile") != report["profile"]:
+        print("Benchmark profile differs from the thresholds profile; comparison skipped.")
+        regressions = []
+    else:
+        regressions = compare_to_thresholds(report, thresholds)
+        report["regressions"] = regressions
+        for message in regressions:
+            print(f"REGRESSION {message}")
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
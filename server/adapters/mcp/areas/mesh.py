@@ -9,6 +9,7 @@ from server.adapters.mcp.sampling.assistant_runner import run_inspection_summary
 from server.adapters.mcp.sampling.result_types import to_inspection_assistant_contract
 from server.adapters.mcp.utils import parse_coordinate
 from server.adapters.mcp.visibility.tags import get_capability_tags
+from server.adapters.rpc.binary_frames import to_json_compatible
 from server.infrastructure.di import (
     get_mesh_handler,
     get_modeling_handler,
@@ -762,6 +763,7 @@ async def mesh_inspect(
     include_deltas: bool = False,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    layout: Literal["rows", "columns"] = "rows",
     assistant_summary: bool = False,
 ) -> MeshInspectResponseContract:
     """
@@ -786,6 +788,9 @@ async def mesh_inspect(
     - "shape_keys": include_deltas (optional)
     - "group_weights": group_name (optional) + selected_only
     - "offset"/"limit": optional paging over returned items (after selection filter)
+    - "layout": "columns" returns parallel arrays in metadata.columns instead of per-item dicts
+      for vertices/edges/faces/uvs/normals/shape_keys and attributes (with attribute_name); read in Object Mode
+      and transferred from the addon as binary array frames
     - "assistant_summary": optional bounded server-side summary of the structured inspection payload
 
     Workflow: READ-ONLY | USE → mesh reconstruction and quick audits
@@ -808,33 +813,33 @@ async def mesh_inspect(
             return _to_mesh_inspect_contract(action, _mesh_inspect_summary(ctx, object_name))
         elif action == "vertices":
             return _to_mesh_inspect_contract(
-                action, _mesh_get_vertex_data(ctx, object_name, selected_only, offset, limit)
+                action, _mesh_get_vertex_data(ctx, object_name, selected_only, offset, limit, layout)
             )
         elif action == "edges":
             return _to_mesh_inspect_contract(
-                action, _mesh_get_edge_data(ctx, object_name, selected_only, offset, limit)
+                action, _mesh_get_edge_data(ctx, object_name, selected_only, offset, limit, layout)
             )
         elif action == "faces":
             return _to_mesh_inspect_contract(
-                action, _mesh_get_face_data(ctx, object_name, selected_only, offset, limit)
+                action, _mesh_get_face_data(ctx, object_name, selected_only, offset, limit, layout)
             )
         elif action == "uvs":
             return _to_mesh_inspect_contract(
                 action,
-                _mesh_get_uv_data(ctx, object_name, uv_layer, selected_only, offset, limit),
+                _mesh_get_uv_data(ctx, object_name, uv_layer, selected_only, offset, limit, layout),
             )
         elif action == "normals":
             return _to_mesh_inspect_contract(
-                action, _mesh_get_loop_normals(ctx, object_name, selected_only, offset, limit)
+                action, _mesh_get_loop_normals(ctx, object_name, selected_only, offset, limit, layout)
             )
         elif action == "attributes":
             return _to_mesh_inspect_contract(
                 action,
-                _mesh_get_attributes(ctx, object_name, attribute_name, selected_only, offset, limit),
+                _mesh_get_attributes(ctx, object_name, attribute_name, selected_only, offset, limit, layout),
             )
         elif action == "shape_keys":
             return _to_mesh_inspect_contract(
-                action, _mesh_get_shape_keys(ctx, object_name, include_deltas, offset, limit)
+                action, _mesh_get_shape_keys(ctx, object_name, include_deltas, offset, limit, layout)
             )
         elif action == "group_weights":
             return _to_mesh_inspect_contract(
@@ -862,6 +867,7 @@ async def mesh_inspect(
             "include_deltas": include_deltas,
             "offset": offset,
             "limit": limit,
+            "layout": layout,
             "assistant_summary": assistant_summary,
         },
         direct_executor=execute,
@@ -880,6 +886,9 @@ def _to_mesh_inspect_contract(action: str, payload: Dict[str, Any]) -> MeshInspe
     if "error" in payload:
         return MeshInspectResponseContract(action=cast(Any, action), error=payload["error"])
 
+    # Column layouts arrive as NumPy views decoded from binary RPC frames.
+    payload = to_json_compatible(payload)
+
     if action == "summary":
         return MeshInspectResponseContract(
             action="summary",
@@ -935,12 +944,13 @@ def _mesh_get_vertex_data(
     selected_only: bool = False,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    layout: str = "rows",
 ) -> Dict[str, Any]:
     """
     [EDIT MODE][READ-ONLY][SAFE] Returns vertex positions and selection states for programmatic analysis.
     """
     try:
-        return get_mesh_handler().get_vertex_data(object_name, selected_only, offset, limit)
+        return get_mesh_handler().get_vertex_data(object_name, selected_only, offset, limit, layout)
     except RuntimeError as e:
         return {"error": str(e)}
 
@@ -952,12 +962,13 @@ def _mesh_get_edge_data(
     selected_only: bool = False,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    layout: str = "rows",
 ) -> Dict[str, Any]:
     """
     [EDIT MODE][READ-ONLY][SAFE] Returns edge connectivity + attributes.
     """
     try:
-        return get_mesh_handler().get_edge_data(object_name, selected_only, offset, limit)
+        return get_mesh_handler().get_edge_data(object_name, selected_only, offset, limit, layout)
     except RuntimeError as e:
         return {"error": str(e)}
 
@@ -969,12 +980,13 @@ def _mesh_get_face_data(
     selected_only: bool = False,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    layout: str = "rows",
 ) -> Dict[str, Any]:
     """
     [EDIT MODE][READ-ONLY][SAFE] Returns face connectivity + attributes.
     """
     try:
-        return get_mesh_handler().get_face_data(object_name, selected_only, offset, limit)
+        return get_mesh_handler().get_face_data(object_name, selected_only, offset, limit, layout)
     except RuntimeError as e:
         return {"error": str(e)}
 
@@ -987,12 +999,13 @@ def _mesh_get_uv_data(
     selected_only: bool = False,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    layout: str = "rows",
 ) -> Dict[str, Any]:
     """
     [EDIT MODE][READ-ONLY][SAFE] Returns UVs per face loop.
     """
     try:
-        return get_mesh_handler().get_uv_data(object_name, uv_layer, selected_only, offset, limit)
+        return get_mesh_handler().get_uv_data(object_name, uv_layer, selected_only, offset, limit, layout)
     except RuntimeError as e:
         return {"error": str(e)}
 
@@ -1004,12 +1017,13 @@ def _mesh_get_loop_normals(
     selected_only: bool = False,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    layout: str = "rows",
 ) -> Dict[str, Any]:
     """
     [EDIT MODE][READ-ONLY][SAFE] Returns per-loop normals (split/custom).
     """
     try:
-        return get_mesh_handler().get_loop_normals(object_name, selected_only, offset, limit)
+        return get_mesh_handler().get_loop_normals(object_name, selected_only, offset, limit, layout)
     except RuntimeError as e:
         return {"error": str(e)}
 
@@ -1041,12 +1055,13 @@ def _mesh_get_attributes(
     selected_only: bool = False,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    layout: str = "rows",
 ) -> Dict[str, Any]:
     """
     [EDIT MODE][READ-ONLY][SAFE] Returns mesh attribute data (vertex colors, layers).
     """
     try:
-        result = get_mesh_handler().get_attributes(object_name, attribute_name, selected_only, offset, limit)
+        result = get_mesh_handler().get_attributes(object_name, attribute_name, selected_only, offset, limit, layout)
         return result
     except RuntimeError as e:
         return {"error": str(e)}
@@ -1059,12 +1074,13 @@ def _mesh_get_shape_keys(
     include_deltas: bool = False,
     offset: Optional[int] = None,
     limit: Optional[int] = None,
+    layout: str = "rows",
 ) -> Dict[str, Any]:
     """
     [OBJECT MODE][READ-ONLY][SAFE] Returns shape key data.
     """
     try:
-        return get_mesh_handler().get_shape_keys(object_name, include_deltas, offset, limit)
+        return get_mesh_handler().get_shape_keys(object_name, include_deltas, offset, limit, layout)
     except RuntimeError as e:
         return {"error": str(e)}
 
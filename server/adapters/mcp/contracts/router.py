@@ -119,6 +119,7 @@ class RouterStatusContract(MCPContract):
     last_router_disposition: str | None = None
     last_router_error: str | None = None
     assistant_diagnostics: dict[str, Any] | None = None
+    warmup: dict[str, Any] | None = None
     repair_suggestion: RepairSuggestionAssistantContract | None = None
     timeout_policy: dict[str, Any] | None = None
     task_runtime: dict[str, Any] | None = None
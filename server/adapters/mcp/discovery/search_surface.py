@@ -5,10 +5,12 @@
 
 from __future__ import annotations
 
-import hashlib
+import itertools
 import json
 import logging
+from collections import OrderedDict
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Annotated, Any
 
 from fastmcp.exceptions import NotFoundError, ToolError
@@ -46,9 +48,27 @@ _GATE_RECOVERY_QUERY_HINTS = (
 )
 
 
-def _catalog_hash(search_documents: dict[str, str]) -> str:
-    key = "|".join(f"{tool_name}:{document}" for tool_name, document in sorted(search_documents.items()))
-    return hashlib.sha256(key.encode()).hexdigest()
+# BM25 indexes kept for distinct visible tool sets (guided phases, gate plans, handoffs)
+DEFAULT_INDEX_CACHE_SIZE = 16
+
+
+@dataclass(frozen=True)
+class _CachedDocument:
+    """Enriched search document for one tool definition."""
+
+    version: str | None
+    description: str | None
+    parameters: dict[str, Any]
+    document: str
+    revision: int
+
+
+@dataclass(frozen=True)
+class _CachedIndex:
+    """BM25 index over one visible tool set, in the order it was built."""
+
+    index: Any
+    tool_names: tuple[str, ...]
 
 
 class BlenderDiscoverySearchTransform(BM25SearchTransform):
@@ -61,6 +81,7 @@ class BlenderDiscoverySearchTransform(BM25SearchTransform):
         always_visible: list[str] | None = None,
         entry_map: dict[str, Any] | None = None,
         contract_line: str = CONTRACT_LINE_LLM_GUIDED_V2,
+        index_cache_size: int = DEFAULT_INDEX_CACHE_SIZE,
     ) -> None:
         super().__init__(
             max_results=max_results,
@@ -68,6 +89,10 @@ class BlenderDiscoverySearchTransform(BM25SearchTransform):
         )
         self._entry_map = entry_map or build_discovery_entry_map()
         self._contract_line = contract_line
+        self._documents: dict[str, _CachedDocument] = {}
+        self._document_revisions = itertools.count(1)
+        self._indexes: OrderedDict[frozenset[tuple[str, int]], _CachedIndex] = OrderedDict()
+        self._index_cache_size = max(1, index_cache_size)
 
     def _exact_match_tools(self, tools: Sequence[Tool], query: str) -> Sequence[Tool]:
         normalized_query = query.strip().lower()
@@ -109,21 +134,55 @@ class BlenderDiscoverySearchTransform(BM25SearchTransform):
         if exact_matches:
             return tuple(exact_matches[: self._max_results])
 
-        search_documents = build_search_documents(tools, entry_map=self._entry_map)
-        current_hash = _catalog_hash(search_documents)
-        if current_hash != self._last_hash:
-            documents = [search_documents[tool.name] for tool in tools]
-            index_cls = type(self._index)
-            new_index = index_cls(self._index.k1, self._index.b)
-            new_index.build(documents)
-            self._index, self._indexed_tools, self._last_hash = (
-                new_index,
-                tools,
-                current_hash,
-            )
-
-        indices = self._index.query(query, self._max_results)
-        return [self._indexed_tools[i] for i in indices]
+        cached = self._index_for(tools)
+        tools_by_name = {tool.name: tool for tool in tools}
+        indices = cached.index.query(query, self._max_results)
+        return [tools_by_name[cached.tool_names[i]] for i in indices]
+
+    def _document_for(self, tool: Tool) -> _CachedDocument:
+        """Return the tool's search document, rebuilding it only when the definition changed."""
+
+        cached = self._documents.get(tool.name)
+        if (
+            cached is not None
+            and cached.version == tool.version
+            and cached.description == tool.description
+            and (cached.parameters is tool.parameters or cached.parameters == tool.parameters)
+        ):
+            return cached
+        document = build_search_documents([tool], entry_map=self._entry_map)[tool.name]
+        cached = _CachedDocument(
+            version=tool.version,
+            description=tool.description,
+            parameters=tool.parameters,
+            document=document,
+            revision=next(self._document_revisions),
+        )
+        self._documents[tool.name] = cached
+        return cached
+
+    def _index_for(self, tools: Sequence[Tool]) -> _CachedIndex:
+        """Return the BM25 index for this visible tool set from a small LRU.
+
+        Sessions in different guided phases see different tool sets; keying by
+        the set (plus document revisions) lets them share indexes instead of
+        rebuilding a single one back and forth.
+        """
+
+        documents = [self._document_for(tool) for tool in tools]
+        fingerprint = frozenset((tool.name, document.revision) for tool, document in zip(tools, documents))
+        cached = self._indexes.get(fingerprint)
+        if cached is not None:
+            self._indexes.move_to_end(fingerprint)
+            return cached
+
+        index = type(self._index)(self._index.k1, self._index.b)
+        index.build([document.document for document in documents])
+        cached = _CachedIndex(index=index, tool_names=tuple(tool.name for tool in tools))
+        self._indexes[fingerprint] = cached
+        while len(self._indexes) > self._index_cache_size:
+            self._indexes.popitem(last=False)
+        return cached
 
     def _canonicalize_call_arguments(self, name: str, arguments: dict[str, Any] | None) -> dict[str, Any] | None:
         return canonicalize_guided_tool_arguments(name, arguments, contract_line=self._contract_line)
@@ -44,6 +44,7 @@ from server.adapters.mcp.session_state import set_session_value
 from server.adapters.mcp.transforms.visibility_policy import GUIDED_SPATIAL_SUPPORT_TOOLS, resolve_guided_tool_family
 from server.infrastructure.config import get_config
 from server.infrastructure.di import get_postcondition_registry, get_router, get_scene_handler, is_router_enabled
+from server.infrastructure.router_warmup import get_router_warmup
 from server.router.domain.entities.correction_policy import CorrectionCategory
 from server.router.infrastructure.logger import get_router_logger
 
@@ -1507,6 +1508,16 @@ def get_router_status() -> Dict[str, Any]:
             "message": "Router Supervisor is disabled. Set ROUTER_ENABLED=true to enable.",
         }
 
+    # Report warm-up progress without blocking on (or racing) the router stage
+    warmup = get_router_warmup()
+    if warmup is not None and warmup.is_pending("router"):
+        return {
+            "enabled": True,
+            "initialized": False,
+            "message": "Router warm-up in progress.",
+            "warmup": warmup.status(),
+        }
+
     router = get_router()
     if router is None:
         return {
@@ -1515,7 +1526,7 @@ def get_router_status() -> Dict[str, Any]:
             "message": "Router enabled but not initialized.",
         }
 
-    return {
+    status = {
         "enabled": True,
         "initialized": True,
         "ready": router.is_ready(),
@@ -1524,3 +1535,6 @@ def get_router_status() -> Dict[str, Any]:
         "config": str(router.get_config()),
         "assistant_diagnostics": router.get_assistant_diagnostics(),
     }
+    if warmup is not None:
+        status["warmup"] = warmup.status()
+    return status
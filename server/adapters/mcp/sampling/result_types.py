@@ -130,6 +130,7 @@ class VisionAssistContract(MCPContract):
     captures_used: list[str] = []
     input_summary: VisionInputSummaryContract | None = None
     boundary_policy: VisionBoundaryPolicyContract = VisionBoundaryPolicyContract()
+    cache_status: Literal["hit", "miss", "bypass"] | None = None
     truth_source: Literal["vision_assist"] = "vision_assist"
 
 
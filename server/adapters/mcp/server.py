@@ -14,6 +14,7 @@ import sys
 from server.adapters.mcp.factory import build_server
 from server.infrastructure.config import get_config
 from server.infrastructure.di import is_router_enabled
+from server.infrastructure.router_warmup import start_router_warmup
 
 logger = logging.getLogger(__name__)
 
@@ -42,8 +43,11 @@ def run(surface_profile: str | None = None):
     server = build_server(surface_profile=selected_surface)
     transport_mode = config.MCP_TRANSPORT_MODE
 
-    # Log router status (lazy loading via DI on first tool use)
-    if is_router_enabled():
+    # Log router status (lazy loading via DI on first tool use, unless warmed up)
+    if is_router_enabled() and config.ROUTER_WARMUP_ENABLED:
+        warmup = start_router_warmup()
+        logger.info("Router Supervisor ENABLED - background warm-up started (%s)", ", ".join(warmup.stage_names))
+    elif is_router_enabled():
         logger.info("Router Supervisor ENABLED - lazy loading via DI")
     else:
         logger.info("Router Supervisor DISABLED - direct tool execution mode")
@@ -8,11 +8,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from threading import Lock
 from time import time
+from typing import Callable
 
 from server.adapters.mcp.tasks.progress import (
     BackgroundProgressSnapshot,
     build_progress_snapshot,
 )
+from server.infrastructure.config import get_config
 
 BackgroundJobStatus = str
 TERMINAL_BACKGROUND_JOB_STATUSES = frozenset({"completed", "failed", "cancelled"})
@@ -59,22 +61,41 @@ class BackgroundJobRecord:
 
 
 class BackgroundJobRegistry:
-    """Thread-safe registry keyed by FastMCP ``task_id``."""
+    """Thread-safe registry keyed by FastMCP ``task_id``.
 
-    def __init__(self) -> None:
+    Active records are never dropped. Terminal records are retained for
+    ``terminal_ttl_seconds`` (0 keeps them until evicted) and capped at
+    ``max_terminal_records``, oldest first.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_terminal_records: int = 256,
+        terminal_ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time,
+    ) -> None:
         self._lock = Lock()
         self._jobs: dict[str, BackgroundJobRecord] = {}
+        self._max_terminal_records = max_terminal_records
+        self._terminal_ttl_seconds = terminal_ttl_seconds
+        self._clock = clock
 
     def register(self, *, task_id: str, tool_name: str, backend_kind: str) -> BackgroundJobRecord:
         """Create or replace the tracked state for a background task."""
 
+        now = self._clock()
         record = BackgroundJobRecord(
             task_id=task_id,
             tool_name=tool_name,
             backend_kind=backend_kind,
+            created_at=now,
+            updated_at=now,
         )
         with self._lock:
+            self._jobs.pop(task_id, None)
             self._jobs[task_id] = record
+            self._prune_terminal_locked()
         return record
 
     def bind_backend_job(self, task_id: str, backend_job_id: str) -> BackgroundJobRecord | None:
@@ -192,22 +213,44 @@ class BackgroundJobRegistry:
                 result_ref=changes.get("result_ref", current.result_ref),
                 error=changes.get("error", current.error),
                 created_at=current.created_at,
-                updated_at=time(),
+                updated_at=self._clock(),
             )
             self._jobs[task_id] = updated
+            if is_terminal_background_job_status(updated.status):
+                self._prune_terminal_locked()
             return updated
 
+    def _prune_terminal_locked(self) -> None:
+        terminal = sorted(
+            (record for record in self._jobs.values() if is_terminal_background_job_status(record.status)),
+            key=lambda record: record.updated_at,
+        )
+        excess = max(len(terminal) - self._max_terminal_records, 0)
+        cutoff = self._clock() - self._terminal_ttl_seconds if self._terminal_ttl_seconds > 0 else None
+        for index, record in enumerate(terminal):
+            if index < excess or (cutoff is not None and record.updated_at < cutoff):
+                del self._jobs[record.task_id]
 
-_JOB_REGISTRY = BackgroundJobRegistry()
 
+_JOB_REGISTRY: BackgroundJobRegistry | None = None
+_JOB_REGISTRY_LOCK = Lock()
 
-def get_background_job_registry() -> BackgroundJobRegistry:
-    """Return the shared background job registry."""
 
-    return _JOB_REGISTRY
+def get_background_job_registry() -> BackgroundJobRegistry:
+    """Return the shared background job registry, bounded by the active config."""
+
+    global _JOB_REGISTRY
+    with _JOB_REGISTRY_LOCK:
+        if _JOB_REGISTRY is None:
+            config = get_config()
+            _JOB_REGISTRY = BackgroundJobRegistry(
+                max_terminal_records=config.MCP_TASK_RESULT_MAX_ENTRIES,
+                terminal_ttl_seconds=config.MCP_TASK_RESULT_TTL_SECONDS,
+            )
+        return _JOB_REGISTRY
 
 
 def reset_background_job_registry_for_tests() -> None:
     """Clear shared registry state between tests."""
 
-    _JOB_REGISTRY.clear()
+    get_background_job_registry().clear()
@@ -1,14 +1,37 @@
 # SPDX-FileCopyrightText: 2024-2026 Patryk Ciechański
 # SPDX-License-Identifier: Apache-2.0
 
-"""In-memory result storage for background-capable task bookkeeping."""
+"""Bounded result storage for background-capable task bookkeeping.
+
+Completed payloads (base64 viewport renders, large inspection results) are
+kept under a resident byte budget with LRU + TTL eviction. Payloads at or above
+the spill threshold are pickled to a private temporary directory and only the
+reference stays in memory; spilled bytes have their own budget.
+"""
 
 from __future__ import annotations
 
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from threading import Lock
 from time import time
-from typing import Any
+from typing import Any, Callable
+
+from server.infrastructure.config import get_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RESIDENT_BYTES = 64 * 1024 * 1024
+DEFAULT_SPILL_THRESHOLD_BYTES = 256 * 1024
+DEFAULT_MAX_SPILL_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_ENTRIES = 256
 
 
 @dataclass(frozen=True)
@@ -22,12 +45,58 @@ class BackgroundResultRecord:
     created_at: float = field(default_factory=time)
 
 
+@dataclass
+class _StoredResult:
+    record: BackgroundResultRecord
+    size_bytes: int
+    spill_path: str | None = None
+
+
+def _encode_payload(payload: Any) -> tuple[bytes | None, int]:
+    """Return the pickled payload (None when unpicklable) and its size estimate."""
+
+    try:
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None, sys.getsizeof(payload)
+    return data, len(data)
+
+
+def _without_payload(record: BackgroundResultRecord) -> BackgroundResultRecord:
+    return BackgroundResultRecord(
+        result_ref=record.result_ref,
+        task_id=record.task_id,
+        tool_name=record.tool_name,
+        payload=None,
+        created_at=record.created_at,
+    )
+
+
 class BackgroundResultStore:
-    """Thread-safe in-memory result store keyed by stable ``result_ref``."""
+    """Thread-safe, byte-bounded result store keyed by stable ``result_ref``."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_resident_bytes: int = DEFAULT_MAX_RESIDENT_BYTES,
+        spill_threshold_bytes: int = DEFAULT_SPILL_THRESHOLD_BYTES,
+        max_spill_bytes: int = DEFAULT_MAX_SPILL_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time,
+    ) -> None:
         self._lock = Lock()
-        self._results: dict[str, BackgroundResultRecord] = {}
+        self._results: OrderedDict[str, _StoredResult] = OrderedDict()
+        self._max_resident_bytes = max_resident_bytes
+        self._spill_threshold_bytes = spill_threshold_bytes
+        self._max_spill_bytes = max_spill_bytes
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._spill_dir: tempfile.TemporaryDirectory[str] | None = None
+        self._resident_bytes = 0
+        self._spilled_bytes = 0
+        self._counters = {"evictions": 0, "expirations": 0, "spills": 0, "spill_failures": 0}
 
     def put(self, *, task_id: str, tool_name: str, payload: Any) -> BackgroundResultRecord:
         """Store a completed result and return its stable reference."""
@@ -37,34 +106,161 @@ class BackgroundResultStore:
             task_id=task_id,
             tool_name=tool_name,
             payload=payload,
+            created_at=self._clock(),
+        )
+        data, size_bytes = _encode_payload(payload)
+        spill_path = None
+        if data is not None and self._spill_threshold_bytes > 0 and size_bytes >= self._spill_threshold_bytes:
+            spill_path = self._write_spill(record.result_ref, data)
+
+        stored = _StoredResult(
+            record=record if spill_path is None else _without_payload(record),
+            size_bytes=size_bytes,
+            spill_path=spill_path,
         )
         with self._lock:
-            self._results[record.result_ref] = record
+            self._discard_locked(record.result_ref)
+            self._results[record.result_ref] = stored
+            self._account_locked(stored, 1)
+            self._expire_locked()
+            self._enforce_budgets_locked(keep=record.result_ref)
         return record
 
     def get(self, result_ref: str) -> BackgroundResultRecord | None:
-        """Return a stored result by reference."""
+        """Return a stored result by reference, loading spilled payloads from disk."""
 
         with self._lock:
-            return self._results.get(result_ref)
+            self._expire_locked()
+            stored = self._results.get(result_ref)
+            if stored is None:
+                return None
+            self._results.move_to_end(result_ref)
+            if stored.spill_path is None:
+                return stored.record
+            spill_path = stored.spill_path
+            record = stored.record
+
+        try:
+            with open(spill_path, "rb") as handle:
+                payload = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError) as exc:
+            logger.warning("Spilled task result %s could not be read: %s", result_ref, exc)
+            with self._lock:
+                current = self._results.get(result_ref)
+                if current is not None and current.spill_path == spill_path:
+                    self._discard_locked(result_ref)
+            return None
+        return BackgroundResultRecord(
+            result_ref=record.result_ref,
+            task_id=record.task_id,
+            tool_name=record.tool_name,
+            payload=payload,
+            created_at=record.created_at,
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        """Return resident/spilled byte counts and eviction counters."""
+
+        with self._lock:
+            return {
+                "entries": len(self._results),
+                "spilled_entries": sum(1 for stored in self._results.values() if stored.spill_path is not None),
+                "resident_bytes": self._resident_bytes,
+                "spilled_bytes": self._spilled_bytes,
+                **self._counters,
+            }
 
     def clear(self) -> None:
         """Remove all stored results."""
 
         with self._lock:
-            self._results.clear()
+            for result_ref in list(self._results):
+                self._discard_locked(result_ref)
+
+    def _write_spill(self, result_ref: str, data: bytes) -> str | None:
+        try:
+            if self._spill_dir is None:
+                self._spill_dir = tempfile.TemporaryDirectory(prefix="blender-ai-mcp-task-results-")
+            # Unique per write, so replacing a result never unlinks the new file.
+            file_name = f"{result_ref.replace(':', '_')}-{uuid.uuid4().hex}.pickle"
+            path = os.path.join(self._spill_dir.name, file_name)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "wb") as handle:
+                handle.write(data)
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to spill task result %s to disk; keeping it in memory: %s", result_ref, exc)
+            with self._lock:
+                self._counters["spill_failures"] += 1
+            return None
+        with self._lock:
+            self._counters["spills"] += 1
+        return path
+
+    def _account_locked(self, stored: _StoredResult, sign: int) -> None:
+        if stored.spill_path is None:
+            self._resident_bytes += sign * stored.size_bytes
+        else:
+            self._spilled_bytes += sign * stored.size_bytes
+
+    def _discard_locked(self, result_ref: str) -> _StoredResult | None:
+        stored = self._results.pop(result_ref, None)
+        if stored is None:
+            return None
+        self._account_locked(stored, -1)
+        if stored.spill_path is not None:
+            try:
+                os.unlink(stored.spill_path)
+            except OSError:
+                pass
+        return stored
+
+    def _expire_locked(self) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        cutoff = self._clock() - self._ttl_seconds
+        expired = [ref for ref, stored in self._results.items() if stored.record.created_at < cutoff]
+        for result_ref in expired:
+            self._discard_locked(result_ref)
+            self._counters["expirations"] += 1
+
+    def _enforce_budgets_locked(self, *, keep: str) -> None:
+        for result_ref in list(self._results):
+            too_many = len(self._results) > self._max_entries
+            over_resident = self._resident_bytes > self._max_resident_bytes
+            over_spill = self._spilled_bytes > self._max_spill_bytes
+            if not (too_many or over_resident or over_spill):
+                return
+            if result_ref == keep:
+                continue
+            spilled = self._results[result_ref].spill_path is not None
+            if too_many or (over_resident and not spilled) or (over_spill and spilled):
+                self._discard_locked(result_ref)
+                self._counters["evictions"] += 1
 
 
-_RESULT_STORE = BackgroundResultStore()
+_RESULT_STORE: BackgroundResultStore | None = None
+_RESULT_STORE_LOCK = Lock()
 
 
 def get_background_result_store() -> BackgroundResultStore:
-    """Return the shared background result store."""
+    """Return the shared background result store, sized from the active config."""
 
-    return _RESULT_STORE
+    global _RESULT_STORE
+    with _RESULT_STORE_LOCK:
+        if _RESULT_STORE is None:
+            config = get_config()
+            _RESULT_STORE = BackgroundResultStore(
+                max_resident_bytes=config.MCP_TASK_RESULT_MAX_BYTES,
+                spill_threshold_bytes=config.MCP_TASK_RESULT_SPILL_THRESHOLD_BYTES,
+                max_spill_bytes=config.MCP_TASK_RESULT_SPILL_MAX_BYTES,
+                ttl_seconds=config.MCP_TASK_RESULT_TTL_SECONDS,
+                max_entries=config.MCP_TASK_RESULT_MAX_ENTRIES,
+            )
+        return _RESULT_STORE
 
 
 def reset_background_result_store_for_tests() -> None:
     """Clear the shared result store between tests."""
 
-    _RESULT_STORE.clear()
+    get_background_result_store().clear()
@@ -21,6 +21,13 @@ from server.adapters.mcp.tasks.job_registry import (
 )
 from server.adapters.mcp.tasks.result_store import get_background_result_store
 from server.adapters.mcp.timeout_policy import MCPTimeoutPolicy, build_timeout_policy
+from server.application.services.background_jobs import (
+    JOB_POLL_INTERVAL_SECONDS,
+    JOB_PUSH_FALLBACK_POLL_SECONDS,
+    JobSnapshotStream,
+    close_job_snapshots,
+    subscribe_job_snapshots,
+)
 from server.infrastructure.config import get_config
 from server.infrastructure.di import get_rpc_client
 
@@ -103,6 +110,28 @@ async def _report_background_progress(
         logger.debug("Skipping MCP progress notification for %s/%s: %s", tool_name, task_id, exc)
 
 
+async def _subscribe_job_events(
+    rpc_client: Any,
+    job_id: str,
+    *,
+    deadline: float,
+    rpc_timeout_seconds: float,
+) -> JobSnapshotStream | None:
+    """Subscribe to pushed snapshots for ``job_id`` and deliver them to the running loop."""
+
+    if getattr(rpc_client, "subscribe_background_job", None) is None:
+        return None
+    return await asyncio.to_thread(
+        partial(
+            subscribe_job_snapshots,
+            rpc_client,
+            job_id,
+            timeout_seconds=min(_remaining_task_budget_seconds(deadline), rpc_timeout_seconds),
+            loop=asyncio.get_running_loop(),
+        )
+    )
+
+
 async def run_rpc_background_job(
     ctx: Context,
     *,
@@ -113,9 +142,17 @@ async def run_rpc_background_job(
     result_formatter: Callable[[Any], T],
     start_message: str,
     completion_message: str,
-    poll_interval_seconds: float = 0.25,
+    poll_interval_seconds: float = JOB_POLL_INTERVAL_SECONDS,
+    push_fallback_poll_seconds: float = JOB_PUSH_FALLBACK_POLL_SECONDS,
 ) -> T:
-    """Run an adopted Blender-backed operation in foreground or task mode."""
+    """Run an adopted Blender-backed operation in foreground or task mode.
+
+    In task mode the bridge subscribes to addon-pushed job snapshots and reacts
+    to progress/completion as soon as they arrive. While the push stream is
+    alive it only polls ``rpc.get_job`` every ``push_fallback_poll_seconds`` as
+    a safety net; without a stream (older addon, dropped connection) it falls
+    back to polling every ``poll_interval_seconds``.
+    """
 
     if not is_background_task_context(ctx):
         return foreground_executor()
@@ -157,8 +194,16 @@ async def run_rpc_background_job(
 
     registry.bind_backend_job(task_id, addon_job_id)
     poll_deadline = _monotonic_now() + float(policy.task_timeout_seconds)
+    events: JobSnapshotStream | None = None
 
     try:
+        events = await _subscribe_job_events(
+            rpc_client,
+            addon_job_id,
+            deadline=poll_deadline,
+            rpc_timeout_seconds=policy.rpc_timeout_seconds,
+        )
+        snapshot = events.initial_snapshot if events is not None else None
         while True:
             remaining_budget = _remaining_task_budget_seconds(poll_deadline)
             if remaining_budget <= 0:
@@ -177,19 +222,22 @@ async def run_rpc_background_job(
                 registry.mark_failed(task_id, cancel_error or error)
                 raise RuntimeError(cancel_error or error)
 
-            poll_response = await asyncio.to_thread(
-                partial(
-                    rpc_client.get_background_job_status,
-                    addon_job_id,
-                    timeout_seconds=remaining_budget,
+            if snapshot is None and events is not None and events.active:
+                snapshot = await events.next_snapshot_async(min(remaining_budget, push_fallback_poll_seconds))
+            if snapshot is None:
+                poll_response = await asyncio.to_thread(
+                    partial(
+                        rpc_client.get_background_job_status,
+                        addon_job_id,
+                        timeout_seconds=remaining_budget,
+                    )
                 )
-            )
-            if poll_response.status == "error":
-                error = poll_response.error or f"Polling failed for background job {addon_job_id}"
-                registry.mark_failed(task_id, error)
-                raise RuntimeError(error)
+                if poll_response.status == "error":
+                    error = poll_response.error or f"Polling failed for background job {addon_job_id}"
+                    registry.mark_failed(task_id, error)
+                    raise RuntimeError(error)
+                snapshot = poll_response.result if isinstance(poll_response.result, dict) else {}
 
-            snapshot = poll_response.result if isinstance(poll_response.result, dict) else {}
             status = str(snapshot.get("status") or "unknown")
             current = float(snapshot.get("progress_current", 0))
             total_raw = snapshot.get("progress_total")
@@ -262,7 +310,9 @@ async def run_rpc_background_job(
                 registry.mark_cancelled(task_id, error=error)
                 raise asyncio.CancelledError(error)
 
-            await asyncio.sleep(poll_interval_seconds)
+            snapshot = None
+            if events is None or not events.active:
+                await asyncio.sleep(poll_interval_seconds)
     except asyncio.CancelledError:
         cancel_response = await asyncio.to_thread(
             rpc_client.cancel_background_job,
@@ -274,6 +324,8 @@ async def run_rpc_background_job(
             error=cancel_error or f"Task {task_id} cancelled while waiting for Blender job {addon_job_id}",
         )
         raise
+    finally:
+        close_job_snapshots(rpc_client, events)
 
 
 async def run_local_background_operation(
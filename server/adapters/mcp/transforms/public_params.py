@@ -46,6 +46,7 @@ HIDDEN_ARGUMENTS: dict[tuple[str, str], set[str]] = {
         "selected_only",
         "uv_layer",
         "include_deltas",
+        "layout",
         "assistant_summary",
     },
     (
@@ -35,6 +35,7 @@ from .config import (
     VisionExternalProviderName,
     VisionMLXLocalConfig,
     VisionOpenAICompatibleConfig,
+    VisionResultCacheConfig,
     VisionRuntimeConfig,
     VisionSegmentationProviderName,
     VisionSegmentationSidecarConfig,
@@ -51,6 +52,7 @@ from .evaluation import (
 )
 from .policy import choose_capture_preset_profile, choose_reference_target_view, infer_capture_preset_profile
 from .reporting import attach_vision_artifacts
+from .result_cache import VisionResultCache
 from .runtime import LazyVisionBackendResolver, build_vision_runtime_config
 
 _RUNNER_EXPORTS = {
@@ -91,6 +93,8 @@ __all__ = [
     "VisionSegmentationProviderName",
     "VisionSegmentationSidecarConfig",
     "VisionRequest",
+    "VisionResultCache",
+    "VisionResultCacheConfig",
     "VisionRuntimeConfig",
     "VisionTransformersLocalConfig",
     "VISION_ASSIST_POLICY",
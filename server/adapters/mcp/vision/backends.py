@@ -16,8 +16,11 @@ from typing import Any
 
 import httpx
 
+from server.infrastructure.file_handoff import mapped_file
+
 from .backend import VisionBackend, VisionBackendUnavailableError, VisionRequest
 from .config import VisionContractProfile, VisionRuntimeConfig
+from .http_pool import VisionHttpPool, get_vision_http_pool
 from .parsing import diagnose_vision_output_text, parse_vision_output_text
 from .prompting import (
     _is_reference_understanding_request,
@@ -37,9 +40,14 @@ def _media_type_for(path: str, fallback: str) -> str:
     return guessed or fallback
 
 
+def _image_to_base64(path: str) -> str:
+    # Encode straight from the mapped file pages instead of an intermediate bytes copy.
+    with mapped_file(path) as raw:
+        return base64.b64encode(raw).decode("ascii")
+
+
 def _image_to_data_url(path: str, media_type: str) -> str:
-    raw = Path(path).read_bytes()
-    encoded = base64.b64encode(raw).decode("ascii")
+    encoded = _image_to_base64(path)
     return f"data:{media_type};base64,{encoded}"
 
 
@@ -673,6 +681,16 @@ class OpenAICompatibleVisionBackend(VisionBackend):
                 headers["X-Title"] = self._external_config.site_name
         return headers
 
+    def _http_pool(self) -> VisionHttpPool:
+        """Return the shared keep-alive pool for this provider endpoint."""
+
+        return get_vision_http_pool(
+            f"{self._external_config.provider_name}:{(self._external_config.base_url or '').rstrip('/')}",
+            timeout_seconds=self._runtime_config.timeout_seconds,
+            max_concurrency=self._external_config.max_concurrency,
+            http2=self._external_config.http2,
+        )
+
     def _build_request_payload(self, request: VisionRequest) -> dict[str, Any]:
         vision_contract_profile = self._external_config.vision_contract_profile
         if self._external_config.provider_name == "google_ai_studio":
@@ -687,7 +705,7 @@ class OpenAICompatibleVisionBackend(VisionBackend):
             ]
             for image in request.images:
                 media_type = _media_type_for(image.path, image.media_type)
-                encoded = base64.b64encode(Path(image.path).read_bytes()).decode("ascii")
+                encoded = _image_to_base64(image.path)
                 parts.append(
                     {
                         "inline_data": {
@@ -800,7 +818,6 @@ class OpenAICompatibleVisionBackend(VisionBackend):
         elif api_key:
             headers["Authorization"] = f"Bearer {api_key}"
 
-        timeout = httpx.Timeout(self._runtime_config.timeout_seconds)
         payload = self._build_request_payload(request)
         endpoint_url = self._endpoint_url()
         payload_summary = _request_payload_summary(
@@ -814,14 +831,7 @@ class OpenAICompatibleVisionBackend(VisionBackend):
         )
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    endpoint_url,
-                    json=payload,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                parsed_response = response.json()
+            parsed_response = await self._http_pool().post_json(endpoint_url, payload=payload, headers=headers)
         except httpx.HTTPStatusError as exc:
             response = exc.response
             logger.error(
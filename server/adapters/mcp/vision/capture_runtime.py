@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import base64
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Literal
 
 from server.adapters.mcp.contracts.scene import SceneAssembledTargetScopeContract
@@ -14,11 +15,19 @@ from server.adapters.mcp.contracts.vision import (
     VisionCaptureBundleContract,
     VisionCaptureImageContract,
 )
+from server.infrastructure.file_handoff import (
+    file_handoff_enabled,
+    record_handoff_failure,
+    verify_handoff_file,
+)
 from server.infrastructure.tmp_paths import get_viewport_output_paths
 
 CaptureStage = Literal["before", "after"]
 CapturePresetProfile = Literal["compact", "rich"]
 
+# Addon job budget for `scene.capture_view_set`, scaled by the number of views.
+VIEW_SET_TIMEOUT_PER_VIEW_SECONDS = 15.0
+
 
 @dataclass(frozen=True, slots=True)
 class CapturePresetSpec:
@@ -196,11 +205,22 @@ def capture_stage_images(
     """Capture one deterministic stage view-set using the current viewport API."""
 
     resolved_preset_specs = preset_specs or resolve_capture_preset_specs(preset_profile)
+    normalized_target_objects = [name for name in list(target_objects or []) if str(name).strip()]
+    isolate_names = normalized_target_objects or ([target_object] if target_object else [])
+    view_set_captures = _capture_view_set(
+        scene_handler,
+        bundle_id=bundle_id,
+        stage=stage,
+        target_object=target_object,
+        isolate_names=isolate_names,
+        preset_specs=resolved_preset_specs,
+    )
+    if view_set_captures is not None:
+        return view_set_captures
+
     original_state = capture_scene_state(scene_handler)
     captures: list[VisionCaptureImageContract] = []
     try:
-        normalized_target_objects = [name for name in list(target_objects or []) if str(name).strip()]
-        isolate_names = normalized_target_objects or ([target_object] if target_object else [])
         for preset in resolved_preset_specs:
             focus_target = target_object if preset.focus_target else None
             if preset is not resolved_preset_specs[0]:
@@ -231,37 +251,152 @@ def capture_stage_images(
                         )
                     except Exception:
                         pass
-            b64_data = scene_handler.get_viewport(
-                width=preset.width,
-                height=preset.height,
-                shading=preset.shading,
-                camera_name=None,
-                focus_target=focus_target,
-            )
-            filename = f"{bundle_id}_{stage}_{preset.name}.jpg"
-            latest_name = f"{bundle_id}_{stage}_{preset.name}_latest.jpg"
-            internal_file, _internal_latest, external_file, _external_latest = get_viewport_output_paths(
-                filename,
-                latest_name=latest_name,
-            )
-            internal_file.write_bytes(base64.b64decode(b64_data))
-
-            captures.append(
-                VisionCaptureImageContract(
-                    label=f"{preset.name}_{stage}",
-                    image_path=str(internal_file),
-                    host_visible_path=external_file,
-                    preset_name=preset.name,
-                    media_type="image/jpeg",
-                    view_kind=preset.view_kind,
+            internal_file, external_file = _stage_output_paths(bundle_id, stage, preset)
+            if not _capture_to_shared_file(scene_handler, preset, focus_target, internal_file, external_file):
+                b64_data = scene_handler.get_viewport(
+                    width=preset.width,
+                    height=preset.height,
+                    shading=preset.shading,
+                    camera_name=None,
+                    focus_target=focus_target,
                 )
-            )
+                internal_file.write_bytes(base64.b64decode(b64_data))
+
+            captures.append(_capture_contract(stage, preset, internal_file, external_file))
     finally:
         restore_scene_state(scene_handler, original_state)
 
     return captures
 
 
+def _stage_output_paths(bundle_id: str, stage: CaptureStage, preset: CapturePresetSpec) -> tuple[Path, str]:
+    filename = f"{bundle_id}_{stage}_{preset.name}.jpg"
+    latest_name = f"{bundle_id}_{stage}_{preset.name}_latest.jpg"
+    internal_file, _internal_latest, external_file, _external_latest = get_viewport_output_paths(
+        filename,
+        latest_name=latest_name,
+    )
+    return internal_file, external_file
+
+
+def _capture_contract(
+    stage: CaptureStage,
+    preset: CapturePresetSpec,
+    internal_file: Path,
+    external_file: str,
+) -> VisionCaptureImageContract:
+    return VisionCaptureImageContract(
+        label=f"{preset.name}_{stage}",
+        image_path=str(internal_file),
+        host_visible_path=external_file,
+        preset_name=preset.name,
+        media_type="image/jpeg",
+        view_kind=preset.view_kind,
+    )
+
+
+def _capture_view_set(
+    scene_handler,
+    *,
+    bundle_id: str,
+    stage: CaptureStage,
+    target_object: str | None,
+    isolate_names: list[str],
+    preset_specs: tuple[CapturePresetSpec, ...],
+) -> list[VisionCaptureImageContract] | None:
+    """Render the whole stage in one `scene.capture_view_set` addon job.
+
+    Returns None when the handler or addon cannot run the job, so the caller
+    falls back to the per-preset RPC sequence. A file handoff that does not
+    verify is retried once with inline base64 images and switches ``auto``
+    handoff off for the process, so later stages render only once.
+    """
+
+    if not hasattr(scene_handler, "capture_view_set"):
+        return None
+    paths = [_stage_output_paths(bundle_id, stage, preset) for preset in preset_specs]
+    for handoff in (True, False) if file_handoff_enabled() else (False,):
+        presets = [
+            {
+                "name": preset.name,
+                "width": preset.width,
+                "height": preset.height,
+                "shading": preset.shading,
+                "focus_target": preset.focus_target,
+                "isolate_target": preset.isolate_target,
+                "focus_zoom_factor": preset.focus_zoom_factor,
+                "standard_view": preset.standard_view,
+                "orbit_horizontal": preset.orbit_horizontal,
+                "orbit_vertical": preset.orbit_vertical,
+                "output_path": external_file if handoff else None,
+            }
+            for preset, (_internal_file, external_file) in zip(preset_specs, paths)
+        ]
+        try:
+            result = scene_handler.capture_view_set(
+                presets,
+                target_object=target_object,
+                isolate_objects=isolate_names or None,
+                timeout_seconds=VIEW_SET_TIMEOUT_PER_VIEW_SECONDS * len(presets),
+            )
+        except Exception:
+            return None
+        items = result.get("captures") if isinstance(result, dict) else None
+        if not isinstance(items, list) or len(items) != len(preset_specs):
+            return None
+
+        unverified: list[tuple[str, Path]] = []
+        for item, (internal_file, external_file) in zip(items, paths):
+            if not isinstance(item, dict):
+                return None
+            if item.get("image_base64"):
+                internal_file.write_bytes(base64.b64decode(item["image_base64"]))
+            elif not verify_handoff_file(internal_file, size=item.get("size"), sha256=item.get("sha256")):
+                unverified.append((str(item.get("path") or external_file), internal_file))
+        if unverified:
+            record_handoff_failure([addon_path for addon_path, _ in unverified], [local for _, local in unverified])
+        else:
+            return [
+                _capture_contract(stage, preset, internal_file, external_file)
+                for preset, (internal_file, external_file) in zip(preset_specs, paths)
+            ]
+    return None
+
+
+def _capture_to_shared_file(
+    scene_handler,
+    preset: CapturePresetSpec,
+    focus_target: str | None,
+    internal_file: Path,
+    external_file: str,
+) -> bool:
+    """Let the addon render straight into the shared output path; False means use inline base64.
+
+    A file that does not verify switches ``auto`` handoff off for the process, so later
+    captures go straight to inline base64 instead of rendering twice.
+    """
+
+    if not file_handoff_enabled() or not hasattr(scene_handler, "get_viewport_file"):
+        return False
+    try:
+        result = scene_handler.get_viewport_file(
+            external_file,
+            width=preset.width,
+            height=preset.height,
+            shading=preset.shading,
+            camera_name=None,
+            focus_target=focus_target,
+        )
+    except Exception:
+        return False
+    if not isinstance(result, dict):
+        return False
+    if verify_handoff_file(internal_file, size=result.get("size"), sha256=result.get("sha256")):
+        return True
+    record_handoff_failure([str(result.get("path") or external_file)], [internal_file])
+    return False
+
+
 def capture_scene_state(scene_handler) -> CaptureSceneState:
     """Capture best-effort reversible scene/view state for bounded capture flows.
 
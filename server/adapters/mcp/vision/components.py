@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2024-2026 Patryk Ciechański
+# SPDX-License-Identifier: Apache-2.0
+
+"""Vectorized 4-connected component labeling for binary silhouette masks.
+
+Masks are run-length encoded per row, overlapping runs on adjacent rows are
+paired with ``searchsorted``, and runs are merged with a vectorized
+hook-and-compress union-find. All work is NumPy array operations over runs,
+so cost scales with the number of runs instead of foreground pixels.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+_MEMO_SIZE = 16
+_memo: OrderedDict[tuple[bytes, tuple[int, ...], int | None], np.ndarray] = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RunLabels:
+    """Row runs of a mask and the component each run belongs to.
+
+    ``rows``/``starts``/``ends`` describe ``mask[row, start:end]`` runs in
+    row-major order; ``labels`` holds the smallest run index of each run's
+    component, so labels order components by their first pixel.
+    """
+
+    shape: tuple[int, int]
+    rows: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+    labels: np.ndarray
+
+
+def _encode_runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return rows, starts, ends
+
+
+def _overlap_pairs(rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, width: int) -> tuple[np.ndarray, np.ndarray]:
+    """Pair every run with the runs it touches on the row above."""
+
+    stride = width + 1
+    end_keys = rows * stride + ends
+    start_keys = rows * stride + starts
+    upper_row = (rows - 1) * stride
+    first = np.searchsorted(end_keys, upper_row + starts, side="right")
+    stop = np.searchsorted(start_keys, upper_row + ends, side="left")
+    counts = np.maximum(stop - first, 0)
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    lower = np.repeat(np.arange(rows.size), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    upper = np.repeat(first, counts) + offsets
+    return upper, lower
+
+
+def _union_find(size: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    parent = np.arange(size)
+    while left.size:
+        root_left = parent[left]
+        root_right = parent[right]
+        pending = root_left != root_right
+        if not bool(pending.any()):
+            break
+        left, right = left[pending], right[pending]
+        low = np.minimum(root_left[pending], root_right[pending])
+        high = np.maximum(root_left[pending], root_right[pending])
+        np.minimum.at(parent, high, low)
+        while True:
+            compressed = parent[parent]
+            if np.array_equal(compressed, parent):
+                break
+            parent = compressed
+    return parent
+
+
+def label_runs(mask: np.ndarray) -> RunLabels:
+    """Label the 4-connected components of a 2D boolean mask by row runs."""
+
+    mask = np.asarray(mask, dtype=bool)
+    if mask.ndim != 2:
+        raise ValueError("label_runs expects a 2D mask")
+    rows, starts, ends = _encode_runs(mask)
+    upper, lower = _overlap_pairs(rows, starts, ends, mask.shape[1])
+    labels = _union_find(rows.size, upper, lower)
+    return RunLabels(shape=mask.shape, rows=rows, starts=starts, ends=ends, labels=labels)
+
+
+def _paint_runs(shape: tuple[int, int], rows: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    height, width = shape
+    stride = width + 1
+    coverage = np.zeros(height * stride + 1, dtype=np.int32)
+    np.add.at(coverage, rows * stride + starts, 1)
+    np.add.at(coverage, rows * stride + ends, -1)
+    return np.ascontiguousarray((np.cumsum(coverage[:-1]) > 0).reshape(height, stride)[:, :width])
+
+
+def _largest_from_runs(runs: RunLabels, weights: np.ndarray | None = None) -> np.ndarray:
+    if runs.rows.size == 0:
+        return np.zeros(runs.shape, dtype=bool)
+    if weights is None:
+        weights = runs.ends - runs.starts
+    sizes = np.bincount(runs.labels, weights=weights, minlength=runs.rows.size)
+    selected = runs.labels == int(np.argmax(sizes))
+    return _paint_runs(runs.shape, runs.rows[selected], runs.starts[selected], runs.ends[selected])
+
+
+def _block_reduce(mask: np.ndarray, block: int) -> tuple[np.ndarray, np.ndarray]:
+    height, width = mask.shape
+    padded_height = -(-height // block) * block
+    padded_width = -(-width // block) * block
+    padded = np.zeros((padded_height, padded_width), dtype=bool)
+    padded[:height, :width] = mask
+    blocks = padded.reshape(padded_height // block, block, padded_width // block, block)
+    counts = blocks.sum(axis=(1, 3))
+    return counts > 0, counts
+
+
+def _memo_key(mask: np.ndarray, max_side: int | None) -> tuple[bytes, tuple[int, ...], int | None]:
+    digest = hashlib.blake2b(np.packbits(mask).tobytes(), digest_size=16).digest()
+    return digest, mask.shape, max_side
+
+
+def _remember(key: tuple[bytes, tuple[int, ...], int | None], component: np.ndarray) -> None:
+    with _memo_lock:
+        _memo[key] = component
+        _memo.move_to_end(key)
+        while len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+
+
+def largest_component(mask: np.ndarray, *, max_side: int | None = None) -> np.ndarray:
+    """Return the largest 4-connected component of ``mask`` as a boolean mask.
+
+    Ties go to the component whose first pixel comes first in row-major order.
+    Results are memoized per mask content; the returned component is also
+    remembered as its own largest component, so re-scoring it is free.
+
+    Args:
+        mask: 2D boolean mask.
+        max_side: Optional downsample-first mode. When the mask's longer side
+            exceeds it, components are labeled on a block-max-pooled mask and
+            the winner is mapped back onto the full-resolution pixels. Faster,
+            but pixels bridged only through a shared block may be merged.
+
+    Returns:
+        Boolean mask of the same shape.
+    """
+
+    mask = np.asarray(mask, dtype=bool)
+    if mask.ndim != 2 or not bool(mask.any()):
+        return np.zeros(mask.shape, dtype=bool)
+
+    key = _memo_key(mask, max_side)
+    with _memo_lock:
+        cached = _memo.get(key)
+        if cached is not None:
+            _memo.move_to_end(key)
+            return cached.copy()
+
+    block = 1
+    if max_side is not None and max_side > 0:
+        block = -(-max(mask.shape) // max_side)
+
+    if block <= 1:
+        component = _largest_from_runs(label_runs(mask))
+    else:
+        reduced, counts = _block_reduce(mask, block)
+        runs = label_runs(reduced)
+        row_totals = np.zeros((counts.shape[0], counts.shape[1] + 1), dtype=np.int64)
+        np.cumsum(counts, axis=1, out=row_totals[:, 1:])
+        weights = row_totals[runs.rows, runs.ends] - row_totals[runs.rows, runs.starts]
+        reduced_component = _largest_from_runs(runs, weights)
+        expanded = np.repeat(np.repeat(reduced_component, block, axis=0), block, axis=1)
+        component = np.logical_and(expanded[: mask.shape[0], : mask.shape[1]], mask)
+
+    component.setflags(write=False)
+    _remember(key, component)
+    if max_side is None:
+        _remember(_memo_key(component, max_side), component)
+    return component.copy()
+
+
+def clear_component_memo() -> None:
+    """Drop memoized labeling results."""
+
+    with _memo_lock:
+        _memo.clear()
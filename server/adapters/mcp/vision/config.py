@@ -65,6 +65,8 @@ class VisionOpenAICompatibleConfig(BaseModel):
     require_parameters: bool = False
     enable_response_healing: bool = True
     prefer_json_object_for_qwen: bool = True
+    max_concurrency: int = Field(default=4, ge=1)
+    http2: bool = False
     model_capabilities: VisionModelCapabilities | None = None
 
     @model_validator(mode="after")
@@ -95,6 +97,18 @@ class VisionMLXLocalConfig(BaseModel):
         return self
 
 
+class VisionResultCacheConfig(BaseModel):
+    """Configuration for the content-addressed vision result cache."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = True
+    cache_dir: str | None = None
+    ttl_seconds: float = Field(default=86400.0, gt=0)
+    max_memory_entries: int = Field(default=64, ge=1)
+    max_disk_bytes: int = Field(default=64 * 1024 * 1024, ge=0)
+
+
 class VisionRuntimeConfig(BaseModel):
     """Top-level runtime configuration for bounded vision assistance."""
 
@@ -110,6 +124,7 @@ class VisionRuntimeConfig(BaseModel):
     mlx_local: VisionMLXLocalConfig | None = None
     openai_compatible_external: VisionOpenAICompatibleConfig | None = None
     segmentation_sidecar: "VisionSegmentationSidecarConfig | None" = None
+    result_cache: VisionResultCacheConfig = VisionResultCacheConfig()
 
     @property
     def effective_max_tokens(self) -> int:
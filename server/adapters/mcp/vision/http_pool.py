@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: 2024-2026 Patryk Ciechański
+# SPDX-License-Identifier: Apache-2.0
+
+"""Shared HTTP connection pools for external vision backends.
+
+Vision backends are resolved per call, so connection reuse cannot live on the
+backend instance. Pools are shared per provider endpoint instead and keep one
+keep-alive ``httpx.AsyncClient`` per running event loop (an async client is
+bound to the loop it first ran on). A loop's client is closed when the loop
+shuts down its async generators (as ``asyncio.run`` does), and state for
+closed loops is dropped on the next request. Each pool also:
+
+- caps concurrent requests per provider with a semaphore
+- coalesces identical in-flight requests (same endpoint, headers, and payload,
+  i.e. same prompt and images) into one upstream call
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import importlib.util
+import json
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+_pools: dict[tuple[Any, ...], "VisionHttpPool"] = {}
+_pools_lock = threading.Lock()
+
+
+def request_fingerprint(url: str, payload: Any, headers: dict[str, str] | None) -> str:
+    """Return a stable hash identifying one outbound JSON request."""
+
+    digest = hashlib.sha256()
+    digest.update(url.encode("utf-8"))
+    digest.update(json.dumps(sorted((headers or {}).items())).encode("utf-8"))
+    digest.update(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class _LoopState:
+    client: Any
+    semaphore: asyncio.Semaphore
+    inflight: dict[str, asyncio.Future] = field(default_factory=dict)
+    closer: AsyncGenerator[None, None] | None = None
+
+
+async def _close_client_on_loop_shutdown(client: Any) -> AsyncGenerator[None, None]:
+    """Suspend until the loop finalizes async generators, then close ``client``."""
+
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+class VisionHttpPool:
+    """Keep-alive client pool with per-provider concurrency cap and request coalescing."""
+
+    def __init__(self, *, timeout_seconds: float, max_concurrency: int = 4, http2: bool = False) -> None:
+        self._timeout_seconds = timeout_seconds
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._http2 = bool(http2) and self._http2_supported()
+        self._states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = weakref.WeakKeyDictionary()
+        self._stats = {"requests": 0, "upstream_requests": 0, "coalesced": 0, "clients_created": 0}
+
+    @staticmethod
+    def _http2_supported() -> bool:
+        if importlib.util.find_spec("h2") is not None:
+            return True
+        logger.warning("HTTP/2 requested for vision backend but the 'h2' package is not installed; using HTTP/1.1.")
+        return False
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def http2(self) -> bool:
+        return self._http2
+
+    def get_stats(self) -> dict[str, int]:
+        """Return request/coalescing counters for diagnostics and tests."""
+
+        return dict(self._stats)
+
+    def _create_client(self) -> Any:
+        limits = httpx.Limits(
+            max_connections=self._max_concurrency,
+            max_keepalive_connections=self._max_concurrency,
+            keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        kwargs: dict[str, Any] = {"timeout": httpx.Timeout(self._timeout_seconds), "limits": limits}
+        if self._http2:
+            kwargs["http2"] = True
+        self._stats["clients_created"] += 1
+        return httpx.AsyncClient(**kwargs)
+
+    async def _loop_state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None or state.client.is_closed:
+            self._forget_closed_loops()
+            state = _LoopState(client=self._create_client(), semaphore=asyncio.Semaphore(self._max_concurrency))
+            # Starting the generator registers it with this loop, so loop shutdown
+            # (``shutdown_asyncgens``) closes the client and its sockets.
+            state.closer = _close_client_on_loop_shutdown(state.client)
+            await state.closer.__anext__()
+            self._states[loop] = state
+        return state
+
+    def _forget_closed_loops(self) -> None:
+        # The state (futures, semaphore) references its loop, so weak keys alone never expire.
+        for loop in [loop for loop in self._states if loop.is_closed()]:
+            self._states.pop(loop, None)
+
+    async def post_json(self, url: str, *, payload: Any, headers: dict[str, str] | None = None) -> Any:
+        """POST ``payload`` as JSON and return the decoded JSON response.
+
+        Identical requests already in flight on this loop share one upstream
+        call; each caller receives its own copy of the decoded body. HTTP
+        errors propagate as the usual ``httpx`` exceptions.
+        """
+
+        state = await self._loop_state()
+        self._stats["requests"] += 1
+        key = request_fingerprint(url, payload, headers)
+        task = state.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(state, url, payload, headers))
+            state.inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(state, key, done))
+        else:
+            self._stats["coalesced"] += 1
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    @staticmethod
+    def _finish(state: _LoopState, key: str, done: asyncio.Future) -> None:
+        state.inflight.pop(key, None)
+        if not done.cancelled():
+            done.exception()  # mark retrieved even when every waiter was cancelled
+
+    async def _send(self, state: _LoopState, url: str, payload: Any, headers: dict[str, str] | None) -> Any:
+        async with state.semaphore:
+            self._stats["upstream_requests"] += 1
+            response = await state.client.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            return response.json()
+
+    async def aclose(self) -> None:
+        """Close the client bound to the running loop, if any."""
+
+        state = self._states.pop(asyncio.get_running_loop(), None)
+        if state is not None and state.closer is not None:
+            await state.closer.aclose()
+
+
+def get_vision_http_pool(
+    endpoint_key: str,
+    *,
+    timeout_seconds: float,
+    max_concurrency: int = 4,
+    http2: bool = False,
+) -> VisionHttpPool:
+    """Return the process-wide pool for one provider endpoint and client settings."""
+
+    key = (endpoint_key, float(timeout_seconds), int(max_concurrency), bool(http2))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = VisionHttpPool(timeout_seconds=timeout_seconds, max_concurrency=max_concurrency, http2=http2)
+            _pools[key] = pool
+        return pool
+
+
+def reset_vision_http_pools() -> None:
+    """Forget all shared pools (tests and config reloads)."""
+
+    with _pools_lock:
+        _pools.clear()
@@ -0,0 +1,232 @@
+# SPDX-FileCopyrightText: 2024-2026 Patryk Ciechański
+# SPDX-License-Identifier: Apache-2.0
+
+"""Content-addressed cache for bounded vision results.
+
+Agents often re-run a checkpoint without changing the scene, which produces
+byte-identical captures. Results are keyed by the SHA-256 of every image's
+bytes, the rendered prompt for the active contract profile, and the backend
+model, so a repeat request skips local inference or a paid external call.
+
+Entries live in an in-memory LRU and, when ``cache_dir`` is configured, in a
+size-bounded on-disk LRU (one JSON file per key, recency tracked by mtime).
+Both layers honour the configured TTL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from server.infrastructure.file_handoff import file_sha256
+
+from .backend import VisionRequest
+from .config import VisionResultCacheConfig, VisionRuntimeConfig
+from .prompting import build_local_vision_payload_text, build_vision_payload_text, build_vision_system_prompt
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FORMAT_VERSION = 1
+
+
+def vision_prompt_fingerprint(request: VisionRequest, runtime_config: VisionRuntimeConfig) -> str:
+    """Hash the system prompt and payload text the active backend would send."""
+
+    profile = runtime_config.active_vision_contract_profile
+    external = runtime_config.openai_compatible_external
+    provider_name = external.provider_name if external is not None else None
+    if runtime_config.provider == "openai_compatible_external":
+        payload_text = build_vision_payload_text(request, vision_contract_profile=profile, provider_name=provider_name)
+    else:
+        payload_text = build_local_vision_payload_text(request)
+    system_prompt = build_vision_system_prompt(
+        backend_kind=runtime_config.provider,
+        vision_contract_profile=profile,
+        provider_name=provider_name,
+        request=request,
+    )
+    digest = hashlib.sha256()
+    digest.update(system_prompt.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(payload_text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class VisionResultCache:
+    """Memory + disk LRU of vision payloads keyed by image and prompt content."""
+
+    def __init__(self, config: VisionResultCacheConfig, *, clock: Callable[[], float] = time.time) -> None:
+        self._config = config
+        self._clock = clock
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_dir = Path(config.cache_dir).expanduser() if config.cache_dir else None
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def build_key(
+        self,
+        request: VisionRequest,
+        runtime_config: VisionRuntimeConfig,
+        *,
+        backend_kind: str,
+        model_name: str,
+    ) -> str | None:
+        """Return the cache key for a request, or None when an image cannot be hashed."""
+
+        images = []
+        for image in request.images:
+            try:
+                image_hash = file_sha256(image.path)
+            except OSError:
+                return None
+            images.append([image_hash, image.role, image.label, image.media_type])
+
+        material = {
+            "version": _CACHE_FORMAT_VERSION,
+            "backend_kind": backend_kind,
+            "model_name": model_name,
+            "contract_profile": runtime_config.active_vision_contract_profile,
+            "max_tokens": runtime_config.effective_max_tokens,
+            "prompt": vision_prompt_fingerprint(request, runtime_config),
+            "request": {
+                "goal": request.goal,
+                "target_object": request.target_object,
+                "prompt_hint": request.prompt_hint,
+                "truth_summary": request.truth_summary,
+                "metadata": request.metadata,
+            },
+            "images": images,
+        }
+        encoded = json.dumps(material, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a cached payload copy, or None on miss/expiry."""
+
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, payload = entry
+                if now - created_at <= self._config.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return json.loads(json.dumps(payload))
+                del self._memory[key]
+
+        disk_entry = self._read_disk(key, now)
+        with self._lock:
+            if disk_entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._remember(key, *disk_entry)
+            self._stats["hits"] += 1
+            self._stats["disk_hits"] += 1
+        # The decoded payload is now the memory entry; callers get their own copy
+        return json.loads(json.dumps(disk_entry[1]))
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        """Store one successful payload in memory and (when configured) on disk."""
+
+        try:
+            encoded = json.dumps({"created_at": self._clock(), "payload": payload}, sort_keys=True)
+        except (TypeError, ValueError):
+            logger.debug("Vision payload is not JSON-serializable; skipping result cache")
+            return
+        stored = json.loads(encoded)
+        with self._lock:
+            self._remember(key, stored["created_at"], stored["payload"])
+            self._stats["stores"] += 1
+        self._write_disk(key, encoded)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and current sizes."""
+
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        stats["disk_enabled"] = self._cache_dir is not None
+        return stats
+
+    def _remember(self, key: str, created_at: float, payload: dict[str, Any]) -> None:
+        self._memory[key] = (created_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._config.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _entry_path(self, key: str) -> Path | None:
+        return self._cache_dir / f"{key}.json" if self._cache_dir is not None else None
+
+    def _read_disk(self, key: str, now: float) -> tuple[float, dict[str, Any]] | None:
+        path = self._entry_path(key)
+        if path is None:
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            created_at = float(data["created_at"])
+            payload = data["payload"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            path.unlink(missing_ok=True)
+            return None
+        if now - created_at > self._config.ttl_seconds or not isinstance(payload, dict):
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return created_at, payload
+
+    def _write_disk(self, key: str, encoded: str) -> None:
+        path = self._entry_path(key)
+        if path is None or self._config.max_disk_bytes <= 0:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_text(encoded, encoding="utf-8")
+            os.replace(temp_path, path)
+            self._prune_disk()
+        except OSError as exc:
+            logger.warning("Failed to persist vision result cache entry: %s", exc)
+
+    def _prune_disk(self) -> None:
+        if self._cache_dir is None:
+            return
+        entries = []
+        total = 0
+        for path in self._cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self._config.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop all memory and disk entries."""
+
+        with self._lock:
+            self._memory.clear()
+        if self._cache_dir is not None and self._cache_dir.is_dir():
+            for path in self._cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
@@ -125,6 +125,28 @@ async def run_vision_assist(
         "local_runtime" if backend.backend_kind in {"transformers_local", "mlx_local"} else "external_runtime",
     )
 
+    cache = resolver.result_cache
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.build_key(
+            request,
+            runtime,
+            backend_kind=backend.backend_kind,
+            model_name=backend.model_name,
+        )
+    cached_payload = cache.get(cache_key) if cache is not None and cache_key is not None else None
+    if cached_payload is not None:
+        cached_payload["cache_status"] = "hit"
+        return AssistantRunResult(
+            status="success",
+            assistant_name=VISION_ASSIST_POLICY.assistant_name,
+            message="vision_assist completed.",
+            budget=budget,
+            request_id=request_id,
+            capability_source=capability_source,
+            result=to_contract(VisionAssistContract, cached_payload),
+        )
+
     try:
         payload = await backend.analyze(request)
     except VisionBackendUnavailableError as exc:
@@ -148,6 +170,12 @@ async def run_vision_assist(
             rejection_reason=str(exc),
         )
 
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, payload)
+        payload = {**payload, "cache_status": "miss"}
+    else:
+        payload = {**payload, "cache_status": "bypass"}
+
     return AssistantRunResult(
         status="success",
         assistant_name=VISION_ASSIST_POLICY.assistant_name,
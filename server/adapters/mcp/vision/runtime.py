@@ -22,11 +22,13 @@ from .config import (
     VisionContractProfile,
     VisionMLXLocalConfig,
     VisionOpenAICompatibleConfig,
+    VisionResultCacheConfig,
     VisionRuntimeConfig,
     VisionSegmentationSidecarConfig,
     VisionTransformersLocalConfig,
 )
 from .model_profiles import ModelCapabilityProfile, resolve_model_profile
+from .result_cache import VisionResultCache
 
 _OPENROUTER_DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
 _GOOGLE_AI_STUDIO_DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
@@ -187,6 +189,8 @@ def build_vision_runtime_config(config: Config) -> VisionRuntimeConfig:
             prefer_json_object_for_qwen=(
                 config.VISION_OPENROUTER_PREFER_JSON_OBJECT_FOR_QWEN if use_openrouter_profile else False
             ),
+            max_concurrency=getattr(config, "VISION_EXTERNAL_MAX_CONCURRENCY", 4),
+            http2=getattr(config, "VISION_EXTERNAL_HTTP2", False),
             model_capabilities=openrouter_fallback_profile.to_runtime_capabilities()
             if openrouter_fallback_profile is not None
             else None,
@@ -215,6 +219,13 @@ def build_vision_runtime_config(config: Config) -> VisionRuntimeConfig:
         mlx_local=mlx_local_config,
         openai_compatible_external=external_config,
         segmentation_sidecar=segmentation_sidecar_config,
+        result_cache=VisionResultCacheConfig(
+            enabled=bool(getattr(config, "VISION_RESULT_CACHE_ENABLED", True)),
+            cache_dir=getattr(config, "VISION_RESULT_CACHE_DIR", None),
+            ttl_seconds=float(getattr(config, "VISION_RESULT_CACHE_TTL_SECONDS", 86400.0)),
+            max_memory_entries=int(getattr(config, "VISION_RESULT_CACHE_MAX_ENTRIES", 64)),
+            max_disk_bytes=int(getattr(config, "VISION_RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+        ),
     )
 
 
@@ -227,6 +238,7 @@ class LazyVisionBackendResolver:
 
     def __init__(self, runtime_config: VisionRuntimeConfig) -> None:
         self._runtime_config = runtime_config
+        self._result_cache: VisionResultCache | None = None
 
     @property
     def runtime_config(self) -> VisionRuntimeConfig:
@@ -234,6 +246,16 @@ class LazyVisionBackendResolver:
 
         return self._runtime_config
 
+    @property
+    def result_cache(self) -> VisionResultCache | None:
+        """Return the resolver-lifetime result cache, or None when disabled."""
+
+        if not self._runtime_config.result_cache.enabled:
+            return None
+        if self._result_cache is None:
+            self._result_cache = VisionResultCache(self._runtime_config.result_cache)
+        return self._result_cache
+
     def resolve(self, factory: Callable[[VisionRuntimeConfig], VisionBackend | None]) -> VisionBackend:
         """Resolve one backend lazily using an injected factory.
 
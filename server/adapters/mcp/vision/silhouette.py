@@ -5,11 +5,12 @@
 
 from __future__ import annotations
 
-from collections import deque
 from typing import Any
 
 import numpy as np
 
+from .components import largest_component
+
 _NORMALIZED_MASK_SIZE = 128
 _BORDER_RATIO_THRESHOLD = 0.35
 
@@ -23,43 +24,10 @@ def _metric_severity(delta: float, *, high: float, medium: float) -> str:
     return "low"
 
 
-def _largest_component(mask: np.ndarray) -> np.ndarray:
+def _largest_component(mask: np.ndarray, max_side: int | None = None) -> np.ndarray:
     if mask.ndim != 2 or not bool(mask.any()):
         return np.zeros_like(mask, dtype=bool)
-
-    visited = np.zeros(mask.shape, dtype=bool)
-    best_coords: list[tuple[int, int]] = []
-
-    height, width = mask.shape
-    active_pixels = np.argwhere(mask)
-    for y, x in active_pixels:
-        if visited[y, x]:
-            continue
-        queue: deque[tuple[int, int]] = deque([(int(y), int(x))])
-        visited[y, x] = True
-        coords: list[tuple[int, int]] = []
-        while queue:
-            current_y, current_x = queue.popleft()
-            coords.append((current_y, current_x))
-            for delta_y, delta_x in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                next_y = current_y + delta_y
-                next_x = current_x + delta_x
-                if next_y < 0 or next_y >= height or next_x < 0 or next_x >= width:
-                    continue
-                if visited[next_y, next_x] or not bool(mask[next_y, next_x]):
-                    continue
-                visited[next_y, next_x] = True
-                queue.append((next_y, next_x))
-
-        if len(coords) > len(best_coords):
-            best_coords = coords
-
-    component = np.zeros_like(mask, dtype=bool)
-    if not best_coords:
-        return component
-    ys, xs = zip(*best_coords)
-    component[np.array(ys), np.array(xs)] = True
-    return component
+    return largest_component(mask, max_side=max_side)
 
 
 def _otsu_threshold(values: np.ndarray) -> int:
@@ -83,11 +51,11 @@ def _otsu_threshold(values: np.ndarray) -> int:
     return max(1, min(254, threshold))
 
 
-def _candidate_score(mask: np.ndarray) -> float:
+def _candidate_score(mask: np.ndarray, max_side: int | None = None) -> float:
     if not bool(mask.any()):
         return float("-inf")
 
-    component = _largest_component(mask)
+    component = _largest_component(mask, max_side)
     if not bool(component.any()):
         return float("-inf")
 
@@ -105,7 +73,7 @@ def _candidate_score(mask: np.ndarray) -> float:
     return centered_area_bonus - (border_ratio * 2.0)
 
 
-def _extract_mask_from_image(image_path: str) -> tuple[np.ndarray | None, list[str]]:
+def _extract_mask_from_image(image_path: str, label_max_side: int | None = None) -> tuple[np.ndarray | None, list[str]]:
     notes: list[str] = []
 
     try:
@@ -122,7 +90,7 @@ def _extract_mask_from_image(image_path: str) -> tuple[np.ndarray | None, list[s
 
     alpha = rgba[:, :, 3]
     if np.any(alpha < 250):
-        component = _largest_component(alpha > 32)
+        component = _largest_component(alpha > 32, label_max_side)
         if bool(component.any()):
             return component, notes
         notes.append("Alpha channel was present, but no stable foreground component was found.")
@@ -133,10 +101,10 @@ def _extract_mask_from_image(image_path: str) -> tuple[np.ndarray | None, list[s
         return None, notes
     threshold = _otsu_threshold(grayscale)
     candidates = (
-        _largest_component(grayscale <= threshold),
-        _largest_component(grayscale >= threshold),
+        _largest_component(grayscale <= threshold, label_max_side),
+        _largest_component(grayscale >= threshold, label_max_side),
     )
-    best_candidate = max(candidates, key=_candidate_score)
+    best_candidate = max(candidates, key=lambda candidate: _candidate_score(candidate, label_max_side))
     if not bool(best_candidate.any()):
         notes.append("Otsu thresholding did not isolate a stable silhouette mask.")
         return None, notes
@@ -194,11 +162,17 @@ def build_silhouette_analysis(
     reference_label: str | None = None,
     capture_label: str | None = None,
     target_view: str | None = None,
+    label_max_side: int | None = None,
 ) -> dict[str, Any]:
-    """Build deterministic silhouette metrics from one reference/capture pair."""
+    """Build deterministic silhouette metrics from one reference/capture pair.
+
+    ``label_max_side`` enables downsample-first component labeling for large
+    images (see ``components.largest_component``); the default labels at full
+    resolution.
+    """
 
-    reference_mask, reference_notes = _extract_mask_from_image(reference_path)
-    capture_mask, capture_notes = _extract_mask_from_image(capture_path)
+    reference_mask, reference_notes = _extract_mask_from_image(reference_path, label_max_side)
+    capture_mask, capture_notes = _extract_mask_from_image(capture_path, label_max_side)
     notes = [*reference_notes, *capture_notes]
     if reference_mask is None or capture_mask is None:
         return {
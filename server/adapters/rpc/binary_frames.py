@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2024-2026 Patryk Ciechański
+# SPDX-License-Identifier: Apache-2.0
+
+"""Decoder for the addon's binary RPC response frames.
+
+Frame layout (mirrors ``blender_addon/infrastructure/binary_frames.py``)::
+
+    MAGIC | u32 header length (big-endian) | JSON header | pad | raw buffers
+
+The JSON header holds ``{"payload": ..., "arrays": [...]}``. Placeholders
+``{"__array__": i}`` inside ``payload`` are replaced with ``numpy.frombuffer``
+views over the received frame, so array data is never copied or parsed.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+from typing import Any
+
+import numpy as np
+
+MAGIC = b"BMB1"
+ENCODING = "binary"
+ALIGNMENT = 8
+JSON_FLOAT_PRECISION = 6
+
+
+def is_binary_frame(data: bytes | bytearray | memoryview) -> bool:
+    """Return True when a received frame body uses the binary layout."""
+
+    return bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def decode_frame(data: bytes | bytearray) -> Any:
+    """Decode a binary frame body into its payload with zero-copy NumPy array views."""
+
+    if not is_binary_frame(data):
+        raise ValueError("Not a binary RPC frame")
+    header_start = len(MAGIC) + 4
+    (header_length,) = struct.unpack(">I", bytes(data[len(MAGIC) : header_start]))
+    header_end = header_start + header_length
+    header = json.loads(bytes(data[header_start:header_end]).decode("utf-8"))
+    base = (header_end + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+    arrays = []
+    for descriptor in header.get("arrays", []):
+        dtype = np.dtype(descriptor["dtype"])
+        shape = tuple(int(size) for size in descriptor["shape"])
+        offset = base + int(descriptor["offset"])
+        if offset + int(descriptor["nbytes"]) > len(data):
+            raise ValueError("Binary RPC frame is truncated")
+        arrays.append(np.frombuffer(data, dtype=dtype, count=math.prod(shape), offset=offset).reshape(shape))
+
+    def restore(value: Any) -> Any:
+        if isinstance(value, dict):
+            if len(value) == 1 and "__array__" in value:
+                return arrays[int(value["__array__"])]
+            return {key: restore(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [restore(item) for item in value]
+        return value
+
+    return restore(header.get("payload"))
+
+
+def to_json_compatible(value: Any, precision: int = JSON_FLOAT_PRECISION) -> Any:
+    """Convert decoded arrays back to plain lists (floats rounded) for JSON-only consumers."""
+
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "f":
+            return np.round(value.astype(np.float64), precision).tolist()
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {key: to_json_compatible(item, precision) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_json_compatible(item, precision) for item in value]
+    return value
@@ -1,15 +1,27 @@
+import asyncio
 import json
 import logging
 import socket
 import struct
+import threading
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
 
+from server.adapters.rpc.binary_frames import ENCODING, decode_frame, is_binary_frame
 from server.domain.interfaces.rpc import IRpcClient
 from server.domain.models.rpc import RpcRequest, RpcResponse
 
 logger = logging.getLogger(__name__)
 
+# Marker on unsolicited addon frames that push background job snapshots.
+JOB_EVENT = "job_update"
+
+JobEventCallback = Callable[[Optional[Dict[str, Any]]], None]
+
+# Extra addon execution budget per ``rpc.batch`` item on top of the single-request default.
+BATCH_ITEM_TIMEOUT_SECONDS = 2.0
+
 
 def send_msg(sock, msg):
     # Prefix each message with a 4-byte length (network byte order)
@@ -38,7 +50,20 @@ def recvall(sock, n):
     return data
 
 
+class _NotConnectedError(Exception):
+    """Raised when the client cannot (re)connect to the addon RPC server."""
+
+
 class RpcClient(IRpcClient):
+    """Multiplexed RPC client for the Blender addon.
+
+    One socket carries many in-flight requests. Each request is tagged with its
+    ``request_id``; a single reader thread demultiplexes responses (which the
+    addon may answer out of order) onto per-request futures, so concurrent
+    ``asyncio.to_thread`` callers sharing the DI singleton no longer serialize
+    behind one another or race on the socket.
+    """
+
     def __init__(
         self,
         host: str,
@@ -53,11 +78,24 @@ class RpcClient(IRpcClient):
         self.timeout = rpc_timeout_seconds
         self.addon_execution_timeout_seconds = addon_execution_timeout_seconds
 
+        # Guards socket lifecycle, the reader thread handle, and the pending map.
+        self._lock = threading.Lock()
+        # Serializes whole-frame writes so concurrent senders never interleave bytes.
+        self._send_lock = threading.Lock()
+        self._pending: Dict[str, Tuple[Any, Future]] = {}
+        # subscription_id -> (socket, callback) for addon-pushed job events.
+        self._subscriptions: Dict[str, Tuple[Any, JobEventCallback]] = {}
+        self._reader_thread: Optional[threading.Thread] = None
+        self._reader_socket = None
+
     def connect(self):
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(self.timeout)
             self.socket.connect((self.host, self.port))
+            # Reads happen on the dedicated reader thread; per-request deadlines
+            # are enforced on the response futures instead of the socket.
+            self.socket.settimeout(None)
             return True
         except ConnectionRefusedError:
             self.socket = None
@@ -68,78 +106,305 @@ class RpcClient(IRpcClient):
             return False
 
     def close(self):
-        if self.socket:
+        with self._lock:
+            sock = self.socket
+            self.socket = None
+            self._reader_socket = None
+            self._reader_thread = None
+            failed = self._drain_pending_locked(sock)
+            lost_streams = self._drain_subscriptions_locked(sock)
+        if sock:
             try:
-                self.socket.close()
+                sock.close()
             except Exception:
                 pass
-            self.socket = None
+        for future in failed:
+            self._resolve_future(future, exception=ConnectionResetError("RPC client closed"))
+        for callback in lost_streams:
+            try:
+                callback(None)
+            except Exception:
+                logger.exception("Background job event callback failed")
 
-    def send_request(
+    @property
+    def in_flight_count(self) -> int:
+        """Number of requests currently awaiting a response."""
+
+        with self._lock:
+            return len(self._pending)
+
+    def _build_request(
         self,
         cmd: str,
-        args: Dict[str, Any] = None,
-        timeout_seconds: Optional[float] = None,
-        *,
-        rpc_timeout_seconds: Optional[float] = None,
-    ) -> RpcResponse:
-        if args is None:
-            args = {}
-
+        args: Optional[Dict[str, Any]],
+        timeout_seconds: Optional[float],
+        rpc_timeout_seconds: Optional[float],
+        accept_encoding: Optional[str] = None,
+    ) -> Tuple[RpcRequest, float]:
         addon_timeout = timeout_seconds or self.addon_execution_timeout_seconds
         client_timeout = self.timeout if rpc_timeout_seconds is None else min(self.timeout, rpc_timeout_seconds)
         request = RpcRequest(
             cmd=cmd,
-            args=args,
+            args=args or {},
             timeout_seconds=addon_timeout,
             deadline_unix_ms=int((time.time() + addon_timeout) * 1000),
+            accept_encoding=accept_encoding,
         )
+        return request, client_timeout
+
+    def _submit(self, request: RpcRequest, *, on_event: Optional[JobEventCallback] = None) -> Future:
+        """Register a pending future for ``request`` and write it to the shared socket.
 
-        # Auto-reconnect logic
-        if not self.socket:
-            if not self.connect():
-                return RpcResponse(
-                    request_id=request.request_id,
-                    status="error",
-                    error="Could not connect to Blender Addon. Is Blender running with the addon installed?",
-                )
+        ``on_event`` registers a push subscription under the request id before the
+        frame is written, so events the addon pushes ahead of its ack are not lost.
+        """
 
+        future: Future = Future()
+        with self._lock:
+            # Auto-reconnect logic
+            if not self.socket and not self.connect():
+                raise _NotConnectedError()
+            sock = self.socket
+            self._pending[request.request_id] = (sock, future)
+            if on_event is not None:
+                self._subscriptions[request.request_id] = (sock, on_event)
+            self._ensure_reader_locked(sock)
+
+        data = request.model_dump_json().encode("utf-8")
         try:
-            # Keep the socket boundary explicit per request.
-            if self.socket is None:
-                raise ConnectionResetError("RPC socket is not connected")
-            self.socket.settimeout(client_timeout)
-
-            # Send
-            data = request.model_dump_json().encode("utf-8")
-            send_msg(self.socket, data)
-
-            # Receive
-            response_data = recv_msg(self.socket)
-            if not response_data:
-                raise ConnectionResetError("Connection closed by server")
-
-            response_dict = json.loads(response_data.decode("utf-8"))
-            return RpcResponse(**response_dict)
-
-        except (socket.timeout, ConnectionResetError, BrokenPipeError) as e:
-            logger.warning("Connection lost while talking to Blender RPC: %s", e)
-            self.close()
+            with self._send_lock:
+                send_msg(sock, data)
+        except Exception:
+            self._discard_pending(request.request_id)
+            self.unsubscribe_background_job(request.request_id)
+            raise
+        return future
+
+    def _ensure_reader_locked(self, sock) -> None:
+        if self._reader_socket is sock and self._reader_thread is not None and self._reader_thread.is_alive():
+            return
+        self._reader_socket = sock
+        self._reader_thread = threading.Thread(
+            target=self._reader_loop,
+            args=(sock,),
+            name="BlenderRpcClientReader",
+            daemon=True,
+        )
+        self._reader_thread.start()
+
+    def _reader_loop(self, sock) -> None:
+        """Demultiplex responses from ``sock`` onto their pending futures until EOF/error."""
+
+        error: BaseException = ConnectionResetError("Connection closed by server")
+        try:
+            while True:
+                response_data = recv_msg(sock)
+                if not response_data:
+                    break
+                try:
+                    if is_binary_frame(response_data):
+                        response_dict = decode_frame(response_data)
+                    else:
+                        response_dict = json.loads(response_data.decode("utf-8"))
+                except ValueError:
+                    logger.warning("Dropping undecodable RPC response frame (%d bytes)", len(response_data))
+                    continue
+                if isinstance(response_dict, dict) and response_dict.get("event") == JOB_EVENT:
+                    self._dispatch_job_event(response_dict)
+                    continue
+                request_id = response_dict.get("request_id") if isinstance(response_dict, dict) else None
+                future = self._discard_pending(request_id) if request_id else None
+                if future is None:
+                    logger.debug("Dropping RPC response without a waiting request: %s", request_id)
+                    continue
+                try:
+                    self._resolve_future(future, result=RpcResponse(**response_dict))
+                except Exception as exc:
+                    self._resolve_future(future, exception=exc)
+        except Exception as exc:
+            error = exc
+        finally:
+            self._fail_connection(sock, error)
+
+    def _dispatch_job_event(self, frame: Dict[str, Any]) -> None:
+        with self._lock:
+            entry = self._subscriptions.get(str(frame.get("subscription_id")))
+        if entry is None:
+            return
+        snapshot = frame.get("result")
+        try:
+            entry[1](snapshot if isinstance(snapshot, dict) else None)
+        except Exception:
+            logger.exception("Background job event callback failed")
+
+    def _discard_pending(self, request_id: Optional[str]) -> Optional[Future]:
+        with self._lock:
+            entry = self._pending.pop(request_id, None) if request_id else None
+        return entry[1] if entry is not None else None
+
+    def _drain_pending_locked(self, sock) -> list[Future]:
+        drained = [request_id for request_id, (owner, _future) in self._pending.items() if owner is sock]
+        return [self._pending.pop(request_id)[1] for request_id in drained]
+
+    def _drain_subscriptions_locked(self, sock) -> list[JobEventCallback]:
+        drained = [key for key, (owner, _callback) in self._subscriptions.items() if owner is sock]
+        return [self._subscriptions.pop(key)[1] for key in drained]
+
+    def _fail_connection(self, sock, error: BaseException) -> None:
+        with self._lock:
+            if self.socket is sock:
+                self.socket = None
+            if self._reader_socket is sock:
+                self._reader_socket = None
+                self._reader_thread = None
+            failed = self._drain_pending_locked(sock)
+            lost_streams = self._drain_subscriptions_locked(sock)
+        try:
+            sock.close()
+        except Exception:
+            pass
+        for future in failed:
+            self._resolve_future(future, exception=error)
+        for callback in lost_streams:
+            try:
+                callback(None)
+            except Exception:
+                logger.exception("Background job event callback failed")
+
+    @staticmethod
+    def _resolve_future(future: Future, *, result: Any = None, exception: Optional[BaseException] = None) -> None:
+        # A waiter may already have given up (timeout / asyncio cancellation).
+        if future.done():
+            return
+        try:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except Exception:
+            pass
+
+    def _error_response(self, request: RpcRequest, exc: BaseException, client_timeout: float) -> RpcResponse:
+        if isinstance(exc, _NotConnectedError):
+            return RpcResponse(
+                request_id=request.request_id,
+                status="error",
+                error="Could not connect to Blender Addon. Is Blender running with the addon installed?",
+            )
+        if isinstance(exc, socket.timeout):
+            logger.warning("Timed out waiting for Blender RPC response to '%s'", request.cmd)
             return RpcResponse(
                 request_id=request.request_id,
                 status="error",
-                error=f"RPC client timeout after {self.timeout:.1f}s while waiting for '{cmd}'",
-                error_code="timeout" if isinstance(e, socket.timeout) else "connection_error",
+                error=f"RPC client timeout after {client_timeout:.1f}s while waiting for '{request.cmd}'",
+                error_code="timeout",
                 error_boundary="rpc_client",
             )
-        except Exception as e:
+        if isinstance(exc, OSError):
+            logger.warning("Connection lost while talking to Blender RPC: %s", exc)
             return RpcResponse(
                 request_id=request.request_id,
                 status="error",
-                error=f"Unexpected error: {str(e)}",
-                error_code="unexpected_error",
+                error=f"Connection to Blender RPC lost while waiting for '{request.cmd}': {exc}",
+                error_code="connection_error",
                 error_boundary="rpc_client",
             )
+        return RpcResponse(
+            request_id=request.request_id,
+            status="error",
+            error=f"Unexpected error: {str(exc)}",
+            error_code="unexpected_error",
+            error_boundary="rpc_client",
+        )
+
+    def send_request(
+        self,
+        cmd: str,
+        args: Dict[str, Any] = None,
+        timeout_seconds: Optional[float] = None,
+        *,
+        rpc_timeout_seconds: Optional[float] = None,
+        accept_encoding: Optional[str] = None,
+    ) -> RpcResponse:
+        request, client_timeout = self._build_request(cmd, args, timeout_seconds, rpc_timeout_seconds, accept_encoding)
+        return self._send(request, client_timeout)
+
+    def _send(self, request: RpcRequest, client_timeout: float) -> RpcResponse:
+        try:
+            future = self._submit(request)
+            return future.result(timeout=client_timeout)
+        except Exception as exc:
+            return self._error_response(request, exc, client_timeout)
+        finally:
+            # Late responses for abandoned requests are dropped by the reader.
+            self._discard_pending(request.request_id)
+
+    async def send_request_async(
+        self,
+        cmd: str,
+        args: Dict[str, Any] = None,
+        timeout_seconds: Optional[float] = None,
+        *,
+        rpc_timeout_seconds: Optional[float] = None,
+    ) -> RpcResponse:
+        """Native asyncio variant of ``send_request``.
+
+        Connect/write run off the event loop; the wait itself is a plain awaitable
+        on the demultiplexed response future, so no worker thread is parked per
+        in-flight request.
+        """
+
+        request, client_timeout = self._build_request(cmd, args, timeout_seconds, rpc_timeout_seconds)
+        try:
+            future = await asyncio.to_thread(self._submit, request)
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=client_timeout)
+        except Exception as exc:
+            return self._error_response(request, exc, client_timeout)
+        finally:
+            self._discard_pending(request.request_id)
+
+    def send_binary_request(
+        self,
+        cmd: str,
+        args: Dict[str, Any] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> RpcResponse:
+        """Like ``send_request`` but lets the addon reply with a binary frame.
+
+        Array fields of the result arrive as ``numpy.frombuffer`` views over
+        the received frame. Addons without binary support simply answer with JSON.
+        """
+
+        return self.send_request(cmd, args, timeout_seconds, accept_encoding=ENCODING)
+
+    def send_batch(
+        self,
+        commands: Sequence[Mapping[str, Any]],
+        *,
+        stop_on_error: bool = False,
+        undo_message: Optional[str] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> RpcResponse:
+        """Run ordered ``{cmd, args}`` items in one addon main-thread callback via ``rpc.batch``.
+
+        The envelope status reflects transport/validation only; per-item status lives in
+        ``result["results"]``. The addon pushes a single undo step for the whole batch.
+
+        ``timeout_seconds`` is the budget for the whole batch. By default it grows by
+        ``BATCH_ITEM_TIMEOUT_SECONDS`` per item, and the client waits at least as long
+        as the addon may run, so a long batch is never abandoned half-applied.
+        """
+
+        items = [{"cmd": item["cmd"], "args": dict(item.get("args") or {})} for item in commands]
+        if timeout_seconds is None:
+            timeout_seconds = self.addon_execution_timeout_seconds + BATCH_ITEM_TIMEOUT_SECONDS * len(items)
+        request, client_timeout = self._build_request(
+            "rpc.batch",
+            {"commands": items, "stop_on_error": stop_on_error, "undo_message": undo_message},
+            timeout_seconds,
+            None,
+        )
+        return self._send(request, max(client_timeout, timeout_seconds))
 
     def launch_background_job(
         self,
@@ -183,3 +448,44 @@ class RpcClient(IRpcClient):
             timeout_seconds=timeout_seconds,
             rpc_timeout_seconds=timeout_seconds,
         )
+
+    def subscribe_background_job(
+        self,
+        job_id: str,
+        on_event: JobEventCallback,
+        *,
+        timeout_seconds: Optional[float] = None,
+    ) -> Optional[RpcResponse]:
+        """Ask the addon to push snapshots for ``job_id`` over this connection.
+
+        Returns the acknowledgement (its ``result`` is the current snapshot and its
+        ``request_id`` the subscription id). ``on_event`` runs on the reader thread
+        for every pushed snapshot and once with ``None`` if the connection drops.
+        On an error acknowledgement no subscription remains registered.
+        """
+
+        request, client_timeout = self._build_request(
+            "rpc.subscribe_job",
+            {"job_id": job_id},
+            timeout_seconds,
+            timeout_seconds,
+        )
+        try:
+            future = self._submit(request, on_event=on_event)
+            response = future.result(timeout=client_timeout)
+        except Exception as exc:
+            response = self._error_response(request, exc, client_timeout)
+        finally:
+            self._discard_pending(request.request_id)
+        if response.status != "ok":
+            self.unsubscribe_background_job(request.request_id)
+        return response
+
+    def unsubscribe_background_job(self, subscription_id: str) -> None:
+        """Stop delivering pushed snapshots for ``subscription_id``.
+
+        The addon drops its side when the job finishes or the connection closes.
+        """
+
+        with self._lock:
+            self._subscriptions.pop(subscription_id, None)
@@ -0,0 +1,123 @@
+"""Shared push-then-poll plumbing for waiting on addon background jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any
+
+from server.domain.interfaces.rpc import IRpcClient
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_JOB_STATUSES = frozenset({"completed", "failed", "cancelled"})
+# Poll cadence when no push stream is available (older addon, dropped connection).
+JOB_POLL_INTERVAL_SECONDS = 0.25
+# Safety-net poll cadence while addon-pushed snapshots are arriving.
+JOB_PUSH_FALLBACK_POLL_SECONDS = 5.0
+
+
+class JobSnapshotStream:
+    """Addon-pushed job snapshots handed from the RPC reader thread to a waiter.
+
+    Snapshots are full job state, so only the newest undelivered one is kept.
+    Waiters may block a thread (``next_snapshot``) or await on an event loop
+    (``next_snapshot_async``).
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self._condition = threading.Condition()
+        self._pending: dict[str, Any] | None = None
+        self._lost = False
+        self._loop = loop
+        self._wakeup = asyncio.Event() if loop is not None else None
+        self.subscription_id: str | None = None
+        self.initial_snapshot: dict[str, Any] | None = None
+
+    @property
+    def active(self) -> bool:
+        """Whether pushed snapshots may still arrive."""
+
+        with self._condition:
+            return self.subscription_id is not None and not self._lost
+
+    def on_event(self, snapshot: dict[str, Any] | None) -> None:
+        with self._condition:
+            if snapshot is None:
+                self._lost = True
+            else:
+                self._pending = snapshot
+            self._condition.notify_all()
+        if self._loop is not None and self._wakeup is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                # The waiting loop is gone; nothing is listening any more.
+                pass
+
+    def close(self) -> None:
+        with self._condition:
+            self._lost = True
+            self._condition.notify_all()
+
+    def _take(self) -> dict[str, Any] | None:
+        snapshot, self._pending = self._pending, None
+        return snapshot
+
+    def next_snapshot(self, timeout: float) -> dict[str, Any] | None:
+        """Block for the newest pushed snapshot; None on timeout or a lost stream."""
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending is not None or self._lost, timeout=timeout)
+            return self._take()
+
+    async def next_snapshot_async(self, timeout: float) -> dict[str, Any] | None:
+        """Await the newest pushed snapshot; None on timeout or a lost stream."""
+
+        if self._wakeup is None:
+            raise RuntimeError("JobSnapshotStream was created without an event loop")
+        # Clear before checking so a push landing in between still wakes the wait.
+        self._wakeup.clear()
+        with self._condition:
+            if self._pending is not None or self._lost:
+                return self._take()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        with self._condition:
+            return self._take()
+
+
+def subscribe_job_snapshots(
+    rpc_client: IRpcClient,
+    job_id: str,
+    *,
+    timeout_seconds: float,
+    loop: asyncio.AbstractEventLoop | None = None,
+) -> JobSnapshotStream | None:
+    """Subscribe to pushed snapshots for ``job_id``; None when the transport or addon cannot push."""
+
+    subscribe = getattr(rpc_client, "subscribe_background_job", None)
+    if subscribe is None:
+        return None
+    stream = JobSnapshotStream(loop)
+    try:
+        response = subscribe(job_id, stream.on_event, timeout_seconds=timeout_seconds)
+    except Exception as exc:
+        logger.debug("Job event subscription failed for %s: %s", job_id, exc)
+        return None
+    if response is None or response.status != "ok":
+        return None
+    stream.initial_snapshot = response.result if isinstance(response.result, dict) else None
+    stream.subscription_id = response.request_id
+    return stream
+
+
+def close_job_snapshots(rpc_client: IRpcClient, stream: JobSnapshotStream | None) -> None:
+    """Unsubscribe ``stream`` if it was opened."""
+
+    if stream is not None and stream.subscription_id is not None:
+        stream.close()
+        rpc_client.unsubscribe_background_job(stream.subscription_id)
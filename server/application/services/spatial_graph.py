@@ -172,6 +172,35 @@ def _scene_object_names(reader: _SceneSpatialReader) -> set[str] | None:
     return names
 
 
+def _measure_relation_pairs_bulk(
+    reader: _SceneSpatialReader,
+    pairs: list[tuple[str, str]],
+) -> dict[tuple[str, str], dict[str, Any]] | None:
+    """Measure all pairs through one optional bulk reader call.
+
+    Returns ``None`` when the reader has no bulk path or the bulk call cannot be
+    used, so callers fall back to the per-pair gap/alignment/overlap/contact reads.
+    """
+
+    measure_relations_bulk = getattr(reader, "measure_relations_bulk", None)
+    if not callable(measure_relations_bulk) or not pairs:
+        return None
+    try:
+        payload = measure_relations_bulk([{"from_object": left, "to_object": right} for left, right in pairs])
+    except RuntimeError:
+        return None
+    items = payload.get("pairs") if isinstance(payload, dict) else None
+    if not isinstance(items, list) or len(items) != len(pairs):
+        return None
+
+    measurements: dict[tuple[str, str], dict[str, Any]] = {}
+    for pair_key, item in zip(pairs, items):
+        if not isinstance(item, dict) or (item.get("from_object"), item.get("to_object")) != pair_key:
+            return None
+        measurements[pair_key] = item
+    return measurements
+
+
 def _name_role_tokens(object_name: str) -> list[str]:
     normalized = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", object_name.strip())
     return [token for token in re.split(r"[^a-zA-Z0-9]+", normalized.lower()) if token]
@@ -1094,6 +1123,9 @@ class SpatialGraphService:
                 else:
                     planned_pair.include_support = True
 
+        bulk_measurements = _measure_relation_pairs_bulk(
+            reader, [(pair.from_object, pair.to_object) for pair in planned_pairs]
+        )
         relation_pairs: list[dict[str, Any]] = []
         for pair in planned_pairs:
             gap_payload: dict[str, Any] | None = None
@@ -1101,15 +1133,24 @@ class SpatialGraphService:
             overlap_payload: dict[str, Any] | None = None
             contact_assertion: dict[str, Any] | None = None
             error: str | None = None
-            try:
-                gap_payload = reader.measure_gap(pair.from_object, pair.to_object)
-                alignment_payload = reader.measure_alignment(
-                    pair.from_object, pair.to_object, ["X", "Y", "Z"], "CENTER"
-                )
-                overlap_payload = reader.measure_overlap(pair.from_object, pair.to_object)
-                contact_assertion = reader.assert_contact(pair.from_object, pair.to_object)
-            except RuntimeError as exc:
-                error = str(exc)
+            if bulk_measurements is not None:
+                measured = bulk_measurements[(pair.from_object, pair.to_object)]
+                gap_payload = measured.get("gap")
+                alignment_payload = measured.get("alignment")
+                overlap_payload = measured.get("overlap")
+                contact_assertion = measured.get("contact_assertion")
+                if measured.get("error"):
+                    error = f"Blender Error: {measured['error']}"
+            else:
+                try:
+                    gap_payload = reader.measure_gap(pair.from_object, pair.to_object)
+                    alignment_payload = reader.measure_alignment(
+                        pair.from_object, pair.to_object, ["X", "Y", "Z"], "CENTER"
+                    )
+                    overlap_payload = reader.measure_overlap(pair.from_object, pair.to_object)
+                    contact_assertion = reader.assert_contact(pair.from_object, pair.to_object)
+                except RuntimeError as exc:
+                    error = str(exc)
 
             pair_seam: _PlannedCreatureSeam | None = pair.seam
             attachment_relation = _attachment_relation(pair.from_object, pair.to_object) if pair_seam is None else None
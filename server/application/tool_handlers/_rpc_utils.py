@@ -1,6 +1,6 @@
 from typing import Any, cast
 
-from server.domain.models.rpc import RpcResponse
+from server.domain.models.rpc import RpcResponse, split_batch_response
 
 
 def require_result(response: RpcResponse) -> Any:
@@ -45,3 +45,12 @@ def require_list_of_strings_result(response: RpcResponse) -> list[str]:
     if not all(isinstance(item, str) for item in result):
         raise RuntimeError("Blender Error: Expected a list of strings in RPC result")
     return cast(list[str], result)
+
+
+def require_batch_item_responses(response: RpcResponse) -> list[RpcResponse]:
+    """Split an ``rpc.batch`` envelope into one ``RpcResponse`` per submitted item."""
+    require_dict_result(response)
+    try:
+        return split_batch_response(response)
+    except ValueError as exc:
+        raise RuntimeError(f"Blender Error: {exc}") from exc
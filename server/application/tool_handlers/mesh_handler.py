@@ -9,6 +9,12 @@ class MeshToolHandler(IMeshTool):
     def __init__(self, rpc_client: IRpcClient):
         self.rpc = rpc_client
 
+    def _send_inspection(self, cmd: str, args: Dict[str, Any], layout: str) -> dict:
+        """Column layouts accept binary frames, so their arrays arrive as NumPy views."""
+        if layout == "rows":
+            return require_dict_result(self.rpc.send_request(cmd, args))
+        return require_dict_result(self.rpc.send_binary_request(cmd, {**args, "layout": layout}))
+
     def select_all(self, deselect: bool = False) -> str:
         return require_str_result(self.rpc.send_request("mesh.select_all", {"deselect": deselect}))
 
@@ -83,34 +89,49 @@ class MeshToolHandler(IMeshTool):
         return require_str_result(self.rpc.send_request("mesh.select_less"))
 
     def get_vertex_data(
-        self, object_name: str, selected_only: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        selected_only: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> dict:
         args: Dict[str, Any] = {"object_name": object_name, "selected_only": selected_only}
         if offset is not None:
             args["offset"] = offset
         if limit is not None:
             args["limit"] = limit
-        return require_dict_result(self.rpc.send_request("mesh.get_vertex_data", args))
+        return self._send_inspection("mesh.get_vertex_data", args, layout)
 
     def get_edge_data(
-        self, object_name: str, selected_only: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        selected_only: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> dict:
         args: Dict[str, Any] = {"object_name": object_name, "selected_only": selected_only}
         if offset is not None:
             args["offset"] = offset
         if limit is not None:
             args["limit"] = limit
-        return require_dict_result(self.rpc.send_request("mesh.get_edge_data", args))
+        return self._send_inspection("mesh.get_edge_data", args, layout)
 
     def get_face_data(
-        self, object_name: str, selected_only: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        selected_only: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> dict:
         args: Dict[str, Any] = {"object_name": object_name, "selected_only": selected_only}
         if offset is not None:
             args["offset"] = offset
         if limit is not None:
             args["limit"] = limit
-        return require_dict_result(self.rpc.send_request("mesh.get_face_data", args))
+        return self._send_inspection("mesh.get_face_data", args, layout)
 
     def get_uv_data(
         self,
@@ -119,6 +140,7 @@ class MeshToolHandler(IMeshTool):
         selected_only: bool = False,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> dict:
         args: Dict[str, Any] = {"object_name": object_name, "selected_only": selected_only}
         if uv_layer is not None:
@@ -127,17 +149,22 @@ class MeshToolHandler(IMeshTool):
             args["offset"] = offset
         if limit is not None:
             args["limit"] = limit
-        return require_dict_result(self.rpc.send_request("mesh.get_uv_data", args))
+        return self._send_inspection("mesh.get_uv_data", args, layout)
 
     def get_loop_normals(
-        self, object_name: str, selected_only: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        selected_only: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> dict:
         args: Dict[str, Any] = {"object_name": object_name, "selected_only": selected_only}
         if offset is not None:
             args["offset"] = offset
         if limit is not None:
             args["limit"] = limit
-        return require_dict_result(self.rpc.send_request("mesh.get_loop_normals", args))
+        return self._send_inspection("mesh.get_loop_normals", args, layout)
 
     def get_vertex_group_weights(
         self,
@@ -163,6 +190,7 @@ class MeshToolHandler(IMeshTool):
         selected_only: bool = False,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> dict:
         args: Dict[str, Any] = {"object_name": object_name, "selected_only": selected_only}
         if attribute_name is not None:
@@ -171,17 +199,22 @@ class MeshToolHandler(IMeshTool):
             args["offset"] = offset
         if limit is not None:
             args["limit"] = limit
-        return require_dict_result(self.rpc.send_request("mesh.get_attributes", args))
+        return self._send_inspection("mesh.get_attributes", args, layout)
 
     def get_shape_keys(
-        self, object_name: str, include_deltas: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        include_deltas: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> dict:
         args: Dict[str, Any] = {"object_name": object_name, "include_deltas": include_deltas}
         if offset is not None:
             args["offset"] = offset
         if limit is not None:
             args["limit"] = limit
-        return require_dict_result(self.rpc.send_request("mesh.get_shape_keys", args))
+        return self._send_inspection("mesh.get_shape_keys", args, layout)
 
     def select_by_location(self, axis: str, min_coord: float, max_coord: float, mode: str = "VERT") -> str:
         args = {"axis": axis, "min_coord": min_coord, "max_coord": max_coord, "mode": mode}
@@ -1,5 +1,13 @@
-from typing import Any, Dict, List, Optional
-
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from server.application.services.background_jobs import (
+    JOB_POLL_INTERVAL_SECONDS,
+    JOB_PUSH_FALLBACK_POLL_SECONDS,
+    TERMINAL_JOB_STATUSES,
+    close_job_snapshots,
+    subscribe_job_snapshots,
+)
 from server.application.services.spatial_graph import get_spatial_graph_service
 from server.application.tool_handlers._rpc_utils import (
     require_dict_result,
@@ -10,6 +18,10 @@ from server.application.tool_handlers.collection_handler import CollectionToolHa
 from server.domain.interfaces.rpc import IRpcClient
 from server.domain.tools.scene import ISceneTool
 
+_JOB_DEFAULT_TIMEOUT_SECONDS = 30.0
+# Extra client-side wait so the addon normally reports its own job timeout first.
+_JOB_DEADLINE_GRACE_SECONDS = 5.0
+
 
 class SceneToolHandler(ISceneTool):
     def __init__(self, rpc_client: IRpcClient):
@@ -69,6 +81,111 @@ class SceneToolHandler(ISceneTool):
         }
         return require_str_result(self.rpc.send_request("scene.get_viewport", args))
 
+    def get_viewport_file(
+        self,
+        output_path: str,
+        width: int = 1024,
+        height: int = 768,
+        shading: str = "SOLID",
+        camera_name: Optional[str] = None,
+        focus_target: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        args = {
+            "width": width,
+            "height": height,
+            "shading": shading,
+            "camera_name": camera_name,
+            "focus_target": focus_target,
+            "output_path": output_path,
+        }
+        return require_dict_result(self.rpc.send_request("scene.get_viewport", args))
+
+    def capture_view_set(
+        self,
+        presets: List[Dict[str, Any]],
+        target_object: Optional[str] = None,
+        isolate_objects: Optional[List[str]] = None,
+        timeout_seconds: Optional[float] = None,
+        progress_callback: Optional[Callable[[float, Optional[float], Optional[str]], None]] = None,
+    ) -> Dict[str, Any]:
+        args = {
+            "presets": presets,
+            "target_object": target_object,
+            "isolate_objects": isolate_objects,
+        }
+        budget = float(timeout_seconds) if timeout_seconds is not None else _JOB_DEFAULT_TIMEOUT_SECONDS
+        snapshot = require_dict_result(
+            self.rpc.launch_background_job("scene.capture_view_set", args, timeout_seconds=budget)
+        )
+        job_id = str(snapshot.get("job_id") or "")
+        if not job_id:
+            raise RuntimeError("Blender Error: scene.capture_view_set launch did not return a job_id")
+
+        snapshot = self._wait_for_background_job(
+            job_id,
+            snapshot,
+            deadline=time.monotonic() + budget + _JOB_DEADLINE_GRACE_SECONDS,
+            progress_callback=progress_callback,
+        )
+        if snapshot.get("status") != "completed":
+            raise RuntimeError(
+                f"Blender Error: {snapshot.get('error') or 'scene.capture_view_set ' + snapshot['status']}"
+            )
+        collected = require_dict_result(self.rpc.collect_background_job_result(job_id))
+        result = collected.get("result")
+        if not isinstance(result, dict):
+            raise RuntimeError("Blender Error: scene.capture_view_set returned no capture payload")
+        return result
+
+    def _wait_for_background_job(
+        self,
+        job_id: str,
+        snapshot: Dict[str, Any],
+        *,
+        deadline: float,
+        progress_callback: Optional[Callable[[float, Optional[float], Optional[str]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Wait for an addon job to settle and return its terminal snapshot.
+
+        Progress arrives as addon-pushed snapshots while the subscription is alive,
+        with a slow ``rpc.get_job`` poll as a safety net; without a push stream
+        (older addon, dropped connection) the job is polled instead. Past
+        ``deadline`` the addon job is cancelled and a ``RuntimeError`` is raised.
+        """
+        events = subscribe_job_snapshots(self.rpc, job_id, timeout_seconds=max(deadline - time.monotonic(), 0.0))
+        if events is not None and events.initial_snapshot is not None:
+            snapshot = events.initial_snapshot
+
+        try:
+            while snapshot.get("status") not in TERMINAL_JOB_STATUSES:
+                if progress_callback is not None:
+                    progress_callback(
+                        float(snapshot.get("progress_current") or 0),
+                        snapshot.get("progress_total"),
+                        snapshot.get("status_message"),
+                    )
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    try:
+                        self.rpc.cancel_background_job(job_id)
+                    except Exception:
+                        pass
+                    raise RuntimeError(
+                        f"Blender Error: background job {job_id} did not finish in time and was cancelled"
+                    )
+
+                if events is not None and events.active:
+                    pushed = events.next_snapshot(min(remaining, JOB_PUSH_FALLBACK_POLL_SECONDS))
+                    if pushed is not None:
+                        snapshot = pushed
+                        continue
+                else:
+                    time.sleep(min(remaining, JOB_POLL_INTERVAL_SECONDS))
+                snapshot = require_dict_result(self.rpc.get_background_job_status(job_id))
+        finally:
+            close_job_snapshots(self.rpc, events)
+        return snapshot
+
     def create_light(
         self, type: str, energy: float, color: List[float], location: List[float], name: Optional[str] = None
     ) -> str:
@@ -298,6 +415,28 @@ class SceneToolHandler(ISceneTool):
             )
         )
 
+    def measure_relations_bulk(
+        self,
+        pairs: List[Dict[str, str]],
+        tolerance: float = 0.0001,
+        max_gap: float = 0.0001,
+        allow_overlap: bool = False,
+    ) -> Dict[str, Any]:
+        return require_dict_result(
+            self.rpc.send_request(
+                "scene.measure_relations_bulk",
+                {
+                    "pairs": [{"from_object": pair["from_object"], "to_object": pair["to_object"]} for pair in pairs],
+                    "tolerance": tolerance,
+                    "max_gap": max_gap,
+                    "allow_overlap": allow_overlap,
+                },
+            )
+        )
+
+    def get_mesh_cache_stats(self, reset: bool = False) -> Dict[str, Any]:
+        return require_dict_result(self.rpc.send_request("scene.get_mesh_cache_stats", {"reset": reset}))
+
     def assert_contact(
         self,
         from_object: str,
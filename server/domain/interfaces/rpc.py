@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence
 
 from server.domain.models.rpc import RpcResponse
 
@@ -17,6 +18,76 @@ class IRpcClient(ABC):
         """Sends an RPC request and returns the response."""
         pass
 
+    async def send_request_async(
+        self,
+        cmd: str,
+        args: Dict[str, Any] = None,
+        timeout_seconds: Optional[float] = None,
+        *,
+        rpc_timeout_seconds: Optional[float] = None,
+    ) -> RpcResponse:
+        """Asyncio variant of ``send_request``; defaults to a worker-thread offload."""
+        return await asyncio.to_thread(
+            self.send_request,
+            cmd,
+            args,
+            timeout_seconds,
+            rpc_timeout_seconds=rpc_timeout_seconds,
+        )
+
+    def send_binary_request(
+        self,
+        cmd: str,
+        args: Dict[str, Any] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> RpcResponse:
+        """Send a request whose result may carry NumPy arrays decoded from a binary frame.
+
+        Transports without binary frames fall back to ``send_request``; array fields
+        then arrive as plain lists.
+        """
+        return self.send_request(cmd, args, timeout_seconds)
+
+    def send_batch(
+        self,
+        commands: Sequence[Mapping[str, Any]],
+        *,
+        stop_on_error: bool = False,
+        undo_message: Optional[str] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> RpcResponse:
+        """Execute ordered ``{cmd, args}`` items and return per-item status in one envelope.
+
+        The default implementation issues the items sequentially through
+        ``send_request`` and mirrors the addon ``rpc.batch`` result shape.
+        """
+        results: list[Dict[str, Any]] = []
+        stopped_early = False
+        for index, item in enumerate(commands):
+            cmd = str(item["cmd"])
+            if stopped_early:
+                results.append({"index": index, "cmd": cmd, "status": "skipped"})
+                continue
+            response = self.send_request(cmd, dict(item.get("args") or {}), timeout_seconds)
+            entry: Dict[str, Any] = {"index": index, "cmd": cmd, "status": response.status}
+            if response.status == "error":
+                entry["error"] = response.error
+                stopped_early = stop_on_error
+            else:
+                entry["result"] = response.result
+            results.append(entry)
+        return RpcResponse(
+            request_id="batch",
+            status="ok",
+            result={
+                "results": results,
+                "executed": sum(1 for item in results if item["status"] != "skipped"),
+                "failed": sum(1 for item in results if item["status"] == "error"),
+                "skipped": sum(1 for item in results if item["status"] == "skipped"),
+                "stopped_early": stopped_early,
+            },
+        )
+
     def launch_background_job(
         self,
         cmd: str,
@@ -34,3 +105,20 @@ class IRpcClient(ABC):
 
     def collect_background_job_result(self, job_id: str, *, timeout_seconds: Optional[float] = None) -> RpcResponse:
         raise NotImplementedError
+
+    def subscribe_background_job(
+        self,
+        job_id: str,
+        on_event: Callable[[Optional[Dict[str, Any]]], None],
+        *,
+        timeout_seconds: Optional[float] = None,
+    ) -> Optional[RpcResponse]:
+        """Subscribe to pushed job snapshots; ``None`` means the transport cannot push.
+
+        ``on_event`` receives each pushed snapshot, or ``None`` once the stream is lost.
+        """
+        return None
+
+    def unsubscribe_background_job(self, subscription_id: str) -> None:
+        """Stop delivering pushed snapshots for a subscription."""
+        return None
@@ -1,5 +1,5 @@
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -10,6 +10,8 @@ class RpcRequest(BaseModel):
     args: Dict[str, Any] = Field(default_factory=dict)
     timeout_seconds: Optional[float] = None
     deadline_unix_ms: Optional[int] = None
+    # "binary" lets the addon answer array-bearing results with a binary frame.
+    accept_encoding: Optional[str] = None
 
 
 class RpcResponse(BaseModel):
@@ -19,3 +21,28 @@ class RpcResponse(BaseModel):
     error: Optional[str] = None
     error_code: Optional[str] = None
     error_boundary: Optional[str] = None
+
+
+def split_batch_response(response: RpcResponse) -> List[RpcResponse]:
+    """Split an ``rpc.batch`` envelope into one ``RpcResponse`` per submitted item.
+
+    Skipped items (after a ``stop_on_error`` failure) surface as errors with
+    ``error_code="batch_item_skipped"``.
+    """
+    result = response.result
+    items = result.get("results") if isinstance(result, dict) else None
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError("Expected a 'results' list in batch RPC result")
+    responses: List[RpcResponse] = []
+    for index, item in enumerate(items):
+        skipped = item.get("status") == "skipped"
+        responses.append(
+            RpcResponse(
+                request_id=f"{response.request_id}:{item.get('index', index)}",
+                status="ok" if item.get("status") == "ok" else "error",
+                result=item.get("result"),
+                error=item.get("error") or ("Skipped after an earlier batch failure" if skipped else None),
+                error_code="batch_item_skipped" if skipped else item.get("error_code"),
+            )
+        )
+    return responses
@@ -103,21 +103,36 @@ class IMeshTool(ABC):
 
     @abstractmethod
     def get_vertex_data(
-        self, object_name: str, selected_only: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        selected_only: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> Dict[str, Any]:
         """Returns vertex positions and selection states for programmatic analysis."""
         pass
 
     @abstractmethod
     def get_edge_data(
-        self, object_name: str, selected_only: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        selected_only: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> Dict[str, Any]:
         """Returns edge connectivity and attributes."""
         pass
 
     @abstractmethod
     def get_face_data(
-        self, object_name: str, selected_only: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        selected_only: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> Dict[str, Any]:
         """Returns face connectivity and attributes."""
         pass
@@ -130,13 +145,19 @@ class IMeshTool(ABC):
         selected_only: bool = False,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> Dict[str, Any]:
         """Returns UV data per face loop."""
         pass
 
     @abstractmethod
     def get_loop_normals(
-        self, object_name: str, selected_only: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        selected_only: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> Dict[str, Any]:
         """Returns per-loop normals (split/custom)."""
         pass
@@ -161,13 +182,19 @@ class IMeshTool(ABC):
         selected_only: bool = False,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> Dict[str, Any]:
         """Returns mesh attribute data."""
         pass
 
     @abstractmethod
     def get_shape_keys(
-        self, object_name: str, include_deltas: bool = False, offset: Optional[int] = None, limit: Optional[int] = None
+        self,
+        object_name: str,
+        include_deltas: bool = False,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        layout: str = "rows",
     ) -> Dict[str, Any]:
         """Returns shape key data (optionally with deltas)."""
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 class ISceneTool(ABC):
@@ -45,6 +45,31 @@ class ISceneTool(ABC):
         """Returns a base64 encoded image of the viewport."""
         pass
 
+    @abstractmethod
+    def get_viewport_file(
+        self,
+        output_path: str,
+        width: int = 1024,
+        height: int = 768,
+        shading: str = "SOLID",
+        camera_name: Optional[str] = None,
+        focus_target: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Renders the viewport straight into a shared-filesystem JPEG path and returns path/size/sha256."""
+        pass
+
+    @abstractmethod
+    def capture_view_set(
+        self,
+        presets: List[Dict[str, Any]],
+        target_object: Optional[str] = None,
+        isolate_objects: Optional[List[str]] = None,
+        timeout_seconds: Optional[float] = None,
+        progress_callback: Optional[Callable[[float, Optional[float], Optional[str]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Renders several viewport presets in one addon background job and returns per-view captures."""
+        pass
+
     @abstractmethod
     def create_light(
         self, type: str, energy: float, color: List[float], location: List[float], name: Optional[str] = None
@@ -259,6 +284,22 @@ class ISceneTool(ABC):
         """Measures whether two scene objects overlap."""
         pass
 
+    @abstractmethod
+    def measure_relations_bulk(
+        self,
+        pairs: List[Dict[str, str]],
+        tolerance: float = 0.0001,
+        max_gap: float = 0.0001,
+        allow_overlap: bool = False,
+    ) -> Dict[str, Any]:
+        """Measures gap, alignment, overlap, and contact for many object pairs in one call."""
+        pass
+
+    @abstractmethod
+    def get_mesh_cache_stats(self, reset: bool = False) -> Dict[str, Any]:
+        """Returns hit/miss/eviction stats for the addon evaluated mesh/BVH cache."""
+        pass
+
     @abstractmethod
     def assert_contact(
         self,
@@ -16,6 +16,30 @@ class Config(BaseSettings):
     # Router Supervisor
     ROUTER_ENABLED: bool = Field(default=True, description="Enable Router Supervisor for LLM tool calls")
     ROUTER_LOG_DECISIONS: bool = Field(default=True, description="Log router decisions")
+    ROUTER_VECTOR_MEMORY_NAMESPACES: str = Field(
+        default="",
+        description="Comma-separated vector namespaces served from an in-memory matrix even with LanceDB (e.g. tools)",
+    )
+    ROUTER_EMBEDDING_BACKEND: str = Field(
+        default="torch",
+        description="Embedding backend for the router semantic layer: torch|torch_int8|onnx",
+    )
+    ROUTER_EMBEDDING_MODEL_PATH: str | None = Field(
+        default=None,
+        description="Local directory (or hub id) of the embedding model; default sentence-transformers/LaBSE",
+    )
+    ROUTER_EMBEDDING_ONNX_FILE: str | None = Field(
+        default=None,
+        description="ONNX file inside the model directory for the onnx backend (e.g. onnx/model_qint8_avx512_vnni.onnx)",
+    )
+    ROUTER_EMBEDDING_CACHE_DIR: str | None = Field(
+        default=None,
+        description="Directory for the persistent router embedding cache; empty disables the disk cache",
+    )
+    ROUTER_WARMUP_ENABLED: bool = Field(
+        default=False,
+        description="Warm up router models, vector store and matchers in background threads at server start",
+    )
     OTEL_ENABLED: bool = Field(default=False, description="Enable OpenTelemetry bootstrap")
     OTEL_EXPORTER: str = Field(default="none", description="OpenTelemetry exporter: none|console|memory")
     OTEL_SERVICE_NAME: str = Field(default="blender-ai-mcp", description="OpenTelemetry service.name")
@@ -27,6 +51,31 @@ class Config(BaseSettings):
     MCP_LIST_PAGE_SIZE: int = Field(default=100, description="Default MCP list page size")
     MCP_TOOL_TIMEOUT_SECONDS: float = Field(default=30.0, gt=0, description="Foreground MCP tool timeout")
     MCP_TASK_TIMEOUT_SECONDS: float = Field(default=300.0, gt=0, description="Background MCP task timeout")
+    MCP_TASK_RESULT_MAX_BYTES: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Resident memory budget for completed background task results (LRU eviction)",
+    )
+    MCP_TASK_RESULT_SPILL_THRESHOLD_BYTES: int = Field(
+        default=256 * 1024,
+        ge=0,
+        description="Task results at or above this size are spilled to disk; 0 disables spilling",
+    )
+    MCP_TASK_RESULT_SPILL_MAX_BYTES: int = Field(
+        default=512 * 1024 * 1024,
+        ge=0,
+        description="Disk budget for spilled background task results (LRU eviction)",
+    )
+    MCP_TASK_RESULT_TTL_SECONDS: float = Field(
+        default=3600.0,
+        ge=0,
+        description="Lifetime of completed task results and terminal job records; 0 keeps them until evicted",
+    )
+    MCP_TASK_RESULT_MAX_ENTRIES: int = Field(
+        default=256,
+        gt=0,
+        description="Maximum stored task results and retained terminal job records",
+    )
     RPC_TIMEOUT_SECONDS: float = Field(default=30.0, gt=0, description="RPC socket timeout")
     ADDON_EXECUTION_TIMEOUT_SECONDS: float = Field(default=30.0, gt=0, description="Blender addon execution timeout")
     MCP_PROMPTS_AS_TOOLS_ENABLED: bool = Field(
@@ -76,6 +125,15 @@ class Config(BaseSettings):
         default=None,
         description="Optional external vision contract profile override: generic_full|google_family_compare",
     )
+    VISION_EXTERNAL_MAX_CONCURRENCY: int = Field(
+        default=4,
+        gt=0,
+        description="Maximum concurrent requests (and pooled keep-alive connections) per external vision provider",
+    )
+    VISION_EXTERNAL_HTTP2: bool = Field(
+        default=False,
+        description="Use HTTP/2 for external vision requests when the optional 'h2' package is installed",
+    )
     VISION_OPENROUTER_BASE_URL: str | None = Field(
         default=None,
         description="Optional OpenRouter base URL override for vision; defaults to https://openrouter.ai/api/v1",
@@ -150,6 +208,29 @@ class Config(BaseSettings):
         gt=0,
         description="Maximum part outputs accepted from the optional segmentation sidecar",
     )
+    VISION_RESULT_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Reuse vision results for byte-identical images, prompt profile, and model",
+    )
+    VISION_RESULT_CACHE_DIR: str | None = Field(
+        default=None,
+        description="Directory for the on-disk vision result cache; empty keeps the cache in memory only",
+    )
+    VISION_RESULT_CACHE_TTL_SECONDS: float = Field(
+        default=86400.0,
+        gt=0,
+        description="Lifetime of one cached vision result",
+    )
+    VISION_RESULT_CACHE_MAX_ENTRIES: int = Field(
+        default=64,
+        gt=0,
+        description="Maximum vision results kept in memory",
+    )
+    VISION_RESULT_CACHE_MAX_BYTES: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Maximum size of the on-disk vision result cache (least recently used entries are evicted)",
+    )
 
     @model_validator(mode="after")
     def validate_timeout_hierarchy(self):
@@ -197,6 +278,16 @@ def get_config() -> Config:
         BLENDER_RPC_PORT=int(os.getenv("BLENDER_RPC_PORT", 8765)),
         ROUTER_ENABLED=os.getenv("ROUTER_ENABLED", "true").lower() in ("true", "1", "yes"),
         ROUTER_LOG_DECISIONS=os.getenv("ROUTER_LOG_DECISIONS", "true").lower() in ("true", "1", "yes"),
+        ROUTER_VECTOR_MEMORY_NAMESPACES=os.getenv("ROUTER_VECTOR_MEMORY_NAMESPACES", ""),
+        ROUTER_EMBEDDING_BACKEND=os.getenv("ROUTER_EMBEDDING_BACKEND", "torch").strip().lower() or "torch",
+        ROUTER_EMBEDDING_MODEL_PATH=os.getenv("ROUTER_EMBEDDING_MODEL_PATH") or None,
+        ROUTER_EMBEDDING_ONNX_FILE=os.getenv("ROUTER_EMBEDDING_ONNX_FILE") or None,
+        ROUTER_EMBEDDING_CACHE_DIR=os.getenv(
+            "ROUTER_EMBEDDING_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".cache", "blender-ai-mcp", "embeddings"),
+        )
+        or None,
+        ROUTER_WARMUP_ENABLED=os.getenv("ROUTER_WARMUP_ENABLED", "false").lower() in ("true", "1", "yes"),
         OTEL_ENABLED=os.getenv("OTEL_ENABLED", "false").lower() in ("true", "1", "yes"),
         OTEL_EXPORTER=os.getenv("OTEL_EXPORTER", "none"),
         OTEL_SERVICE_NAME=os.getenv("OTEL_SERVICE_NAME", "blender-ai-mcp"),
@@ -206,6 +297,11 @@ def get_config() -> Config:
         MCP_LIST_PAGE_SIZE=int(os.getenv("MCP_LIST_PAGE_SIZE", 100)),
         MCP_TOOL_TIMEOUT_SECONDS=float(os.getenv("MCP_TOOL_TIMEOUT_SECONDS", 30.0)),
         MCP_TASK_TIMEOUT_SECONDS=float(os.getenv("MCP_TASK_TIMEOUT_SECONDS", 300.0)),
+        MCP_TASK_RESULT_MAX_BYTES=int(os.getenv("MCP_TASK_RESULT_MAX_BYTES", 64 * 1024 * 1024)),
+        MCP_TASK_RESULT_SPILL_THRESHOLD_BYTES=int(os.getenv("MCP_TASK_RESULT_SPILL_THRESHOLD_BYTES", 256 * 1024)),
+        MCP_TASK_RESULT_SPILL_MAX_BYTES=int(os.getenv("MCP_TASK_RESULT_SPILL_MAX_BYTES", 512 * 1024 * 1024)),
+        MCP_TASK_RESULT_TTL_SECONDS=float(os.getenv("MCP_TASK_RESULT_TTL_SECONDS", 3600.0)),
+        MCP_TASK_RESULT_MAX_ENTRIES=int(os.getenv("MCP_TASK_RESULT_MAX_ENTRIES", 256)),
         RPC_TIMEOUT_SECONDS=float(os.getenv("RPC_TIMEOUT_SECONDS", 30.0)),
         ADDON_EXECUTION_TIMEOUT_SECONDS=float(os.getenv("ADDON_EXECUTION_TIMEOUT_SECONDS", 30.0)),
         MCP_PROMPTS_AS_TOOLS_ENABLED=(
@@ -233,6 +329,8 @@ def get_config() -> Config:
         VISION_EXTERNAL_API_KEY_ENV=os.getenv("VISION_EXTERNAL_API_KEY_ENV") or None,
         VISION_EXTERNAL_PROVIDER=os.getenv("VISION_EXTERNAL_PROVIDER", "generic"),
         VISION_EXTERNAL_CONTRACT_PROFILE=os.getenv("VISION_EXTERNAL_CONTRACT_PROFILE") or None,
+        VISION_EXTERNAL_MAX_CONCURRENCY=int(os.getenv("VISION_EXTERNAL_MAX_CONCURRENCY", 4)),
+        VISION_EXTERNAL_HTTP2=os.getenv("VISION_EXTERNAL_HTTP2", "false").lower() in ("true", "1", "yes"),
         VISION_OPENROUTER_BASE_URL=os.getenv("VISION_OPENROUTER_BASE_URL") or None,
         VISION_OPENROUTER_MODEL=os.getenv("VISION_OPENROUTER_MODEL") or None,
         VISION_OPENROUTER_API_KEY=os.getenv("VISION_OPENROUTER_API_KEY") or None,
@@ -260,4 +358,13 @@ def get_config() -> Config:
         VISION_SEGMENTATION_API_KEY_ENV=os.getenv("VISION_SEGMENTATION_API_KEY_ENV") or None,
         VISION_SEGMENTATION_TIMEOUT_SECONDS=float(os.getenv("VISION_SEGMENTATION_TIMEOUT_SECONDS", 15.0)),
         VISION_SEGMENTATION_MAX_PARTS=int(os.getenv("VISION_SEGMENTATION_MAX_PARTS", 16)),
+        VISION_RESULT_CACHE_ENABLED=os.getenv("VISION_RESULT_CACHE_ENABLED", "true").lower() in ("true", "1", "yes"),
+        VISION_RESULT_CACHE_DIR=os.getenv(
+            "VISION_RESULT_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".cache", "blender-ai-mcp", "vision_results"),
+        )
+        or None,
+        VISION_RESULT_CACHE_TTL_SECONDS=float(os.getenv("VISION_RESULT_CACHE_TTL_SECONDS", 86400.0)),
+        VISION_RESULT_CACHE_MAX_ENTRIES=int(os.getenv("VISION_RESULT_CACHE_MAX_ENTRIES", 64)),
+        VISION_RESULT_CACHE_MAX_BYTES=int(os.getenv("VISION_RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
     )
@@ -1,3 +1,6 @@
+import threading
+from pathlib import Path
+
 from server.adapters.rpc.client import RpcClient
 from server.application.tool_handlers.armature_handler import ArmatureToolHandler
 from server.application.tool_handlers.baking_handler import BakingToolHandler
@@ -154,41 +157,77 @@ def get_armature_handler() -> IArmatureTool:
 
 # Shared instances for router components (TASK-048)
 _labse_model_instance = None
+_embedding_service_instance = None
 _vector_store_instance = None
 _intent_classifier_instance = None
 _workflow_classifier_instance = None
+_tool_metadata_instance = None
 _router_instance = None
 
+# Router singletons may be built concurrently by the startup warm-up
+# (server/infrastructure/router_warmup.py) and by early tool calls; each
+# provider holds its own lock so late callers wait instead of loading twice.
+_labse_model_lock = threading.Lock()
+_embedding_service_lock = threading.Lock()
+_vector_store_lock = threading.Lock()
+_intent_classifier_lock = threading.Lock()
+_workflow_classifier_lock = threading.Lock()
+_tool_metadata_lock = threading.Lock()
+_router_lock = threading.Lock()
+
+
+def get_embedding_backend_spec():
+    """Provider for the configured embedding backend (ROUTER_EMBEDDING_*)."""
+    import os
+
+    from server.router.infrastructure.embedding_backends import EmbeddingBackendSpec
+
+    config = get_config()
+    return EmbeddingBackendSpec(
+        backend=config.ROUTER_EMBEDDING_BACKEND,
+        model_path=config.ROUTER_EMBEDDING_MODEL_PATH,
+        onnx_file=config.ROUTER_EMBEDDING_ONNX_FILE,
+        local_files_only=os.getenv("HF_HUB_OFFLINE", "").lower() in ("1", "true", "yes"),
+    )
+
+
+def get_embedding_model_name() -> str:
+    """Name keying embedding caches and stored content hashes for the configured backend."""
+    return get_embedding_backend_spec().cache_name
+
 
 def get_labse_model():
-    """Provider for shared LaBSE model (~1.8GB RAM).
+    """Provider for shared LaBSE model (~1.8GB RAM at full precision).
 
     Singleton - shared between IntentClassifier and WorkflowIntentClassifier.
+    Loaded through the configured embedding backend (fp32, int8, or ONNX).
     """
     global _labse_model_instance
-    if _labse_model_instance is None:
+    if _labse_model_instance is not None:
+        return _labse_model_instance
+
+    with _labse_model_lock:
+        if _labse_model_instance is not None:
+            return _labse_model_instance
         try:
             import logging
             import os
 
-            from sentence_transformers import SentenceTransformer
+            from server.router.infrastructure.embedding_backends import load_embedding_model
 
             running_pytest = os.getenv("PYTEST_CURRENT_TEST") is not None
             if running_pytest:
                 logging.info("Skipping LaBSE load under pytest")
                 return None
 
-            local_only = os.getenv("HF_HUB_OFFLINE", "").lower() in ("1", "true", "yes")
-            logging.info("Loading shared LaBSE model...")
-            _labse_model_instance = SentenceTransformer(
-                "sentence-transformers/LaBSE",
-                local_files_only=local_only,
-            )
+            spec = get_embedding_backend_spec()
+            logging.info(f"Loading shared LaBSE model ({spec.backend})...")
+            _labse_model_instance = load_embedding_model(spec)
             logging.info("Shared LaBSE model loaded")
-        except ImportError:
+        except ImportError as e:
             import logging
 
-            logging.warning("sentence-transformers not installed, LaBSE model unavailable")
+            logging.warning(f"Embedding backend dependencies not installed, LaBSE model unavailable ({e})")
             return None
         except Exception as e:
             import logging
@@ -198,6 +237,30 @@ def get_labse_model():
     return _labse_model_instance
 
 
+def get_embedding_service():
+    """Provider for the shared batched/cached embedding service over LaBSE.
+
+    Singleton - returns None when the LaBSE model is unavailable. The disk
+    cache lives in ``ROUTER_EMBEDDING_CACHE_DIR`` (empty disables it).
+    """
+    global _embedding_service_instance
+    if _embedding_service_instance is None:
+        with _embedding_service_lock:
+            if _embedding_service_instance is None:
+                model = get_labse_model()
+                if model is None:
+                    return None
+                from server.router.infrastructure.embedding_service import EmbeddingService
+
+                cache_dir = get_config().ROUTER_EMBEDDING_CACHE_DIR
+                _embedding_service_instance = EmbeddingService(
+                    model,
+                    model_name=get_embedding_model_name(),
+                    cache_dir=Path(cache_dir).expanduser() if cache_dir else None,
+                )
+    return _embedding_service_instance
+
+
 def get_vector_store():
     """Provider for shared LanceVectorStore.
 
@@ -205,9 +268,15 @@ def get_vector_store():
     """
     global _vector_store_instance
     if _vector_store_instance is None:
-        from server.router.infrastructure.vector_store.lance_store import LanceVectorStore
-
-        _vector_store_instance = LanceVectorStore()
+        with _vector_store_lock:
+            if _vector_store_instance is None:
+                from server.router.infrastructure.vector_store.lance_store import (
+                    LanceVectorStore,
+                    parse_vector_namespaces,
+                )
+
+                memory_namespaces = parse_vector_namespaces(get_config().ROUTER_VECTOR_MEMORY_NAMESPACES)
+                _vector_store_instance = LanceVectorStore(memory_namespaces=memory_namespaces)
     return _vector_store_instance
 
 
@@ -234,39 +303,69 @@ def get_postcondition_registry() -> PostconditionRegistry:
 def get_intent_classifier():
     """Provider for IntentClassifier (tool classification).
 
-    Singleton - uses shared LaBSE model and vector store.
+    Singleton - uses the shared embedding service and vector store.
     """
     global _intent_classifier_instance
     if _intent_classifier_instance is None:
-        from server.router.application.classifier.intent_classifier import IntentClassifier
-
-        _intent_classifier_instance = IntentClassifier(
-            config=get_router_config(),
-            vector_store=get_vector_store(),
-            model=get_labse_model(),
-        )
+        with _intent_classifier_lock:
+            if _intent_classifier_instance is None:
+                from server.router.application.classifier.intent_classifier import IntentClassifier
+
+                _intent_classifier_instance = IntentClassifier(
+                    config=get_router_config(),
+                    vector_store=get_vector_store(),
+                    model_name=get_embedding_model_name(),
+                    model=get_embedding_service(),
+                )
     return _intent_classifier_instance
 
 
 def get_workflow_classifier():
     """Provider for WorkflowIntentClassifier (workflow classification).
 
-    Singleton - uses shared LaBSE model and vector store.
+    Singleton - uses the shared embedding service and vector store.
     """
     global _workflow_classifier_instance
     if _workflow_classifier_instance is None:
-        from server.router.application.classifier.workflow_intent_classifier import (
-            WorkflowIntentClassifier,
-        )
-
-        _workflow_classifier_instance = WorkflowIntentClassifier(
-            config=get_router_config(),
-            vector_store=get_vector_store(),
-            model=get_labse_model(),
-        )
+        with _workflow_classifier_lock:
+            if _workflow_classifier_instance is None:
+                from server.router.application.classifier.workflow_intent_classifier import (
+                    WorkflowIntentClassifier,
+                )
+
+                _workflow_classifier_instance = WorkflowIntentClassifier(
+                    config=get_router_config(),
+                    vector_store=get_vector_store(),
+                    model_name=get_embedding_model_name(),
+                    model=get_embedding_service(),
+                )
     return _workflow_classifier_instance
 
 
+def get_tool_metadata():
+    """Provider for tool metadata dicts used by intent classification.
+
+    Singleton - parses the per-tool metadata JSON files once. Returns an
+    empty dict (not cached) when loading fails.
+    """
+    global _tool_metadata_instance
+    if _tool_metadata_instance is None:
+        with _tool_metadata_lock:
+            if _tool_metadata_instance is None:
+                from server.router.infrastructure.metadata_loader import MetadataLoader
+
+                try:
+                    metadata = MetadataLoader().load_all()
+                except Exception as e:
+                    import logging
+
+                    logging.warning(f"Failed to load tool metadata for router: {e}")
+                    return {}
+                # Convert ToolMetadata objects to dicts for classifier
+                _tool_metadata_instance = {name: tool.to_dict() for name, tool in metadata.items()}
+    return _tool_metadata_instance
+
+
 def get_router():
     """Provider for SupervisorRouter. Singleton with lazy initialization.
 
@@ -280,27 +379,27 @@ def get_router():
         return None
 
     if _router_instance is None:
-        from server.router.application.router import SupervisorRouter
-        from server.router.infrastructure.metadata_loader import MetadataLoader
-
-        _router_instance = SupervisorRouter(
-            config=get_router_config(),
-            rpc_client=get_rpc_client(),
-            classifier=get_intent_classifier(),
-            workflow_classifier=get_workflow_classifier(),
-        )
-
-        # Load tool metadata for intent classification
-        try:
-            loader = MetadataLoader()
-            metadata = loader.load_all()
-            # Convert ToolMetadata objects to dicts for classifier
-            metadata_dicts = {name: tool.to_dict() for name, tool in metadata.items()}
-            _router_instance.load_tool_metadata(metadata_dicts)
-        except Exception as e:
-            import logging
-
-            logging.warning(f"Failed to load tool metadata for router: {e}")
+        with _router_lock:
+            if _router_instance is None:
+                from server.router.application.router import SupervisorRouter
+
+                router = SupervisorRouter(
+                    config=get_router_config(),
+                    rpc_client=get_rpc_client(),
+                    classifier=get_intent_classifier(),
+                    workflow_classifier=get_workflow_classifier(),
+                )
+
+                # Load tool metadata for intent classification
+                try:
+                    router.load_tool_metadata(get_tool_metadata())
+                except Exception as e:
+                    import logging
+
+                    logging.warning(f"Failed to load tool metadata for router: {e}")
+
+                # Publish only once fully loaded so lock-free readers never see a half-built router
+                _router_instance = router
 
     return _router_instance
 
@@ -0,0 +1,123 @@
+"""Shared-filesystem handoff helpers for files written by the Blender addon.
+
+When the MCP server and Blender share a filesystem (local runs, Docker volume
+mounts), the addon can write captures straight into the server's output
+directory and return only ``{path, size, sha256}``. The server then verifies
+the file in place instead of moving image bytes through base64-in-JSON.
+
+Environment Variables:
+    BLENDER_AI_CAPTURE_HANDOFF: Optional. ``auto`` (default) tries the file
+        handoff and falls back to inline base64 when the addon cannot write the
+        path or the written file does not verify. After the first file that does
+        not verify, ``auto`` stays on inline base64 for the rest of the process.
+        ``inline`` always uses base64.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_HANDOFF_ENV = "BLENDER_AI_CAPTURE_HANDOFF"
+CAPTURE_HANDOFF_MODES = ("auto", "inline")
+
+_handoff_lock = threading.Lock()
+_handoff_failed = False
+
+
+def capture_handoff_mode() -> str:
+    """Return the configured capture handoff mode (unknown values mean ``auto``)."""
+
+    mode = (os.getenv(CAPTURE_HANDOFF_ENV) or "auto").strip().lower()
+    return mode if mode in CAPTURE_HANDOFF_MODES else "auto"
+
+
+def file_handoff_enabled() -> bool:
+    """Return True while captures should try the shared-file path.
+
+    False in ``inline`` mode and after a handoff in this process failed to verify,
+    so a server that does not share the addon's filesystem renders each capture once.
+    """
+
+    return capture_handoff_mode() != "inline" and not _handoff_failed
+
+
+def record_handoff_failure(addon_paths: Iterable[str], local_paths: Iterable[Union[str, Path]] = ()) -> None:
+    """Switch ``auto`` handoff off for this process and clean up after the failed attempt.
+
+    Local files that exist but did not verify are deleted. Files the addon wrote
+    where this server cannot see them are reported once, so they can be removed
+    on the Blender host.
+    """
+
+    global _handoff_failed
+    for path in local_paths:
+        try:
+            Path(path).unlink(missing_ok=True)
+        except OSError:
+            pass
+    with _handoff_lock:
+        first_failure = not _handoff_failed
+        _handoff_failed = True
+    if first_failure:
+        logger.warning(
+            "Capture file handoff did not verify; using inline base64 for the rest of this process "
+            "(set %s=inline to skip the probe). Unverified addon-side files: %s",
+            CAPTURE_HANDOFF_ENV,
+            ", ".join(str(path) for path in addon_paths) or "-",
+        )
+
+
+def reset_handoff_state() -> None:
+    """Forget a recorded handoff failure (tests, or after fixing the volume mapping)."""
+
+    global _handoff_failed
+    with _handoff_lock:
+        _handoff_failed = False
+
+
+@contextmanager
+def mapped_file(path: Union[str, Path]) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Yield a read-only buffer over ``path``, memory-mapped when the platform allows it.
+
+    Empty files (which cannot be mapped) yield ``b""``; filesystems without mmap
+    support fall back to a plain read.
+    """
+
+    with open(path, "rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield handle.read()
+            return
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """Return the hex SHA-256 of a file, hashed straight from its mapped pages."""
+
+    with mapped_file(path) as data:
+        return hashlib.sha256(data).hexdigest()
+
+
+def verify_handoff_file(path: Union[str, Path], *, size: Optional[int], sha256: Optional[str]) -> bool:
+    """Return True when ``path`` exists with the size and checksum reported by the addon."""
+
+    try:
+        file_path = Path(path)
+        if not file_path.is_file() or size is None or not sha256:
+            return False
+        if file_path.stat().st_size != int(size):
+            return False
+        return file_sha256(file_path) == str(sha256).lower()
+    except (OSError, ValueError, TypeError):
+        return False
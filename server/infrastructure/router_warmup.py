@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: 2024-2026 Patryk Ciechański
+# SPDX-License-Identifier: Apache-2.0
+
+"""Opt-in background warm-up of the Router Supervisor singletons.
+
+The router is otherwise built lazily on the first routed tool call, which
+then pays for the LaBSE load, LanceDB open, tool metadata parsing, tool and
+workflow embeddings, and EnsembleMatcher setup inline. The warm-up runs those
+stages in daemon threads right after server bootstrap. Independent stages run
+concurrently; dependent stages start once their prerequisites finish.
+
+The stages call the regular DI providers, whose per-singleton locks make an
+early tool call wait for the stage already in flight instead of redoing it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+
+
+@dataclass
+class WarmupStage:
+    """One warm-up step and its readiness/timing state."""
+
+    name: str
+    func: Callable[[], Any]
+    after: tuple[str, ...] = ()
+    status: str = field(default=PENDING, init=False)
+    error: str | None = field(default=None, init=False)
+    started_at: float | None = field(default=None, init=False)
+    finished_at: float | None = field(default=None, init=False)
+    done: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return round((end - self.started_at) * 1000.0, 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"status": self.status, "duration_ms": self.duration_ms}
+        if self.after:
+            payload["after"] = list(self.after)
+        if self.error:
+            payload["error"] = self.error
+        return payload
+
+
+class RouterWarmup:
+    """Runs warm-up stages in background threads and tracks their readiness."""
+
+    def __init__(self, stages: Sequence[WarmupStage]):
+        self._stages = {stage.name: stage for stage in stages}
+        for stage in stages:
+            unknown = [name for name in stage.after if name not in self._stages]
+            if unknown:
+                raise ValueError(f"Warm-up stage '{stage.name}' depends on unknown stage(s): {unknown}")
+        self._started_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def stage_names(self) -> list[str]:
+        return list(self._stages)
+
+    def start(self) -> None:
+        """Start one daemon thread per stage (idempotent)."""
+
+        with self._lock:
+            if self._started_at is not None:
+                return
+            self._started_at = time.perf_counter()
+        for stage in self._stages.values():
+            threading.Thread(
+                target=self._run_stage, args=(stage,), name=f"router-warmup-{stage.name}", daemon=True
+            ).start()
+
+    def _run_stage(self, stage: WarmupStage) -> None:
+        for name in stage.after:
+            self._stages[name].done.wait()
+
+        stage.started_at = time.perf_counter()
+        stage.status = RUNNING
+        try:
+            stage.func()
+        except Exception as e:
+            stage.error = f"{type(e).__name__}: {e}"
+            stage.status = FAILED
+            logger.warning("Router warm-up stage '%s' failed: %s", stage.name, stage.error)
+        else:
+            stage.status = READY
+        finally:
+            stage.finished_at = time.perf_counter()
+            stage.done.set()
+        logger.info("Router warm-up stage '%s' %s in %.1f ms", stage.name, stage.status, stage.duration_ms or 0.0)
+
+    def wait(self, name: str, timeout: float | None = None) -> bool:
+        """Block until a stage finishes; True when it finished successfully."""
+
+        stage = self._stages[name]
+        stage.done.wait(timeout)
+        return stage.status == READY
+
+    def is_pending(self, name: str) -> bool:
+        """True while a stage has not finished (queued or running)."""
+
+        return not self._stages[name].done.is_set()
+
+    def status(self) -> dict[str, Any]:
+        """Readiness and timing per stage, safe to call while stages run."""
+
+        stages = {name: stage.to_dict() for name, stage in self._stages.items()}
+        finished = [stage for stage in self._stages.values() if stage.done.is_set()]
+        elapsed_ms = None
+        if self._started_at is not None:
+            ends = [stage.finished_at for stage in finished if stage.finished_at is not None]
+            end = max(ends) if len(finished) == len(self._stages) and ends else time.perf_counter()
+            elapsed_ms = round((end - self._started_at) * 1000.0, 1)
+        return {
+            "started": self._started_at is not None,
+            "completed": len(finished) == len(self._stages),
+            "ready": all(stage.status == READY for stage in self._stages.values()),
+            "elapsed_ms": elapsed_ms,
+            "stages": stages,
+        }
+
+
+def _warm_labse_model() -> None:
+    from server.infrastructure import di
+
+    if di.get_embedding_service() is None:
+        raise RuntimeError("LaBSE model unavailable; router falls back to non-semantic matching")
+
+
+def _warm_vector_store() -> None:
+    from server.infrastructure import di
+
+    di.get_vector_store()
+
+
+def _warm_tool_metadata() -> None:
+    from server.infrastructure import di
+
+    if not di.get_tool_metadata():
+        raise RuntimeError("No tool metadata loaded")
+
+
+def _warm_router() -> None:
+    from server.infrastructure import di
+
+    if di.get_router() is None:
+        raise RuntimeError("Router is disabled")
+
+
+def _warm_ensemble() -> None:
+    from server.infrastructure import di
+
+    router = di.get_router()
+    if router is None:
+        raise RuntimeError("Router is disabled")
+    router.warm_up_ensemble()
+
+
+def default_router_stages() -> list[WarmupStage]:
+    """Stages mirroring what the first routed call would otherwise do inline."""
+
+    return [
+        WarmupStage("labse_model", _warm_labse_model),
+        WarmupStage("vector_store", _warm_vector_store),
+        WarmupStage("tool_metadata", _warm_tool_metadata),
+        # Classifiers + tool embeddings; waits for the shared model/store/metadata
+        WarmupStage("router", _warm_router, after=("labse_model", "vector_store", "tool_metadata")),
+        # Workflow registry, workflow embeddings, EnsembleMatcher
+        WarmupStage("ensemble", _warm_ensemble, after=("router",)),
+    ]
+
+
+_warmup_instance: RouterWarmup | None = None
+_warmup_lock = threading.Lock()
+
+
+def start_router_warmup(stages: Sequence[WarmupStage] | None = None) -> RouterWarmup:
+    """Start the process-wide router warm-up once and return it."""
+
+    global _warmup_instance
+    with _warmup_lock:
+        if _warmup_instance is None:
+            _warmup_instance = RouterWarmup(default_router_stages() if stages is None else stages)
+            _warmup_instance.start()
+        return _warmup_instance
+
+
+def get_router_warmup() -> RouterWarmup | None:
+    """Return the running warm-up, or None when it was never started."""
+
+    return _warmup_instance
+
+
+def reset_router_warmup() -> None:
+    """Forget the process-wide warm-up (tests only; running threads are not stopped)."""
+
+    global _warmup_instance
+    with _warmup_lock:
+        _warmup_instance = None
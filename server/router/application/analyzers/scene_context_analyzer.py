@@ -2,8 +2,13 @@
 Scene Context Analyzer Implementation.
 
 Analyzes Blender scene state via RPC for router decision making.
+
+Addons that provide ``scene.router_context`` are read with one RPC per
+analysis; the cached context is reused while the addon's scene revision is
+unchanged. Older addons fall back to the per-field RPCs with a TTL cache.
 """
 
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -24,7 +29,7 @@ class SceneContextAnalyzer(ISceneAnalyzer):
 
     Attributes:
         rpc_client: RPC client for Blender communication.
-        cache_ttl: Cache time-to-live in seconds.
+        cache_ttl: Cache time-to-live in seconds (legacy per-field RPC path).
     """
 
     def __init__(
@@ -42,6 +47,10 @@ class SceneContextAnalyzer(ISceneAnalyzer):
         self._cache_ttl = cache_ttl
         self._cached_context: Optional[SceneContext] = None
         self._cache_timestamp: Optional[datetime] = None
+        # Scene revision of the cached context (router_context path only)
+        self._cached_revision: Optional[int] = None
+        # None = not probed yet, False = addon lacks scene.router_context
+        self._router_context_supported: Optional[bool] = None
 
     def set_rpc_client(self, rpc_client: Any) -> None:
         """Set the RPC client.
@@ -50,6 +59,8 @@ class SceneContextAnalyzer(ISceneAnalyzer):
             rpc_client: RPC client for Blender communication.
         """
         self._rpc_client = rpc_client
+        self._router_context_supported = None
+        self.invalidate_cache()
 
     def analyze(self, object_name: Optional[str] = None) -> SceneContext:
         """Analyze current scene context.
@@ -60,6 +71,11 @@ class SceneContextAnalyzer(ISceneAnalyzer):
         Returns:
             SceneContext with current scene state.
         """
+        if self._rpc_client is not None and self._router_context_supported is not False:
+            context = self._analyze_router_context(object_name)
+            if context is not None:
+                return context
+
         # Check cache first
         cached = self.get_cached()
         if cached is not None:
@@ -147,6 +163,134 @@ class SceneContextAnalyzer(ISceneAnalyzer):
         """Invalidate the scene context cache."""
         self._cached_context = None
         self._cache_timestamp = None
+        self._cached_revision = None
+
+    def _analyze_router_context(self, object_name: Optional[str]) -> Optional[SceneContext]:
+        """Analyze via the composite ``scene.router_context`` RPC.
+
+        Sends the cached revision; if the addon reports it unchanged, only the
+        hot state (mode, active object, selection) is refreshed in the cached
+        context.
+
+        Returns:
+            SceneContext, or None to fall back to the per-field RPCs.
+        """
+        cached = self._cached_context
+        since_revision = None
+        if cached is not None and self._cached_revision is not None and object_name in (None, cached.active_object):
+            since_revision = self._cached_revision
+
+        payload = self._get_router_context_rpc(object_name, since_revision)
+        if payload is None:
+            return None
+
+        if payload.get("unchanged") and cached is not None:
+            mode = self._normalize_mode(payload.get("mode"))
+            active_object = payload.get("active_object")
+            active_changed = object_name is None and cached.active_object and active_object != cached.active_object
+            if mode == cached.mode and not active_changed:
+                context = self._apply_hot_state(cached, payload, object_name)
+                self._cached_context = context
+                return context
+            # Revision counters miss some UI-only changes; re-read everything
+            payload = self._get_router_context_rpc(object_name, None)
+            if payload is None:
+                return None
+
+        context = self._context_from_router_payload(payload, object_name)
+        self._cached_context = context
+        self._cache_timestamp = datetime.now()
+        self._cached_revision = payload["revision"]
+        return context
+
+    def _apply_hot_state(
+        self, context: SceneContext, payload: Dict[str, Any], object_name: Optional[str]
+    ) -> SceneContext:
+        """Return a copy of a cached context with mode/selection from a router_context payload.
+
+        The cached context may already be held by earlier callers, so it is
+        never changed in place.
+        """
+        active_object = object_name or payload.get("active_object") or context.active_object
+        selected_objects = list(payload.get("selected_object_names", context.selected_objects))
+        topology = context.topology
+        if context.mode == "EDIT" and topology is not None:
+            topology = replace(
+                topology,
+                selected_verts=int(payload.get("edit_mode_vertex_count") or 0),
+                selected_edges=int(payload.get("edit_mode_edge_count") or 0),
+                selected_faces=int(payload.get("edit_mode_face_count") or 0),
+            )
+        return replace(
+            context,
+            active_object=active_object,
+            selected_objects=selected_objects,
+            objects=[
+                replace(obj, selected=obj.name in selected_objects, active=obj.name == active_object)
+                for obj in context.objects
+            ],
+            topology=topology,
+        )
+
+    def _context_from_router_payload(self, payload: Dict[str, Any], object_name: Optional[str]) -> SceneContext:
+        """Build SceneContext from a full router_context payload."""
+        mode = self._normalize_mode(payload.get("mode"))
+        active_object = object_name or payload.get("active_object")
+        selected_objects = payload.get("selected_object_names", [])
+        focus = payload.get("focus") if isinstance(payload.get("focus"), dict) else {}
+        if focus.get("name") != active_object:
+            focus = {}
+
+        objects = []
+        for obj_data in payload.get("objects", []):
+            if not isinstance(obj_data, dict):
+                continue
+            obj_name = obj_data.get("name", "")
+            is_active = obj_name == active_object
+            objects.append(
+                ObjectInfo(
+                    name=obj_name,
+                    type=obj_data.get("type", "MESH"),
+                    location=obj_data.get("location", [0.0, 0.0, 0.0]),
+                    dimensions=focus.get("dimensions", [1.0, 1.0, 1.0]) if is_active else [1.0, 1.0, 1.0],
+                    selected=obj_name in selected_objects,
+                    active=is_active,
+                )
+            )
+
+        topology = None
+        topology_data = focus.get("topology")
+        if mode == "EDIT" and isinstance(topology_data, dict):
+            topology = TopologyInfo(
+                vertices=int(topology_data.get("vertex_count") or 0),
+                edges=int(topology_data.get("edge_count") or 0),
+                faces=int(topology_data.get("face_count") or 0),
+                triangles=int(topology_data.get("triangle_count") or 0),
+                selected_verts=int(payload.get("edit_mode_vertex_count") or 0),
+                selected_edges=int(payload.get("edit_mode_edge_count") or 0),
+                selected_faces=int(payload.get("edit_mode_face_count") or 0),
+            )
+
+        proportions = None
+        for obj in objects:
+            if obj.active and obj.dimensions:
+                proportions = calculate_proportions(obj.dimensions)
+                break
+
+        materials = focus.get("material_names", [])
+        modifiers = focus.get("modifier_names", [])
+
+        return SceneContext(
+            mode=mode,
+            active_object=active_object,
+            selected_objects=selected_objects,
+            objects=objects,
+            topology=topology,
+            proportions=proportions,
+            materials=materials if isinstance(materials, list) else [],
+            modifiers=modifiers if isinstance(modifiers, list) else [],
+            timestamp=datetime.now(),
+        )
 
     def get_mode(self) -> str:
         """Get current Blender mode.
@@ -338,6 +482,42 @@ class SceneContextAnalyzer(ISceneAnalyzer):
             logging.error(f"_get_mode_data_rpc failed: {e}")
             return {"mode": "OBJECT"}
 
+    def _get_router_context_rpc(
+        self,
+        object_name: Optional[str],
+        since_revision: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        """Get the composite router context via RPC.
+
+        Returns:
+            Payload dict, or None when the call failed or the addon does not
+            support ``scene.router_context`` (remembered until the client changes).
+        """
+        client = self._rpc_client
+        if client is None:
+            return None
+        args: Dict[str, Any] = {}
+        if object_name:
+            args["object_name"] = object_name
+        if since_revision is not None:
+            args["since_revision"] = since_revision
+        try:
+            response = client.send_request("scene.router_context", args)
+        except Exception as e:
+            import logging
+
+            logging.warning(f"_get_router_context_rpc failed: {e}")
+            return None
+
+        result = response.result
+        if response.status == "ok" and isinstance(result, dict) and isinstance(result.get("revision"), int):
+            self._router_context_supported = True
+            return result
+        if response.status == "ok" or "Unknown command" in str(getattr(response, "error", "") or ""):
+            # Older addon: use the per-field RPCs from now on
+            self._router_context_supported = False
+        return None
+
     def _get_objects_rpc(self) -> List[Dict[str, Any]]:
         """Get objects list via RPC."""
         client = self._rpc_client
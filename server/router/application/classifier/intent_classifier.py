@@ -14,9 +14,14 @@ from server.router.domain.interfaces.i_intent_classifier import IIntentClassifie
 from server.router.domain.interfaces.i_vector_store import (
     IVectorStore,
     VectorNamespace,
-    VectorRecord,
 )
 from server.router.infrastructure.config import RouterConfig
+from server.router.infrastructure.vector_store.embedding_sync import (
+    EmbeddingEntry,
+    EmbeddingSyncPlan,
+    apply_embedding_sync,
+    plan_embedding_sync,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -284,18 +289,19 @@ class IntentClassifier(IIntentClassifier):
             if texts:
                 self._tool_texts[tool_name] = texts
 
-        # Check if vector store already has embeddings
+        # Only re-embed tools whose text or metadata changed since the last sync
         store = self._ensure_vector_store()
-        existing_count = store.count(VectorNamespace.TOOLS)
+        plan = plan_embedding_sync(store, VectorNamespace.TOOLS, self._build_tool_entries(metadata), self._model_name)
 
-        if existing_count >= len(self._tool_texts):
-            logger.info(f"Vector store already has {existing_count} tool embeddings")
+        if plan.is_up_to_date:
+            log = logger.debug if plan.cached else logger.info
+            log(f"Vector store tool embeddings are up to date ({plan.unchanged} tools)")
             self._is_loaded = True
             return
 
         # Compute and store embeddings if available
         if EMBEDDINGS_AVAILABLE and self._load_model():
-            self._compute_and_store_embeddings(metadata)
+            self._compute_and_store_embeddings(metadata, plan)
             if store.count(VectorNamespace.TOOLS) > 0:
                 self._is_loaded = True
                 return
@@ -304,54 +310,57 @@ class IntentClassifier(IIntentClassifier):
         self._setup_tfidf_fallback()
         self._is_loaded = True
 
-    def _compute_and_store_embeddings(self, metadata: Dict[str, Any]) -> None:
-        """Compute embeddings and store in LanceDB.
+    def _build_tool_entries(self, metadata: Dict[str, Any]) -> List[EmbeddingEntry]:
+        """Build the desired (id, text, metadata) entries for the TOOLS namespace.
+
+        Args:
+            metadata: Tool metadata for storing alongside vectors.
+
+        Returns:
+            One entry per tool with extracted texts.
+        """
+        entries: List[EmbeddingEntry] = []
+        for tool_name, texts in self._tool_texts.items():
+            tool_meta = metadata.get(tool_name, {})
+            entries.append(
+                (
+                    tool_name,
+                    " ".join(texts),
+                    {
+                        "keywords": tool_meta.get("keywords", []),
+                        "mode_required": tool_meta.get("mode_required"),
+                        "category": tool_meta.get("category"),
+                    },
+                )
+            )
+        return entries
+
+    def _compute_and_store_embeddings(
+        self,
+        metadata: Dict[str, Any],
+        plan: Optional[EmbeddingSyncPlan] = None,
+    ) -> None:
+        """Embed added/changed tools in one batch and drop removed ones.
 
         Args:
             metadata: Tool metadata for storing alongside vectors.
+            plan: Precomputed sync plan (computed from metadata if None).
         """
         if self._model is None:
             return
 
-        logger.info(f"Computing embeddings for {len(self._tool_texts)} tools")
-
         store = self._ensure_vector_store()
-        records = []
-
-        for tool_name, texts in self._tool_texts.items():
-            try:
-                # Combine texts and encode
-                combined = " ".join(texts)
-                embedding = self._model.encode(
-                    combined,
-                    convert_to_numpy=True,
-                    normalize_embeddings=True,
-                    show_progress_bar=False,
-                )
-
-                # Get metadata for this tool
-                tool_meta = metadata.get(tool_name, {})
-
-                records.append(
-                    VectorRecord(
-                        id=tool_name,
-                        namespace=VectorNamespace.TOOLS,
-                        vector=embedding.tolist(),
-                        text=combined,
-                        metadata={
-                            "keywords": tool_meta.get("keywords", []),
-                            "mode_required": tool_meta.get("mode_required"),
-                            "category": tool_meta.get("category"),
-                        },
-                    )
-                )
+        if plan is None:
+            plan = plan_embedding_sync(
+                store, VectorNamespace.TOOLS, self._build_tool_entries(metadata), self._model_name
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to compute embedding for {tool_name}: {e}")
+        logger.info(f"Computing embeddings for {len(plan.to_embed)} of {len(self._tool_texts)} tools")
 
-        if records:
-            count = store.upsert(records)
-            logger.info(f"Stored {count} tool embeddings in LanceDB")
+        try:
+            apply_embedding_sync(store, plan, self._model)
+        except Exception as e:
+            logger.error(f"Failed to compute tool embeddings: {e}")
 
     def _setup_tfidf_fallback(self) -> None:
         """Setup TF-IDF fallback when embeddings unavailable."""
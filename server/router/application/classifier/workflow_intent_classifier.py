@@ -15,13 +15,18 @@ from typing import Any, Dict, List, Optional, Tuple
 from server.router.domain.interfaces.i_vector_store import (
     IVectorStore,
     VectorNamespace,
-    VectorRecord,
 )
 from server.router.domain.interfaces.i_workflow_intent_classifier import (
     IWorkflowIntentClassifier,
 )
 from server.router.infrastructure.config import RouterConfig
 from server.router.infrastructure.language_detector import detect_language
+from server.router.infrastructure.vector_store.embedding_sync import (
+    EmbeddingEntry,
+    EmbeddingSyncPlan,
+    apply_embedding_sync,
+    plan_embedding_sync,
+)
 
 # Source type weights for scoring
 SOURCE_WEIGHTS = {
@@ -167,15 +172,18 @@ class WorkflowIntentClassifier(IWorkflowIntentClassifier):
             logger.warning("No workflow texts extracted for embedding")
             return
 
-        # Check if vector store already has embeddings
-        # TASK-050-3: Compare unique workflows, not total records (multi-embedding)
+        # Only re-embed workflow texts that changed since the last sync
         store = self._ensure_vector_store()
-        unique_workflows = store.get_unique_workflow_count()
+        plan = plan_embedding_sync(
+            store, VectorNamespace.WORKFLOWS, self._build_workflow_entries(workflows), self._model_name
+        )
 
-        if unique_workflows >= len(self._workflow_texts):
-            logger.info(
-                f"Vector store already has {unique_workflows} workflows "
-                f"({store.get_workflow_embedding_count()} total embeddings)"
+        if plan.is_up_to_date:
+            # Repeat loads (e.g. every catalog search) hit the sync memo; only report the first check
+            log = logger.debug if plan.cached else logger.info
+            log(
+                f"Vector store workflow embeddings are up to date "
+                f"({len(self._workflow_texts)} workflows, {plan.unchanged} embeddings)"
             )
             # Still need to load model for query encoding
             if EMBEDDINGS_AVAILABLE:
@@ -185,7 +193,7 @@ class WorkflowIntentClassifier(IWorkflowIntentClassifier):
 
         # Compute and store embeddings if available
         if EMBEDDINGS_AVAILABLE and self._load_model():
-            self._compute_and_store_embeddings(workflows)
+            self._compute_and_store_embeddings(workflows, plan)
             if store.count(VectorNamespace.WORKFLOWS) > 0:
                 self._is_loaded = True
                 return
@@ -266,22 +274,18 @@ class WorkflowIntentClassifier(IWorkflowIntentClassifier):
 
         return texts_with_meta
 
-    def _compute_and_store_embeddings(self, workflows: Dict[str, Any]) -> None:
-        """Compute embeddings and store in LanceDB.
+    def _build_workflow_entries(self, workflows: Dict[str, Any]) -> List[EmbeddingEntry]:
+        """Build the desired (id, text, metadata) entries for the WORKFLOWS namespace.
 
-        TASK-050-3: Multi-embedding - creates separate embedding for each text.
+        TASK-050-3: Multi-embedding - one entry per workflow text.
 
         Args:
             workflows: Workflow definitions for metadata extraction.
-        """
-        if self._model is None:
-            return
 
-        logger.info(f"Computing multi-embeddings for {len(workflows)} workflows")
-
-        store = self._ensure_vector_store()
-        records: List[VectorRecord] = []
-        total_embeddings = 0
+        Returns:
+            Entries with IDs of the form ``workflow_name__source_type__index``.
+        """
+        entries: List[EmbeddingEntry] = []
 
         for name, workflow in workflows.items():
             try:
@@ -297,50 +301,51 @@ class WorkflowIntentClassifier(IWorkflowIntentClassifier):
 
                 # Create separate embedding for each text
                 for idx, (text, source_type, weight) in enumerate(texts_with_meta):
-                    # Detect language
-                    language = detect_language(text)
-
-                    # Compute embedding
-                    embedding = self._model.encode(
-                        text,
-                        convert_to_numpy=True,
-                        normalize_embeddings=True,
-                        show_progress_bar=False,
-                    )
-
-                    # Create unique ID: workflow_name__source_type__index
-                    record_id = f"{name}__{source_type}__{idx}"
-
                     # Build metadata for weighted search
                     metadata = {
                         "workflow_id": name,
                         "source_type": source_type,
                         "source_weight": weight,
-                        "language": language,
+                        "language": detect_language(text),
                     }
                     if category:
                         metadata["category"] = category
 
-                    records.append(
-                        VectorRecord(
-                            id=record_id,
-                            namespace=VectorNamespace.WORKFLOWS,
-                            vector=embedding.tolist(),
-                            text=text,
-                            metadata=metadata,
-                        )
-                    )
-                    total_embeddings += 1
+                    # Unique ID: workflow_name__source_type__index
+                    entries.append((f"{name}__{source_type}__{idx}", text, metadata))
 
             except Exception as e:
-                logger.error(f"Failed to compute embeddings for {name}: {e}")
+                logger.error(f"Failed to collect embedding texts for {name}: {e}")
+
+        return entries
 
-        if records:
-            count = store.upsert(records)
-            logger.info(
-                f"Stored {count} workflow embeddings ({total_embeddings} texts from {len(workflows)} workflows)"
+    def _compute_and_store_embeddings(
+        self,
+        workflows: Dict[str, Any],
+        plan: Optional[EmbeddingSyncPlan] = None,
+    ) -> None:
+        """Embed added/changed workflow texts in one batch and drop removed ones.
+
+        Args:
+            workflows: Workflow definitions for metadata extraction.
+            plan: Precomputed sync plan (computed from workflows if None).
+        """
+        if self._model is None:
+            return
+
+        store = self._ensure_vector_store()
+        if plan is None:
+            plan = plan_embedding_sync(
+                store, VectorNamespace.WORKFLOWS, self._build_workflow_entries(workflows), self._model_name
             )
 
+        logger.info(f"Computing multi-embeddings for {len(plan.to_embed)} texts from {len(workflows)} workflows")
+
+        try:
+            apply_embedding_sync(store, plan, self._model)
+        except Exception as e:
+            logger.error(f"Failed to compute workflow embeddings: {e}")
+
     def _setup_tfidf_fallback(self) -> None:
         """Setup TF-IDF fallback when embeddings unavailable."""
         try:
@@ -9,9 +9,10 @@ TASK-060: Refactored to delegate to UnifiedEvaluator.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
 
 from server.router.application.evaluator.unified_evaluator import UnifiedEvaluator
+from server.router.application.workflows.base import WorkflowStep
 
 logger = logging.getLogger(__name__)
 
@@ -143,6 +144,38 @@ class ConditionEvaluator:
             logger.warning(f"Condition evaluation failed: '{condition}' - {e}")
             return True  # Fail-open: execute step if condition can't be evaluated
 
+    def evaluate_steps(self, steps: Sequence[WorkflowStep]) -> List[bool]:
+        """Evaluate the conditions of an expanded step list in one pass.
+
+        Each condition sees the context produced by the previous steps that
+        would execute (via simulate_step_effect). Compiled expressions are
+        shared across steps, and the context is restored afterwards.
+
+        Args:
+            steps: Workflow steps (tool, params, condition).
+
+        Returns:
+            One flag per step: True if the step should execute.
+            Empty or invalid conditions are True (fail-open).
+        """
+        original_context = self._unified.get_context()
+        results: List[bool] = []
+        try:
+            for step in steps:
+                condition = step.condition.strip() if step.condition else ""
+                should_execute = True
+                if condition:
+                    try:
+                        should_execute = self._unified.evaluate_as_bool(condition)
+                    except Exception as e:
+                        logger.warning(f"Condition evaluation failed: '{condition}' - {e}")
+                results.append(should_execute)
+                if should_execute:
+                    self.simulate_step_effect(step.tool, step.params)
+        finally:
+            self._unified.set_context(original_context)
+        return results
+
     def simulate_step_effect(self, tool_name: str, params: Dict[str, Any]) -> None:
         """Simulate the effect of a workflow step on context.
 
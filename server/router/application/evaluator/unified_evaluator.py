@@ -8,15 +8,32 @@ TASK-060: Consolidates ExpressionEvaluator and ConditionEvaluator logic.
 """
 
 import ast
+import functools
 import logging
 import math
 import operator
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from server.router.domain.interfaces.i_expression_evaluator import IExpressionEvaluator
 
 logger = logging.getLogger(__name__)
 
+# Bounded LRU of compiled expressions, keyed by evaluator class and stripped text.
+COMPILED_EXPRESSION_CACHE_SIZE = 2048
+
+CompiledExpression = Callable[[Dict[str, Any]], Any]
+
+_MISSING = object()
+
+
+def _raising(message: str) -> CompiledExpression:
+    """Return a compiled node that raises ``ValueError(message)`` when evaluated."""
+
+    def fail(ctx: Dict[str, Any]) -> Any:
+        raise ValueError(message)
+
+    return fail
+
 
 class UnifiedEvaluator(IExpressionEvaluator):
     """AST-based evaluator for math, comparisons, and logic.
@@ -35,6 +52,10 @@ class UnifiedEvaluator(IExpressionEvaluator):
     - Ternary: x if condition else y
     - String comparisons: mode == 'EDIT'
 
+    Expressions are parsed and validated once, compiled into closures, and
+    kept in a bounded LRU keyed by expression text, so repeated step
+    conditions and loop expressions skip ``ast.parse`` and the tree walk.
+
     Security:
     - AST-based parsing (no eval/exec)
     - Function whitelist only
@@ -172,13 +193,31 @@ class UnifiedEvaluator(IExpressionEvaluator):
         if not expression or not expression.strip():
             raise ValueError("Empty expression")
 
-        expression = expression.strip()
+        return _compile_cached(type(self), expression.strip())(self._context)
 
-        try:
-            tree = ast.parse(expression, mode="eval")
-            return self._eval_node(tree.body)
-        except SyntaxError as e:
-            raise ValueError(f"Invalid expression syntax: {e}")
+    def evaluate_many(self, expressions: Iterable[str]) -> List[Any]:
+        """Evaluate several expressions against the current context.
+
+        Args:
+            expressions: Expression strings to evaluate.
+
+        Returns:
+            Evaluated values, in input order.
+
+        Raises:
+            ValueError: On the first invalid expression.
+        """
+        return [self.evaluate(expression) for expression in expressions]
+
+    @staticmethod
+    def clear_compiled_cache() -> None:
+        """Drop all compiled expressions (shared by every evaluator instance)."""
+        _compile_cached.cache_clear()
+
+    @staticmethod
+    def compiled_cache_info() -> Any:
+        """Return ``functools`` cache statistics for compiled expressions."""
+        return _compile_cached.cache_info()
 
     def evaluate_safe(self, expression: str, default: Any = 0.0) -> Any:
         """Evaluate expression with fallback on error.
@@ -228,8 +267,29 @@ class UnifiedEvaluator(IExpressionEvaluator):
             raise ValueError(f"Expression returned string, expected numeric: {result}")
         return float(result)
 
-    def _eval_node(self, node: ast.AST) -> Any:
-        """Recursively evaluate AST node.
+    @classmethod
+    def _compile_expression(cls, expression: str) -> CompiledExpression:
+        """Parse and compile a stripped expression into a closure.
+
+        Validation happens once here. Constructs that are not allowed compile
+        to closures that raise on evaluation, so errors surface in the same
+        order (and are skipped by the same short-circuits) as in a tree walk.
+
+        Args:
+            expression: Stripped expression string.
+
+        Returns:
+            Callable taking the evaluation context and returning the value.
+        """
+        try:
+            tree = ast.parse(expression, mode="eval")
+        except SyntaxError as e:
+            return _raising(f"Invalid expression syntax: {e}")
+        return cls._compile_node(tree.body)
+
+    @classmethod
+    def _compile_node(cls, node: ast.AST) -> CompiledExpression:
+        """Compile an AST node over the allowed node set.
 
         Handles:
         - Constants (ast.Constant) - numbers, strings, booleans
@@ -242,264 +302,199 @@ class UnifiedEvaluator(IExpressionEvaluator):
         - Variable references (ast.Name) - from context
 
         Args:
-            node: AST node to evaluate.
+            node: AST node to compile.
 
         Returns:
-            Evaluated value.
-
-        Raises:
-            ValueError: If node type is not allowed.
+            Compiled closure for the node.
         """
-        # === Constants ===
-
-        # Constant (Python 3.8+) - handles numbers, strings, booleans, None
         if isinstance(node, ast.Constant):
-            return self._eval_constant(node.value)
-
-        # === Operations ===
-
-        # Binary operation (+, -, *, /, //, %, **)
+            return cls._compile_constant(node.value)
         if isinstance(node, ast.BinOp):
-            return self._eval_binop(node)
-
-        # Unary operation (-, +, not)
+            return cls._compile_binop(node)
         if isinstance(node, ast.UnaryOp):
-            return self._eval_unaryop(node)
-
-        # Comparison (<, <=, >, >=, ==, !=)
+            return cls._compile_unaryop(node)
         if isinstance(node, ast.Compare):
-            return self._eval_compare(node)
-
-        # Boolean operation (and, or)
+            return cls._compile_compare(node)
         if isinstance(node, ast.BoolOp):
-            return self._eval_boolop(node)
-
-        # Ternary expression (x if cond else y)
+            return cls._compile_boolop(node)
         if isinstance(node, ast.IfExp):
-            return self._eval_ifexp(node)
-
-        # === References ===
-
-        # Function call
+            return cls._compile_ifexp(node)
         if isinstance(node, ast.Call):
-            return self._eval_call(node)
-
-        # Variable reference
+            return cls._compile_call(node)
         if isinstance(node, ast.Name):
-            return self._eval_name(node)
+            return cls._compile_name(node)
 
-        raise ValueError(f"Unsupported AST node: {type(node).__name__}")
+        return _raising(f"Unsupported AST node: {type(node).__name__}")
 
-    def _eval_constant(self, value: Any) -> Any:
-        """Evaluate constant value.
-
-        Args:
-            value: Constant value from ast.Constant node.
-
-        Returns:
-            Float value (or string for string literals).
-
-        Raises:
-            ValueError: If constant type is not supported.
-        """
+    @classmethod
+    def _compile_constant(cls, value: Any) -> CompiledExpression:
+        """Compile constant value (float, or string for string literals)."""
         # CRITICAL: Check bool BEFORE int (bool is subclass of int)
         if isinstance(value, bool):
-            return 1.0 if value else 0.0
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            return value  # Return string for comparisons
-        raise ValueError(f"Invalid constant type: {type(value).__name__}")
-
-    def _eval_binop(self, node: ast.BinOp) -> float:
-        """Evaluate binary operation.
-
-        Args:
-            node: ast.BinOp node.
-
-        Returns:
-            Result of binary operation.
-
-        Raises:
-            ValueError: If operator is not supported or operands are strings.
-        """
-        left = self._eval_node(node.left)
-        right = self._eval_node(node.right)
-
-        # Ensure numeric operands
-        if isinstance(left, str) or isinstance(right, str):
-            raise ValueError(f"Cannot perform arithmetic on strings: {left}, {right}")
-
+            result: Any = 1.0 if value else 0.0
+        elif isinstance(value, (int, float)):
+            result = float(value)
+        elif isinstance(value, str):
+            result = value  # Return string for comparisons
+        else:
+            return _raising(f"Invalid constant type: {type(value).__name__}")
+        return lambda ctx: result
+
+    @classmethod
+    def _compile_binop(cls, node: ast.BinOp) -> CompiledExpression:
+        """Compile binary operation (numeric operands only)."""
+        left = cls._compile_node(node.left)
+        right = cls._compile_node(node.right)
         op_type = type(node.op)
-        if op_type not in self.BINARY_OPS:
-            raise ValueError(f"Unsupported operator: {op_type.__name__}")
-
-        return float(self.BINARY_OPS[op_type](left, right))
-
-    def _eval_unaryop(self, node: ast.UnaryOp) -> float:
-        """Evaluate unary operation.
-
-        Args:
-            node: ast.UnaryOp node.
-
-        Returns:
-            Result of unary operation.
-
-        Raises:
-            ValueError: If operator is not supported.
-        """
-        operand = self._eval_node(node.operand)
-
-        if isinstance(node.op, ast.USub):
-            if isinstance(operand, str):
-                raise ValueError(f"Cannot negate string: {operand}")
-            return -operand
-        if isinstance(node.op, ast.UAdd):
-            if isinstance(operand, str):
-                raise ValueError(f"Cannot apply + to string: {operand}")
-            return +operand
-        if isinstance(node.op, ast.Not):
-            # not x: return 0.0 if truthy, 1.0 if falsy
-            return 0.0 if operand else 1.0
-
-        raise ValueError(f"Unsupported unary operator: {type(node.op).__name__}")
-
-    def _eval_compare(self, node: ast.Compare) -> float:
-        """Evaluate comparison expression.
-
-        Handles chained comparisons: 0 < x < 10
-        Handles string comparisons: mode == 'EDIT'
-
-        Args:
-            node: ast.Compare node.
-
-        Returns:
-            1.0 if comparison is True, 0.0 if False.
-
-        Raises:
-            ValueError: If comparison operator is not supported.
+        op = cls.BINARY_OPS.get(op_type)
+
+        def binop(ctx: Dict[str, Any]) -> float:
+            left_value = left(ctx)
+            right_value = right(ctx)
+            # Ensure numeric operands
+            if isinstance(left_value, str) or isinstance(right_value, str):
+                raise ValueError(f"Cannot perform arithmetic on strings: {left_value}, {right_value}")
+            if op is None:
+                raise ValueError(f"Unsupported operator: {op_type.__name__}")
+            return float(op(left_value, right_value))
+
+        return binop
+
+    @classmethod
+    def _compile_unaryop(cls, node: ast.UnaryOp) -> CompiledExpression:
+        """Compile unary operation (-, +, not)."""
+        operand = cls._compile_node(node.operand)
+        op = node.op
+
+        def unaryop(ctx: Dict[str, Any]) -> Any:
+            value = operand(ctx)
+            if isinstance(op, ast.USub):
+                if isinstance(value, str):
+                    raise ValueError(f"Cannot negate string: {value}")
+                return -value
+            if isinstance(op, ast.UAdd):
+                if isinstance(value, str):
+                    raise ValueError(f"Cannot apply + to string: {value}")
+                return +value
+            if isinstance(op, ast.Not):
+                # not x: return 0.0 if truthy, 1.0 if falsy
+                return 0.0 if value else 1.0
+            raise ValueError(f"Unsupported unary operator: {type(op).__name__}")
+
+        return unaryop
+
+    @classmethod
+    def _compile_compare(cls, node: ast.Compare) -> CompiledExpression:
+        """Compile comparison, including chained (0 < x < 10) and string comparisons.
+
+        Evaluates to 1.0 if the comparison is True, 0.0 if False.
         """
-        left = self._eval_node(node.left)
-
-        for op, comparator in zip(node.ops, node.comparators):
-            right = self._eval_node(comparator)
-
-            op_type = type(op)
-            if op_type not in self.COMPARE_OPS:
-                raise ValueError(f"Unsupported comparison operator: {op_type.__name__}")
-
-            if not self.COMPARE_OPS[op_type](left, right):
-                return 0.0  # False
-
-            left = right  # For chained comparisons
-
-        return 1.0  # True
+        left = cls._compile_node(node.left)
+        steps = [
+            (type(op), cls.COMPARE_OPS.get(type(op)), cls._compile_node(comparator))
+            for op, comparator in zip(node.ops, node.comparators)
+        ]
+
+        def compare(ctx: Dict[str, Any]) -> float:
+            left_value = left(ctx)
+            for op_type, op, comparator in steps:
+                right_value = comparator(ctx)
+                if op is None:
+                    raise ValueError(f"Unsupported comparison operator: {op_type.__name__}")
+                if not op(left_value, right_value):
+                    return 0.0  # False
+                left_value = right_value  # For chained comparisons
+            return 1.0  # True
+
+        return compare
+
+    @classmethod
+    def _compile_boolop(cls, node: ast.BoolOp) -> CompiledExpression:
+        """Compile boolean operation with short-circuit evaluation (1.0 / 0.0)."""
+        values = [cls._compile_node(value) for value in node.values]
 
-    def _eval_boolop(self, node: ast.BoolOp) -> float:
-        """Evaluate boolean operation with short-circuit evaluation.
-
-        Args:
-            node: ast.BoolOp node.
-
-        Returns:
-            1.0 if True, 0.0 if False.
-
-        Raises:
-            ValueError: If boolean operator is not supported.
-        """
         if isinstance(node.op, ast.And):
-            # All values must be truthy (non-zero, non-empty string)
-            for value in node.values:
-                result = self._eval_node(value)
-                if not result:
-                    return 0.0  # Short-circuit: first False
-            return 1.0
 
-        if isinstance(node.op, ast.Or):
-            # At least one value must be truthy
-            for value in node.values:
-                result = self._eval_node(value)
-                if result:
-                    return 1.0  # Short-circuit: first True
-            return 0.0
-
-        raise ValueError(f"Unsupported boolean operator: {type(node.op).__name__}")
+            def and_op(ctx: Dict[str, Any]) -> float:
+                for value in values:
+                    if not value(ctx):
+                        return 0.0  # Short-circuit: first False
+                return 1.0
 
-    def _eval_ifexp(self, node: ast.IfExp) -> Any:
-        """Evaluate ternary expression (x if condition else y).
-
-        Args:
-            node: ast.IfExp node.
+            return and_op
 
-        Returns:
-            Body value if condition is truthy, else orelse value.
-        """
-        condition = self._eval_node(node.test)
+        if isinstance(node.op, ast.Or):
 
-        if condition:
-            return self._eval_node(node.body)
-        else:
-            return self._eval_node(node.orelse)
+            def or_op(ctx: Dict[str, Any]) -> float:
+                for value in values:
+                    if value(ctx):
+                        return 1.0  # Short-circuit: first True
+                return 0.0
 
-    def _eval_call(self, node: ast.Call) -> float:
-        """Evaluate function call.
+            return or_op
 
-        Args:
-            node: ast.Call node.
+        return _raising(f"Unsupported boolean operator: {type(node.op).__name__}")
 
-        Returns:
-            Function result.
+    @classmethod
+    def _compile_ifexp(cls, node: ast.IfExp) -> CompiledExpression:
+        """Compile ternary expression (x if condition else y)."""
+        test = cls._compile_node(node.test)
+        body = cls._compile_node(node.body)
+        orelse = cls._compile_node(node.orelse)
+        return lambda ctx: body(ctx) if test(ctx) else orelse(ctx)
 
-        Raises:
-            ValueError: If function is not in whitelist.
-        """
+    @classmethod
+    def _compile_call(cls, node: ast.Call) -> CompiledExpression:
+        """Compile whitelisted function call (numeric arguments, float result)."""
         if not isinstance(node.func, ast.Name):
-            raise ValueError("Only simple function calls allowed")
+            return _raising("Only simple function calls allowed")
 
         func_name = node.func.id
-        if func_name not in self.FUNCTIONS:
-            raise ValueError(f"Function not allowed: {func_name}")
-
-        args = [self._eval_node(arg) for arg in node.args]
+        if func_name not in cls.FUNCTIONS:
+            return _raising(f"Function not allowed: {func_name}")
 
-        # Ensure all args are numeric for math functions
-        for arg in args:
-            if isinstance(arg, str):
-                raise ValueError(f"Function '{func_name}' requires numeric arguments, got string")
+        func = cls.FUNCTIONS[func_name]
+        arg_fns = [cls._compile_node(arg) for arg in node.args]
 
-        # Special handling for functions that need integer arguments
-        if func_name == "round" and len(args) == 2:
-            # round(number, ndigits) - ndigits must be int
-            return float(round(args[0], int(args[1])))
+        def call(ctx: Dict[str, Any]) -> float:
+            args = [arg_fn(ctx) for arg_fn in arg_fns]
 
-        return float(self.FUNCTIONS[func_name](*args))
+            # Ensure all args are numeric for math functions
+            for arg in args:
+                if isinstance(arg, str):
+                    raise ValueError(f"Function '{func_name}' requires numeric arguments, got string")
 
-    def _eval_name(self, node: ast.Name) -> Any:
-        """Evaluate variable reference.
+            # Special handling for functions that need integer arguments
+            if func_name == "round" and len(args) == 2:
+                # round(number, ndigits) - ndigits must be int
+                return float(round(args[0], int(args[1])))
 
-        Args:
-            node: ast.Name node.
+            return float(func(*args))
 
-        Returns:
-            Variable value from context.
+        return call
 
-        Raises:
-            ValueError: If variable is not in context.
-        """
+    @classmethod
+    def _compile_name(cls, node: ast.Name) -> CompiledExpression:
+        """Compile variable reference (context first, then true/false literals)."""
         var_name = node.id
 
-        # Check context first
-        if var_name in self._context:
-            return self._context[var_name]
-
         # Handle True/False as names (Python compatibility)
         # Also handle lowercase for backward compatibility with ConditionEvaluator
+        fallback: Optional[float] = None
         if var_name == "True" or var_name.lower() == "true":
-            return 1.0
-        if var_name == "False" or var_name.lower() == "false":
-            return 0.0
+            fallback = 1.0
+        elif var_name == "False" or var_name.lower() == "false":
+            fallback = 0.0
 
-        raise ValueError(f"Unknown variable: {var_name}")
+        def name(ctx: Dict[str, Any]) -> Any:
+            value = ctx.get(var_name, _MISSING)
+            if value is not _MISSING:
+                return value
+            if fallback is not None:
+                return fallback
+            raise ValueError(f"Unknown variable: {var_name}")
+
+        return name
 
     # === Computed Parameters (preserved from ExpressionEvaluator) ===
 
@@ -595,3 +590,8 @@ class UnifiedEvaluator(IExpressionEvaluator):
             raise ValueError(f"Circular dependency detected: {remaining}")
 
         return sorted_nodes
+
+
+@functools.lru_cache(maxsize=COMPILED_EXPRESSION_CACHE_SIZE)
+def _compile_cached(evaluator_cls: type, expression: str) -> CompiledExpression:
+    return evaluator_cls._compile_expression(expression)
@@ -7,11 +7,21 @@ Stores:
 - Failed matches (for improvement)
 - User corrections
 
+Storage is an append-only JSONL log: new entries are appended as entry
+objects, later changes as small update records (``{"_update": index, ...}``).
+Writes are group-committed by a short-lived background thread, and the file
+is compacted (rewritten atomically) only when it grows past the cap.
+
 TASK-046-6
 """
 
+import atexit
 import json
 import logging
+import os
+import threading
+import time
+import weakref
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,6 +29,20 @@ from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Compact the log once it holds this many lines per retained entry
+COMPACTION_RATIO = 1.5
+
+# Update records carry the position of the entry they patch under this key
+UPDATE_KEY = "_update"
+
+_OPEN_COLLECTORS: "weakref.WeakSet[FeedbackCollector]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_collectors() -> None:
+    for collector in list(_OPEN_COLLECTORS):
+        collector.flush()
+
 
 @dataclass
 class FeedbackEntry:
@@ -92,67 +116,177 @@ class FeedbackCollector:
         storage_path: Optional[Path] = None,
         max_entries: int = 10000,
         auto_save: bool = True,
+        flush_interval: float = 0.5,
     ):
         """Initialize collector.
 
         Args:
             storage_path: Path to feedback storage file.
                          Defaults to ~/.blender-mcp/feedback.jsonl
-            max_entries: Maximum entries to keep in memory and storage.
-            auto_save: Whether to auto-save after each entry.
+            max_entries: Maximum entries to keep in memory and storage
+                         (enforced when the log is compacted).
+            auto_save: Whether to queue a background write after each entry.
+            flush_interval: Seconds the background writer waits to group
+                            pending records into one commit.
         """
         self._storage_path = storage_path or (Path.home() / ".blender-mcp" / "feedback.jsonl")
         self._max_entries = max_entries
         self._auto_save = auto_save
+        self._flush_interval = flush_interval
         self._entries: List[FeedbackEntry] = []
-        self._is_dirty = False
+
+        # Serialized log lines not yet written, and the state of the log on disk
+        self._pending: List[str] = []
+        self._file_lines = 0
+        self._needs_newline = False
+        self._needs_compaction = False
+
+        # _io_lock serializes file writes; _lock guards entries and pending lines
+        self._io_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
 
         self._load()
+        _OPEN_COLLECTORS.add(self)
 
     def _load(self) -> None:
-        """Load existing feedback from storage."""
+        """Load feedback by replaying the append-only log.
+
+        Entry lines append an entry, update lines patch an earlier entry by
+        position. A torn last line (crash mid-write) is skipped.
+        """
         if not self._storage_path.exists():
             logger.debug(f"Feedback file not found: {self._storage_path}")
             return
 
         try:
-            with open(self._storage_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        self._entries.append(FeedbackEntry.from_dict(data))
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse feedback line: {e}")
+            with open(self._storage_path, "rb") as f:
+                content = f.read()
+            self._needs_newline = bool(content) and not content.endswith(b"\n")
+
+            for line in content.decode("utf-8").splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                self._file_lines += 1
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse feedback line: {e}")
+                    continue
+                if UPDATE_KEY in data:
+                    self._replay_update(data)
+                else:
+                    self._entries.append(FeedbackEntry.from_dict(data))
 
             logger.info(f"Loaded {len(self._entries)} feedback entries")
 
         except Exception as e:
             logger.warning(f"Failed to load feedback: {e}")
 
-    def _save(self) -> None:
-        """Save feedback to storage."""
-        if not self._is_dirty:
+    def _replay_update(self, data: Dict[str, Any]) -> None:
+        """Apply one update record from the log."""
+        index = data.pop(UPDATE_KEY)
+        if not isinstance(index, int) or not 0 <= index < len(self._entries):
+            logger.warning(f"Skipping feedback update for unknown entry {index!r}")
             return
+        entry = self._entries[index]
+        for key, value in data.items():
+            if hasattr(entry, key):
+                setattr(entry, key, value)
 
-        try:
-            # Ensure directory exists
-            self._storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Keep only max entries
-            entries_to_save = self._entries[-self._max_entries :]
+    def _append_entry(self, entry: FeedbackEntry) -> None:
+        """Add an entry and queue its log line (caller holds _lock)."""
+        self._entries.append(entry)
+        self._pending.append(json.dumps(entry.to_dict()))
 
-            with open(self._storage_path, "w", encoding="utf-8") as f:
-                for entry in entries_to_save:
-                    f.write(json.dumps(entry.to_dict()) + "\n")
+    def _queue_update(self, index: int, **fields: Any) -> None:
+        """Queue an update record for the entry at index (caller holds _lock)."""
+        self._pending.append(json.dumps({UPDATE_KEY: index, **fields}))
 
-            self._is_dirty = False
-            logger.debug(f"Saved {len(entries_to_save)} feedback entries")
+    def _schedule_flush(self) -> None:
+        """Start the background writer unless auto_save is off or one is running."""
+        if not self._auto_save:
+            return
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(target=self._writer_loop, name="feedback-writer", daemon=True)
+            self._writer.start()
+
+    def _writer_loop(self) -> None:
+        """Group-commit pending records until the queue is drained, then exit."""
+        while True:
+            if self._flush_interval > 0:
+                time.sleep(self._flush_interval)
+            self.flush()
+            with self._lock:
+                if not self._pending:
+                    self._writer = None
+                    return
+
+    def flush(self) -> None:
+        """Write pending records, compacting the log when it has grown past the cap."""
+        with self._io_lock:
+            with self._lock:
+                threshold = max(int(self._max_entries * COMPACTION_RATIO), self._max_entries + 1)
+                compact = self._needs_compaction or self._file_lines + len(self._pending) > threshold
+                if not compact and not self._pending:
+                    return
+                if compact:
+                    # The in-memory entries already include every pending record
+                    if len(self._entries) > self._max_entries:
+                        del self._entries[: len(self._entries) - self._max_entries]
+                    lines = [json.dumps(entry.to_dict()) for entry in self._entries]
+                else:
+                    lines = self._pending
+                self._pending = []
 
-        except Exception as e:
-            logger.warning(f"Failed to save feedback: {e}")
+            try:
+                if compact:
+                    self._rewrite(lines)
+                else:
+                    self._append(lines)
+            except Exception as e:
+                logger.warning(f"Failed to save feedback: {e}")
+                with self._lock:
+                    if compact:
+                        self._needs_compaction = True
+                    else:
+                        self._pending[:0] = lines
+                return
+
+            with self._lock:
+                if compact:
+                    self._file_lines = len(lines)
+                    self._needs_compaction = False
+                else:
+                    self._file_lines += len(lines)
+            logger.debug(f"{'Compacted' if compact else 'Appended'} {len(lines)} feedback records")
+
+    def _append(self, lines: List[str]) -> None:
+        """Append lines in one write (caller holds _io_lock)."""
+        self._storage_path.parent.mkdir(parents=True, exist_ok=True)
+        data = "\n".join(lines) + "\n"
+        if self._needs_newline:
+            data = "\n" + data
+        with open(self._storage_path, "a", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._needs_newline = False
+
+    def _rewrite(self, lines: List[str]) -> None:
+        """Atomically replace the log with a compacted snapshot (caller holds _io_lock)."""
+        self._storage_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._storage_path.with_name(f"{self._storage_path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            if lines:
+                f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._storage_path)
+        self._needs_newline = False
 
     def record_match(
         self,
@@ -188,11 +322,9 @@ class FeedbackCollector:
             metadata=metadata or {},
         )
 
-        self._entries.append(entry)
-        self._is_dirty = True
-
-        if self._auto_save:
-            self._save()
+        with self._lock:
+            self._append_entry(entry)
+        self._schedule_flush()
 
         logger.debug(f"Recorded match: {prompt[:30]}... -> {matched_workflow} ({match_type}, {confidence:.1%})")
 
@@ -220,17 +352,21 @@ class FeedbackCollector:
             The created or updated FeedbackEntry.
         """
         # Try to find and update existing entry
-        for entry in reversed(self._entries):
-            if entry.prompt == prompt and entry.matched_workflow == original_match:
-                entry.user_correction = correct_workflow
-                entry.was_helpful = False
-                self._is_dirty = True
-
-                if self._auto_save:
-                    self._save()
-
-                logger.info(f"Recorded correction: {prompt[:30]}... {original_match} -> {correct_workflow}")
-                return entry
+        with self._lock:
+            found = None
+            for index in range(len(self._entries) - 1, -1, -1):
+                entry = self._entries[index]
+                if entry.prompt == prompt and entry.matched_workflow == original_match:
+                    entry.user_correction = correct_workflow
+                    entry.was_helpful = False
+                    self._queue_update(index, user_correction=correct_workflow, was_helpful=False)
+                    found = entry
+                    break
+
+        if found is not None:
+            self._schedule_flush()
+            logger.info(f"Recorded correction: {prompt[:30]}... {original_match} -> {correct_workflow}")
+            return found
 
         # Create new correction entry if not found
         entry = FeedbackEntry(
@@ -244,11 +380,9 @@ class FeedbackCollector:
             metadata=metadata or {},
         )
 
-        self._entries.append(entry)
-        self._is_dirty = True
-
-        if self._auto_save:
-            self._save()
+        with self._lock:
+            self._append_entry(entry)
+        self._schedule_flush()
 
         logger.info(f"Recorded new correction: {prompt[:30]}... -> {correct_workflow}")
 
@@ -273,18 +407,20 @@ class FeedbackCollector:
         Returns:
             True if an entry was found and updated, False otherwise.
         """
-        for entry in reversed(self._entries):
-            if entry.prompt == prompt and entry.matched_workflow == matched_workflow:
-                entry.was_helpful = was_helpful
-                self._is_dirty = True
-
-                if self._auto_save:
-                    self._save()
-
-                logger.debug(f"Recorded helpful={was_helpful}: {prompt[:30]}... -> {matched_workflow}")
-                return True
-
-        return False
+        with self._lock:
+            found = False
+            for index in range(len(self._entries) - 1, -1, -1):
+                entry = self._entries[index]
+                if entry.prompt == prompt and entry.matched_workflow == matched_workflow:
+                    entry.was_helpful = was_helpful
+                    self._queue_update(index, was_helpful=was_helpful)
+                    found = True
+                    break
+
+        if found:
+            self._schedule_flush()
+            logger.debug(f"Recorded helpful={was_helpful}: {prompt[:30]}... -> {matched_workflow}")
+        return found
 
     def get_new_sample_prompts(
         self,
@@ -473,9 +609,11 @@ class FeedbackCollector:
 
         Warning: This deletes all stored feedback data.
         """
-        self._entries.clear()
-        self._is_dirty = True
-        self._save()
+        with self._lock:
+            self._entries.clear()
+            self._pending = []
+            self._needs_compaction = True
+        self.flush()
         logger.info("Cleared all feedback entries")
 
     def export_for_training(
@@ -536,9 +674,8 @@ class FeedbackCollector:
         return self._entries[start:end]
 
     def save(self) -> None:
-        """Manually save feedback to storage."""
-        self._is_dirty = True
-        self._save()
+        """Manually save feedback to storage (writes pending records synchronously)."""
+        self.flush()
 
     def get_info(self) -> Dict[str, Any]:
         """Get collector information.
@@ -551,5 +688,6 @@ class FeedbackCollector:
             "max_entries": self._max_entries,
             "current_entries": len(self._entries),
             "auto_save": self._auto_save,
+            "pending_writes": len(self._pending),
             "statistics": self.get_statistics(),
         }
@@ -4,8 +4,10 @@ Supervisor Router.
 Main orchestrator that processes LLM tool calls through the router pipeline.
 """
 
+import threading
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from server.domain.models.rpc import split_batch_response
 from server.router.application.analyzers.geometry_pattern_detector import GeometryPatternDetector
 from server.router.application.analyzers.scene_context_analyzer import SceneContextAnalyzer
 from server.router.application.classifier.intent_classifier import IntentClassifier
@@ -144,6 +146,7 @@ class SupervisorRouter:
         self._last_ensemble_result: Optional[EnsembleResult] = None
         self._pending_modifiers: Dict[str, Any] = {}  # Modifiers from ensemble
         self._last_ensemble_init_error: Optional[str] = None
+        self._ensemble_lock = threading.Lock()
 
         # Workflow adaptation (TASK-051)
         # Adapts workflow steps based on confidence level
@@ -613,6 +616,8 @@ class SupervisorRouter:
 
         Lazily initializes the ensemble matcher with all components.
         TASK-053-9: New method for ensemble matching support.
+        Concurrent callers (e.g. the startup warm-up and an early routed
+        call) wait for a single initialization instead of repeating it.
 
         Returns:
             True if initialized successfully, False otherwise.
@@ -620,6 +625,13 @@ class SupervisorRouter:
         if self._ensemble_matcher is not None:
             return True
 
+        with self._ensemble_lock:
+            if self._ensemble_matcher is not None:
+                return True
+            return self._initialize_ensemble()
+
+    def _initialize_ensemble(self) -> bool:
+        """Build the ensemble matcher; caller holds `_ensemble_lock`."""
         try:
             from server.router.application.matcher.ensemble_aggregator import EnsembleAggregator
             from server.router.application.matcher.ensemble_matcher import EnsembleMatcher
@@ -634,12 +646,13 @@ class SupervisorRouter:
 
             # Ensure workflow classifier exists before creating matchers
             if self._workflow_classifier is None:
-                # Use shared LaBSE model from DI (singleton)
-                from server.infrastructure.di import get_labse_model
+                # Use the shared embedding service from DI (singleton)
+                from server.infrastructure.di import get_embedding_model_name, get_embedding_service
 
                 self._workflow_classifier = WorkflowIntentClassifier(
                     config=self.config,
-                    model=get_labse_model(),
+                    model_name=get_embedding_model_name(),
+                    model=get_embedding_service(),
                 )
 
             # Create modifier extractor with LaBSE semantic matching
@@ -1001,6 +1014,15 @@ class SupervisorRouter:
         """
         self.classifier.load_tool_embeddings(metadata)
 
+    def warm_up_ensemble(self) -> None:
+        """Build the ensemble matcher now instead of on the first routed call.
+
+        Raises:
+            RuntimeError: If the ensemble matcher could not be initialized.
+        """
+        if not self._ensure_ensemble_initialized():
+            raise RuntimeError(self._last_ensemble_init_error or "Ensemble matcher initialization failed")
+
     def is_ready(self) -> bool:
         """Check if router is ready for processing.
 
@@ -1318,44 +1340,56 @@ class SupervisorRouter:
             self.logger.log_info(f"Workflow '{workflow_name}' produced no tool calls")
             return []
 
-        # Execute each tool call via RPC
+        # Execute all tool calls in one `rpc.batch` round trip (one main-thread tick,
+        # one undo step). Items run independently, matching the previous per-call loop.
         results = []
-        for call in calls:
-            tool_name = call.tool_name
-            params = call.params
-
-            # Convert MCP tool name to RPC command name
-            # e.g., "modeling_create_primitive" -> "modeling.create_primitive"
-            rpc_command = self._tool_name_to_rpc_command(tool_name)
-
-            # Execute via RPC client
-            if self._rpc_client:
-                try:
-                    result = self._rpc_client.send_request(rpc_command, params)
+        if self._rpc_client:
+            rpc_commands = [
+                # Convert MCP tool name to RPC command name
+                # e.g., "modeling_create_primitive" -> "modeling.create_primitive"
+                {"cmd": self._tool_name_to_rpc_command(call.tool_name), "args": call.params}
+                for call in calls
+            ]
+            try:
+                batch_response = self._rpc_client.send_batch(
+                    rpc_commands,
+                    undo_message=f"MCP: workflow {workflow_name}",
+                )
+                if batch_response.status == "error":
+                    raise RuntimeError(batch_response.error or "rpc.batch failed")
+                item_responses = split_batch_response(batch_response)
+            except Exception as e:
+                self.logger.log_info(f"Workflow '{workflow_name}' batch failed: {e}")
+                item_responses = None
+                for call in calls:
                     results.append(
                         {
-                            "tool": tool_name,
-                            "params": params,
-                            "result": result,
-                            "success": True,
+                            "tool": call.tool_name,
+                            "params": call.params,
+                            "error": str(e),
+                            "success": False,
                         }
                     )
-                except Exception as e:
-                    self.logger.log_info(f"Tool '{tool_name}' failed: {e}")
+
+            if item_responses is not None:
+                for call, item_response in zip(calls, item_responses):
+                    if item_response.status == "error":
+                        self.logger.log_info(f"Tool '{call.tool_name}' failed: {item_response.error}")
                     results.append(
                         {
-                            "tool": tool_name,
-                            "params": params,
-                            "error": str(e),
-                            "success": False,
+                            "tool": call.tool_name,
+                            "params": call.params,
+                            "result": item_response,
+                            "success": True,
                         }
                     )
-            else:
-                # No RPC client - just return the calls without execution
+        else:
+            # No RPC client - just return the calls without execution
+            for call in calls:
                 results.append(
                     {
-                        "tool": tool_name,
-                        "params": params,
+                        "tool": call.tool_name,
+                        "params": call.params,
                         "success": True,
                     }
                 )
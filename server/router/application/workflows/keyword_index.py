@@ -0,0 +1,148 @@
+"""
+Keyword Index for workflow trigger keywords.
+
+Precompiled Aho-Corasick automaton over normalized (stripped, lowercased)
+trigger keywords. One pass over the prompt reports every keyword occurrence
+with its position, so matching cost no longer grows with
+(number of keywords x prompt length).
+
+Matches follow the same token/phrase boundary rule as the previous per-keyword
+regex ``(?<!\\w)keyword(?!\\w)``: "screen" does not match inside "screenshot".
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_is_word_char = re.compile(r"\w").match
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Normalize a trigger keyword the way the index stores it."""
+    return keyword.strip().lower()
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """One keyword occurrence in the lowercased text."""
+
+    keyword: str
+    workflow_name: str
+    start: int
+    end: int
+
+
+class KeywordIndex:
+    """Aho-Corasick automaton mapping trigger keywords to workflow names.
+
+    Entries keep their registration order: when several workflows match,
+    ``first_match`` returns the one registered first, like the old
+    per-workflow scan.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        """Build the automaton.
+
+        Args:
+            entries: ``(workflow_name, keyword)`` pairs in priority order.
+                Empty keywords are ignored.
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._keywords: List[str] = []
+        # keyword id -> [(priority, workflow_name), ...]
+        self._owners: List[List[Tuple[int, str]]] = []
+
+        keyword_ids: Dict[str, int] = {}
+        seen_owners = set()
+        for priority, (workflow_name, keyword) in enumerate(entries):
+            normalized = normalize_keyword(keyword)
+            if not normalized or (workflow_name, normalized) in seen_owners:
+                continue
+            seen_owners.add((workflow_name, normalized))
+            keyword_id = keyword_ids.get(normalized)
+            if keyword_id is None:
+                keyword_id = keyword_ids[normalized] = len(self._keywords)
+                self._keywords.append(normalized)
+                self._owners.append([])
+                self._insert(normalized, keyword_id)
+            self._owners[keyword_id].append((priority, workflow_name))
+
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        """Number of distinct normalized keywords."""
+        return len(self._keywords)
+
+    def _insert(self, keyword: str, keyword_id: int) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(keyword_id)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _scan(self, text: str) -> Iterable[Tuple[int, int, int]]:
+        """Yield ``(start, end, keyword_id)`` for boundary-respecting occurrences."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        keywords = self._keywords
+        length = len(text)
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+            end = index + 1
+            if end < length and _is_word_char(text[end]):
+                continue
+            for keyword_id in output[state]:
+                start = end - len(keywords[keyword_id])
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                yield start, end, keyword_id
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Return all keyword matches in ``text.lower()``, ordered by position.
+
+        Overlapping keywords (e.g. "chair" and "office chair") are all reported.
+        """
+        matches = []
+        for start, end, keyword_id in self._scan(text.lower()):
+            keyword = self._keywords[keyword_id]
+            for _priority, workflow_name in self._owners[keyword_id]:
+                matches.append(KeywordMatch(keyword=keyword, workflow_name=workflow_name, start=start, end=end))
+        matches.sort(key=lambda match: (match.start, match.end))
+        return matches
+
+    def first_match(self, text: str) -> Optional[str]:
+        """Return the highest-priority workflow with any matching keyword."""
+        best: Optional[Tuple[int, str]] = None
+        for _start, _end, keyword_id in self._scan(text.lower()):
+            owner = self._owners[keyword_id][0]
+            if best is None or owner[0] < best[0]:
+                best = owner
+        return best[1] if best is not None else None
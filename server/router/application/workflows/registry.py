@@ -14,7 +14,6 @@ TASK-041-14: Added ProportionResolver integration
 
 import dataclasses
 import logging
-import re
 from typing import Any, Dict, List, Optional
 
 from server.router.application.evaluator.condition_evaluator import ConditionEvaluator
@@ -24,22 +23,11 @@ from server.router.application.evaluator.proportion_resolver import ProportionRe
 from server.router.domain.entities.tool_call import CorrectedToolCall
 
 from .base import BaseWorkflow, WorkflowDefinition, WorkflowStep
+from .keyword_index import KeywordIndex, KeywordMatch
 
 logger = logging.getLogger(__name__)
 
 
-def _keyword_matches_text(keyword: str, text: str) -> bool:
-    """Match workflow trigger keywords on token/phrase boundaries, not raw substrings."""
-
-    normalized_keyword = keyword.strip().lower()
-    normalized_text = text.strip().lower()
-    if not normalized_keyword or not normalized_text:
-        return False
-
-    pattern = rf"(?<!\w){re.escape(normalized_keyword)}(?!\w)"
-    return re.search(pattern, normalized_text) is not None
-
-
 class WorkflowRegistry:
     """Central registry for all workflows.
 
@@ -56,6 +44,10 @@ class WorkflowRegistry:
         self._condition_evaluator = ConditionEvaluator()
         self._proportion_resolver = ProportionResolver()
         self._loop_expander = LoopExpander()  # TASK-058: loops + {var} interpolation
+        # Trigger keyword automaton over custom definitions (rebuilt lazily when they change)
+        self._keyword_index: Optional[KeywordIndex] = None
+        self._keyword_index_signature: Optional[tuple] = None
+        self._keyword_index_stale = True
 
     def _register_builtin(self, workflow: BaseWorkflow) -> None:
         """Register a built-in workflow.
@@ -80,6 +72,7 @@ class WorkflowRegistry:
             definition: Workflow definition to register.
         """
         self._custom_definitions[definition.name] = definition
+        self._keyword_index_stale = True
 
     def load_custom_workflows(self, reload: bool = False) -> int:
         """Load custom workflows from YAML/JSON files.
@@ -113,6 +106,7 @@ class WorkflowRegistry:
             logger.debug(f"Registered custom workflow: {name}")
 
         self._custom_loaded = True
+        self._keyword_index_stale = True
         logger.info(f"Loaded {count} custom workflows into registry")
         return count
 
@@ -209,12 +203,35 @@ class WorkflowRegistry:
                 return name
 
         # Check custom definitions
-        for name, definition in self._custom_definitions.items():
-            for keyword in definition.trigger_keywords:
-                if _keyword_matches_text(keyword, text_lower):
-                    return name
+        return self._get_keyword_index().first_match(text_lower)
 
-        return None
+    def find_keyword_matches(self, text: str) -> List[KeywordMatch]:
+        """Find every custom-workflow trigger keyword in text, in one pass.
+
+        Args:
+            text: Text to search for keywords.
+
+        Returns:
+            Matches with keyword, workflow name, and positions in the
+            lowercased text, ordered by position.
+        """
+        self.ensure_custom_loaded()
+        return self._get_keyword_index().find_all(text)
+
+    def _get_keyword_index(self) -> KeywordIndex:
+        """Return the trigger keyword index, rebuilding it only if keywords changed."""
+        if self._keyword_index is None or self._keyword_index_stale:
+            signature = tuple(
+                (name, tuple(definition.trigger_keywords)) for name, definition in self._custom_definitions.items()
+            )
+            if self._keyword_index is None or signature != self._keyword_index_signature:
+                self._keyword_index = KeywordIndex(
+                    (name, keyword) for name, keywords in signature for keyword in keywords
+                )
+                self._keyword_index_signature = signature
+                logger.debug(f"Built workflow keyword index with {len(self._keyword_index)} keywords")
+            self._keyword_index_stale = False
+        return self._keyword_index
 
     def expand_workflow(
         self,
@@ -513,33 +530,24 @@ class WorkflowRegistry:
             logger.debug(f"Extended condition context with workflow params: {list(workflow_params.keys())}")
 
         try:
-            for i, step in enumerate(steps):
-                # DEBUG: Log step condition status
-                condition_display = f'"{step.condition}"' if step.condition else "None"
-                logger.debug(f"Step {i + 1} ({step.tool}): condition={condition_display}")
-
-                # Check condition if present (TASK-041-11)
-                if step.condition:
-                    should_execute = self._condition_evaluator.evaluate(step.condition)
-                    if not should_execute:
-                        logger.debug(
-                            f"Skipping workflow step {i + 1} ({step.tool}): condition '{step.condition}' not met"
-                        )
-                        skipped_count += 1
-                        continue
-
-                # Create tool call
-                call = CorrectedToolCall(
-                    tool_name=step.tool,
-                    params=dict(step.params),
-                    corrections_applied=[f"workflow:{workflow_name}:step_{i + 1}"],
-                    is_injected=True,
-                )
-                calls.append(call)
+            # Conditions are evaluated in one batch; each sees the simulated
+            # effect of earlier executed steps (TASK-041-11/12).
+            should_execute = self._condition_evaluator.evaluate_steps(steps)
+
+            for i, (step, execute) in enumerate(zip(steps, should_execute)):
+                if not execute:
+                    logger.debug(f"Skipping workflow step {i + 1} ({step.tool}): condition '{step.condition}' not met")
+                    skipped_count += 1
+                    continue
 
-                # Simulate step effect on context (TASK-041-12)
-                # This allows subsequent conditions to see updated state
-                self._condition_evaluator.simulate_step_effect(step.tool, step.params)
+                calls.append(
+                    CorrectedToolCall(
+                        tool_name=step.tool,
+                        params=dict(step.params),
+                        corrections_applied=[f"workflow:{workflow_name}:step_{i + 1}"],
+                        is_injected=True,
+                    )
+                )
 
             if skipped_count > 0:
                 logger.info(
@@ -149,6 +149,33 @@ class IVectorStore(ABC):
         """
         pass
 
+    def search_batch(
+        self,
+        query_vectors: List[List[float]],
+        namespace: VectorNamespace,
+        top_k: int = 5,
+        threshold: float = 0.0,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[SearchResult]]:
+        """Search for several query vectors at once.
+
+        The default runs ``search`` per query; stores that can score a batch
+        in one pass override it.
+
+        Args:
+            query_vectors: Query embedding vectors.
+            namespace: Namespace to search in.
+            top_k: Maximum number of results per query.
+            threshold: Minimum similarity score (0.0 to 1.0).
+            metadata_filter: Optional metadata constraints.
+
+        Returns:
+            One result list per query, in input order.
+        """
+        return [
+            self.search(query_vector, namespace, top_k, threshold, metadata_filter) for query_vector in query_vectors
+        ]
+
     @abstractmethod
     def delete(self, ids: List[str], namespace: VectorNamespace) -> int:
         """Delete records by IDs.
@@ -207,6 +234,23 @@ class IVectorStore(ABC):
         """
         pass
 
+    def get_content_hashes(self, namespace: VectorNamespace) -> Dict[str, str]:
+        """Get stored content hashes per record ID.
+
+        Hashes are the ``content_hash`` metadata key written by incremental
+        embedding sync; stores with a typed ``content_hash`` column read that
+        column directly. Records stored without one map to ``""``. Stores that
+        cannot enumerate records return an empty mapping, which makes callers
+        re-embed everything.
+
+        Args:
+            namespace: Namespace to query.
+
+        Returns:
+            Mapping of record ID -> content hash.
+        """
+        return {}
+
     @abstractmethod
     def search_workflows_weighted(
         self,
@@ -0,0 +1,154 @@
+"""
+Embedding Backends.
+
+Pluggable loaders for the model behind the router's semantic layer. Every
+backend returns an object with a `SentenceTransformer.encode`-compatible
+`encode`, so the result can be wrapped by `EmbeddingService` and injected
+wherever the shared LaBSE model was used before.
+
+Built-in backends:
+- ``torch``: full-precision SentenceTransformer (default, previous behaviour).
+- ``torch_int8``: the same model with dynamic int8 quantization of the
+  Linear layers and 8-bit weight-only quantization of the (vocabulary-sized)
+  Embedding tables; CPU only, no extra dependencies.
+- ``onnx``: SentenceTransformer on ONNX Runtime (``optimum[onnxruntime]``),
+  typically loaded from a local export with a quantized ``.onnx`` file
+  (see ``server/scripts/export_embedding_onnx.py``).
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Protocol, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "sentence-transformers/LaBSE"
+DEFAULT_BACKEND = "torch"
+
+
+class EmbeddingModel(Protocol):
+    """Subset of the `SentenceTransformer` API used by the router."""
+
+    def encode(
+        self,
+        sentences: Union[str, Sequence[str]],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray: ...
+
+
+@dataclass(frozen=True)
+class EmbeddingBackendSpec:
+    """Which backend to load and from where.
+
+    Attributes:
+        backend: Registered backend name (``torch``, ``torch_int8``, ``onnx``).
+        model_path: Local model directory or hub id (default: LaBSE from the hub).
+        onnx_file: ONNX file inside the model directory, e.g.
+            ``onnx/model_qint8_avx512_vnni.onnx`` (``onnx`` backend only).
+        local_files_only: Never download; load from the local cache/path only.
+    """
+
+    backend: str = DEFAULT_BACKEND
+    model_path: Optional[str] = None
+    onnx_file: Optional[str] = None
+    local_files_only: bool = False
+
+    @property
+    def model_source(self) -> str:
+        return self.model_path or DEFAULT_MODEL_NAME
+
+    @property
+    def cache_name(self) -> str:
+        """Identifier for embedding caches and stored content hashes.
+
+        Vectors from different backends are not interchangeable, so any
+        non-default backend or model location gets its own name; the default
+        keeps the plain model name so existing caches stay valid.
+        """
+        if self.backend == DEFAULT_BACKEND and self.model_path is None:
+            return DEFAULT_MODEL_NAME
+        name = f"{self.model_source}#{self.backend}"
+        if self.onnx_file:
+            name += f":{self.onnx_file}"
+        return name
+
+
+EmbeddingBackendLoader = Callable[[EmbeddingBackendSpec], EmbeddingModel]
+
+_BACKENDS: Dict[str, EmbeddingBackendLoader] = {}
+
+
+def register_embedding_backend(name: str, loader: EmbeddingBackendLoader) -> None:
+    """Register (or replace) a backend loader under `name`."""
+    _BACKENDS[name] = loader
+
+
+def available_embedding_backends() -> list[str]:
+    """Names of registered backends."""
+    return sorted(_BACKENDS)
+
+
+def load_embedding_model(spec: EmbeddingBackendSpec) -> EmbeddingModel:
+    """Load the model for `spec`.
+
+    Raises:
+        ValueError: If the backend is not registered.
+        ImportError: If the backend's optional dependencies are missing.
+    """
+    loader = _BACKENDS.get(spec.backend)
+    if loader is None:
+        raise ValueError(
+            f"Unknown embedding backend '{spec.backend}'. Expected one of: {', '.join(available_embedding_backends())}"
+        )
+    logger.info(f"Loading embedding model {spec.model_source} with backend '{spec.backend}'")
+    return loader(spec)
+
+
+def _load_torch(spec: EmbeddingBackendSpec) -> EmbeddingModel:
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(spec.model_source, local_files_only=spec.local_files_only)
+
+
+def _load_torch_int8(spec: EmbeddingBackendSpec) -> EmbeddingModel:
+    import torch
+    from sentence_transformers import SentenceTransformer
+    from torch.ao.quantization import default_dynamic_qconfig, float_qparams_weight_only_qconfig, quantize_dynamic
+
+    model = SentenceTransformer(spec.model_source, device="cpu", local_files_only=spec.local_files_only)
+    model.eval()
+    # LaBSE's 501k-token embedding table dominates memory, so it is quantized too
+    quantize_dynamic(
+        model,
+        {
+            torch.nn.Linear: default_dynamic_qconfig,
+            torch.nn.Embedding: float_qparams_weight_only_qconfig,
+        },
+        inplace=True,
+    )
+    return model
+
+
+def _load_onnx(spec: EmbeddingBackendSpec) -> EmbeddingModel:
+    from sentence_transformers import SentenceTransformer
+
+    model_kwargs: Dict[str, Any] = {"provider": "CPUExecutionProvider"}
+    if spec.onnx_file:
+        model_kwargs["file_name"] = spec.onnx_file
+    return SentenceTransformer(
+        spec.model_source,
+        backend="onnx",
+        device="cpu",
+        model_kwargs=model_kwargs,
+        local_files_only=spec.local_files_only,
+    )
+
+
+register_embedding_backend("torch", _load_torch)
+register_embedding_backend("torch_int8", _load_torch_int8)
+register_embedding_backend("onnx", _load_onnx)
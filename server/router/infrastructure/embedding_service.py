@@ -0,0 +1,387 @@
+"""
+Shared Embedding Service.
+
+Wraps the shared LaBSE SentenceTransformer with:
+- an in-process LRU keyed by whitespace-normalized text,
+- micro-batching of concurrent encode requests (the thread that finds no
+  encode in flight encodes everything queued so far in one model call),
+- a persistent content-hash-keyed disk cache (one NumPy archive holding the
+  key index and matrix) for metadata texts, so restarts do not re-embed
+  unchanged tool/workflow texts.
+
+`EmbeddingService.encode` is call-compatible with `SentenceTransformer.encode`
+for the arguments the router uses, so it can be injected wherever a model is.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "sentence-transformers/LaBSE"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "blender-ai-mcp" / "embeddings"
+DEFAULT_LRU_SIZE = 4096
+DEFAULT_BATCH_SIZE = 64
+
+_CacheKey = Tuple[bool, str]
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys (NFC, trimmed, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFC", str(text)).split())
+
+
+@dataclass
+class _PendingEncode:
+    """One caller's batch of texts waiting for the micro-batcher."""
+
+    texts: List[str]
+    normalize: bool
+    vectors: Optional[np.ndarray] = None
+    error: Optional[BaseException] = None
+    done: bool = False
+
+
+@dataclass
+class _EmbeddingStats:
+    lru_hits: int = 0
+    disk_hits: int = 0
+    encoded: int = 0
+    model_calls: int = 0
+    coalesced_requests: int = 0
+    persisted: int = 0
+
+
+class EmbeddingDiskCache:
+    """Content-hash-keyed embedding cache stored as one `<slug>.npz` archive.
+
+    Keys are SHA-256 digests of model name, normalization flag, and normalized
+    text. Keys and matrix live in the same file, written through a
+    process/thread-unique temp file and swapped in with one `os.replace`, so
+    processes sharing the cache directory never pair one writer's keys with
+    another writer's vectors (the last flush wins).
+    """
+
+    def __init__(self, cache_dir: Path, model_name: str):
+        self._cache_dir = Path(cache_dir)
+        slug = hashlib.sha256(model_name.encode("utf-8")).hexdigest()[:16]
+        self._cache_file = self._cache_dir / f"{slug}.npz"
+        self._model_name = model_name
+        self._index: Optional[Dict[str, int]] = None
+        self._matrix: Optional[np.ndarray] = None
+        self._pending: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def digest(self, key: _CacheKey) -> str:
+        normalize, text = key
+        payload = f"{self._model_name}\0{int(normalize)}\0{text}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load(self) -> None:
+        if self._index is not None:
+            return
+        self._index = {}
+        self._matrix = None
+        if not self._cache_file.exists():
+            return
+        try:
+            with np.load(self._cache_file, allow_pickle=False) as archive:
+                keys = [str(key) for key in archive["keys"]]
+                matrix = archive["matrix"]
+            if matrix.ndim != 2 or len(keys) != matrix.shape[0]:
+                logger.warning("Ignoring inconsistent embedding disk cache at %s", self._cache_file)
+                return
+            self._matrix = matrix
+            self._index = {key: row for row, key in enumerate(keys)}
+            logger.info(f"Loaded {len(keys)} cached embeddings from {self._cache_file}")
+        except Exception as e:
+            logger.warning(f"Failed to load embedding disk cache: {e}")
+            self._index = {}
+            self._matrix = None
+
+    def get(self, key: _CacheKey) -> Optional[np.ndarray]:
+        digest = self.digest(key)
+        pending = self._pending.get(digest)
+        if pending is not None:
+            return pending
+        self._load()
+        assert self._index is not None
+        row = self._index.get(digest)
+        if row is None or self._matrix is None:
+            return None
+        return np.array(self._matrix[row], dtype=np.float32)
+
+    def put(self, key: _CacheKey, vector: np.ndarray) -> bool:
+        digest = self.digest(key)
+        self._load()
+        assert self._index is not None
+        if digest in self._index or digest in self._pending:
+            return False
+        self._pending[digest] = np.asarray(vector, dtype=np.float32)
+        return True
+
+    def flush(self) -> int:
+        """Write pending vectors to disk; returns the number of new rows."""
+        if not self._pending:
+            return 0
+        self._load()
+        assert self._index is not None
+        new_keys = list(self._pending.keys())
+        new_rows = np.stack(list(self._pending.values())).astype(np.float32)
+        if self._matrix is not None and self._matrix.shape[1] != new_rows.shape[1]:
+            logger.warning("Embedding dimension changed; rebuilding embedding disk cache")
+            self._index = {}
+            self._matrix = None
+        old_keys = [key for key, _row in sorted(self._index.items(), key=lambda item: item[1])]
+        matrix = new_rows if self._matrix is None else np.concatenate([np.asarray(self._matrix), new_rows])
+        keys = old_keys + new_keys
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = self._cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with open(temp_path, "wb") as handle:
+                    np.savez(handle, keys=np.array(keys, dtype=str), matrix=matrix)
+                os.replace(temp_path, self._cache_file)
+            finally:
+                temp_path.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Failed to write embedding disk cache: {e}")
+            return 0
+
+        self._matrix = matrix
+        self._index = {key: row for row, key in enumerate(keys)}
+        self._pending.clear()
+        return len(new_keys)
+
+    def size(self) -> int:
+        self._load()
+        assert self._index is not None
+        return len(self._index) + len(self._pending)
+
+    def clear(self) -> None:
+        try:
+            self._cache_file.unlink()
+        except FileNotFoundError:
+            pass
+        self._index = {}
+        self._matrix = None
+        self._pending.clear()
+
+
+class EmbeddingService:
+    """Batched, cached front for a SentenceTransformer-like model."""
+
+    def __init__(
+        self,
+        model: Any,
+        model_name: str = DEFAULT_MODEL_NAME,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        lru_size: int = DEFAULT_LRU_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Initialize embedding service.
+
+        Args:
+            model: Loaded model exposing `encode(list[str], ...) -> np.ndarray`.
+            model_name: Model identifier, part of every disk cache key.
+            cache_dir: Directory for the persistent cache (None disables it).
+            lru_size: Maximum number of in-process cached vectors.
+            batch_size: Batch size passed to the model for large encodes.
+        """
+        self._model = model
+        self._model_name = model_name
+        self._lru_size = max(0, int(lru_size))
+        self._batch_size = max(1, int(batch_size))
+        self._lru: "OrderedDict[_CacheKey, np.ndarray]" = OrderedDict()
+        self._disk = EmbeddingDiskCache(cache_dir, model_name) if cache_dir is not None else None
+        self._cache_lock = threading.Lock()
+        self._batch_cond = threading.Condition()
+        self._queue: List[_PendingEncode] = []
+        self._encoding = False
+        self._stats = _EmbeddingStats()
+
+    @property
+    def model(self) -> Any:
+        return self._model
+
+    def encode(
+        self,
+        sentences: Union[str, Sequence[str]],
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False,
+        batch_size: Optional[int] = None,
+        persist: bool = False,
+        **_kwargs: Any,
+    ) -> np.ndarray:
+        """Encode one text or a list of texts, serving repeats from cache.
+
+        Args:
+            sentences: Text or texts to embed.
+            convert_to_numpy: Accepted for compatibility; results are always NumPy.
+            normalize_embeddings: L2-normalize vectors (part of the cache key).
+            show_progress_bar: Ignored.
+            batch_size: Ignored; the service batches internally.
+            persist: Also store newly computed vectors in the disk cache.
+
+        Returns:
+            A vector for a single string, otherwise a `(n, dim)` matrix.
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        keys: List[_CacheKey] = [(bool(normalize_embeddings), normalize_text(text)) for text in texts]
+
+        found: Dict[_CacheKey, np.ndarray] = {}
+        missing: List[_CacheKey] = []
+        with self._cache_lock:
+            for key in dict.fromkeys(keys):
+                vector = self._lru_get(key)
+                if vector is not None:
+                    self._stats.lru_hits += 1
+                    found[key] = vector
+                    continue
+                vector = self._disk.get(key) if self._disk is not None else None
+                if vector is not None:
+                    self._stats.disk_hits += 1
+                    self._lru_put(key, vector)
+                    found[key] = vector
+                    continue
+                missing.append(key)
+
+        if missing:
+            for normalize in (False, True):
+                group = [text for flag, text in missing if flag is normalize]
+                if not group:
+                    continue
+                vectors = self._encode_coalesced(group, normalize)
+                with self._cache_lock:
+                    for text, vector in zip(group, vectors):
+                        key = (normalize, text)
+                        found[key] = vector
+                        self._lru_put(key, vector)
+                        if persist and self._disk is not None and self._disk.put(key, vector):
+                            self._stats.persisted += 1
+
+        if persist and self._disk is not None:
+            with self._cache_lock:
+                self._disk.flush()
+
+        if single:
+            return found[keys[0]]
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack([found[key] for key in keys])
+
+    def _encode_coalesced(self, texts: List[str], normalize: bool) -> List[np.ndarray]:
+        """Encode through the micro-batcher; concurrent callers share one model call."""
+        request = _PendingEncode(texts=texts, normalize=normalize)
+        with self._batch_cond:
+            self._queue.append(request)
+            while self._encoding and not request.done:
+                self._batch_cond.wait()
+            if not request.done:
+                self._encoding = True
+                batch, self._queue = self._queue, []
+            else:
+                batch = []
+
+        if batch:
+            try:
+                self._run_batch(batch)
+            finally:
+                with self._batch_cond:
+                    self._encoding = False
+                    self._batch_cond.notify_all()
+
+        if request.error is not None:
+            raise request.error
+        assert request.vectors is not None
+        return list(request.vectors)
+
+    def _run_batch(self, batch: List[_PendingEncode]) -> None:
+        for normalize in (False, True):
+            requests = [item for item in batch if item.normalize is normalize]
+            if not requests:
+                continue
+            unique = list(dict.fromkeys(text for item in requests for text in item.texts))
+            try:
+                matrix = np.asarray(
+                    self._model.encode(
+                        unique,
+                        batch_size=self._batch_size,
+                        convert_to_numpy=True,
+                        normalize_embeddings=normalize,
+                        show_progress_bar=False,
+                    ),
+                    dtype=np.float32,
+                )
+                rows = {text: matrix[index] for index, text in enumerate(unique)}
+                for item in requests:
+                    item.vectors = np.stack([rows[text] for text in item.texts])
+            except Exception as exc:
+                for item in requests:
+                    item.error = exc
+            with self._cache_lock:
+                self._stats.model_calls += 1
+                self._stats.encoded += len(unique)
+                self._stats.coalesced_requests += len(requests) - 1
+            for item in requests:
+                item.done = True
+
+    def _lru_get(self, key: _CacheKey) -> Optional[np.ndarray]:
+        vector = self._lru.get(key)
+        if vector is not None:
+            self._lru.move_to_end(key)
+        return vector
+
+    def _lru_put(self, key: _CacheKey, vector: np.ndarray) -> None:
+        if self._lru_size == 0:
+            return
+        self._lru[key] = vector
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._lru_size:
+            self._lru.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache and batching counters."""
+        with self._cache_lock:
+            return {
+                "model_name": self._model_name,
+                "lru_size": len(self._lru),
+                "lru_capacity": self._lru_size,
+                "disk_cache_size": self._disk.size() if self._disk is not None else 0,
+                "lru_hits": self._stats.lru_hits,
+                "disk_hits": self._stats.disk_hits,
+                "encoded": self._stats.encoded,
+                "model_calls": self._stats.model_calls,
+                "coalesced_requests": self._stats.coalesced_requests,
+                "persisted": self._stats.persisted,
+            }
+
+    def clear(self, include_disk: bool = False) -> None:
+        """Drop the in-process LRU (and optionally the disk cache)."""
+        with self._cache_lock:
+            self._lru.clear()
+            if include_disk and self._disk is not None:
+                self._disk.clear()
+
+
+def encode_texts(model: Any, texts: Sequence[str], persist: bool = False) -> np.ndarray:
+    """Encode texts as one normalized batch, persisting through an `EmbeddingService` when given one."""
+    if isinstance(model, EmbeddingService):
+        return model.encode(list(texts), normalize_embeddings=True, persist=persist)
+    return model.encode(
+        list(texts),
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
@@ -15,6 +15,15 @@ from typing import Any, Dict, List, Optional
 logger = logging.getLogger(__name__)
 
 
+def compute_content_hash(payload: Any) -> str:
+    """Compute a stable hash of a JSON-serializable payload.
+
+    Used for whole-cache validation and per-record embedding staleness checks.
+    """
+    content = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.md5(content.encode()).hexdigest()
+
+
 @dataclass
 class ToolMetadata:
     """Metadata for a single tool.
@@ -375,11 +384,7 @@ class MetadataLoader:
 
     def _compute_hash(self) -> str:
         """Compute hash of all metadata for cache validation."""
-        content = json.dumps(
-            {k: v.to_dict() for k, v in sorted(self._cache.items())},
-            sort_keys=True,
-        )
-        return hashlib.md5(content.encode()).hexdigest()
+        return compute_content_hash({k: v.to_dict() for k, v in sorted(self._cache.items())})
 
     def _is_cache_valid(self) -> bool:
         """Check if cache is still valid."""
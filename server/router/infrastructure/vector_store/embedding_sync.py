@@ -0,0 +1,183 @@
+"""
+Incremental Embedding Sync.
+
+Keeps a vector store namespace in step with the metadata it was built from.
+Each record stores a content hash of its text, metadata and embedding model;
+on warm start only added or changed records are re-embedded and records whose
+source disappeared are deleted. A namespace confirmed in sync is remembered per
+process, so repeated loads of unchanged entries skip reading the stored hashes.
+"""
+
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from server.router.domain.interfaces.i_vector_store import (
+    IVectorStore,
+    VectorNamespace,
+    VectorRecord,
+)
+from server.router.infrastructure.embedding_service import encode_texts
+from server.router.infrastructure.metadata_loader import compute_content_hash
+
+logger = logging.getLogger(__name__)
+
+CONTENT_HASH_KEY = "content_hash"
+
+# (record_id, text, metadata) triples describing the desired namespace contents.
+EmbeddingEntry = Tuple[str, str, Dict[str, Any]]
+
+# store -> {namespace: fingerprint of the entries it was last confirmed to hold}
+_synced_fingerprints: "weakref.WeakKeyDictionary[IVectorStore, Dict[VectorNamespace, str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_synced_lock = threading.Lock()
+
+
+def embedding_content_hash(text: str, metadata: Dict[str, Any], model_name: str) -> str:
+    """Hash everything that determines a stored record.
+
+    Args:
+        text: Text that gets embedded.
+        metadata: Metadata stored alongside the vector (without the hash key).
+        model_name: Embedding model name, so a model change re-embeds.
+
+    Returns:
+        Hex content hash.
+    """
+    return compute_content_hash({"model": model_name, "text": text, "metadata": metadata})
+
+
+@dataclass
+class EmbeddingSyncPlan:
+    """Difference between desired entries and the stored namespace.
+
+    Attributes:
+        namespace: Namespace the plan applies to.
+        to_embed: Added or changed entries, metadata already carrying the hash.
+        to_delete: IDs stored but no longer desired.
+        unchanged: Number of records whose hash still matches.
+        cached: True when the plan came from the per-process sync memo
+            instead of the stored hashes.
+        fingerprint: Hash over all entry hashes, used as the memo key.
+    """
+
+    namespace: VectorNamespace
+    to_embed: List[EmbeddingEntry] = field(default_factory=list)
+    to_delete: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    cached: bool = False
+    fingerprint: str = ""
+
+    @property
+    def is_up_to_date(self) -> bool:
+        """True when the stored namespace already matches the entries."""
+        return not self.to_embed and not self.to_delete
+
+
+def plan_embedding_sync(
+    store: IVectorStore,
+    namespace: VectorNamespace,
+    entries: List[EmbeddingEntry],
+    model_name: str,
+) -> EmbeddingSyncPlan:
+    """Compare desired entries against stored content hashes.
+
+    Args:
+        store: Vector store holding the namespace.
+        namespace: Namespace to sync.
+        entries: Desired (record_id, text, metadata) entries.
+        model_name: Embedding model name included in each hash.
+
+    Returns:
+        Plan listing entries to (re-)embed and IDs to delete.
+    """
+    hashed = [
+        (record_id, text, metadata, embedding_content_hash(text, metadata, model_name))
+        for record_id, text, metadata in entries
+    ]
+    fingerprint = compute_content_hash(sorted((record_id, content_hash) for record_id, _, _, content_hash in hashed))
+    if _is_known_in_sync(store, namespace, fingerprint, len(hashed)):
+        return EmbeddingSyncPlan(namespace=namespace, unchanged=len(hashed), cached=True, fingerprint=fingerprint)
+
+    stored = store.get_content_hashes(namespace)
+    plan = EmbeddingSyncPlan(namespace=namespace, fingerprint=fingerprint)
+    desired_ids = set()
+
+    for record_id, text, metadata, content_hash in hashed:
+        desired_ids.add(record_id)
+        if stored.get(record_id) == content_hash:
+            plan.unchanged += 1
+            continue
+        plan.to_embed.append((record_id, text, {**metadata, CONTENT_HASH_KEY: content_hash}))
+
+    plan.to_delete = sorted(record_id for record_id in stored if record_id not in desired_ids)
+    if plan.is_up_to_date:
+        _remember_in_sync(store, namespace, fingerprint)
+    return plan
+
+
+def _is_known_in_sync(store: IVectorStore, namespace: VectorNamespace, fingerprint: str, size: int) -> bool:
+    """True when ``store`` was confirmed to hold exactly these entries in this process.
+
+    The record count guards against the namespace being cleared or edited
+    outside of the sync helpers since then.
+    """
+    with _synced_lock:
+        try:
+            known = _synced_fingerprints.get(store, {}).get(namespace)
+        except TypeError:
+            return False
+    return known == fingerprint and store.count(namespace) == size
+
+
+def _remember_in_sync(store: IVectorStore, namespace: VectorNamespace, fingerprint: str) -> None:
+    with _synced_lock:
+        try:
+            _synced_fingerprints.setdefault(store, {})[namespace] = fingerprint
+        except TypeError:
+            pass
+
+
+def apply_embedding_sync(store: IVectorStore, plan: EmbeddingSyncPlan, model: Any) -> int:
+    """Embed changed entries in one batch and delete removed records.
+
+    Args:
+        store: Vector store holding the namespace.
+        plan: Plan from :func:`plan_embedding_sync`.
+        model: SentenceTransformer-compatible model or embedding service.
+
+    Returns:
+        Number of records upserted.
+
+    Raises:
+        Exception: Propagates embedding failures; nothing is written then.
+    """
+    upserted = 0
+    if plan.to_embed:
+        texts = [text for _record_id, text, _metadata in plan.to_embed]
+        embeddings = encode_texts(model, texts, persist=True)
+        records = [
+            VectorRecord(
+                id=record_id,
+                namespace=plan.namespace,
+                vector=embedding.tolist(),
+                text=text,
+                metadata=metadata,
+            )
+            for (record_id, text, metadata), embedding in zip(plan.to_embed, embeddings)
+        ]
+        upserted = store.upsert(records)
+
+    if plan.to_delete:
+        store.delete(plan.to_delete, plan.namespace)
+    if plan.fingerprint and upserted == len(plan.to_embed):
+        _remember_in_sync(store, plan.namespace, plan.fingerprint)
+
+    logger.info(
+        f"Synced {plan.namespace.value} embeddings: {upserted} embedded, "
+        f"{len(plan.to_delete)} deleted, {plan.unchanged} unchanged"
+    )
+    return upserted
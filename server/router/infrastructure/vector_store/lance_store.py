@@ -9,8 +9,9 @@ TASK-047-2
 
 import json
 import logging
+import math
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from server.router.domain.interfaces.i_vector_store import (
     IVectorStore,
@@ -19,6 +20,7 @@ from server.router.domain.interfaces.i_vector_store import (
     VectorRecord,
     WeightedSearchResult,
 )
+from server.router.infrastructure.vector_store.matrix_index import VectorMatrix
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +34,53 @@ except ImportError:
     LANCEDB_AVAILABLE = False
     lancedb = None  # type: ignore
     pa = None  # type: ignore
+
+try:
+    from lancedb.index import BTree
+except ImportError:
+    # Older lancedb clients only offer `create_scalar_index`.
+    BTree = None  # type: ignore
     logger.warning("lancedb or pyarrow not installed. Vector store will use in-memory fallback.")
 
 DEFAULT_DB_PATH = Path.home() / ".cache" / "blender-ai-mcp" / "vector_store"
 
+# Hot metadata keys mirrored into typed scalar columns for WHERE-clause pushdown.
+# The JSON metadata blob stays the source of truth for full metadata.
+METADATA_COLUMNS: Dict[str, str] = {
+    "workflow_id": "string",
+    "workflow_name": "string",
+    "parameter_name": "string",
+    "source_type": "string",
+    "language": "string",
+    "content_hash": "string",
+    "source_weight": "float",
+}
+
+# Columns with a BTREE scalar index
+INDEXED_COLUMNS = ("id", "namespace", "workflow_id", "workflow_name", "parameter_name")
+
+
+def _sql_literal(value: str) -> str:
+    """Quote a string for a LanceDB WHERE clause."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def parse_vector_namespaces(value: str) -> List[VectorNamespace]:
+    """Parse a comma-separated namespace list (e.g. "tools,workflows").
+
+    Unknown entries are logged and skipped.
+    """
+    namespaces: List[VectorNamespace] = []
+    for item in value.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        try:
+            namespaces.append(VectorNamespace(item))
+        except ValueError:
+            logger.warning(f"Ignoring unknown vector namespace: {item!r}")
+    return namespaces
+
 
 class LanceVectorStore(IVectorStore):
     """LanceDB implementation with HNSW indexing.
@@ -46,17 +91,26 @@ class LanceVectorStore(IVectorStore):
     - Metadata filtering
     - Persistent storage
     - Automatic index management
+    - Matrix-backed in-memory fallback; optional in-memory serving of
+      small namespaces (e.g. TOOLS) when LanceDB is available
     """
 
     TABLE_NAME = "embeddings"
     VECTOR_DIM = 768  # LaBSE dimension
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        memory_namespaces: Optional[Iterable[VectorNamespace]] = None,
+    ):
         """Initialize LanceDB connection.
 
         Args:
             db_path: Path to database directory.
                      Default: ~/.cache/blender-ai-mcp/vector_store/
+            memory_namespaces: Namespaces to search from an in-memory matrix
+                     mirror even when LanceDB is available (small namespaces
+                     such as TOOLS, where LanceDB query overhead dominates).
         """
         self._db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         self._db: Optional[Any] = None
@@ -65,6 +119,15 @@ class LanceVectorStore(IVectorStore):
         # In-memory fallback when LanceDB unavailable
         self._fallback_store: Dict[str, VectorRecord] = {}
         self._use_fallback = not LANCEDB_AVAILABLE
+        # Per-namespace matrices over _fallback_store (dropped on every fallback write)
+        self._fallback_matrices: Dict[VectorNamespace, VectorMatrix] = {}
+
+        # Typed metadata columns present in the table schema (filter pushdown)
+        self._typed_columns: frozenset = frozenset()
+
+        # Matrix mirrors of LanceDB namespaces (loaded lazily, dropped on writes)
+        self._memory_namespaces = frozenset(memory_namespaces or ())
+        self._memory_mirrors: Dict[VectorNamespace, VectorMatrix] = {}
 
         if not self._use_fallback:
             self._initialize_db()
@@ -75,6 +138,8 @@ class LanceVectorStore(IVectorStore):
             self._db_path.mkdir(parents=True, exist_ok=True)
             self._db = lancedb.connect(str(self._db_path))
             self._ensure_table()
+            if self._table is not None:
+                self._prepare_table()
             logger.info(f"LanceDB initialized at {self._db_path}")
         except Exception as e:
             logger.error(f"Failed to initialize LanceDB: {e}")
@@ -99,16 +164,7 @@ class LanceVectorStore(IVectorStore):
                 self._table = self._db.open_table(self.TABLE_NAME)
             else:
                 # Create empty table with schema
-                schema = pa.schema(
-                    [
-                        pa.field("id", pa.string()),
-                        pa.field("namespace", pa.string()),
-                        pa.field("vector", pa.list_(pa.float32(), self.VECTOR_DIM)),
-                        pa.field("text", pa.string()),
-                        pa.field("metadata", pa.large_binary()),  # JSON as large_binary for json_extract
-                    ]
-                )
-                self._table = self._db.create_table(self.TABLE_NAME, schema=schema)
+                self._table = self._db.create_table(self.TABLE_NAME, schema=self._table_schema())
                 logger.info(f"Created LanceDB table: {self.TABLE_NAME}")
         except Exception as e:
             message = str(e)
@@ -125,6 +181,115 @@ class LanceVectorStore(IVectorStore):
             logger.error(f"Failed to ensure table: {e}")
             self._use_fallback = True
 
+    @classmethod
+    def _table_schema(cls) -> Any:
+        """Arrow schema: core fields, JSON metadata blob, typed metadata columns."""
+        types = {"string": pa.string(), "float": pa.float64()}
+        return pa.schema(
+            [
+                pa.field("id", pa.string()),
+                pa.field("namespace", pa.string()),
+                pa.field("vector", pa.list_(pa.float32(), cls.VECTOR_DIM)),
+                pa.field("text", pa.string()),
+                pa.field("metadata", pa.large_binary()),  # JSON as large_binary for json_extract
+                *(pa.field(name, types[kind]) for name, kind in METADATA_COLUMNS.items()),
+            ]
+        )
+
+    def _prepare_table(self) -> None:
+        """Migrate legacy schemas and index the typed filter columns.
+
+        Each step is best-effort: without typed columns, metadata filters
+        fall back to Python-side filtering.
+        """
+        try:
+            self._migrate_schema()
+        except Exception as e:
+            logger.warning(f"Failed to migrate LanceDB table to typed metadata columns: {e}")
+
+        try:
+            names = set(self._require_table().schema.names)
+        except Exception as e:
+            logger.warning(f"Failed to read LanceDB table schema: {e}")
+            names = set()
+        self._typed_columns = frozenset(name for name in METADATA_COLUMNS if name in names)
+
+        try:
+            self._ensure_scalar_indexes()
+        except Exception as e:
+            logger.warning(f"Failed to create LanceDB scalar indexes: {e}")
+
+    def _migrate_schema(self) -> None:
+        """Rewrite a legacy table (JSON metadata only) with typed metadata columns."""
+        table = self._require_table()
+        existing = set(table.schema.names)
+        if all(name in existing for name in METADATA_COLUMNS):
+            return
+
+        rows = table.to_arrow().to_pylist()
+        typed_columns = frozenset(METADATA_COLUMNS)
+        for row in rows:
+            row.update(self._metadata_columns(self._decode_metadata(row.get("metadata")), typed_columns))
+        self._table = self._db.create_table(
+            self.TABLE_NAME,
+            data=rows or None,
+            schema=self._table_schema(),
+            mode="overwrite",
+        )
+        logger.info(f"Migrated LanceDB table '{self.TABLE_NAME}' to typed metadata columns ({len(rows)} rows)")
+
+    def _ensure_scalar_indexes(self, replace: bool = False) -> None:
+        """Create BTREE indexes on filter columns (missing ones, or all when replace)."""
+        table = self._require_table()
+        indexed = set()
+        if not replace:
+            for index in table.list_indices():
+                indexed.update(getattr(index, "columns", []) or [])
+        for column in INDEXED_COLUMNS:
+            if column in indexed or (column in METADATA_COLUMNS and column not in self._typed_columns):
+                continue
+            if BTree is not None:
+                table.create_index(column, replace=True, config=BTree())
+            else:
+                table.create_scalar_index(column, replace=True)
+
+    @staticmethod
+    def _metadata_columns(metadata: Dict[str, Any], columns: Iterable[str]) -> Dict[str, Any]:
+        """Typed column values for a record's metadata (None when absent or mistyped)."""
+        values: Dict[str, Any] = {}
+        for name in columns:
+            value = metadata.get(name)
+            if METADATA_COLUMNS[name] == "float":
+                is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+                values[name] = float(value) if is_number else None
+            else:
+                values[name] = value if isinstance(value, str) else None
+        return values
+
+    def _filter_clause(self, key: str, value: Any) -> Optional[str]:
+        """WHERE clause for one metadata filter item, or None if it cannot be pushed down."""
+        if key not in self._typed_columns:
+            return None
+        if METADATA_COLUMNS[key] == "float":
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+                return f"{key} = {float(value)!r}"
+            return None
+        if isinstance(value, str):
+            return f"{key} = {_sql_literal(value)}"
+        return None
+
+    def _split_metadata_filter(self, metadata_filter: Optional[Dict[str, Any]]) -> Tuple[List[str], Dict[str, Any]]:
+        """Split a metadata filter into pushed-down clauses and residual Python-side items."""
+        clauses: List[str] = []
+        residual: Dict[str, Any] = {}
+        for key, value in (metadata_filter or {}).items():
+            clause = self._filter_clause(key, value)
+            if clause is None:
+                residual[key] = value
+            else:
+                clauses.append(clause)
+        return clauses, residual
+
     def _require_table(self) -> Any:
         if self._table is None:
             raise RuntimeError("LanceDB table is not initialized")
@@ -150,18 +315,20 @@ class LanceVectorStore(IVectorStore):
                         "vector": r.vector,
                         "text": r.text,
                         "metadata": json.dumps(r.metadata).encode("utf-8"),  # Convert to bytes
+                        **self._metadata_columns(r.metadata, self._typed_columns),
                     }
                 )
 
             # Delete existing records with same IDs in same namespace
             for r in records:
                 try:
-                    table.delete(f"id = '{r.id}' AND namespace = '{r.namespace.value}'")
+                    table.delete(f"id = {_sql_literal(r.id)} AND namespace = {_sql_literal(r.namespace.value)}")
                 except Exception:
                     pass  # Record may not exist
 
             # Insert new records
             table.add(data)
+            self._drop_memory_mirrors({r.namespace for r in records})
             logger.debug(f"Upserted {len(records)} records")
             return len(records)
 
@@ -174,6 +341,7 @@ class LanceVectorStore(IVectorStore):
         for r in records:
             key = f"{r.namespace.value}:{r.id}"
             self._fallback_store[key] = r
+        self._fallback_matrices.clear()
         return len(records)
 
     def search(
@@ -188,15 +356,19 @@ class LanceVectorStore(IVectorStore):
         if self._use_fallback:
             return self._search_fallback(query_vector, namespace, top_k, threshold, metadata_filter)
 
+        mirror = self._memory_mirror(namespace)
+        if mirror is not None:
+            return mirror.search([query_vector], top_k, threshold, metadata_filter, clip_negative=True)[0]
+
         try:
             table = self._require_table()
-            # Build WHERE clause for namespace filter only
-            where = f"namespace = '{namespace.value}'"
+            # Push filters on typed metadata columns into the WHERE clause;
+            # anything else is filtered in Python over a larger fetch window
+            clauses, residual_filter = self._split_metadata_filter(metadata_filter)
+            where = " AND ".join([f"namespace = {_sql_literal(namespace.value)}", *clauses])
 
-            # Execute search without metadata filters (filter in Python instead)
-            # Fetch more results to account for filtering
-            fetch_limit = top_k * 10 if metadata_filter else top_k
-            results = table.search(query_vector).where(where).limit(fetch_limit).to_list()
+            fetch_limit = top_k * 10 if residual_filter else top_k
+            results = table.search(query_vector).where(where, prefilter=True).limit(fetch_limit).to_list()
 
             # Convert to SearchResult with Python-side metadata filtering
             output = []
@@ -224,10 +396,10 @@ class LanceVectorStore(IVectorStore):
                     except (json.JSONDecodeError, TypeError, AttributeError):
                         pass
 
-                # Apply Python-side metadata filtering
-                if metadata_filter:
+                # Apply Python-side filtering for keys without a typed column
+                if residual_filter:
                     match = True
-                    for key, value in metadata_filter.items():
+                    for key, value in residual_filter.items():
                         if metadata.get(key) != value:
                             match = False
                             break
@@ -261,55 +433,96 @@ class LanceVectorStore(IVectorStore):
         threshold: float,
         metadata_filter: Optional[Dict[str, Any]],
     ) -> List[SearchResult]:
-        """Fallback search using linear scan."""
-        try:
-            import numpy as np
+        """Fallback search: one matmul over the namespace matrix."""
+        return self._fallback_matrix(namespace).search([query_vector], top_k, threshold, metadata_filter)[0]
 
-            query = np.array(query_vector)
-            query_norm = np.linalg.norm(query)
-            if query_norm > 0:
-                query = query / query_norm
+    def search_batch(
+        self,
+        query_vectors: List[List[float]],
+        namespace: VectorNamespace,
+        top_k: int = 5,
+        threshold: float = 0.0,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[List[SearchResult]]:
+        """Search several query vectors, in one matmul when served from memory."""
+        if not query_vectors:
+            return []
 
-            results = []
-            for key, record in self._fallback_store.items():
-                if record.namespace != namespace:
-                    continue
+        if self._use_fallback:
+            return self._fallback_matrix(namespace).search(query_vectors, top_k, threshold, metadata_filter)
 
-                # Apply metadata filter
-                if metadata_filter:
-                    match = True
-                    for k, v in metadata_filter.items():
-                        if record.metadata.get(k) != v:
-                            match = False
-                            break
-                    if not match:
-                        continue
-
-                # Calculate cosine similarity
-                vec = np.array(record.vector)
-                vec_norm = np.linalg.norm(vec)
-                if vec_norm > 0:
-                    vec = vec / vec_norm
-
-                score = float(np.dot(query, vec))
-
-                if score >= threshold:
-                    results.append(
-                        SearchResult(
-                            id=record.id,
-                            score=score,
-                            text=record.text,
-                            metadata=record.metadata,
-                        )
-                    )
+        mirror = self._memory_mirror(namespace)
+        if mirror is not None:
+            return mirror.search(query_vectors, top_k, threshold, metadata_filter, clip_negative=True)
 
-            # Sort by score descending
-            results.sort(key=lambda x: x.score, reverse=True)
-            return results[:top_k]
+        return [
+            self.search(query_vector, namespace, top_k, threshold, metadata_filter) for query_vector in query_vectors
+        ]
 
-        except ImportError:
-            logger.error("NumPy not available for fallback search")
-            return []
+    def _fallback_matrix(self, namespace: VectorNamespace) -> VectorMatrix:
+        """Return the (cached) matrix over fallback records of a namespace."""
+        matrix = self._fallback_matrices.get(namespace)
+        if matrix is None:
+            matrix = VectorMatrix(r for r in self._fallback_store.values() if r.namespace == namespace)
+            self._fallback_matrices[namespace] = matrix
+        return matrix
+
+    def _memory_mirror(self, namespace: VectorNamespace) -> Optional[VectorMatrix]:
+        """Return the in-memory mirror of a LanceDB namespace, loading it on first use.
+
+        Returns None when the namespace is not configured for in-memory
+        serving or the mirror cannot be loaded (LanceDB search is used then).
+        """
+        if namespace not in self._memory_namespaces:
+            return None
+
+        mirror = self._memory_mirrors.get(namespace)
+        if mirror is not None:
+            return mirror
+
+        try:
+            table = self._require_table()
+            where = f"namespace = '{namespace.value}'"
+            limit = max(table.count_rows(where), 1)
+            rows = table.search().where(where).select(["id", "vector", "text", "metadata"]).limit(limit).to_list()
+            mirror = VectorMatrix(
+                VectorRecord(
+                    id=row["id"],
+                    namespace=namespace,
+                    vector=list(row["vector"]),
+                    text=row.get("text", ""),
+                    metadata=self._decode_metadata(row.get("metadata")),
+                )
+                for row in rows
+            )
+        except Exception as e:
+            logger.error(f"Failed to load in-memory mirror for {namespace.value}: {e}")
+            return None
+
+        self._memory_mirrors[namespace] = mirror
+        logger.debug(f"Loaded in-memory mirror for {namespace.value}: {len(mirror)} records")
+        return mirror
+
+    def _drop_memory_mirrors(self, namespaces: Optional[Iterable[VectorNamespace]] = None) -> None:
+        """Forget mirrors after LanceDB writes (all mirrors when namespaces is None)."""
+        if namespaces is None:
+            self._memory_mirrors.clear()
+            return
+        for namespace in namespaces:
+            self._memory_mirrors.pop(namespace, None)
+
+    @staticmethod
+    def _decode_metadata(raw: Any) -> Dict[str, Any]:
+        """Decode the JSON metadata column (bytes or str); {} when missing or invalid."""
+        if not raw:
+            return {}
+        try:
+            if isinstance(raw, bytes):
+                raw = raw.decode("utf-8")
+            metadata = json.loads(raw)
+        except (json.JSONDecodeError, TypeError, AttributeError, UnicodeDecodeError):
+            return {}
+        return metadata if isinstance(metadata, dict) else {}
 
     def delete(self, ids: List[str], namespace: VectorNamespace) -> int:
         """Delete records by IDs."""
@@ -324,12 +537,14 @@ class LanceVectorStore(IVectorStore):
             count = 0
             for id_ in ids:
                 try:
-                    before = table.count_rows(f"id = '{id_}' AND namespace = '{namespace.value}'")
-                    table.delete(f"id = '{id_}' AND namespace = '{namespace.value}'")
+                    where = f"id = {_sql_literal(id_)} AND namespace = {_sql_literal(namespace.value)}"
+                    before = table.count_rows(where)
+                    table.delete(where)
                     count += before
                 except Exception:
                     pass
 
+            self._drop_memory_mirrors([namespace])
             logger.debug(f"Deleted {count} records")
             return count
 
@@ -345,6 +560,7 @@ class LanceVectorStore(IVectorStore):
             if key in self._fallback_store:
                 del self._fallback_store[key]
                 count += 1
+        self._fallback_matrices.clear()
         return count
 
     def count(self, namespace: Optional[VectorNamespace] = None) -> int:
@@ -383,6 +599,8 @@ class LanceVectorStore(IVectorStore):
             "workflows_count": self.count(VectorNamespace.WORKFLOWS),
             "using_fallback": self._use_fallback,
             "lancedb_available": LANCEDB_AVAILABLE,
+            "memory_namespaces": sorted(namespace.value for namespace in self._memory_namespaces),
+            "filter_columns": sorted(self._typed_columns),
         }
 
     def rebuild_index(self) -> bool:
@@ -399,7 +617,8 @@ class LanceVectorStore(IVectorStore):
                 num_sub_vectors=96,
                 replace=True,
             )
-            logger.info("Rebuilt HNSW index")
+            self._ensure_scalar_indexes(replace=True)
+            logger.info("Rebuilt HNSW and scalar indexes")
             return True
         except Exception as e:
             logger.error(f"Failed to rebuild index: {e}")
@@ -419,6 +638,7 @@ class LanceVectorStore(IVectorStore):
             else:
                 # Delete all records
                 table.delete("id IS NOT NULL")
+            self._drop_memory_mirrors([namespace] if namespace else None)
 
             after = self.count(namespace)
             deleted = before - after
@@ -431,6 +651,7 @@ class LanceVectorStore(IVectorStore):
 
     def _clear_fallback(self, namespace: Optional[VectorNamespace]) -> int:
         """Fallback clear using in-memory store."""
+        self._fallback_matrices.clear()
         if namespace is None:
             count = len(self._fallback_store)
             self._fallback_store.clear()
@@ -467,6 +688,41 @@ class LanceVectorStore(IVectorStore):
             logger.error(f"Failed to get IDs: {e}")
             return []
 
+    def get_content_hashes(self, namespace: VectorNamespace) -> Dict[str, str]:
+        """Get stored content hashes per record ID.
+
+        Args:
+            namespace: Namespace to query.
+
+        Returns:
+            Mapping of record ID -> content hash ("" for records without one).
+        """
+        if self._use_fallback:
+            return {
+                r.id: str(r.metadata.get("content_hash", ""))
+                for r in self._fallback_store.values()
+                if r.namespace == namespace
+            }
+
+        try:
+            table = self._require_table()
+            limit = max(table.count_rows(f"namespace = '{namespace.value}'"), 1)
+            # Read the typed column when the schema has it; legacy tables decode the JSON blob
+            typed = "content_hash" in self._typed_columns
+            results = (
+                table.search()
+                .where(f"namespace = '{namespace.value}'")
+                .select(["id", "content_hash" if typed else "metadata"])
+                .limit(limit)
+                .to_list()
+            )
+            if typed:
+                return {r["id"]: str(r.get("content_hash") or "") for r in results}
+            return {r["id"]: str(self._decode_metadata(r.get("metadata")).get("content_hash", "")) for r in results}
+        except Exception as e:
+            logger.error(f"Failed to get content hashes: {e}")
+            return {}
+
     def is_available(self) -> bool:
         """Check if vector store is available and working.
 
@@ -499,6 +755,12 @@ class LanceVectorStore(IVectorStore):
         if self._use_fallback:
             return self._search_workflows_weighted_fallback(query_vector, query_language, top_k, min_score)
 
+        mirror = self._memory_mirror(VectorNamespace.WORKFLOWS)
+        if mirror is not None:
+            return mirror.search_workflows_weighted(
+                [query_vector], query_language, top_k, min_score, clip_negative=True
+            )[0]
+
         try:
             table = self._require_table()
             # Search with higher limit to get multiple embeddings per workflow
@@ -577,66 +839,9 @@ class LanceVectorStore(IVectorStore):
         top_k: int,
         min_score: float,
     ) -> List[WeightedSearchResult]:
-        """Fallback weighted search using linear scan."""
-        try:
-            import numpy as np
-
-            query = np.array(query_vector)
-            query_norm = np.linalg.norm(query)
-            if query_norm > 0:
-                query = query / query_norm
-
-            workflow_matches: Dict[str, WeightedSearchResult] = {}
-
-            for record in self._fallback_store.values():
-                if record.namespace != VectorNamespace.WORKFLOWS:
-                    continue
-
-                # Extract metadata
-                workflow_id = record.metadata.get("workflow_id", record.id)
-                source_type = record.metadata.get("source_type", "unknown")
-                source_weight = float(record.metadata.get("source_weight", 1.0))
-                text_language = record.metadata.get("language", "en")
-
-                # Calculate cosine similarity
-                vec = np.array(record.vector)
-                vec_norm = np.linalg.norm(vec)
-                if vec_norm > 0:
-                    vec = vec / vec_norm
-
-                raw_score = float(np.dot(query, vec))
-
-                # Language boost
-                language_boost = 1.0 if text_language == query_language else 0.9
-
-                # Calculate final score
-                final_score = raw_score * source_weight * language_boost
-
-                # Keep best match per workflow
-                if workflow_id not in workflow_matches or final_score > workflow_matches[workflow_id].final_score:
-                    workflow_matches[workflow_id] = WeightedSearchResult(
-                        workflow_id=workflow_id,
-                        raw_score=raw_score,
-                        source_weight=source_weight,
-                        language_boost=language_boost,
-                        final_score=final_score,
-                        matched_text=record.text,
-                        source_type=source_type,
-                    )
-
-            # Sort and filter
-            results = sorted(
-                workflow_matches.values(),
-                key=lambda x: x.final_score,
-                reverse=True,
-            )
-            results = [r for r in results if r.final_score >= min_score]
-
-            return results[:top_k]
-
-        except ImportError:
-            logger.error("NumPy not available for fallback search")
-            return []
+        """Fallback weighted search: one matmul over the workflow matrix."""
+        matrix = self._fallback_matrix(VectorNamespace.WORKFLOWS)
+        return matrix.search_workflows_weighted([query_vector], query_language, top_k, min_score)[0]
 
     def get_workflow_embedding_count(self) -> int:
         """Get count of workflow embeddings (multiple per workflow).
@@ -0,0 +1,193 @@
+"""
+Matrix-backed In-memory Vector Index.
+
+Keeps one namespace as a contiguous, pre-normalized float32 matrix with side
+arrays for the metadata columns used by weighted workflow scoring
+(workflow_id, source_weight, language). A query batch is a single matmul
+plus ``argpartition`` instead of a per-record Python loop.
+
+Used by LanceVectorStore for the in-memory fallback and, optionally, to serve
+tiny namespaces (e.g. TOOLS) where LanceDB query overhead dominates.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from server.router.domain.interfaces.i_vector_store import (
+    SearchResult,
+    VectorRecord,
+    WeightedSearchResult,
+)
+
+# Language boost for workflow texts whose language differs from the query
+OTHER_LANGUAGE_BOOST = 0.9
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _stable_top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the top_k scores, descending, ties in row order."""
+    if top_k < len(scores):
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        # Include every row tied with the k-th score, so tie order stays stable
+        cutoff = scores[candidates].min()
+        candidates = np.flatnonzero(scores >= cutoff)
+    else:
+        candidates = np.arange(len(scores))
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order][:top_k]
+
+
+class VectorMatrix:
+    """Immutable snapshot of one namespace's vectors and metadata columns."""
+
+    def __init__(self, records: Iterable[VectorRecord]):
+        """Build the matrix.
+
+        Args:
+            records: Records of a single namespace, in insertion order.
+        """
+        self._records: List[VectorRecord] = list(records)
+        if self._records:
+            matrix = np.asarray([record.vector for record in self._records], dtype=np.float32)
+            self._matrix = np.ascontiguousarray(_normalize_rows(matrix))
+        else:
+            self._matrix = np.zeros((0, 0), dtype=np.float32)
+
+        metadata = [record.metadata for record in self._records]
+        self._workflow_ids = [m.get("workflow_id", record.id) for m, record in zip(metadata, self._records)]
+        self._source_types = [m.get("source_type", "unknown") for m in metadata]
+        self._source_weights = np.asarray([float(m.get("source_weight", 1.0)) for m in metadata], dtype=np.float64)
+        self._languages = np.asarray([m.get("language", "en") for m in metadata], dtype=object)
+        # Dense group codes in first-appearance order of workflow_id
+        codes: Dict[str, int] = {}
+        self._workflow_codes = np.asarray(
+            [codes.setdefault(workflow_id, len(codes)) for workflow_id in self._workflow_ids], dtype=np.int64
+        )
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def records(self) -> List[VectorRecord]:
+        return list(self._records)
+
+    def _scores(self, query_vectors: Sequence[Sequence[float]]) -> np.ndarray:
+        """Cosine similarity matrix of shape (queries, rows)."""
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis, :]
+        queries = _normalize_rows(queries)
+        if not self._records:
+            return np.zeros((len(queries), 0), dtype=np.float32)
+        return queries @ self._matrix.T
+
+    def _filter_mask(self, metadata_filter: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        if not metadata_filter:
+            return None
+        items = list(metadata_filter.items())
+        return np.asarray(
+            [all(record.metadata.get(key) == value for key, value in items) for record in self._records],
+            dtype=bool,
+        )
+
+    def search(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        top_k: int = 5,
+        threshold: float = 0.0,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        clip_negative: bool = False,
+    ) -> List[List[SearchResult]]:
+        """Search a batch of queries.
+
+        Args:
+            query_vectors: One or more query embeddings.
+            top_k: Maximum results per query.
+            threshold: Minimum cosine similarity.
+            metadata_filter: Exact-match metadata filter.
+            clip_negative: Clamp scores at 0.0 (LanceDB distance semantics).
+
+        Returns:
+            Results per query, sorted by score descending.
+        """
+        scores = self._scores(query_vectors)
+        if clip_negative:
+            scores = np.maximum(scores, 0.0)
+        mask = self._filter_mask(metadata_filter)
+
+        batches: List[List[SearchResult]] = []
+        for row_scores in scores:
+            eligible = row_scores >= threshold
+            if mask is not None:
+                eligible &= mask
+            rows = np.flatnonzero(eligible)
+            top = rows[_stable_top_k(row_scores[rows], top_k)] if top_k > 0 else rows[:0]
+            batches.append(
+                [
+                    SearchResult(
+                        id=self._records[i].id,
+                        score=float(row_scores[i]),
+                        text=self._records[i].text,
+                        metadata=self._records[i].metadata,
+                    )
+                    for i in top
+                ]
+            )
+        return batches
+
+    def search_workflows_weighted(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        query_language: str = "en",
+        top_k: int = 5,
+        min_score: float = 0.0,
+        clip_negative: bool = False,
+    ) -> List[List[WeightedSearchResult]]:
+        """Weighted workflow search for a batch of queries.
+
+        final_score = raw_score * source_weight * language_boost, keeping the
+        best-scoring record per workflow_id.
+
+        Returns:
+            Results per query, sorted by final_score descending.
+        """
+        raw_scores = self._scores(query_vectors)
+        if clip_negative:
+            raw_scores = np.maximum(raw_scores, 0.0)
+        boosts = np.where(self._languages == query_language, 1.0, OTHER_LANGUAGE_BOOST)
+        final_scores = raw_scores * (self._source_weights * boosts)
+
+        batches: List[List[WeightedSearchResult]] = []
+        for raw_row, final_row in zip(raw_scores, final_scores):
+            if not len(final_row):
+                batches.append([])
+                continue
+            # Best row per workflow: highest final score, earliest row on ties
+            order = np.lexsort((np.arange(len(final_row)), -final_row))
+            _, first = np.unique(self._workflow_codes[order], return_index=True)
+            best_rows = order[first]
+            best_rows = best_rows[final_row[best_rows] >= min_score]
+            # Sort workflows by final score, ties in first-appearance order
+            ranked = best_rows[np.lexsort((self._workflow_codes[best_rows], -final_row[best_rows]))][:top_k]
+            batches.append(
+                [
+                    WeightedSearchResult(
+                        workflow_id=self._workflow_ids[i],
+                        raw_score=float(raw_row[i]),
+                        source_weight=float(self._source_weights[i]),
+                        language_boost=float(boosts[i]),
+                        final_score=float(final_row[i]),
+                        matched_text=self._records[i].text,
+                        source_type=self._source_types[i],
+                    )
+                    for i in ranked
+                ]
+            )
+        return batches
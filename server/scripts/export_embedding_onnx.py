@@ -0,0 +1,52 @@
+"""
+Export LaBSE for the ONNX embedding backend.
+
+Writes a local SentenceTransformer directory with `onnx/model.onnx` plus an
+int8 dynamically quantized `onnx/model_qint8_<config>.onnx`, ready for:
+
+    ROUTER_EMBEDDING_BACKEND=onnx
+    ROUTER_EMBEDDING_MODEL_PATH=<output_dir>
+    ROUTER_EMBEDDING_ONNX_FILE=onnx/model_qint8_<config>.onnx
+
+Requires `optimum[onnxruntime]` next to sentence-transformers.
+
+Usage:
+    python -m server.scripts.export_embedding_onnx <output_dir> [--quantization avx512_vnni|avx512|avx2|arm64]
+"""
+
+import argparse
+import logging
+import sys
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    """Export the ONNX model and its quantized variant."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("output_dir", help="Directory for the exported model")
+    parser.add_argument("--model", default="sentence-transformers/LaBSE", help="Source model id or path")
+    parser.add_argument(
+        "--quantization",
+        default="avx512_vnni",
+        choices=["avx512_vnni", "avx512", "avx2", "arm64"],
+        help="Target CPU for int8 dynamic quantization",
+    )
+    args = parser.parse_args(argv)
+
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    logger.info(f"Exporting {args.model} to ONNX in {args.output_dir}...")
+    model = SentenceTransformer(args.model, backend="onnx", device="cpu")
+    model.save(args.output_dir)
+
+    logger.info(f"Quantizing for {args.quantization}...")
+    export_dynamic_quantized_onnx_model(model, args.quantization, args.output_dir)
+
+    logger.info(f"Done. Set ROUTER_EMBEDDING_ONNX_FILE=onnx/model_qint8_{args.quantization}.onnx")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
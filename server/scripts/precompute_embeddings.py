@@ -70,10 +70,7 @@ def main():
         # Get shared WorkflowIntentClassifier via DI (uses same LaBSE model)
         workflow_classifier = get_workflow_classifier()
 
-        # Clear existing workflow embeddings for fresh multi-embedding
-        workflow_classifier.clear_cache()
-
-        # Load workflows - now creates multi-embeddings (TASK-050)
+        # Load workflows - incremental sync re-embeds only changed texts (TASK-050)
         workflow_classifier.load_workflow_embeddings(workflows)
 
         wf_info = workflow_classifier.get_info()
@@ -0,0 +1 @@
+"""Offline benchmark harness (simulated addon, flows, thresholds); run via scripts/run_benchmarks.py."""
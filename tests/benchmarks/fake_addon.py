@@ -0,0 +1,205 @@
+"""Simulated Blender addon for offline benchmarks.
+
+Runs the real `BlenderRpcServer` (framing, multiplexing, `rpc.batch`, background
+jobs, binary frames) against a `SyntheticScene` instead of `bpy`. Work that the
+addon dispatches through `bpy.app.timers` goes to `SimulatedMainThread`, a single
+FIFO worker that waits `main_thread_latency_ms` before each callback, like
+Blender picking up a timer on its next event-loop tick. `command_latency_ms`
+adds a per-command handler cost on top.
+
+Run standalone (the benchmark runner does this by default):
+
+    python -m tests.benchmarks.fake_addon --port 8799 --main-thread-latency-ms 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Callable, Dict
+
+from blender_addon.infrastructure import rpc_server as rpc_module
+from blender_addon.infrastructure.rpc_server import BlenderRpcServer
+
+from tests.benchmarks.synthetic_scene import DEFAULT_MESH_RESOLUTION, DEFAULT_OBJECT_COUNT, SyntheticScene
+
+DEFAULT_MAIN_THREAD_LATENCY_MS = 4.0
+FAKE_BLENDER_VERSION = "4.2.0 (benchmark stand-in)"
+
+
+class SimulatedMainThread:
+    """`bpy.app.timers` stand-in: one worker thread running callbacks in FIFO order."""
+
+    def __init__(self, tick_latency_ms: float = DEFAULT_MAIN_THREAD_LATENCY_MS):
+        self.tick_latency_ms = float(tick_latency_ms)
+        self.callback_count = 0
+        self._queue: queue.Queue[Callable[[], Any] | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="simulated-blender-main", daemon=True)
+        self._thread.start()
+
+    def register(self, function: Callable[[], Any], first_interval: float = 0.0, persistent: bool = False) -> None:
+        self._queue.put(function)
+
+    def is_registered(self, function: Callable[[], Any]) -> bool:
+        return False
+
+    def unregister(self, function: Callable[[], Any]) -> None:
+        pass
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+
+    def _loop(self) -> None:
+        while True:
+            function = self._queue.get()
+            if function is None:
+                return
+            if self.tick_latency_ms > 0:
+                time.sleep(self.tick_latency_ms / 1000.0)
+            self.callback_count += 1
+            try:
+                function()
+            except Exception as e:
+                print(f"[FakeAddon] Main-thread callback failed: {e}")
+
+
+def make_fake_bpy(main_thread: SimulatedMainThread) -> SimpleNamespace:
+    """Builds the subset of `bpy` the RPC server touches."""
+    return SimpleNamespace(
+        app=SimpleNamespace(timers=main_thread, version_string=FAKE_BLENDER_VERSION),
+        ops=SimpleNamespace(ed=SimpleNamespace(undo_push=lambda message="": None)),
+    )
+
+
+class SimulatedBlenderRpcServer(BlenderRpcServer):
+    """`BlenderRpcServer` serving a synthetic scene with injected handler latency.
+
+    Commands without a synthetic handler (modeling, transforms, ...) are
+    acknowledged and bump the scene revision, so workflow batches run end to end.
+    """
+
+    def __init__(
+        self,
+        scene: SyntheticScene,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        command_latency_ms: Dict[str, float] | None = None,
+        default_command_latency_ms: float = 0.0,
+    ):
+        super().__init__(host=host, port=port)
+        self.scene = scene
+        self.command_latency_ms = dict(command_latency_ms or {})
+        self.default_command_latency_ms = float(default_command_latency_ms)
+        for cmd, handler in scene.handlers().items():
+            self.register_handler(cmd, handler)
+        for cmd, handler in scene.background_handlers().items():
+            self.register_background_handler(cmd, handler)
+
+    def start(self):
+        super().start()
+        if self.server_socket is not None and not self.port:
+            self.port = self.server_socket.getsockname()[1]
+
+    def _simulate_cost(self, cmd: str) -> None:
+        latency_ms = self.command_latency_ms.get(cmd, self.default_command_latency_ms)
+        if latency_ms > 0:
+            time.sleep(latency_ms / 1000.0)
+
+    def _execute_command(self, cmd: str, request_id: str, args: Dict[str, Any], *, push_undo: bool) -> Dict[str, Any]:
+        if cmd not in self.command_registry and not cmd.startswith("rpc."):
+            self.register_handler(cmd, lambda _cmd=cmd, **kwargs: self.scene.apply_edit(_cmd, **kwargs))
+        self._simulate_cost(cmd)
+        return super()._execute_command(cmd, request_id, args, push_undo=push_undo)
+
+    def _invoke_background_handler(self, handler_func: Callable[..., Any], job) -> Any:
+        self._simulate_cost(job.cmd)
+        return super()._invoke_background_handler(handler_func, job)
+
+
+@contextmanager
+def simulated_addon(
+    *,
+    main_thread_latency_ms: float = DEFAULT_MAIN_THREAD_LATENCY_MS,
+    object_count: int = DEFAULT_OBJECT_COUNT,
+    mesh_resolution: int = DEFAULT_MESH_RESOLUTION,
+    command_latency_ms: Dict[str, float] | None = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+):
+    """Runs the simulated addon in this process and yields the started server.
+
+    Patches the RPC server module's `bpy` for the duration, so do not combine
+    with a real addon in the same interpreter.
+    """
+    main_thread = SimulatedMainThread(main_thread_latency_ms)
+    previous_bpy = rpc_module.bpy
+    rpc_module.bpy = make_fake_bpy(main_thread)
+    server = SimulatedBlenderRpcServer(
+        SyntheticScene(object_count=object_count, mesh_resolution=mesh_resolution),
+        host=host,
+        port=port,
+        command_latency_ms=command_latency_ms,
+    )
+    try:
+        server.start()
+        if not server.running:
+            raise RuntimeError(f"Simulated addon failed to listen on {host}:{port}")
+        yield server
+    finally:
+        server.stop()
+        main_thread.stop()
+        rpc_module.bpy = previous_bpy
+
+
+def _parse_command_latency(values: list[str]) -> Dict[str, float]:
+    latencies = {}
+    for value in values:
+        cmd, separator, milliseconds = value.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"Expected CMD=MS, got '{value}'")
+        latencies[cmd] = float(milliseconds)
+    return latencies
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulated Blender addon RPC server for benchmarks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--main-thread-latency-ms", type=float, default=DEFAULT_MAIN_THREAD_LATENCY_MS)
+    parser.add_argument("--object-count", type=int, default=DEFAULT_OBJECT_COUNT)
+    parser.add_argument("--mesh-resolution", type=int, default=DEFAULT_MESH_RESOLUTION)
+    parser.add_argument(
+        "--command-latency-ms",
+        action="append",
+        default=[],
+        metavar="CMD=MS",
+        help="Extra handler latency for one command (repeatable).",
+    )
+    args = parser.parse_args(argv)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    with simulated_addon(
+        main_thread_latency_ms=args.main_thread_latency_ms,
+        object_count=args.object_count,
+        mesh_resolution=args.mesh_resolution,
+        command_latency_ms=_parse_command_latency(args.command_latency_ms),
+        host=args.host,
+        port=args.port,
+    ):
+        try:
+            stop.wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,260 @@
+"""Representative end-to-end flows and RPC metering for the benchmark harness.
+
+Each flow drives the real server-side handlers and services against the
+simulated addon through a `MeteredRpcClient` installed as the DI RPC client,
+so the measured RPC count and wire bytes are exactly what the MCP tools send.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator
+
+from server.adapters.rpc.client import RpcClient
+
+from tests.benchmarks.synthetic_scene import BODY_NAME, GRID_MESH_NAME
+
+WORKFLOW_GOAL = "picnic table with straight legs"
+WORKFLOW_PARAMS = {"table_length": 1.6, "table_width": 0.75, "leg_length": 0.75}
+RELATION_GOAL_HINT = "creature body with mirrored limbs"
+
+
+class RpcMeter:
+    """Thread-safe counters for RPC round trips and socket bytes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.rpc_count = 0
+            self.bytes_sent = 0
+            self.bytes_received = 0
+            self.commands: Counter[str] = Counter()
+
+    def record_rpc(self, cmd: str) -> None:
+        with self._lock:
+            self.rpc_count += 1
+            self.commands[cmd] += 1
+
+    def record_bytes(self, *, sent: int = 0, received: int = 0) -> None:
+        with self._lock:
+            self.bytes_sent += sent
+            self.bytes_received += received
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rpc_count": self.rpc_count,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "commands": dict(self.commands),
+            }
+
+
+class _MeteredSocket:
+    """Socket proxy counting payload bytes; everything else is delegated."""
+
+    def __init__(self, sock, meter: RpcMeter):
+        self._sock = sock
+        self._meter = meter
+
+    def sendall(self, data, *args):
+        self._sock.sendall(data, *args)
+        self._meter.record_bytes(sent=len(data))
+
+    def recv(self, bufsize, *args):
+        data = self._sock.recv(bufsize, *args)
+        self._meter.record_bytes(received=len(data))
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+
+class MeteredRpcClient(RpcClient):
+    """`RpcClient` that reports every submitted request and socket byte to a `RpcMeter`."""
+
+    def __init__(self, host: str, port: int, meter: RpcMeter | None = None, **kwargs):
+        super().__init__(host, port, **kwargs)
+        self.meter = meter or RpcMeter()
+
+    def connect(self):
+        connected = super().connect()
+        if connected:
+            self.socket = _MeteredSocket(self.socket, self.meter)
+        return connected
+
+    def _submit(self, request, *, on_event=None):
+        self.meter.record_rpc(request.cmd)
+        return super()._submit(request, on_event=on_event)
+
+
+@contextmanager
+def installed_rpc_client(client: RpcClient) -> Iterator[RpcClient]:
+    """Makes `client` the DI RPC client and restores the previous one on exit.
+
+    A router built before or during the block is rebound as well, since it keeps
+    its own reference to the client it was created with.
+    """
+    import server.infrastructure.di as di
+
+    previous = di._rpc_client_instance
+    di._rpc_client_instance = client
+    if di._router_instance is not None:
+        di._router_instance.set_rpc_client(client)
+    try:
+        yield client
+    finally:
+        di._rpc_client_instance = previous
+        if di._router_instance is not None:
+            di._router_instance.set_rpc_client(di.get_rpc_client())
+
+
+class FlowFailed(RuntimeError):
+    """Raised when a flow's result shows it did not exercise the intended path."""
+
+
+@dataclass(frozen=True)
+class BenchmarkFlow:
+    name: str
+    description: str
+    run: Callable[[], Any]
+
+
+def _router_handler():
+    from server.infrastructure.di import get_router_handler
+
+    handler = get_router_handler()
+    if not handler.is_enabled():
+        raise FlowFailed("Router is disabled (ROUTER_ENABLED=false)")
+    return handler
+
+
+def _run_router_set_goal() -> Dict[str, Any]:
+    handler = _router_handler()
+    handler.clear_goal()
+    result = handler.set_goal(WORKFLOW_GOAL)
+    if result.get("status") not in ("needs_input", "ready"):
+        raise FlowFailed(f"router_set_goal: unexpected status {result.get('status')!r}: {result.get('message')}")
+    return result
+
+
+def _run_workflow_execution() -> Dict[str, Any]:
+    handler = _router_handler()
+    handler.clear_goal()
+    result = handler.set_goal(WORKFLOW_GOAL, resolved_params=dict(WORKFLOW_PARAMS))
+    if result.get("status") != "ready":
+        raise FlowFailed(f"workflow_execution: unexpected status {result.get('status')!r}: {result.get('message')}")
+    return result
+
+
+def _relation_targets(scene_objects: list[str]) -> list[str]:
+    return [BODY_NAME, *[name for name in scene_objects if name.startswith("Limb_")]]
+
+
+def _scene_objects() -> list[str]:
+    from server.infrastructure.di import get_scene_handler
+
+    return [str(item["name"]) for item in get_scene_handler().list_objects()]
+
+
+def _run_scene_relation_graph() -> Dict[str, Any]:
+    from server.infrastructure.di import get_scene_handler
+
+    scene_handler = get_scene_handler()
+    targets = _relation_targets(_scene_objects())
+    graph = scene_handler.get_relation_graph(target_objects=targets, goal_hint=RELATION_GOAL_HINT)
+    if not graph.get("pairs"):
+        raise FlowFailed("scene_relation_graph: no relation pairs evaluated")
+    return graph
+
+
+def _run_reference_compare_stage() -> Dict[str, Any]:
+    from server.adapters.mcp.areas.reference import (
+        _assembled_target_scope,
+        _build_correction_truth_bundle,
+        _build_stage_view_diagnostics_hints,
+    )
+    from server.adapters.mcp.vision.capture_runtime import capture_stage_images
+    from server.infrastructure.di import get_scene_handler
+
+    scene_handler = get_scene_handler()
+    targets = _relation_targets(_scene_objects())
+    captures = capture_stage_images(
+        scene_handler,
+        bundle_id="benchmark",
+        stage="after",
+        target_object=BODY_NAME,
+        target_objects=targets,
+        preset_profile="compact",
+    )
+    if not captures:
+        raise FlowFailed("reference_compare_stage: no stage captures")
+    hints = _build_stage_view_diagnostics_hints(
+        scene_handler=scene_handler,
+        captures=captures,
+        preset_profile="compact",
+        target_object=BODY_NAME,
+        target_objects=targets,
+        collection_name=None,
+        target_view=None,
+    )
+    scope = _assembled_target_scope(target_object=BODY_NAME, target_objects=targets, collection_name=None)
+    truth_bundle, _relation_graph = _build_correction_truth_bundle(scene_handler, scope, goal_hint=RELATION_GOAL_HINT)
+    return {"captures": captures, "view_diagnostics_hints": hints, "truth_bundle": truth_bundle}
+
+
+def _run_mesh_get_large_reads(layout: str) -> Dict[str, Any]:
+    from server.infrastructure.di import get_mesh_handler
+
+    mesh_handler = get_mesh_handler()
+    results = {
+        "vertices": mesh_handler.get_vertex_data(GRID_MESH_NAME, layout=layout),
+        "edges": mesh_handler.get_edge_data(GRID_MESH_NAME, layout=layout),
+        "faces": mesh_handler.get_face_data(GRID_MESH_NAME, layout=layout),
+    }
+    if not results["faces"].get("face_count"):
+        raise FlowFailed(f"mesh_get_large_reads ({layout}): empty face payload")
+    return results
+
+
+FLOWS: Dict[str, BenchmarkFlow] = {
+    flow.name: flow
+    for flow in (
+        BenchmarkFlow(
+            "router_set_goal",
+            "router_set_goal matching a workflow that still needs input",
+            _run_router_set_goal,
+        ),
+        BenchmarkFlow(
+            "workflow_execution",
+            "router_set_goal with resolved params, executing the workflow as one rpc.batch",
+            _run_workflow_execution,
+        ),
+        BenchmarkFlow(
+            "scene_relation_graph",
+            "scene_relation_graph over the body and its mirrored limbs",
+            _run_scene_relation_graph,
+        ),
+        BenchmarkFlow(
+            "reference_compare_stage",
+            "staged reference compare: view-set capture, view diagnostics and truth bundle",
+            _run_reference_compare_stage,
+        ),
+        BenchmarkFlow(
+            "mesh_get_large_reads",
+            "mesh_get_vertex/edge/face_data on the grid mesh (columns layout)",
+            lambda: _run_mesh_get_large_reads("columns"),
+        ),
+        BenchmarkFlow(
+            "mesh_get_large_reads_rows",
+            "mesh_get_vertex/edge/face_data on the grid mesh (rows layout)",
+            lambda: _run_mesh_get_large_reads("rows"),
+        ),
+    )
+}
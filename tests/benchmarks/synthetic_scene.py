@@ -0,0 +1,584 @@
+"""Synthetic scene state and addon-shaped payloads for the benchmark addon.
+
+`SyntheticScene` stands in for `bpy.data`: a body with mirrored, touching
+limb pairs (axis-aligned boxes), one subdivided grid mesh for large
+`mesh.get_*` reads and JPEG viewport renders. Handler methods keep the addon
+handler signatures and payload shapes (bounding-box measurement basis), so the
+real server-side handlers and services consume them unchanged.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+from blender_addon.application.handlers.mesh_arrays import edge_columns, face_columns, normalize_layout, vertex_columns
+
+BODY_NAME = "Body"
+GRID_MESH_NAME = "Grid_Mesh"
+DEFAULT_OBJECT_COUNT = 16
+DEFAULT_MESH_RESOLUTION = 128
+DEFAULT_JPEG_QUALITY = 85
+
+_AXES = ("X", "Y", "Z")
+
+
+def _round_values(values, precision=6):
+    return [round(float(value), precision) for value in values]
+
+
+def _round_axis_mapping(values, precision=6):
+    return {axis: round(float(value), precision) for axis, value in zip("xyz", values)}
+
+
+def _axis_gap(source_min, source_max, target_min, target_max):
+    if source_max < target_min:
+        return float(target_min - source_max)
+    if target_max < source_min:
+        return float(source_min - target_max)
+    return 0.0
+
+
+def _axis_overlap(source_min, source_max, target_min, target_max):
+    return max(0.0, float(min(source_max, target_max) - max(source_min, target_min)))
+
+
+def _assertion_payload(*, assertion, subject, passed, target=None, **fields):
+    payload = {"assertion": assertion, "passed": bool(passed), "subject": subject, "target": target, **fields}
+    return {key: value for key, value in payload.items() if value is not None}
+
+
+@dataclass(frozen=True)
+class SyntheticObject:
+    """One axis-aligned box standing in for a scene object."""
+
+    name: str
+    location: tuple[float, float, float]
+    dimensions: tuple[float, float, float]
+    type: str = "MESH"
+
+    @property
+    def bbox_min(self) -> list[float]:
+        return [self.location[axis] - self.dimensions[axis] / 2.0 for axis in range(3)]
+
+    @property
+    def bbox_max(self) -> list[float]:
+        return [self.location[axis] + self.dimensions[axis] / 2.0 for axis in range(3)]
+
+
+class _Collection:
+    """`bpy_prop_collection` stand-in supporting `len()` and `foreach_get`."""
+
+    def __init__(self, count: int, props: dict[str, Callable[[], np.ndarray]]):
+        self._count = count
+        self._props = props
+
+    def __len__(self) -> int:
+        return self._count
+
+    def foreach_get(self, prop: str, values: np.ndarray) -> None:
+        values[:] = np.asarray(self._props[prop](), dtype=values.dtype).reshape(-1)
+
+
+class _NoAttributes:
+    def get(self, name):
+        return None
+
+
+class SyntheticGridMesh:
+    """Flat `resolution` x `resolution` quad grid exposing the mesh data `mesh_arrays` reads."""
+
+    def __init__(self, resolution: int):
+        side = resolution + 1
+        ys, xs = np.divmod(np.arange(side * side), side)
+        co = np.stack([xs / resolution - 0.5, ys / resolution - 0.5, np.zeros(side * side)], axis=1)
+
+        qy, qx = np.divmod(np.arange(resolution * resolution), resolution)
+        corner = qy * side + qx
+        loop_verts = np.stack([corner, corner + 1, corner + side + 1, corner + side], axis=1).reshape(-1)
+
+        horizontal = [(y * side + x, y * side + x + 1) for y in range(side) for x in range(resolution)]
+        vertical = [(y * side + x, (y + 1) * side + x) for y in range(resolution) for x in range(side)]
+        edge_verts = np.array(horizontal + vertical, dtype=np.int32).reshape(-1, 2)
+        edge_lookup = {tuple(sorted(pair)): index for index, pair in enumerate(edge_verts.tolist())}
+        loop_next = loop_verts.reshape(-1, 4)[:, [1, 2, 3, 0]].reshape(-1)
+        loop_edges = np.array(
+            [edge_lookup[(min(a, b), max(a, b))] for a, b in zip(loop_verts.tolist(), loop_next.tolist())],
+            dtype=np.int32,
+        )
+
+        face_count = resolution * resolution
+        centers = co[loop_verts.reshape(-1, 4)].mean(axis=1)
+        vertex_count, edge_count = len(co), len(edge_verts)
+        self.vertices = _Collection(vertex_count, {"co": lambda: co, "select": lambda: np.ones(vertex_count)})
+        self.edges = _Collection(
+            edge_count,
+            {
+                "vertices": lambda: edge_verts,
+                "select": lambda: np.ones(edge_count),
+                "use_seam": lambda: np.zeros(edge_count),
+                "use_edge_sharp": lambda: np.zeros(edge_count),
+            },
+        )
+        self.loops = _Collection(
+            len(loop_verts), {"vertex_index": lambda: loop_verts, "edge_index": lambda: loop_edges}
+        )
+        self.polygons = _Collection(
+            face_count,
+            {
+                "select": lambda: np.ones(face_count),
+                "loop_start": lambda: np.arange(face_count) * 4,
+                "loop_total": lambda: np.full(face_count, 4),
+                "normal": lambda: np.tile([0.0, 0.0, 1.0], face_count),
+                "center": lambda: centers,
+                "area": lambda: np.full(face_count, 1.0 / face_count),
+                "material_index": lambda: np.zeros(face_count),
+            },
+        )
+        self.attributes = _NoAttributes()
+
+
+def _rows_from_columns(payload: dict[str, Any], rows_key: str) -> dict[str, Any]:
+    """Converts a column payload into the addon's per-element `rows` layout."""
+    columns = payload.pop("columns")
+    strides = payload.pop("strides", {})
+    payload.pop("layout", None)
+    count = len(columns["index"])
+    loop_totals = columns.pop("loop_total", None)
+    split: dict[str, list] = {}
+    for name, values in columns.items():
+        values = values.tolist() if values.dtype.kind != "f" else np.round(values.astype(np.float64), 6).tolist()
+        if name == "verts" and loop_totals is not None:
+            bounds = np.cumsum(loop_totals).tolist()
+            split[name] = [values[start:end] for start, end in zip([0, *bounds[:-1]], bounds)]
+        elif strides.get(name, 1) > 1:
+            width = strides[name]
+            split[name] = [values[index * width : (index + 1) * width] for index in range(count)]
+        else:
+            split[name] = values
+    payload[rows_key] = [{name: values[index] for name, values in split.items()} for index in range(count)]
+    return payload
+
+
+def render_viewport_jpeg(width: int, height: int, quality: int = DEFAULT_JPEG_QUALITY) -> bytes:
+    """Renders a deterministic shaded gradient with mild noise, sized like a real viewport capture."""
+    from PIL import Image
+
+    ys, xs = np.mgrid[0:height, 0:width].astype(np.float32)
+    base = 60.0 + 120.0 * (ys / max(height - 1, 1))[..., None] * np.array([0.8, 0.9, 1.0], dtype=np.float32)
+    inside = (np.abs(xs - width / 2) < width / 5) & (np.abs(ys - height / 2) < height / 4)
+    base[inside] = np.array([170.0, 165.0, 150.0]) + 30.0 * (xs[inside] / width)[..., None]
+    noise = np.random.default_rng(width * 31 + height).normal(0.0, 4.0, base.shape)
+    pixels = np.clip(base + noise, 0, 255).astype(np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels, "RGB").save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+class SyntheticScene:
+    """In-memory scene with addon-compatible handler methods."""
+
+    def __init__(
+        self,
+        object_count: int = DEFAULT_OBJECT_COUNT,
+        mesh_resolution: int = DEFAULT_MESH_RESOLUTION,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    ):
+        self.objects: dict[str, SyntheticObject] = {}
+        self.mesh = SyntheticGridMesh(mesh_resolution)
+        self.jpeg_quality = jpeg_quality
+        self.revision = 0
+        self._lock = threading.Lock()
+        self._jpeg_cache: dict[tuple[int, int], bytes] = {}
+        self._build_objects(max(1, object_count))
+
+    def _build_objects(self, object_count: int) -> None:
+        self._add(SyntheticObject(BODY_NAME, (0.0, 0.0, 1.0), (2.0, 1.0, 1.0)))
+        self._add(SyntheticObject(GRID_MESH_NAME, (0.0, 0.0, -5.0), (1.0, 1.0, 0.0)))
+        pair_count = max(0, object_count - 2) // 2
+        for index in range(pair_count):
+            # Limbs touch the body's X faces and are mirrored across x=0
+            y = -0.4 + 0.8 * (index + 0.5) / pair_count
+            size = (0.5, min(0.8 / pair_count, 0.2), 0.3)
+            self._add(SyntheticObject(f"Limb_{index:02d}_L", (-1.0 - size[0] / 2, y, 1.0), size))
+            self._add(SyntheticObject(f"Limb_{index:02d}_R", (1.0 + size[0] / 2, y, 1.0), size))
+        if object_count > 2 and (object_count - 2) % 2:
+            self._add(SyntheticObject("Prop", (0.0, 2.0, 0.25), (0.5, 0.5, 0.5)))
+
+    def _add(self, obj: SyntheticObject) -> None:
+        self.objects[obj.name] = obj
+
+    @property
+    def limb_names(self) -> list[str]:
+        return [name for name in self.objects if name.startswith("Limb_")]
+
+    def _get(self, object_name) -> SyntheticObject:
+        obj = self.objects.get(object_name)
+        if obj is None:
+            raise ValueError(f"Object '{object_name}' not found")
+        return obj
+
+    def _bbox(self, object_name) -> dict[str, list[float]]:
+        obj = self._get(object_name)
+        bbox_min, bbox_max = obj.bbox_min, obj.bbox_max
+        return {
+            "min": bbox_min,
+            "max": bbox_max,
+            "center": [(bbox_min[axis] + bbox_max[axis]) / 2.0 for axis in range(3)],
+            "dimensions": [bbox_max[axis] - bbox_min[axis] for axis in range(3)],
+        }
+
+    def apply_edit(self, cmd: str, **args) -> str:
+        """Acknowledges a mutating command and bumps the scene revision."""
+        with self._lock:
+            self.revision += 1
+        return f"{cmd} applied"
+
+    def viewport_jpeg(self, width: int, height: int) -> bytes:
+        key = (int(width), int(height))
+        if key not in self._jpeg_cache:
+            self._jpeg_cache[key] = render_viewport_jpeg(*key, quality=self.jpeg_quality)
+        return self._jpeg_cache[key]
+
+    # --- scene.* read handlers ---
+
+    def list_objects(self):
+        return [
+            {"name": obj.name, "type": obj.type, "location": [round(value, 3) for value in obj.location]}
+            for obj in self.objects.values()
+        ]
+
+    def get_mode(self):
+        return {
+            "mode": "OBJECT",
+            "active_object": BODY_NAME,
+            "active_object_type": "MESH",
+            "selected_object_names": [BODY_NAME],
+            "selection_count": 1,
+        }
+
+    def list_selection(self):
+        return {
+            "mode": "OBJECT",
+            "selected_object_names": [BODY_NAME],
+            "selection_count": 1,
+            "edit_mode_vertex_count": None,
+            "edit_mode_edge_count": None,
+            "edit_mode_face_count": None,
+        }
+
+    def inspect_mesh_topology(self, object_name, detailed=False):
+        self._get(object_name)
+        mesh = self.mesh if object_name == GRID_MESH_NAME else None
+        return {
+            "object_name": object_name,
+            "vertex_count": len(mesh.vertices) if mesh else 8,
+            "edge_count": len(mesh.edges) if mesh else 12,
+            "face_count": len(mesh.polygons) if mesh else 6,
+            "triangle_count": 0,
+        }
+
+    def router_context(self, object_name=None, since_revision=None):
+        mode = self.get_mode()
+        context = {"revision": self.revision, **{key: mode[key] for key in mode if key != "selection_count"}}
+        if since_revision is not None and since_revision == self.revision:
+            context["unchanged"] = True
+            return context
+        context["objects"] = self.list_objects()
+        focus = self.objects.get(object_name or BODY_NAME)
+        if focus is not None:
+            topology = self.inspect_mesh_topology(focus.name)
+            topology.pop("object_name")
+            context["focus"] = {
+                "name": focus.name,
+                "type": focus.type,
+                "dimensions": list(focus.dimensions),
+                "material_names": [],
+                "modifier_names": [],
+                "topology": topology,
+            }
+        return context
+
+    def get_bounding_box(self, object_name, world_space=True):
+        bbox = self._bbox(object_name)
+        corners = [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+        return {
+            "object_name": object_name,
+            "world_space": world_space,
+            **{key: _round_values(value, 4) for key, value in bbox.items()},
+            "corners": [
+                _round_values([(bbox["min"], bbox["max"])[pick][axis] for axis, pick in enumerate(corner)], 4)
+                for corner in corners
+            ],
+        }
+
+    def measure_gap(self, from_object, to_object, tolerance=0.0001):
+        source, target = self._bbox(from_object), self._bbox(to_object)
+        axis_gap = [_axis_gap(source["min"][i], source["max"][i], target["min"][i], target["max"][i]) for i in range(3)]
+        overlap = [
+            _axis_overlap(source["min"][i], source["max"][i], target["min"][i], target["max"][i]) for i in range(3)
+        ]
+        gap = math.sqrt(sum(value * value for value in axis_gap))
+        if gap > tolerance:
+            relation = "separated"
+        elif all(value > tolerance for value in overlap):
+            relation = "overlapping"
+        else:
+            relation = "contact"
+        return {
+            "from_object": from_object,
+            "to_object": to_object,
+            "gap": round(gap, 6),
+            "axis_gap": _round_axis_mapping(axis_gap),
+            "relation": relation,
+            "tolerance": round(float(tolerance), 6),
+            "units": "blender_units",
+            "measurement_basis": "bounding_box",
+        }
+
+    def measure_alignment(self, from_object, to_object, axes=None, reference="CENTER", tolerance=0.0001):
+        point_key = {"CENTER": "center", "MIN": "min", "MAX": "max"}[str(reference).upper()]
+        source, target = self._bbox(from_object)[point_key], self._bbox(to_object)[point_key]
+        normalized_axes = [str(axis).upper() for axis in (axes or _AXES)]
+        deltas = {
+            axis.lower(): round(target[_AXES.index(axis)] - source[_AXES.index(axis)], 6) for axis in normalized_axes
+        }
+        aligned = [axis for axis in normalized_axes if abs(deltas[axis.lower()]) <= tolerance]
+        return {
+            "from_object": from_object,
+            "to_object": to_object,
+            "reference": str(reference).upper(),
+            "axes": normalized_axes,
+            "deltas": deltas,
+            "aligned_axes": aligned,
+            "misaligned_axes": [axis for axis in normalized_axes if axis not in aligned],
+            "is_aligned": len(aligned) == len(normalized_axes),
+            "max_abs_delta": round(max((abs(value) for value in deltas.values()), default=0.0), 6),
+            "tolerance": round(float(tolerance), 6),
+            "units": "blender_units",
+        }
+
+    def measure_overlap(self, from_object, to_object, tolerance=0.0001):
+        source, target = self._bbox(from_object), self._bbox(to_object)
+        lower = [max(source["min"][i], target["min"][i]) for i in range(3)]
+        upper = [min(source["max"][i], target["max"][i]) for i in range(3)]
+        dimensions = [max(0.0, upper[i] - lower[i]) for i in range(3)]
+        overlaps = all(value > tolerance for value in dimensions)
+        gaps = [_axis_gap(source["min"][i], source["max"][i], target["min"][i], target["max"][i]) for i in range(3)]
+        touching = not overlaps and all(value <= tolerance for value in gaps)
+        volume = dimensions[0] * dimensions[1] * dimensions[2] if overlaps else 0.0
+        return {
+            "from_object": from_object,
+            "to_object": to_object,
+            "overlaps": overlaps,
+            "touching": touching,
+            "relation": "overlap" if overlaps else ("touching" if touching else "disjoint"),
+            "overlap_dimensions": _round_values(dimensions),
+            "overlap_volume": round(volume, 6),
+            "intersection_min": _round_values(lower) if overlaps else None,
+            "intersection_max": _round_values(upper) if overlaps else None,
+            "tolerance": round(float(tolerance), 6),
+            "units": "blender_units",
+            "measurement_basis": "bounding_box",
+        }
+
+    def assert_contact(self, from_object, to_object, max_gap=0.0001, allow_overlap=False):
+        gap_result = self.measure_gap(from_object, to_object, tolerance=max_gap)
+        relation, gap = gap_result["relation"], gap_result["gap"]
+        overlaps = relation == "overlapping"
+        return _assertion_payload(
+            assertion="scene_assert_contact",
+            subject=from_object,
+            target=to_object,
+            passed=gap <= max_gap and (allow_overlap or not overlaps),
+            expected={"max_gap": round(float(max_gap), 6), "allow_overlap": bool(allow_overlap)},
+            actual={"gap": gap, "relation": relation},
+            delta={"gap_overage": round(max(0.0, gap - max_gap), 6)},
+            tolerance=round(float(max_gap), 6),
+            units="blender_units",
+            details={
+                "axis_gap": gap_result["axis_gap"],
+                "measured_relation": relation,
+                "overlap_rejected": overlaps and not allow_overlap,
+                "measurement_basis": "bounding_box",
+            },
+        )
+
+    def measure_relations_bulk(self, pairs, tolerance=0.0001, max_gap=0.0001, allow_overlap=False):
+        results = []
+        for pair in pairs:
+            from_object, to_object = pair.get("from_object"), pair.get("to_object")
+            entry = {"from_object": from_object, "to_object": to_object, "error": None}
+            try:
+                entry["gap"] = self.measure_gap(from_object, to_object, tolerance=tolerance)
+                entry["alignment"] = self.measure_alignment(from_object, to_object, tolerance=tolerance)
+                entry["overlap"] = self.measure_overlap(from_object, to_object, tolerance=tolerance)
+                entry["contact_assertion"] = self.assert_contact(
+                    from_object, to_object, max_gap=max_gap, allow_overlap=allow_overlap
+                )
+            except ValueError as exc:
+                entry.update(gap=None, alignment=None, overlap=None, contact_assertion=None, error=str(exc))
+            results.append(entry)
+        return {"pairs": results, "pair_count": len(results), "evaluated_mesh_count": 0}
+
+    def assert_symmetry(self, left_object, right_object, axis="X", mirror_coordinate=0.0, tolerance=0.0001):
+        axis_index = _AXES.index(str(axis).upper())
+        left, right = self._bbox(left_object), self._bbox(right_object)
+        mirror_delta = right["center"][axis_index] - (2.0 * float(mirror_coordinate) - left["center"][axis_index])
+        center = {
+            name.lower(): round(right["center"][i] - left["center"][i], 6)
+            for i, name in enumerate(_AXES)
+            if i != axis_index
+        }
+        dimensions = {
+            name.lower(): round(right["dimensions"][i] - left["dimensions"][i], 6) for i, name in enumerate(_AXES)
+        }
+        failed = [f"center_{key}" for key, value in center.items() if abs(value) > tolerance]
+        failed += [f"dimensions_{key}" for key, value in dimensions.items() if abs(value) > tolerance]
+        if abs(mirror_delta) > tolerance:
+            failed.append(f"mirror_{_AXES[axis_index].lower()}")
+        return _assertion_payload(
+            assertion="scene_assert_symmetry",
+            subject=left_object,
+            target=right_object,
+            passed=not failed,
+            expected={"axis": _AXES[axis_index], "mirror_coordinate": round(float(mirror_coordinate), 6)},
+            actual={
+                "left_center": _round_values(left["center"]),
+                "right_center": _round_values(right["center"]),
+                "left_dimensions": _round_values(left["dimensions"]),
+                "right_dimensions": _round_values(right["dimensions"]),
+            },
+            delta={"mirror_axis": round(mirror_delta, 6), "center": center, "dimensions": dimensions},
+            tolerance=round(float(tolerance), 6),
+            units="blender_units",
+            details={"failed_checks": failed},
+        )
+
+    def get_view_diagnostics(self, target_object=None, target_objects=None, camera_name=None, **view_args):
+        names = [name for name in [target_object, *(target_objects or [])] if name]
+        if not names:
+            raise ValueError("Provide target_object or target_objects for scene view diagnostics.")
+        # Background Blender has no user viewport; the addon answers with this shape
+        targets = [
+            {
+                "object_name": name,
+                "visibility_verdict": "unavailable",
+                "projection_status": "unavailable",
+                "unavailable_reason": "active_user_viewport_required",
+            }
+            for name in dict.fromkeys(names)
+        ]
+        return {
+            "view_query": {
+                "requested_view_source": "user_perspective",
+                "resolved_view_source": None,
+                "requested_camera_name": None,
+                "resolved_camera_name": None,
+                "analysis_backend": "mirrored_user_perspective",
+                "available": False,
+                "unavailable_reason": "active_user_viewport_required",
+                "state_restored": True,
+            },
+            "targets": targets,
+            "summary": {
+                "target_count": len(targets),
+                "visible_count": 0,
+                "partially_visible_count": 0,
+                "fully_occluded_count": 0,
+                "outside_frame_count": 0,
+                "unavailable_count": len(targets),
+                "centered_target_count": 0,
+                "framing_issue_count": 0,
+            },
+        }
+
+    def get_viewport(self, width=1024, height=768, shading="SOLID", output_path=None, **view_args):
+        data = self.viewport_jpeg(width, height)
+        if output_path and os.path.isdir(os.path.dirname(os.path.abspath(str(output_path)))):
+            with open(output_path, "wb") as handle:
+                handle.write(data)
+            return {
+                "path": str(output_path),
+                "size": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "media_type": "image/jpeg",
+                "width": width,
+                "height": height,
+            }
+        return base64.b64encode(data).decode("ascii")
+
+    def capture_view_set(
+        self, presets, target_object=None, isolate_objects=None, progress_callback=None, is_cancelled=None
+    ):
+        if not isinstance(presets, list) or not presets:
+            raise ValueError("presets must be a non-empty list")
+        captures = []
+        for index, preset in enumerate(presets):
+            name = str(preset.get("name") or f"view_{index}")
+            if progress_callback is not None:
+                progress_callback(index, len(presets), f"Rendering view '{name}' ({index + 1}/{len(presets)})")
+            rendered = self.get_viewport(
+                width=int(preset.get("width", 1024)),
+                height=int(preset.get("height", 768)),
+                output_path=preset.get("output_path"),
+            )
+            if isinstance(rendered, dict):
+                captures.append({"name": name, **rendered})
+            else:
+                captures.append({"name": name, "media_type": "image/jpeg", "image_base64": rendered})
+        return {"view_count": len(captures), "captures": captures}
+
+    # --- mesh.* read handlers ---
+
+    def _mesh_read(self, object_name, reader, rows_key, selected_only, offset, limit, layout):
+        if self._get(object_name).name != GRID_MESH_NAME:
+            raise ValueError(f"Object '{object_name}' has no synthetic mesh data")
+        payload = {
+            "object_name": object_name,
+            "layout": "columns",
+            **reader(self.mesh, selected_only, int(offset or 0), None if limit is None else int(limit)),
+        }
+        return payload if normalize_layout(layout) == "columns" else _rows_from_columns(payload, rows_key)
+
+    def get_vertex_data(self, object_name, selected_only=False, offset=None, limit=None, layout="rows"):
+        return self._mesh_read(object_name, vertex_columns, "vertices", selected_only, offset, limit, layout)
+
+    def get_edge_data(self, object_name, selected_only=False, offset=None, limit=None, layout="rows"):
+        return self._mesh_read(object_name, edge_columns, "edges", selected_only, offset, limit, layout)
+
+    def get_face_data(self, object_name, selected_only=False, offset=None, limit=None, layout="rows"):
+        return self._mesh_read(object_name, face_columns, "faces", selected_only, offset, limit, layout)
+
+    def handlers(self) -> dict[str, Callable[..., Any]]:
+        """Foreground commands served by this scene, keyed by RPC command name."""
+        return {
+            "scene.list_objects": self.list_objects,
+            "scene.get_mode": self.get_mode,
+            "scene.list_selection": self.list_selection,
+            "scene.inspect_mesh_topology": self.inspect_mesh_topology,
+            "scene.router_context": self.router_context,
+            "scene.get_bounding_box": self.get_bounding_box,
+            "scene.measure_gap": self.measure_gap,
+            "scene.measure_alignment": self.measure_alignment,
+            "scene.measure_overlap": self.measure_overlap,
+            "scene.assert_contact": self.assert_contact,
+            "scene.measure_relations_bulk": self.measure_relations_bulk,
+            "scene.assert_symmetry": self.assert_symmetry,
+            "scene.get_view_diagnostics": self.get_view_diagnostics,
+            "scene.get_viewport": self.get_viewport,
+            "mesh.get_vertex_data": self.get_vertex_data,
+            "mesh.get_edge_data": self.get_edge_data,
+            "mesh.get_face_data": self.get_face_data,
+        }
+
+    def background_handlers(self) -> dict[str, Callable[..., Any]]:
+        """Task-capable commands served through `rpc.launch_job`."""
+        return {"scene.capture_view_set": self.capture_view_set}
@@ -0,0 +1,117 @@
+"""
+Parity tests for the quantized / ONNX embedding backends.
+
+Embeds the registered workflows with the fp32 LaBSE model and with each
+candidate backend, then checks that workflow matches for the router test
+prompts agree. No Blender connection is needed, but the models are:
+
+- ``torch_int8`` runs whenever sentence-transformers and torch are installed.
+- ``onnx`` additionally needs ``optimum[onnxruntime]`` and a local export in
+  ``ROUTER_EMBEDDING_MODEL_PATH`` (``python -m server.scripts.export_embedding_onnx``),
+  optionally with ``ROUTER_EMBEDDING_ONNX_FILE``.
+"""
+
+import os
+
+import pytest
+from server.router.application.classifier.workflow_intent_classifier import WorkflowIntentClassifier
+from server.router.application.workflows.registry import get_workflow_registry
+from server.router.infrastructure.embedding_backends import EmbeddingBackendSpec, load_embedding_model
+from server.router.infrastructure.vector_store.lance_store import LanceVectorStore
+
+pytest.importorskip("sentence_transformers")
+
+# Workflow-level prompts used across the router e2e suite (EN/PL/DE)
+PARITY_PROMPTS = [
+    "picnic table with straight legs",
+    "table with straight legs",
+    "table",
+    "prostymi nogami",
+    "proste nogi",
+    "gerade beine",
+    "picnic table with straight left leg",
+    "create phone screen",
+    "create a phone screen cutout",
+    "create screen cutout on phone",
+    "extrude the top face of the phone to create a button",
+    "add segments to tower",
+    "simple house with a roof",
+    "x leg table",
+]
+
+TOP_K = 3
+MAX_SCORE_DRIFT = 0.05
+
+_LOCAL_ONLY = os.getenv("HF_HUB_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def _workflows():
+    registry = get_workflow_registry()
+    registry.ensure_custom_loaded()
+    workflows = {}
+    for name in registry.get_all_workflows():
+        workflow = registry.get_workflow(name)
+        if workflow:
+            workflows[name] = workflow
+        else:
+            definition = registry.get_definition(name)
+            if definition:
+                workflows[name] = definition
+    return workflows
+
+
+def _matches(spec, model, db_path):
+    classifier = WorkflowIntentClassifier(
+        vector_store=LanceVectorStore(db_path=db_path),
+        model_name=spec.cache_name,
+        model=model,
+    )
+    classifier.load_workflow_embeddings(_workflows())
+    # Tiny positive threshold: 0.0 would fall back to the configured threshold
+    return {prompt: classifier.find_similar(prompt, top_k=TOP_K, threshold=1e-9) for prompt in PARITY_PROMPTS}
+
+
+@pytest.fixture(scope="module")
+def reference_matches(tmp_path_factory):
+    spec = EmbeddingBackendSpec(local_files_only=_LOCAL_ONLY)
+    try:
+        model = load_embedding_model(spec)
+    except Exception as e:
+        pytest.skip(f"fp32 LaBSE unavailable: {e}")
+    return _matches(spec, model, tmp_path_factory.mktemp("fp32"))
+
+
+def _candidate_spec(backend):
+    if backend == "torch_int8":
+        pytest.importorskip("torch")
+        return EmbeddingBackendSpec(backend="torch_int8", local_files_only=_LOCAL_ONLY)
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("optimum")
+    model_path = os.getenv("ROUTER_EMBEDDING_MODEL_PATH")
+    if not model_path:
+        pytest.skip("ROUTER_EMBEDDING_MODEL_PATH not set to a local ONNX export")
+    return EmbeddingBackendSpec(
+        backend="onnx",
+        model_path=model_path,
+        onnx_file=os.getenv("ROUTER_EMBEDDING_ONNX_FILE") or None,
+        local_files_only=True,
+    )
+
+
+@pytest.mark.parametrize("backend", ["torch_int8", "onnx"])
+def test_backend_matches_fp32_top_k_workflows(backend, reference_matches, tmp_path):
+    spec = _candidate_spec(backend)
+    candidate = _matches(spec, load_embedding_model(spec), tmp_path)
+
+    for prompt, expected in reference_matches.items():
+        actual = candidate[prompt]
+        expected_names = [name for name, _score in expected]
+        actual_names = [name for name, _score in actual]
+        assert actual_names[:1] == expected_names[:1], f"top-1 differs for {prompt!r}: {actual} vs {expected}"
+        assert len(set(actual_names) & set(expected_names)) >= min(len(expected_names), TOP_K - 1), (
+            f"top-{TOP_K} diverges for {prompt!r}: {actual} vs {expected}"
+        )
+        expected_scores = dict(expected)
+        for name, score in actual:
+            if name in expected_scores:
+                assert abs(score - expected_scores[name]) <= MAX_SCORE_DRIFT, (prompt, name, score, expected_scores)
@@ -2,10 +2,12 @@
 
 import pytest
 from server.adapters.mcp.tasks.job_registry import (
+    BackgroundJobRegistry,
     get_background_job_registry,
     reset_background_job_registry_for_tests,
 )
 from server.adapters.mcp.tasks.result_store import (
+    BackgroundResultStore,
     get_background_result_store,
     reset_background_result_store_for_tests,
 )
@@ -93,3 +95,80 @@ def test_task_runtime_report_matches_current_supported_pair():
     assert report.supported is True
     assert report.fastmcp_version == "3.2.4"
     assert report.pydocket_version == "0.19.2"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_background_result_store_spills_large_payloads_and_keeps_only_the_reference():
+    store = BackgroundResultStore(spill_threshold_bytes=1024)
+    large = "A" * 10_000
+
+    store.put(task_id="big", tool_name="scene_get_viewport", payload=large)
+    store.put(task_id="small", tool_name="scene_get_viewport", payload={"ok": True})
+
+    stats = store.get_stats()
+    assert stats["spilled_entries"] == 1
+    assert stats["spilled_bytes"] >= 10_000
+    assert stats["resident_bytes"] < 1024
+    assert store._results["task-result:big"].record.payload is None
+    assert store.get("task-result:big").payload == large
+    assert store.get("task-result:small").payload == {"ok": True}
+
+    store.put(task_id="big", tool_name="scene_get_viewport", payload=large + "B")
+    assert store.get("task-result:big").payload == large + "B"
+    assert store.get_stats()["spilled_entries"] == 1
+
+    store.clear()
+    assert store.get_stats()["spilled_bytes"] == 0
+
+
+def test_background_result_store_evicts_least_recently_used_results_over_budget():
+    store = BackgroundResultStore(max_resident_bytes=250, spill_threshold_bytes=0)
+    for index in range(3):
+        store.put(task_id=f"t{index}", tool_name="tool", payload="x" * 100)
+        if index == 1:
+            store.get("task-result:t0")
+
+    assert store.get("task-result:t1") is None
+    assert store.get("task-result:t0") is not None
+    assert store.get("task-result:t2") is not None
+    stats = store.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["resident_bytes"] <= 250
+
+
+def test_background_result_store_expires_results_after_ttl():
+    clock = _Clock()
+    store = BackgroundResultStore(ttl_seconds=60, spill_threshold_bytes=16, clock=clock)
+    store.put(task_id="t1", tool_name="tool", payload="y" * 64)
+
+    clock.now += 61
+
+    assert store.get("task-result:t1") is None
+    assert store.get_stats()["expirations"] == 1
+    assert store.get_stats()["spilled_bytes"] == 0
+
+
+def test_background_job_registry_drops_old_terminal_records_but_keeps_active_ones():
+    clock = _Clock()
+    registry = BackgroundJobRegistry(max_terminal_records=2, terminal_ttl_seconds=60, clock=clock)
+    registry.register(task_id="active", tool_name="tool", backend_kind="addon_job")
+    for index in range(3):
+        clock.now += 1
+        registry.register(task_id=f"done-{index}", tool_name="tool", backend_kind="addon_job")
+        registry.mark_completed(f"done-{index}")
+
+    assert registry.get("done-0") is None
+    assert registry.get("done-1") is not None
+    assert registry.get("active") is not None
+
+    clock.now += 120
+    registry.register(task_id="next", tool_name="tool", backend_kind="addon_job")
+
+    assert {record.task_id for record in registry.list()} == {"active", "next"}
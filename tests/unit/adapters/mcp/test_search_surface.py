@@ -1709,3 +1709,69 @@ def test_guided_surface_fails_closed_for_non_bypassed_direct_and_discovered_call
 
     assert "Router processing failed" in direct_text
     assert discovered_text == direct_text
+
+
+def _plain_tool(name: str, description: str):
+    from fastmcp.tools.tool import Tool
+
+    def fn(value: int = 0) -> str:
+        return name
+
+    return Tool.from_function(fn=fn, name=name, description=description)
+
+
+def test_discovery_search_caches_bm25_index_per_visible_tool_set(monkeypatch):
+    """Sessions with different visible sets reuse their own cached index instead of rebuilding."""
+
+    import server.adapters.mcp.discovery.search_surface as search_surface
+
+    built_documents: list[str] = []
+    original_build = search_surface.build_search_documents
+
+    def counting_build(tools, *, entry_map=None):
+        built_documents.extend(tool.name for tool in tools)
+        return original_build(tools, entry_map=entry_map)
+
+    monkeypatch.setattr(search_surface, "build_search_documents", counting_build)
+    transform = search_surface.BlenderDiscoverySearchTransform(entry_map={}, index_cache_size=2)
+    bevel = _plain_tool("alpha_bevel", "Round off hard corners")
+    inset = _plain_tool("beta_inset", "Shrink faces inward")
+    sculpt = _plain_tool("gamma_sculpt", "Brush stroke sculpting")
+    build_phase, sculpt_phase = [bevel, inset], [bevel, sculpt]
+
+    async def run():
+        results = []
+        for _ in range(3):
+            results.append(await transform._search(build_phase, "round corners"))
+            results.append(await transform._search(sculpt_phase, "brush stroke"))
+        return results
+
+    results = asyncio.run(run())
+
+    assert [tool.name for tool in results[0]] == ["alpha_bevel"]
+    assert [tool.name for tool in results[1]] == ["gamma_sculpt"]
+    assert [[tool.name for tool in result] for result in results[2:]] == [["alpha_bevel"], ["gamma_sculpt"]] * 2
+    assert sorted(built_documents) == ["alpha_bevel", "beta_inset", "gamma_sculpt"]
+    assert len(transform._indexes) == 2
+
+
+def test_discovery_search_rebuilds_index_when_tool_definition_changes_and_evicts_lru():
+    from server.adapters.mcp.discovery.search_surface import BlenderDiscoverySearchTransform
+
+    transform = BlenderDiscoverySearchTransform(entry_map={}, index_cache_size=1)
+    bevel = _plain_tool("alpha_bevel", "Round off hard corners")
+    renamed = _plain_tool("alpha_bevel", "Chamfer hard corners")
+    inset = _plain_tool("beta_inset", "Shrink faces inward")
+
+    async def run():
+        before = await transform._search([bevel, inset], "chamfer")
+        after = await transform._search([renamed, inset], "chamfer")
+        await transform._search([inset], "shrink")
+        return before, after
+
+    before, after = asyncio.run(run())
+
+    assert before == []
+    assert [tool.name for tool in after] == ["alpha_bevel"]
+    assert after[0] is renamed
+    assert len(transform._indexes) == 1
@@ -31,6 +31,7 @@ def test_server_run_uses_stdio_transport_mode(monkeypatch):
             MCP_HTTP_HOST="127.0.0.1",
             MCP_HTTP_PORT=8000,
             MCP_STREAMABLE_HTTP_PATH="/mcp",
+            ROUTER_WARMUP_ENABLED=False,
             MCP_PROMPTS_AS_TOOLS_ENABLED=True,
         ),
     )
@@ -55,6 +56,7 @@ def test_server_run_uses_streamable_http_transport_mode(monkeypatch):
             MCP_HTTP_HOST="0.0.0.0",
             MCP_HTTP_PORT=8123,
             MCP_STREAMABLE_HTTP_PATH="/custom-mcp",
+            ROUTER_WARMUP_ENABLED=False,
             MCP_PROMPTS_AS_TOOLS_ENABLED=False,
         ),
     )
@@ -73,3 +75,32 @@ def test_server_run_uses_streamable_http_transport_mode(monkeypatch):
             },
         )
     ]
+
+
+def test_server_run_starts_router_warmup_when_enabled(monkeypatch):
+    fake_server = _FakeServer()
+    started: list[bool] = []
+
+    monkeypatch.setattr(server_module, "build_server", lambda surface_profile=None: fake_server)
+    monkeypatch.setattr(server_module, "is_router_enabled", lambda: True)
+    monkeypatch.setattr(server_module.signal, "signal", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(
+        server_module,
+        "start_router_warmup",
+        lambda: started.append(True) or SimpleNamespace(stage_names=["labse_model", "router"]),
+    )
+    monkeypatch.setattr(
+        server_module,
+        "get_config",
+        lambda: SimpleNamespace(
+            MCP_SURFACE_PROFILE="llm-guided",
+            MCP_TRANSPORT_MODE="stdio",
+            ROUTER_WARMUP_ENABLED=True,
+            MCP_PROMPTS_AS_TOOLS_ENABLED=True,
+        ),
+    )
+
+    server_module.run()
+
+    assert started == [True]
+    assert fake_server.calls == [((), {"transport": "stdio"})]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from threading import Event
 from typing import cast
 
@@ -669,3 +670,86 @@ def test_scene_get_viewport_background_path_marks_failed_on_result_formatter_err
     registry_record = get_background_job_registry().get("task-format-error")
     assert registry_record is not None
     assert registry_record.status == "failed"
+
+
+class _PushingRpcClient:
+    """Fake RPC client that pushes job snapshots from a worker thread instead of answering polls."""
+
+    def __init__(self, pushed: list[dict | None]) -> None:
+        self.pushed = pushed
+        self.polls = 0
+        self.unsubscribed: list[str] = []
+
+    def launch_background_job(self, cmd, args, *, timeout_seconds=None):
+        return RpcResponse(request_id="req-1", status="ok", result={"job_id": "job-push"})
+
+    def subscribe_background_job(self, job_id, on_event, *, timeout_seconds=None):
+        def push() -> None:
+            for snapshot in self.pushed:
+                on_event(snapshot)
+
+        threading.Timer(0.05, push).start()
+        return RpcResponse(
+            request_id="sub-1",
+            status="ok",
+            result={"job_id": job_id, "status": "queued", "progress_current": 0, "progress_total": 1},
+        )
+
+    def unsubscribe_background_job(self, subscription_id):
+        self.unsubscribed.append(subscription_id)
+
+    def get_background_job_status(self, job_id, *, timeout_seconds=None):
+        self.polls += 1
+        return RpcResponse(
+            request_id="req-poll",
+            status="ok",
+            result={"job_id": job_id, "status": "completed", "progress_current": 2, "progress_total": 2},
+        )
+
+    def collect_background_job_result(self, job_id, *, timeout_seconds=None):
+        return RpcResponse(
+            request_id="req-collect",
+            status="ok",
+            result={
+                "job_id": job_id,
+                "result": {"object_name": "Cube", "renders": [{"angle": "front", "path": "/tmp/front.png"}]},
+            },
+        )
+
+    def cancel_background_job(self, job_id):
+        return RpcResponse(request_id="req-cancel", status="ok", result={"job_id": job_id})
+
+
+def test_rpc_background_job_completes_from_pushed_events_without_polling(monkeypatch):
+    """Pushed progress/completion snapshots should drive the task without rpc.get_job polls."""
+
+    fake_rpc = _PushingRpcClient(
+        [
+            {"job_id": "job-push", "status": "running", "progress_current": 1, "progress_total": 2},
+            {"job_id": "job-push", "status": "completed", "progress_current": 2, "progress_total": 2},
+        ]
+    )
+    monkeypatch.setattr("server.adapters.mcp.tasks.task_bridge.get_rpc_client", lambda: fake_rpc)
+
+    ctx = BackgroundContext("task-push")
+    result = asyncio.run(extraction_render_angles(ctx, object_name="Cube"))
+
+    assert '"object_name": "Cube"' in result
+    assert fake_rpc.polls == 0
+    assert fake_rpc.unsubscribed == ["sub-1"]
+    registry_record = get_background_job_registry().get("task-push")
+    assert registry_record is not None
+    assert registry_record.status == "completed"
+
+
+def test_rpc_background_job_falls_back_to_polling_when_the_push_stream_is_lost(monkeypatch):
+    """A dropped push stream should hand completion detection back to rpc.get_job polling."""
+
+    fake_rpc = _PushingRpcClient([None])
+    monkeypatch.setattr("server.adapters.mcp.tasks.task_bridge.get_rpc_client", lambda: fake_rpc)
+
+    ctx = BackgroundContext("task-push-lost")
+    result = asyncio.run(extraction_render_angles(ctx, object_name="Cube"))
+
+    assert '"object_name": "Cube"' in result
+    assert fake_rpc.polls == 1
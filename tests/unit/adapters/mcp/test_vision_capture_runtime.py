@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import base64
+import hashlib
+from pathlib import Path
 
+import pytest
 from server.adapters.mcp.vision import (
     COMPACT_CAPTURE_PRESET_SPECS,
     RICH_CAPTURE_PRESET_SPECS,
@@ -13,6 +16,14 @@ from server.adapters.mcp.vision import (
     resolve_capture_preset_specs,
     restore_scene_state,
 )
+from server.infrastructure.file_handoff import reset_handoff_state
+
+
+@pytest.fixture(autouse=True)
+def _fresh_handoff_state():
+    reset_handoff_state()
+    yield
+    reset_handoff_state()
 
 
 class _Handler:
@@ -265,3 +276,139 @@ def test_capture_stage_images_restores_state_after_capture(tmp_path, monkeypatch
         {"object_name": "Housing", "hide": False, "hide_render": False},
         {"object_name": "Panel", "hide": True, "hide_render": False},
     ]
+
+
+class _FileHandoffHandler(_Handler):
+    def __init__(self, *, corrupt: bool = False) -> None:
+        super().__init__()
+        self.corrupt = corrupt
+        self.file_calls: list[str] = []
+
+    def get_viewport_file(
+        self, output_path, width=1024, height=768, shading="SOLID", camera_name=None, focus_target=None
+    ):
+        self.file_calls.append(output_path)
+        data = b"shared-jpeg"
+        Path(output_path).write_bytes(data)
+        sha256 = hashlib.sha256(b"other" if self.corrupt else data).hexdigest()
+        return {"path": output_path, "size": len(data), "sha256": sha256, "media_type": "image/jpeg"}
+
+
+def test_capture_stage_images_uses_shared_file_handoff_when_paths_match(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_AI_TMP_INTERNAL_DIR", str(tmp_path))
+    monkeypatch.setenv("BLENDER_AI_TMP_EXTERNAL_DIR", str(tmp_path))
+
+    handler = _FileHandoffHandler()
+    captures = capture_stage_images(handler, bundle_id="bundle4", stage="before", target_object="Housing")
+
+    assert len(handler.file_calls) == 4
+    assert handler.calls == []
+    assert tmp_path.joinpath("blender-ai-mcp", "bundle4_before_target_top.jpg").read_bytes() == b"shared-jpeg"
+    assert captures[0].host_visible_path == handler.file_calls[0]
+
+
+def test_capture_stage_images_falls_back_to_inline_when_handoff_does_not_verify(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_AI_TMP_INTERNAL_DIR", str(tmp_path))
+    monkeypatch.setenv("BLENDER_AI_TMP_EXTERNAL_DIR", str(tmp_path))
+
+    handler = _FileHandoffHandler(corrupt=True)
+    capture_stage_images(handler, bundle_id="bundle5", stage="before", target_object="Housing")
+
+    assert len(handler.calls) == 4
+    assert len(handler.file_calls) == 1
+    assert tmp_path.joinpath("blender-ai-mcp", "bundle5_before_context_wide.jpg").read_bytes() == b"fake-jpeg"
+
+    capture_stage_images(handler, bundle_id="bundle5", stage="after", target_object="Housing")
+
+    assert len(handler.file_calls) == 1
+    assert len(handler.calls) == 8
+
+
+def test_capture_stage_images_inline_mode_skips_file_handoff(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_AI_TMP_INTERNAL_DIR", str(tmp_path))
+    monkeypatch.setenv("BLENDER_AI_TMP_EXTERNAL_DIR", str(tmp_path))
+    monkeypatch.setenv("BLENDER_AI_CAPTURE_HANDOFF", "inline")
+
+    handler = _FileHandoffHandler()
+    capture_stage_images(handler, bundle_id="bundle6", stage="before", target_object="Housing")
+
+    assert handler.file_calls == []
+    assert len(handler.calls) == 4
+
+
+class _ViewSetHandler(_Handler):
+    def __init__(self, *, fail: bool = False) -> None:
+        super().__init__()
+        self.fail = fail
+        self.view_set_calls: list[dict] = []
+
+    def capture_view_set(self, presets, target_object=None, isolate_objects=None, timeout_seconds=None):
+        self.view_set_calls.append(
+            {"presets": presets, "target_object": target_object, "isolate_objects": isolate_objects}
+        )
+        if self.fail:
+            raise RuntimeError("Blender Error: Unknown background command: scene.capture_view_set")
+        captures = []
+        for preset in presets:
+            if preset["output_path"]:
+                Path(preset["output_path"]).write_bytes(b"set-jpeg")
+                digest = hashlib.sha256(b"set-jpeg").hexdigest()
+                captures.append({"name": preset["name"], "path": preset["output_path"], "size": 8, "sha256": digest})
+            else:
+                captures.append({"name": preset["name"], "image_base64": base64.b64encode(b"set-inline").decode()})
+        return {"view_count": len(captures), "captures": captures}
+
+
+def test_capture_stage_images_renders_whole_stage_in_one_view_set_job(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_AI_TMP_INTERNAL_DIR", str(tmp_path))
+    monkeypatch.setenv("BLENDER_AI_TMP_EXTERNAL_DIR", str(tmp_path))
+
+    handler = _ViewSetHandler()
+    captures = capture_stage_images(handler, bundle_id="bundle7", stage="after", target_object="Housing")
+
+    assert len(handler.view_set_calls) == 1
+    call = handler.view_set_calls[0]
+    assert call["target_object"] == "Housing"
+    assert call["isolate_objects"] == ["Housing"]
+    assert [preset["standard_view"] for preset in call["presets"]] == [None, "FRONT", "RIGHT", "TOP"]
+    assert handler.calls == []
+    assert handler.isolate_calls == []
+    assert handler.hide_calls == []
+    assert [capture.preset_name for capture in captures] == [
+        "context_wide",
+        "target_front",
+        "target_side",
+        "target_top",
+    ]
+    assert tmp_path.joinpath("blender-ai-mcp", "bundle7_after_target_side.jpg").read_bytes() == b"set-jpeg"
+
+
+def test_capture_stage_images_view_set_retries_inline_when_paths_are_not_shared(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_AI_TMP_INTERNAL_DIR", str(tmp_path / "internal"))
+    monkeypatch.setenv("BLENDER_AI_TMP_EXTERNAL_DIR", str(tmp_path / "external"))
+    tmp_path.joinpath("external", "blender-ai-mcp").mkdir(parents=True)
+
+    handler = _ViewSetHandler()
+    capture_stage_images(handler, bundle_id="bundle8", stage="after", target_object="Housing")
+
+    assert len(handler.view_set_calls) == 2
+    assert all(preset["output_path"] is None for preset in handler.view_set_calls[1]["presets"])
+    assert tmp_path.joinpath("internal", "blender-ai-mcp", "bundle8_after_target_top.jpg").read_bytes() == b"set-inline"
+
+    handler.view_set_calls.clear()
+    capture_stage_images(handler, bundle_id="bundle8b", stage="after", target_object="Housing")
+
+    assert len(handler.view_set_calls) == 1
+    assert all(preset["output_path"] is None for preset in handler.view_set_calls[0]["presets"])
+
+
+def test_capture_stage_images_falls_back_to_per_view_rpcs_when_view_set_is_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLENDER_AI_TMP_INTERNAL_DIR", str(tmp_path / "internal"))
+    monkeypatch.setenv("BLENDER_AI_TMP_EXTERNAL_DIR", str(tmp_path / "external"))
+
+    handler = _ViewSetHandler(fail=True)
+    captures = capture_stage_images(handler, bundle_id="bundle9", stage="after", target_object="Housing")
+
+    assert len(handler.view_set_calls) == 1
+    assert len(handler.calls) == 4
+    assert len(captures) == 4
@@ -0,0 +1,115 @@
+"""Tests for vectorized connected-component labeling used by silhouette analysis."""
+
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+import pytest
+from server.adapters.mcp.vision import components
+from server.adapters.mcp.vision.components import clear_component_memo, label_runs, largest_component
+
+
+def _bfs_largest_component(mask: np.ndarray) -> np.ndarray:
+    """Reference pure-Python BFS (the previous silhouette implementation)."""
+
+    visited = np.zeros(mask.shape, dtype=bool)
+    best: list[tuple[int, int]] = []
+    height, width = mask.shape
+    for y, x in np.argwhere(mask):
+        if visited[y, x]:
+            continue
+        queue = deque([(int(y), int(x))])
+        visited[y, x] = True
+        coords = []
+        while queue:
+            cy, cx = queue.popleft()
+            coords.append((cy, cx))
+            for dy, dx in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                ny, nx = cy + dy, cx + dx
+                if 0 <= ny < height and 0 <= nx < width and mask[ny, nx] and not visited[ny, nx]:
+                    visited[ny, nx] = True
+                    queue.append((ny, nx))
+        if len(coords) > len(best):
+            best = coords
+    component = np.zeros(mask.shape, dtype=bool)
+    if best:
+        ys, xs = zip(*best)
+        component[list(ys), list(xs)] = True
+    return component
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    clear_component_memo()
+    yield
+    clear_component_memo()
+
+
+@pytest.mark.parametrize("density", [0.3, 0.5, 0.6, 0.8])
+def test_largest_component_matches_reference_bfs(density: float):
+    rng = np.random.default_rng(int(density * 100))
+    for _ in range(5):
+        mask = rng.random((37, 53)) < density
+        np.testing.assert_array_equal(largest_component(mask), _bfs_largest_component(mask))
+
+
+def test_spiral_and_diagonal_shapes_follow_four_connectivity():
+    mask = np.zeros((9, 9), dtype=bool)
+    mask[0, :] = True
+    mask[:, 8] = True
+    mask[8, :] = True
+    mask[2:, 0] = True
+    mask[2, 0:7] = True
+    mask[2:7, 6] = True
+    diagonal = np.eye(6, dtype=bool)
+
+    np.testing.assert_array_equal(largest_component(mask), _bfs_largest_component(mask))
+    assert int(largest_component(diagonal).sum()) == 1
+    assert len(set(label_runs(diagonal).labels.tolist())) == 6
+
+
+def test_ties_keep_first_component_in_row_major_order():
+    mask = np.zeros((4, 7), dtype=bool)
+    mask[0, 4:6] = True
+    mask[2, 0:2] = True
+
+    component = largest_component(mask)
+
+    assert component[0, 4] and not component[2, 0]
+
+
+def test_results_are_memoized_per_mask_and_for_the_component(monkeypatch):
+    mask = np.zeros((20, 20), dtype=bool)
+    mask[2:8, 2:8] = True
+    mask[12:14, 12:14] = True
+    calls = []
+    original = components.label_runs
+    monkeypatch.setattr(components, "label_runs", lambda value: calls.append(1) or original(value))
+
+    first = largest_component(mask)
+    first[:] = False
+    again = largest_component(mask)
+    rescored = largest_component(again)
+
+    assert calls == [1]
+    assert int(again.sum()) == 36
+    np.testing.assert_array_equal(rescored, again)
+
+
+def test_downsample_first_mode_keeps_full_resolution_pixels():
+    mask = np.zeros((400, 600), dtype=bool)
+    mask[50:300, 100:350] = True
+    mask[350:360, 500:510] = True
+
+    component = largest_component(mask, max_side=100)
+
+    assert component.shape == mask.shape
+    assert not np.any(component & ~mask)
+    assert int(component.sum()) == 250 * 250
+
+
+def test_empty_and_invalid_masks():
+    assert not largest_component(np.zeros((3, 3), dtype=bool)).any()
+    with pytest.raises(ValueError, match="2D"):
+        label_runs(np.zeros((2, 2, 2), dtype=bool))
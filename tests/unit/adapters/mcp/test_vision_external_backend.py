@@ -89,6 +89,8 @@ class _FakeResponse:
 
 
 class _FakeAsyncClient:
+    is_closed = False
+
     def __init__(self, *, response: _FakeResponse, captured: dict) -> None:
         self._response = response
         self._captured = captured
@@ -146,7 +148,7 @@ def test_external_backend_analyze_returns_structured_payload(monkeypatch, tmp_pa
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(response=_FakeResponse(payload), captured=captured),
+        lambda timeout=None, **kwargs: _FakeAsyncClient(response=_FakeResponse(payload), captured=captured),
     )
 
     result = asyncio.run(backend.analyze(request))
@@ -179,7 +181,7 @@ def test_external_backend_uses_api_key_env_when_inline_key_missing(monkeypatch,
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse(
                 {"choices": [{"message": {"content": '{"goal_summary":"ok","visible_changes":[]}'}}]}
             ),
@@ -217,7 +219,7 @@ def test_external_backend_supports_openrouter_headers_and_default_endpoint(monke
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse(
                 {"choices": [{"message": {"content": '{"goal_summary":"ok","visible_changes":[]}'}}]}
             ),
@@ -261,7 +263,7 @@ def test_external_backend_defaults_openrouter_require_parameters_to_false(monkey
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse(
                 {"choices": [{"message": {"content": '{"goal_summary":"ok","visible_changes":[]}'}}]}
             ),
@@ -297,7 +299,7 @@ def test_openrouter_openai_family_uses_capability_aware_output_cap(monkeypatch,
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse(
                 {
                     "choices": [
@@ -337,7 +339,7 @@ def test_external_backend_uses_json_object_for_qwen_family_on_openrouter(monkeyp
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse(
                 {"choices": [{"message": {"content": '{"goal_summary":"ok","visible_changes":[]}'}}]}
             ),
@@ -372,7 +374,7 @@ def test_external_backend_supports_google_ai_studio_generate_content(monkeypatch
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse(
                 {
                     "candidates": [
@@ -428,7 +430,7 @@ def test_openrouter_google_family_compare_flow_uses_narrow_schema_and_prompt(mon
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse(
                 {
                     "choices": [
@@ -503,7 +505,7 @@ def test_google_ai_studio_compare_flow_uses_narrow_schema_and_prompt(monkeypatch
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse(
                 {
                     "candidates": [
@@ -567,7 +569,7 @@ def test_external_backend_invalid_json_error_includes_diagnostics(monkeypatch, t
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse({"choices": [{"message": {"content": "not-json"}}]}),
             captured={},
         ),
@@ -600,7 +602,7 @@ def test_external_backend_invalid_json_error_includes_contract_profile(monkeypat
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse({"choices": [{"message": {"content": "not-json"}}]}),
             captured={},
         ),
@@ -621,7 +623,7 @@ def test_external_backend_rejects_invalid_json_content(monkeypatch, tmp_path):
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse({"choices": [{"message": {"content": "not-json"}}]}),
             captured={},
         ),
@@ -655,7 +657,7 @@ def test_openrouter_http_error_logs_payload_summary_and_response_preview(monkeyp
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda timeout=None: _FakeAsyncClient(
+        lambda timeout=None, **kwargs: _FakeAsyncClient(
             response=_FakeResponse(
                 {"error": {"message": "Provider rejected json_schema for this model."}},
                 status_code=400,
@@ -0,0 +1,191 @@
+"""Tests for the shared external-vision HTTP pool against a local stub server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from server.adapters.mcp.vision.http_pool import (
+    VisionHttpPool,
+    get_vision_http_pool,
+    request_fingerprint,
+    reset_vision_http_pools,
+)
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.delay = delay
+        self.connections = 0
+        self.requests: list[dict] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def verify_request(self, request, client_address):
+        with self.lock:
+            self.connections += 1
+        return True
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/chat/completions"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+        pass
+
+    def do_POST(self):
+        server: _StubServer = self.server  # type: ignore[assignment]
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append(body)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+        status = 500 if body.get("fail") else 200
+        payload = json.dumps({"echo": body.get("prompt")}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def stub_server():
+    servers = []
+
+    def start(delay: float = 0.0) -> _StubServer:
+        server = _StubServer(delay=delay)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_sequential_requests_reuse_one_keep_alive_connection(stub_server):
+    server = stub_server()
+    pool = VisionHttpPool(timeout_seconds=5.0)
+
+    async def run():
+        results = [await pool.post_json(server.url, payload={"prompt": f"p{i}"}) for i in range(3)]
+        await pool.aclose()
+        return results
+
+    results = asyncio.run(run())
+
+    assert [result["echo"] for result in results] == ["p0", "p1", "p2"]
+    assert server.connections == 1
+    assert pool.get_stats()["clients_created"] == 1
+
+
+def test_clients_are_closed_when_their_event_loop_shuts_down(stub_server):
+    server = stub_server()
+    pool = VisionHttpPool(timeout_seconds=5.0)
+    clients = []
+    tracked_loops = []
+
+    async def run(prompt):
+        result = await pool.post_json(server.url, payload={"prompt": prompt})
+        clients.append(pool._states[asyncio.get_running_loop()].client)
+        tracked_loops.append(len(pool._states))
+        return result
+
+    asyncio.run(run("first"))
+    asyncio.run(run("second"))
+
+    assert all(client.is_closed for client in clients)
+    assert pool.get_stats()["clients_created"] == 2
+    assert tracked_loops == [1, 1]
+
+
+def test_identical_in_flight_requests_are_coalesced(stub_server):
+    server = stub_server(delay=0.2)
+    pool = VisionHttpPool(timeout_seconds=5.0)
+    payload = {"prompt": "compare", "images": ["data:image/png;base64,AAAA"]}
+
+    async def run():
+        results = await asyncio.gather(*(pool.post_json(server.url, payload=payload) for _ in range(4)))
+        await pool.aclose()
+        return results
+
+    results = asyncio.run(run())
+
+    assert len(server.requests) == 1
+    assert all(result == {"echo": "compare"} for result in results)
+    assert len({id(result) for result in results}) == 4
+    assert pool.get_stats()["coalesced"] == 3
+
+
+def test_concurrency_limit_caps_requests_per_provider(stub_server):
+    server = stub_server(delay=0.1)
+    pool = VisionHttpPool(timeout_seconds=5.0, max_concurrency=2)
+
+    async def run():
+        await asyncio.gather(*(pool.post_json(server.url, payload={"prompt": f"p{i}"}) for i in range(5)))
+        await pool.aclose()
+
+    asyncio.run(run())
+
+    assert len(server.requests) == 5
+    assert server.max_active == 2
+
+
+def test_http_errors_reach_every_coalesced_caller(stub_server):
+    server = stub_server(delay=0.1)
+    pool = VisionHttpPool(timeout_seconds=5.0)
+
+    async def run():
+        results = await asyncio.gather(
+            *(pool.post_json(server.url, payload={"fail": True}) for _ in range(2)),
+            return_exceptions=True,
+        )
+        await pool.aclose()
+        return results
+
+    results = asyncio.run(run())
+
+    assert len(server.requests) == 1
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+
+def test_pools_are_shared_per_provider_endpoint_and_settings():
+    reset_vision_http_pools()
+    try:
+        first = get_vision_http_pool("openrouter:https://openrouter.ai/api/v1", timeout_seconds=20.0)
+        again = get_vision_http_pool("openrouter:https://openrouter.ai/api/v1", timeout_seconds=20.0)
+        limited = get_vision_http_pool(
+            "openrouter:https://openrouter.ai/api/v1", timeout_seconds=20.0, max_concurrency=1
+        )
+    finally:
+        reset_vision_http_pools()
+
+    assert first is again
+    assert limited is not first
+    assert limited.max_concurrency == 1
+
+
+def test_request_fingerprint_depends_on_headers_and_payload():
+    base = request_fingerprint("u", {"a": 1, "b": 2}, {"Authorization": "Bearer x"})
+
+    assert base == request_fingerprint("u", {"b": 2, "a": 1}, {"Authorization": "Bearer x"})
+    assert base != request_fingerprint("u", {"a": 1, "b": 3}, {"Authorization": "Bearer x"})
+    assert base != request_fingerprint("u", {"a": 1, "b": 2}, {"Authorization": "Bearer y"})
@@ -0,0 +1,135 @@
+"""Tests for the content-addressed vision result cache."""
+
+from __future__ import annotations
+
+import os
+
+from server.adapters.mcp.vision import (
+    VisionImageInput,
+    VisionRequest,
+    VisionResultCache,
+    VisionResultCacheConfig,
+    VisionRuntimeConfig,
+    VisionTransformersLocalConfig,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _runtime() -> VisionRuntimeConfig:
+    return VisionRuntimeConfig(
+        enabled=True,
+        provider="transformers_local",
+        transformers_local=VisionTransformersLocalConfig(model_id="Qwen/Qwen3-VL-4B-Instruct"),
+    )
+
+
+def _request(tmp_path, content: bytes = b"image", goal: str = "Match the reference.") -> VisionRequest:
+    image_path = tmp_path / "capture.png"
+    image_path.write_bytes(content)
+    return VisionRequest(goal=goal, images=(VisionImageInput(path=str(image_path), role="after", label="front"),))
+
+
+def _key(cache: VisionResultCache, request: VisionRequest, model_name: str = "model-a") -> str | None:
+    return cache.build_key(request, _runtime(), backend_kind="transformers_local", model_name=model_name)
+
+
+def test_key_changes_with_image_bytes_prompt_and_model(tmp_path):
+    cache = VisionResultCache(VisionResultCacheConfig())
+    base = _key(cache, _request(tmp_path))
+
+    assert base is not None
+    assert base == _key(cache, _request(tmp_path))
+    assert base != _key(cache, _request(tmp_path, content=b"other image"))
+    assert base != _key(cache, _request(tmp_path, goal="Another goal."))
+    assert base != _key(cache, _request(tmp_path), model_name="model-b")
+
+
+def test_key_is_none_when_an_image_cannot_be_read(tmp_path):
+    cache = VisionResultCache(VisionResultCacheConfig())
+    request = VisionRequest(
+        goal="Match the reference.",
+        images=(VisionImageInput(path=str(tmp_path / "missing.png"), role="after"),),
+    )
+
+    assert _key(cache, request) is None
+
+
+def test_memory_hits_return_independent_copies():
+    cache = VisionResultCache(VisionResultCacheConfig())
+    cache.put("k", {"visible_changes": ["a"]})
+
+    first = cache.get("k")
+    assert first is not None
+    first["visible_changes"].append("mutated")
+
+    assert cache.get("k") == {"visible_changes": ["a"]}
+    assert cache.get("missing") is None
+    assert cache.get_stats()["hits"] == 2
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_memory_lru_and_ttl_eviction():
+    clock = _Clock()
+    cache = VisionResultCache(VisionResultCacheConfig(max_memory_entries=2, ttl_seconds=60), clock=clock)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    cache.get("a")
+    cache.put("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+
+    clock.now += 61
+    assert cache.get("c") is None
+
+
+def test_disk_entries_survive_new_instances_and_expire(tmp_path):
+    clock = _Clock()
+    config = VisionResultCacheConfig(cache_dir=str(tmp_path / "cache"), ttl_seconds=60)
+    VisionResultCache(config, clock=clock).put("k", {"v": 1})
+
+    restarted = VisionResultCache(config, clock=clock)
+    assert restarted.get("k") == {"v": 1}
+    assert restarted.get_stats()["disk_hits"] == 1
+
+    clock.now += 61
+    assert VisionResultCache(config, clock=clock).get("k") is None
+    assert not (tmp_path / "cache" / "k.json").exists()
+
+
+def test_disk_hits_return_independent_copies(tmp_path):
+    config = VisionResultCacheConfig(cache_dir=str(tmp_path / "cache"))
+    VisionResultCache(config).put("k", {"visible_changes": ["a"]})
+    restarted = VisionResultCache(config)
+
+    first = restarted.get("k")
+    assert first is not None
+    first["cache_status"] = "hit"
+    first["visible_changes"].append("mutated")
+
+    assert restarted.get("k") == {"visible_changes": ["a"]}
+    assert restarted.get_stats()["disk_hits"] == 1
+
+
+def test_disk_cache_evicts_oldest_entries_over_byte_budget(tmp_path):
+    cache_dir = tmp_path / "cache"
+    config = VisionResultCacheConfig(cache_dir=str(cache_dir), max_disk_bytes=250)
+    cache = VisionResultCache(config)
+    for index in range(4):
+        cache.put(f"k{index}", {"text": "x" * 60})
+        path = cache_dir / f"k{index}.json"
+        os.utime(path, (index, index))
+
+    cache.put("k4", {"text": "x" * 60})
+
+    remaining = sorted(path.stem for path in cache_dir.glob("*.json"))
+    assert "k4" in remaining
+    assert "k0" not in remaining
+    assert sum(path.stat().st_size for path in cache_dir.glob("*.json")) <= 250
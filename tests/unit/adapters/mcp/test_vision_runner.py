@@ -220,3 +220,58 @@ def test_runner_normalizes_backend_unavailable_errors(monkeypatch):
 
     assert result.status == "unavailable"
     assert result.capability_source == "local_runtime"
+
+
+def test_runner_serves_repeat_requests_from_result_cache(monkeypatch, tmp_path):
+    image_path = tmp_path / "before.png"
+    image_path.write_bytes(b"png-bytes")
+    request = VisionRequest(
+        goal="Make the housing closer to the reference.",
+        images=(VisionImageInput(path=str(image_path), role="before", label="before"),),
+    )
+    runtime = build_vision_runtime_config(_config())
+    resolver = LazyVisionBackendResolver(runtime)
+    calls: list[VisionRequest] = []
+
+    class _CountingBackend(_SuccessBackend):
+        async def analyze(self, request: VisionRequest) -> dict[str, object]:
+            calls.append(request)
+            return await super().analyze(request)
+
+    monkeypatch.setattr(
+        resolver,
+        "resolve_default",
+        lambda: _CountingBackend("transformers_local", "Qwen/Qwen3-VL-4B-Instruct"),
+    )
+
+    first = asyncio.run(run_vision_assist(_Ctx(), request=request, resolver=resolver))
+    second = asyncio.run(run_vision_assist(_Ctx(), request=request, resolver=resolver))
+    image_path.write_bytes(b"changed-bytes")
+    third = asyncio.run(run_vision_assist(_Ctx(), request=request, resolver=resolver))
+
+    assert len(calls) == 2
+    assert first.result is not None and first.result.cache_status == "miss"
+    assert second.result is not None and second.result.cache_status == "hit"
+    assert second.result.visible_changes == first.result.visible_changes
+    assert third.result is not None and third.result.cache_status == "miss"
+
+
+def test_runner_bypasses_result_cache_when_disabled(monkeypatch, tmp_path):
+    image_path = tmp_path / "before.png"
+    image_path.write_bytes(b"png-bytes")
+    request = VisionRequest(
+        goal="Make the housing closer to the reference.",
+        images=(VisionImageInput(path=str(image_path), role="before", label="before"),),
+    )
+    runtime = build_vision_runtime_config(_config(VISION_RESULT_CACHE_ENABLED=False))
+    resolver = LazyVisionBackendResolver(runtime)
+    monkeypatch.setattr(
+        resolver,
+        "resolve_default",
+        lambda: _SuccessBackend("transformers_local", "Qwen/Qwen3-VL-4B-Instruct"),
+    )
+
+    result = asyncio.run(run_vision_assist(_Ctx(), request=request, resolver=resolver))
+
+    assert resolver.result_cache is None
+    assert result.result is not None and result.result.cache_status == "bypass"
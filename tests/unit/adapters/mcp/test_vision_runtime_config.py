@@ -163,6 +163,23 @@ def test_openrouter_require_parameters_can_be_enabled_explicitly():
     assert runtime.openai_compatible_external.require_parameters is True
 
 
+def test_external_pool_settings_flow_into_runtime_config():
+    config = _base_config(
+        VISION_ENABLED=True,
+        VISION_PROVIDER="openai_compatible_external",
+        VISION_EXTERNAL_PROVIDER="openrouter",
+        VISION_OPENROUTER_MODEL="google/gemma-3-27b-it:free",
+        VISION_EXTERNAL_MAX_CONCURRENCY=2,
+        VISION_EXTERNAL_HTTP2=True,
+    )
+
+    runtime = build_vision_runtime_config(config)
+
+    assert runtime.openai_compatible_external is not None
+    assert runtime.openai_compatible_external.max_concurrency == 2
+    assert runtime.openai_compatible_external.http2 is True
+
+
 def test_explicit_openrouter_provider_supports_generic_model_fallback():
     config = _base_config(
         VISION_ENABLED=True,
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from blender_addon.infrastructure.rpc_server import BlenderRpcServer
+import socket
+import threading
+
+from blender_addon.infrastructure import rpc_server as rpc_module
+from blender_addon.infrastructure.rpc_server import JOB_EVENT, BlenderRpcServer
 from server.adapters.rpc.client import RpcClient
 from server.domain.models.rpc import RpcResponse
 
@@ -135,3 +139,86 @@ def test_rpc_server_can_cancel_a_queued_background_job(monkeypatch):
     assert cancel["status"] == "ok"
     assert cancel["result"]["status"] == "cancelled"
     assert cancel["result"]["cancelled"] is True
+
+
+def test_rpc_server_pushes_job_snapshots_to_subscribers_until_terminal(monkeypatch):
+    """Subscribers should get every progress/status change and be dropped once the job finishes."""
+
+    server = BlenderRpcServer()
+
+    def background_handler(progress_callback=None, is_cancelled=None):
+        progress_callback(1, 2, "halfway")
+        return {"ok": True}
+
+    server.register_background_handler("demo.long", background_handler)
+    monkeypatch.setattr(server, "_schedule_background_job", lambda job_id: None)
+    launch = server._process_request(
+        {"request_id": "req-1", "cmd": "rpc.launch_job", "args": {"cmd": "demo.long", "args": {}}}
+    )
+    job_id = launch["result"]["job_id"]
+    pushed: list[dict] = []
+
+    ack = server._subscribe_background_job(
+        {"request_id": "sub-1", "cmd": "rpc.subscribe_job", "args": {"job_id": job_id}}, pushed.append
+    )
+    server._run_background_job(job_id)
+
+    assert ack["status"] == "ok"
+    assert ack["result"]["status"] == "queued"
+    assert {frame["event"] for frame in pushed} == {JOB_EVENT}
+    assert {frame["subscription_id"] for frame in pushed} == {"sub-1"}
+    assert [frame["result"]["status"] for frame in pushed][-1] == "completed"
+    assert any(frame["result"]["status_message"] == "halfway" for frame in pushed)
+    assert server._job_subscribers == {}
+
+
+def test_rpc_server_subscription_requires_a_streaming_connection():
+    server = BlenderRpcServer()
+
+    response = server._process_request({"request_id": "req-1", "cmd": "rpc.subscribe_job", "args": {"job_id": "x"}})
+
+    assert response["status"] == "error"
+    assert response["error_code"] == "subscription_unavailable"
+
+
+def test_rpc_client_receives_pushed_job_events_over_the_rpc_connection(monkeypatch):
+    """Job events should flow over the multiplexed socket alongside normal responses."""
+
+    monkeypatch.setattr(rpc_module, "bpy", None)
+    server = BlenderRpcServer()
+    server.running = True
+    release = threading.Event()
+
+    def background_handler(progress_callback=None, is_cancelled=None):
+        release.wait(5.0)
+        progress_callback(1, 2, "halfway")
+        return {"ok": True}
+
+    server.register_background_handler("demo.long", background_handler)
+    client_sock, server_sock = socket.socketpair()
+    threading.Thread(target=server._handle_client, args=(server_sock,), daemon=True).start()
+    client = RpcClient("127.0.0.1", 8765)
+    client.socket = client_sock
+    events: list[dict | None] = []
+    finished = threading.Event()
+
+    def on_event(snapshot):
+        events.append(snapshot)
+        if snapshot is not None and snapshot["status"] == "completed":
+            finished.set()
+
+    try:
+        launch = client.launch_background_job("demo.long", {}, timeout_seconds=10.0)
+        job_id = launch.result["job_id"]
+        ack = client.subscribe_background_job(job_id, on_event, timeout_seconds=5.0)
+        release.set()
+
+        assert ack.status == "ok"
+        assert finished.wait(5.0)
+        assert any(event is not None and event["status_message"] == "halfway" for event in events)
+        assert client.collect_background_job_result(job_id, timeout_seconds=5.0).result["result"] == {"ok": True}
+    finally:
+        server.running = False
+        client.close()
+
+    assert events[-1] is None  # closing the connection ends the stream
@@ -0,0 +1,151 @@
+"""Tests for binary RPC response frames (addon encoder, server zero-copy decoder)."""
+
+from __future__ import annotations
+
+import json
+import queue
+import socket
+import threading
+
+import blender_addon.infrastructure.rpc_server as rpc_module
+import numpy as np
+import pytest
+from blender_addon.infrastructure.binary_frames import encode_frame, encode_json, encode_response
+from blender_addon.infrastructure.rpc_server import BlenderRpcServer
+from server.adapters.rpc.binary_frames import decode_frame, is_binary_frame, to_json_compatible
+from server.adapters.rpc.client import RpcClient, recv_msg, send_msg
+
+
+def _columns_payload():
+    return {
+        "request_id": "req-1",
+        "status": "ok",
+        "result": {
+            "object_name": "Cube",
+            "layout": "columns",
+            "strides": {"position": 3},
+            "columns": {
+                "index": np.arange(3, dtype=np.int32),
+                "position": np.array([0.1, 0.2, 0.3, 1, 2, 3, -1, -2, -3], dtype=np.float32),
+                "selected": np.array([True, False, True]),
+            },
+        },
+    }
+
+
+def test_binary_frame_round_trip_returns_views_over_the_frame():
+    frame = bytearray(encode_frame(_columns_payload()))
+
+    assert is_binary_frame(frame)
+    decoded = decode_frame(frame)
+    columns = decoded["result"]["columns"]
+
+    assert decoded["request_id"] == "req-1"
+    assert decoded["result"]["strides"] == {"position": 3}
+    assert columns["index"].dtype == np.int32
+    assert columns["index"].tolist() == [0, 1, 2]
+    assert columns["position"].dtype == np.float32
+    assert columns["selected"].tolist() == [True, False, True]
+    assert np.shares_memory(columns["position"], np.frombuffer(frame, dtype=np.uint8))
+
+
+def test_binary_frame_is_smaller_than_json_for_large_float_columns():
+    positions = np.random.default_rng(7).random(30000, dtype=np.float32)
+    payload = {"request_id": "req-1", "status": "ok", "result": {"columns": {"position": positions}}}
+
+    assert len(encode_frame(payload)) * 2 < len(encode_json(payload))
+
+
+def test_encode_response_falls_back_to_rounded_json():
+    payload = _columns_payload()
+
+    assert not is_binary_frame(encode_response(payload, accept_encoding=None))
+    assert not is_binary_frame(encode_response({"status": "ok", "result": [1, 2]}, accept_encoding="binary"))
+    decoded = json.loads(encode_response(payload, accept_encoding=None))
+    assert decoded["result"]["columns"]["position"][:3] == [0.1, 0.2, 0.3]
+    assert is_binary_frame(encode_response(payload, accept_encoding="binary"))
+
+
+def test_decode_frame_rejects_truncated_buffers():
+    frame = encode_frame(_columns_payload())
+
+    with pytest.raises(ValueError, match="truncated"):
+        decode_frame(frame[:-16])
+
+
+def test_to_json_compatible_rounds_decoded_float_arrays():
+    decoded = decode_frame(encode_frame(_columns_payload()))
+
+    result = to_json_compatible(decoded["result"])
+
+    assert result["columns"]["position"][:3] == [0.1, 0.2, 0.3]
+    assert result["columns"]["selected"] == [True, False, True]
+    json.dumps(result)
+
+
+def test_rpc_client_binary_request_decodes_binary_frames():
+    client_sock, server_sock = socket.socketpair()
+    client = RpcClient("127.0.0.1", 8765)
+    client.socket = client_sock
+
+    def serve():
+        request = json.loads(recv_msg(server_sock).decode("utf-8"))
+        assert request["accept_encoding"] == "binary"
+        payload = _columns_payload()
+        payload["request_id"] = request["request_id"]
+        send_msg(server_sock, encode_response(payload, request["accept_encoding"]))
+
+    server = threading.Thread(target=serve, daemon=True)
+    server.start()
+
+    response = client.send_binary_request("mesh.get_vertex_data", {"object_name": "Cube", "layout": "columns"})
+
+    server.join(timeout=5.0)
+    assert response.status == "ok"
+    assert isinstance(response.result["columns"]["position"], np.ndarray)
+    assert response.result["columns"]["position"].shape == (9,)
+    client.close()
+    server_sock.close()
+
+
+def test_handle_client_encodes_binary_frames_only_when_accepted(monkeypatch):
+    server = BlenderRpcServer()
+    server.running = True
+    monkeypatch.setattr(rpc_module, "bpy", None)
+    server.register_handler("demo.columns", lambda: {"columns": {"value": np.ones(4, dtype=np.float32)}})
+
+    sent_frames = []
+    incoming = queue.Queue()
+    incoming.put(json.dumps({"request_id": "req-json", "cmd": "demo.columns", "args": {}}).encode("utf-8"))
+    incoming.put(
+        json.dumps({"request_id": "req-binary", "cmd": "demo.columns", "args": {}, "accept_encoding": "binary"}).encode(
+            "utf-8"
+        )
+    )
+
+    def fake_send_msg(conn, data):
+        sent_frames.append(bytes(data))
+        if len(sent_frames) == 2:
+            incoming.put(None)
+
+    monkeypatch.setattr(rpc_module, "recv_msg", lambda conn: incoming.get(timeout=5.0))
+    monkeypatch.setattr(rpc_module, "send_msg", fake_send_msg)
+
+    class DummyConn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    server._handle_client(DummyConn())
+
+    by_id = {}
+    for frame in sent_frames:
+        payload = decode_frame(frame) if is_binary_frame(frame) else json.loads(frame.decode("utf-8"))
+        by_id[payload["request_id"]] = (is_binary_frame(frame), payload)
+
+    assert by_id["req-json"][0] is False
+    assert by_id["req-json"][1]["result"]["columns"]["value"] == [1.0, 1.0, 1.0, 1.0]
+    assert by_id["req-binary"][0] is True
+    assert by_id["req-binary"][1]["result"]["columns"]["value"].tolist() == [1.0, 1.0, 1.0, 1.0]
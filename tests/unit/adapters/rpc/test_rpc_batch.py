@@ -0,0 +1,173 @@
+"""Tests for the `rpc.batch` command and client-side batch APIs."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import blender_addon.infrastructure.rpc_server as rpc_module
+import pytest
+from blender_addon.infrastructure.rpc_server import BlenderRpcServer
+from server.adapters.rpc.client import BATCH_ITEM_TIMEOUT_SECONDS, RpcClient
+from server.domain.interfaces.rpc import IRpcClient
+from server.domain.models.rpc import RpcResponse, split_batch_response
+
+
+def _fake_bpy(registered: list):
+    def register(fn, first_interval=0.0):
+        registered.append(fn)
+        fn()
+
+    return SimpleNamespace(
+        app=SimpleNamespace(timers=SimpleNamespace(register=register)),
+        ops=SimpleNamespace(ed=SimpleNamespace(undo_push=MagicMock())),
+    )
+
+
+def _batch_request(commands, **extra):
+    return {
+        "request_id": "batch-1",
+        "cmd": "rpc.batch",
+        "args": {"commands": commands, **extra},
+        "timeout_seconds": 5.0,
+    }
+
+
+def test_rpc_batch_runs_all_items_in_one_main_thread_callback_with_single_undo(monkeypatch):
+    registered: list = []
+    fake_bpy = _fake_bpy(registered)
+    monkeypatch.setattr(rpc_module, "bpy", fake_bpy)
+    server = BlenderRpcServer()
+    server.register_handler("modeling.create_primitive", lambda primitive_type: f"created {primitive_type}")
+    server.register_handler("scene.list_objects", lambda: ["Cube"])
+
+    response = server._process_request(
+        _batch_request(
+            [
+                {"cmd": "modeling.create_primitive", "args": {"primitive_type": "CUBE"}},
+                {"cmd": "scene.list_objects"},
+            ],
+            undo_message="MCP: workflow demo",
+        )
+    )
+
+    assert response["status"] == "ok"
+    assert len(registered) == 1
+    assert [item["status"] for item in response["result"]["results"]] == ["ok", "ok"]
+    assert response["result"]["results"][0]["result"] == "created CUBE"
+    assert response["result"]["executed"] == 2
+    fake_bpy.ops.ed.undo_push.assert_called_once_with(message="MCP: workflow demo")
+
+
+def test_rpc_batch_reports_item_errors_and_honors_stop_on_error(monkeypatch):
+    monkeypatch.setattr(rpc_module, "bpy", None)
+    server = BlenderRpcServer()
+    server.register_handler("scene.list_objects", lambda: [])
+
+    def failing(**kwargs):
+        raise ValueError("boom")
+
+    server.register_handler("modeling.transform_object", failing)
+    commands = [
+        {"cmd": "scene.list_objects"},
+        {"cmd": "modeling.transform_object", "args": {"name": "Cube"}},
+        {"cmd": "scene.list_objects"},
+    ]
+
+    keep_going = server._process_request(_batch_request(commands))
+    assert [item["status"] for item in keep_going["result"]["results"]] == ["ok", "error", "ok"]
+    assert keep_going["result"]["results"][1]["error"] == "boom"
+    assert keep_going["result"]["stopped_early"] is False
+
+    stopped = server._process_request(_batch_request(commands, stop_on_error=True))
+    assert [item["status"] for item in stopped["result"]["results"]] == ["ok", "error", "skipped"]
+    assert stopped["result"]["skipped"] == 1
+    assert stopped["result"]["stopped_early"] is True
+
+
+def test_rpc_batch_read_only_items_do_not_push_undo(monkeypatch):
+    registered: list = []
+    fake_bpy = _fake_bpy(registered)
+    monkeypatch.setattr(rpc_module, "bpy", fake_bpy)
+    server = BlenderRpcServer()
+    server.register_handler("scene.list_objects", lambda: [])
+
+    server._process_request(_batch_request([{"cmd": "scene.list_objects"}]))
+
+    fake_bpy.ops.ed.undo_push.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "commands",
+    [[], [{"args": {}}], [{"cmd": "rpc.get_job"}], [{"cmd": "rpc.batch"}], [{"cmd": "scene.x", "args": [1]}]],
+)
+def test_rpc_batch_rejects_invalid_payloads(monkeypatch, commands):
+    monkeypatch.setattr(rpc_module, "bpy", None)
+    server = BlenderRpcServer()
+
+    response = server._process_request(_batch_request(commands))
+
+    assert response["status"] == "error"
+    assert response["error_code"] == "invalid_batch"
+
+
+def test_rpc_client_send_batch_uses_single_rpc_batch_request(monkeypatch):
+    client = RpcClient("127.0.0.1", 8765, rpc_timeout_seconds=5.0)
+    calls = []
+
+    def fake_send(request, client_timeout):
+        calls.append((request.cmd, request.args, request.timeout_seconds, client_timeout))
+        return RpcResponse(request_id="req", status="ok", result={"results": []})
+
+    monkeypatch.setattr(client, "_send", fake_send)
+
+    client.send_batch([{"cmd": "scene.get_mode"}], stop_on_error=True, timeout_seconds=9.0)
+
+    assert calls == [
+        (
+            "rpc.batch",
+            {"commands": [{"cmd": "scene.get_mode", "args": {}}], "stop_on_error": True, "undo_message": None},
+            9.0,
+            9.0,
+        )
+    ]
+
+
+def test_rpc_client_send_batch_scales_default_timeout_with_item_count(monkeypatch):
+    client = RpcClient("127.0.0.1", 8765, rpc_timeout_seconds=30.0, addon_execution_timeout_seconds=30.0)
+    calls = []
+
+    def fake_send(request, client_timeout):
+        calls.append((request.timeout_seconds, client_timeout))
+        return RpcResponse(request_id="req", status="ok", result={"results": []})
+
+    monkeypatch.setattr(client, "_send", fake_send)
+
+    client.send_batch([{"cmd": "modeling.create_primitive"}] * 40)
+
+    expected = 30.0 + BATCH_ITEM_TIMEOUT_SECONDS * 40
+    assert calls == [(expected, expected)]
+
+
+def test_default_send_batch_falls_back_to_sequential_requests():
+    class SequentialRpc(IRpcClient):
+        def __init__(self):
+            self.cmds = []
+
+        def send_request(self, cmd, args=None, timeout_seconds=None, *, rpc_timeout_seconds=None):
+            self.cmds.append(cmd)
+            if cmd == "bad.cmd":
+                return RpcResponse(request_id="r", status="error", error="nope")
+            return RpcResponse(request_id="r", status="ok", result=cmd)
+
+    rpc = SequentialRpc()
+    response = rpc.send_batch(
+        [{"cmd": "a.cmd"}, {"cmd": "bad.cmd"}, {"cmd": "c.cmd"}],
+        stop_on_error=True,
+    )
+    items = split_batch_response(response)
+
+    assert rpc.cmds == ["a.cmd", "bad.cmd"]
+    assert [item.status for item in items] == ["ok", "error", "error"]
+    assert items[0].result == "a.cmd"
+    assert items[2].error_code == "batch_item_skipped"
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import builtins
+import json
 import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from server.adapters.rpc.client import RpcClient
+from server.adapters.rpc.client import RpcClient, recv_msg, send_msg
 
 
 class _FailingSocket:
@@ -68,3 +72,81 @@ def test_rpc_client_disconnect_does_not_print_to_stdout(monkeypatch, caplog):
     assert response.error_boundary == "rpc_client"
     assert response.error_code == "connection_error"
     assert "Connection lost while talking to Blender RPC" in caplog.text
+
+
+def _serve_out_of_order(server_sock: socket.socket, expected: int) -> None:
+    """Read ``expected`` requests, then answer them in reverse order."""
+
+    requests = []
+    for _ in range(expected):
+        requests.append(json.loads(recv_msg(server_sock).decode("utf-8")))
+    for request in reversed(requests):
+        payload = {"request_id": request["request_id"], "status": "ok", "result": {"cmd": request["cmd"]}}
+        send_msg(server_sock, json.dumps(payload).encode("utf-8"))
+
+
+def test_rpc_client_multiplexes_concurrent_requests_answered_out_of_order():
+    client_sock, server_sock = socket.socketpair()
+    client = RpcClient("127.0.0.1", 8765)
+    client.socket = client_sock
+
+    server = threading.Thread(target=_serve_out_of_order, args=(server_sock, 3), daemon=True)
+    server.start()
+
+    cmds = ["scene.list_objects", "scene.get_mode", "scene.inspect_object"]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        responses = list(pool.map(client.send_request, cmds))
+
+    server.join(timeout=5.0)
+    assert [response.status for response in responses] == ["ok", "ok", "ok"]
+    assert [response.result["cmd"] for response in responses] == cmds
+    assert client.in_flight_count == 0
+    client.close()
+    server_sock.close()
+
+
+def test_rpc_client_async_api_shares_the_multiplexed_connection():
+    client_sock, server_sock = socket.socketpair()
+    client = RpcClient("127.0.0.1", 8765)
+    client.socket = client_sock
+
+    server = threading.Thread(target=_serve_out_of_order, args=(server_sock, 2), daemon=True)
+    server.start()
+
+    async def run():
+        return await asyncio.gather(
+            client.send_request_async("scene.get_mode"),
+            client.send_request_async("scene.list_selection"),
+        )
+
+    first, second = asyncio.run(run())
+
+    server.join(timeout=5.0)
+    assert first.result == {"cmd": "scene.get_mode"}
+    assert second.result == {"cmd": "scene.list_selection"}
+    client.close()
+    server_sock.close()
+
+
+def test_rpc_client_timeout_keeps_connection_and_drops_late_response():
+    client_sock, server_sock = socket.socketpair()
+    client = RpcClient("127.0.0.1", 8765, rpc_timeout_seconds=0.2, addon_execution_timeout_seconds=0.2)
+    client.socket = client_sock
+
+    timed_out = client.send_request("scene.get_viewport")
+    assert timed_out.error_code == "timeout"
+    assert client.in_flight_count == 0
+
+    late = json.loads(recv_msg(server_sock).decode("utf-8"))
+    send_msg(server_sock, json.dumps({"request_id": late["request_id"], "status": "ok"}).encode("utf-8"))
+
+    server = threading.Thread(target=_serve_out_of_order, args=(server_sock, 1), daemon=True)
+    server.start()
+    follow_up = client.send_request("scene.get_mode")
+
+    server.join(timeout=5.0)
+    assert follow_up.status == "ok"
+    assert follow_up.result == {"cmd": "scene.get_mode"}
+    assert client.socket is client_sock
+    client.close()
+    server_sock.close()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import queue
+import threading
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -14,6 +16,7 @@ def test_should_push_undo_and_safe_undo_push(monkeypatch):
 
     assert rpc_module._should_push_undo("mesh.extrude_region") is True
     assert rpc_module._should_push_undo("scene.list_objects") is False
+    assert rpc_module._should_push_undo("scene.capture_view_set") is False
 
     rpc_module._safe_undo_push("test")
     fake_bpy.ops.ed.undo_push.assert_called_once_with(message="test")
@@ -94,6 +97,22 @@ def test_rpc_server_watchdog_restart_preserves_background_jobs(monkeypatch):
     assert "job-1" in server.background_jobs
 
 
+def test_rpc_server_stop_shuts_down_request_workers():
+    server = BlenderRpcServer()
+    release = threading.Event()
+    executor = server._get_request_executor()
+    for _ in range(server.max_inflight_requests):
+        executor.submit(release.wait, 5.0)
+    queued = executor.submit(lambda: None)
+
+    server.stop()
+    release.set()
+
+    assert server._request_executor is None
+    assert queued.cancelled()
+    assert server._get_request_executor() is not executor
+
+
 def test_rpc_server_watchdog_register_and_stop(monkeypatch):
     registered = []
     unregistered = []
@@ -205,3 +224,41 @@ def test_handle_client_invalid_json(monkeypatch):
 
     assert sent_payloads[0]["status"] == "error"
     assert sent_payloads[0]["error"] == "Invalid JSON"
+
+
+def test_handle_client_answers_requests_out_of_order(monkeypatch):
+    server = BlenderRpcServer()
+    server.running = True
+    monkeypatch.setattr(rpc_module, "bpy", None)
+
+    release_slow = threading.Event()
+    server.register_handler("demo.slow", lambda: release_slow.wait(5.0) and "slow")
+    server.register_handler("demo.fast", lambda: "fast")
+
+    sent_payloads = []
+    incoming = queue.Queue()
+    for request_id, cmd in (("req-slow", "demo.slow"), ("req-fast", "demo.fast")):
+        incoming.put(json.dumps({"request_id": request_id, "cmd": cmd, "args": {}}).encode("utf-8"))
+
+    def fake_send_msg(conn, data):
+        payload = json.loads(data.decode("utf-8"))
+        sent_payloads.append(payload)
+        if payload["request_id"] == "req-fast":
+            release_slow.set()
+        if len(sent_payloads) == 2:
+            incoming.put(None)
+
+    monkeypatch.setattr(rpc_module, "recv_msg", lambda conn: incoming.get(timeout=5.0))
+    monkeypatch.setattr(rpc_module, "send_msg", fake_send_msg)
+
+    class DummyConn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    server._handle_client(DummyConn())
+
+    assert [payload["request_id"] for payload in sent_payloads] == ["req-fast", "req-slow"]
+    assert [payload["result"] for payload in sent_payloads] == ["fast", "slow"]
@@ -23,14 +23,24 @@ def test_rpc_client_sends_timeout_budget_and_deadline(monkeypatch):
     )
     client.socket = MagicMock()
 
+    replies: queue.Queue[bytes] = queue.Queue()
+
     def fake_send_msg(sock, msg):
         captured["payload"] = json.loads(msg.decode("utf-8"))
+        replies.put(
+            json.dumps(
+                {"request_id": captured["payload"]["request_id"], "status": "ok", "result": {"ok": True}}
+            ).encode("utf-8")
+        )
+
+    def fake_recv_msg(sock):
+        try:
+            return replies.get(timeout=5.0)
+        except queue.Empty:
+            return None
 
     monkeypatch.setattr("server.adapters.rpc.client.send_msg", fake_send_msg)
-    monkeypatch.setattr(
-        "server.adapters.rpc.client.recv_msg",
-        lambda sock: json.dumps({"request_id": "abc", "status": "ok", "result": {"ok": True}}).encode("utf-8"),
-    )
+    monkeypatch.setattr("server.adapters.rpc.client.recv_msg", fake_recv_msg)
 
     response = client.send_request("scene.list_objects")
 
@@ -16,6 +16,10 @@ def test_register_wires_handlers_and_starts_rpc(monkeypatch):
 
     monkeypatch.setattr(blender_addon, "bpy", fake_bpy)
     monkeypatch.setattr(blender_addon, "rpc_server", rpc_server)
+    register_mesh_cache_handlers = MagicMock()
+    monkeypatch.setattr(blender_addon, "register_mesh_cache_handlers", register_mesh_cache_handlers)
+    register_scene_revision_handlers = MagicMock()
+    monkeypatch.setattr(blender_addon, "register_scene_revision_handlers", register_scene_revision_handlers)
 
     for handler_name in [
         "SceneHandler",
@@ -39,8 +43,13 @@ def test_register_wires_handlers_and_starts_rpc(monkeypatch):
 
     rpc_server.register_handler.assert_any_call("scene.list_objects", ANY)
     rpc_server.register_background_handler.assert_any_call("scene.get_viewport", ANY)
+    rpc_server.register_background_handler.assert_any_call("scene.capture_view_set", ANY)
     rpc_server.register_background_handler.assert_any_call("export.glb", ANY)
     rpc_server.register_background_handler.assert_any_call("extraction.render_angles", ANY)
+    rpc_server.register_handler.assert_any_call("scene.get_mesh_cache_stats", ANY)
+    register_mesh_cache_handlers.assert_called_once_with()
+    rpc_server.register_handler.assert_any_call("scene.router_context", ANY)
+    register_scene_revision_handlers.assert_called_once_with()
     rpc_server.start.assert_called_once()
 
 
@@ -48,12 +57,18 @@ def test_unregister_stops_rpc_server(monkeypatch):
     import blender_addon
 
     rpc_server = MagicMock()
+    unregister_mesh_cache_handlers = MagicMock()
     monkeypatch.setattr(blender_addon, "bpy", MagicMock())
     monkeypatch.setattr(blender_addon, "rpc_server", rpc_server)
+    monkeypatch.setattr(blender_addon, "unregister_mesh_cache_handlers", unregister_mesh_cache_handlers)
+    unregister_scene_revision_handlers = MagicMock()
+    monkeypatch.setattr(blender_addon, "unregister_scene_revision_handlers", unregister_scene_revision_handlers)
 
     blender_addon.unregister()
 
     rpc_server.stop.assert_called_once()
+    unregister_mesh_cache_handlers.assert_called_once_with()
+    unregister_scene_revision_handlers.assert_called_once_with()
 
 
 def test_register_in_mock_mode_does_not_start_rpc(monkeypatch, capsys):
@@ -0,0 +1,71 @@
+"""Tests for shared-filesystem capture handoff helpers."""
+
+from __future__ import annotations
+
+import hashlib
+
+from server.infrastructure.file_handoff import (
+    capture_handoff_mode,
+    file_handoff_enabled,
+    file_sha256,
+    mapped_file,
+    record_handoff_failure,
+    reset_handoff_state,
+    verify_handoff_file,
+)
+
+
+def test_capture_handoff_mode_defaults_to_auto(monkeypatch):
+    monkeypatch.delenv("BLENDER_AI_CAPTURE_HANDOFF", raising=False)
+    assert capture_handoff_mode() == "auto"
+
+    monkeypatch.setenv("BLENDER_AI_CAPTURE_HANDOFF", " INLINE ")
+    assert capture_handoff_mode() == "inline"
+
+    monkeypatch.setenv("BLENDER_AI_CAPTURE_HANDOFF", "bogus")
+    assert capture_handoff_mode() == "auto"
+
+
+def test_mapped_file_handles_empty_and_regular_files(tmp_path):
+    empty = tmp_path / "empty.jpg"
+    empty.write_bytes(b"")
+    regular = tmp_path / "regular.jpg"
+    regular.write_bytes(b"jpeg-bytes")
+
+    with mapped_file(empty) as data:
+        assert bytes(data) == b""
+    with mapped_file(regular) as data:
+        assert bytes(data) == b"jpeg-bytes"
+    assert file_sha256(regular) == hashlib.sha256(b"jpeg-bytes").hexdigest()
+
+
+def test_verify_handoff_file_checks_size_and_checksum(tmp_path):
+    path = tmp_path / "capture.jpg"
+    path.write_bytes(b"jpeg-bytes")
+    digest = hashlib.sha256(b"jpeg-bytes").hexdigest()
+
+    assert verify_handoff_file(path, size=10, sha256=digest.upper()) is True
+    assert verify_handoff_file(path, size=9, sha256=digest) is False
+    assert verify_handoff_file(path, size=10, sha256="0" * 64) is False
+    assert verify_handoff_file(path, size=None, sha256=digest) is False
+    assert verify_handoff_file(tmp_path / "missing.jpg", size=10, sha256=digest) is False
+
+
+def test_recorded_handoff_failure_disables_auto_handoff_and_removes_local_file(tmp_path, monkeypatch, caplog):
+    monkeypatch.delenv("BLENDER_AI_CAPTURE_HANDOFF", raising=False)
+    reset_handoff_state()
+    stale = tmp_path / "capture.jpg"
+    stale.write_bytes(b"partial")
+
+    assert file_handoff_enabled() is True
+    try:
+        record_handoff_failure(["/addon/tmp/blender-ai-mcp/capture.jpg"], [stale, tmp_path / "missing.jpg"])
+
+        assert file_handoff_enabled() is False
+        assert not stale.exists()
+        assert "/addon/tmp/blender-ai-mcp/capture.jpg" in caplog.text
+    finally:
+        reset_handoff_state()
+
+    monkeypatch.setenv("BLENDER_AI_CAPTURE_HANDOFF", "inline")
+    assert file_handoff_enabled() is False
@@ -0,0 +1,149 @@
+"""Tests for the background router warm-up pipeline."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+import server.adapters.mcp.router_helper as router_helper
+import server.infrastructure.di as di
+import server.infrastructure.router_warmup as router_warmup
+from server.infrastructure.router_warmup import RouterWarmup, WarmupStage
+
+
+@pytest.fixture(autouse=True)
+def _reset_warmup():
+    router_warmup.reset_router_warmup()
+    yield
+    router_warmup.reset_router_warmup()
+
+
+def test_independent_stages_run_concurrently_and_report_timing():
+    barrier = threading.Barrier(2, timeout=5)
+    order: list[str] = []
+
+    def meet(name):
+        def _stage():
+            barrier.wait()  # raises BrokenBarrierError unless both run at once
+            order.append(name)
+
+        return _stage
+
+    warmup = RouterWarmup(
+        [
+            WarmupStage("model", meet("model")),
+            WarmupStage("store", meet("store")),
+            WarmupStage("router", lambda: order.append("router"), after=("model", "store")),
+        ]
+    )
+    warmup.start()
+
+    assert warmup.wait("router", timeout=5) is True
+    assert order[-1] == "router"
+    status = warmup.status()
+    assert status["started"] is True and status["completed"] is True and status["ready"] is True
+    assert status["stages"]["router"]["after"] == ["model", "store"]
+    assert all(stage["status"] == "ready" for stage in status["stages"].values())
+    assert all(stage["duration_ms"] >= 0 for stage in status["stages"].values())
+    assert status["elapsed_ms"] >= 0
+
+
+def test_failed_stage_is_reported_and_dependents_still_run():
+    def broken():
+        raise RuntimeError("no model")
+
+    warmup = RouterWarmup(
+        [
+            WarmupStage("model", broken),
+            WarmupStage("router", lambda: None, after=("model",)),
+        ]
+    )
+    warmup.start()
+
+    assert warmup.wait("router", timeout=5) is True
+    assert warmup.wait("model", timeout=5) is False
+    status = warmup.status()
+    assert status["ready"] is False and status["completed"] is True
+    assert status["stages"]["model"] == {
+        "status": "failed",
+        "duration_ms": status["stages"]["model"]["duration_ms"],
+        "error": "RuntimeError: no model",
+    }
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError, match="unknown stage"):
+        RouterWarmup([WarmupStage("router", lambda: None, after=("model",))])
+
+
+def test_start_router_warmup_is_idempotent():
+    calls: list[int] = []
+    first = router_warmup.start_router_warmup([WarmupStage("only", lambda: calls.append(1))])
+    second = router_warmup.start_router_warmup([WarmupStage("only", lambda: calls.append(2))])
+
+    assert first is second
+    assert first.wait("only", timeout=5)
+    assert calls == [1]
+    assert router_warmup.get_router_warmup() is first
+
+
+def test_router_status_reports_warmup_without_blocking(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(router_helper, "is_router_enabled", lambda: True)
+
+    def fail_get_router():
+        raise AssertionError("get_router must not be called while the router stage is pending")
+
+    monkeypatch.setattr(router_helper, "get_router", fail_get_router)
+    warmup = router_warmup.start_router_warmup([WarmupStage("router", lambda: release.wait(5))])
+
+    pending = router_helper.get_router_status()
+
+    assert pending["initialized"] is False
+    assert pending["warmup"]["stages"]["router"]["status"] in {"pending", "running"}
+
+    release.set()
+    assert warmup.wait("router", timeout=5)
+    router = SimpleNamespace(
+        is_ready=lambda: True,
+        get_component_status=lambda: {"classifier": True},
+        get_stats=lambda: {},
+        get_config=lambda: "cfg",
+        get_assistant_diagnostics=lambda: {},
+    )
+    monkeypatch.setattr(router_helper, "get_router", lambda: router)
+
+    ready = router_helper.get_router_status()
+
+    assert ready["initialized"] is True
+    assert ready["warmup"]["ready"] is True
+
+
+def test_concurrent_tool_metadata_callers_share_one_load(monkeypatch):
+    loads: list[int] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    class SlowLoader:
+        def load_all(self):
+            loads.append(1)
+            started.set()
+            release.wait(5)
+            return {"mesh_bevel": SimpleNamespace(to_dict=lambda: {"name": "mesh_bevel"})}
+
+    monkeypatch.setattr("server.router.infrastructure.metadata_loader.MetadataLoader", SlowLoader)
+    monkeypatch.setattr(di, "_tool_metadata_instance", None)
+    results: list[dict] = []
+
+    warm = threading.Thread(target=lambda: results.append(di.get_tool_metadata()))
+    warm.start()
+    assert started.wait(5)
+    early = threading.Thread(target=lambda: results.append(di.get_tool_metadata()))
+    early.start()
+    release.set()
+    warm.join(5)
+    early.join(5)
+
+    assert loads == [1]
+    assert results[0] is results[1] == {"mesh_bevel": {"name": "mesh_bevel"}}
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from typing import Any
 
+import pytest
 import server.infrastructure.di as di
 from server.adapters.mcp.vision import LazyVisionBackendResolver
-from server.infrastructure.config import Config
+from server.infrastructure.config import Config, get_config
 
 
 def _config(**overrides) -> Config:
@@ -58,3 +59,10 @@ def test_di_provides_lazy_vision_runtime_without_loading_model(monkeypatch):
     assert runtime.active_model_name == "Qwen/Qwen3-VL-4B-Instruct"
     assert isinstance(resolver, LazyVisionBackendResolver)
     assert resolver.runtime_config is runtime
+
+
+@pytest.mark.parametrize(("value", "expected"), [("true", True), ("1", True), ("off", False), ("false", False)])
+def test_vision_result_cache_flag_parses_like_other_booleans(monkeypatch, value, expected):
+    monkeypatch.setenv("VISION_RESULT_CACHE_ENABLED", value)
+
+    assert get_config().VISION_RESULT_CACHE_ENABLED is expected
@@ -6,6 +6,7 @@ TASK-041-10
 
 import pytest
 from server.router.application.evaluator.condition_evaluator import ConditionEvaluator
+from server.router.application.workflows.base import WorkflowStep
 
 
 class TestConditionEvaluatorInit:
@@ -385,3 +386,31 @@ class TestRealWorldConditions:
         # Step 4: Another selection check (should NOT run - already selected)
         step4_should_run = evaluator.evaluate("not has_selection")
         assert step4_should_run is False
+
+
+class TestConditionEvaluatorBatch:
+    """Test batch evaluation of an expanded step list."""
+
+    def test_evaluate_steps_matches_sequential_simulation(self):
+        evaluator = ConditionEvaluator()
+        evaluator.set_context({"current_mode": "OBJECT", "has_selection": False})
+        steps = [
+            WorkflowStep(tool="system_set_mode", params={"mode": "EDIT"}, condition="current_mode != 'EDIT'"),
+            WorkflowStep(tool="mesh_select", params={"action": "all"}, condition="not has_selection"),
+            WorkflowStep(tool="system_set_mode", params={"mode": "EDIT"}, condition="current_mode != 'EDIT'"),
+            WorkflowStep(tool="mesh_select", params={"action": "all"}, condition="not has_selection"),
+            WorkflowStep(tool="mesh_extrude_region", params={}),
+        ]
+
+        assert evaluator.evaluate_steps(steps) == [True, True, False, False, True]
+        # Context is restored after the batch
+        assert evaluator.get_context() == {"current_mode": "OBJECT", "has_selection": False}
+
+    def test_evaluate_steps_fails_open_on_invalid_condition(self):
+        evaluator = ConditionEvaluator()
+        steps = [
+            WorkflowStep(tool="mesh_select", params={"action": "none"}, condition="unknown_var > 1"),
+            WorkflowStep(tool="mesh_select", params={"action": "all"}, condition="has_selection"),
+        ]
+
+        assert evaluator.evaluate_steps(steps) == [True, False]
@@ -4,6 +4,7 @@ Tests for UnifiedEvaluator.
 TASK-060: Tests for AST-based unified evaluator.
 """
 
+import ast
 import math
 
 import pytest
@@ -637,3 +638,62 @@ class TestEvaluateAsFloat:
         # Actually, just referencing a string variable should raise
         with pytest.raises(ValueError):
             evaluator.evaluate_as_float("name")
+
+
+class TestUnifiedEvaluatorCompiledCache:
+    """Test compiled-expression caching and batch evaluation."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        UnifiedEvaluator.clear_compiled_cache()
+        yield
+        UnifiedEvaluator.clear_compiled_cache()
+
+    def test_expression_is_parsed_once_across_contexts_and_instances(self, monkeypatch):
+        calls = []
+        original_parse = ast.parse
+        monkeypatch.setattr(
+            ast, "parse", lambda *args, **kwargs: calls.append(args[0]) or original_parse(*args, **kwargs)
+        )
+
+        first = UnifiedEvaluator()
+        second = UnifiedEvaluator()
+        results = []
+        for i in range(5):
+            first.set_context({"i": i})
+            results.append(first.evaluate("  i * 2 + 1 "))
+        second.set_context({"i": 10})
+        results.append(second.evaluate("i * 2 + 1"))
+
+        assert results == [1.0, 3.0, 5.0, 7.0, 9.0, 21.0]
+        assert calls == ["i * 2 + 1"]
+        assert UnifiedEvaluator.compiled_cache_info().hits == 5
+
+    def test_unknown_variable_is_resolved_per_evaluation(self):
+        evaluator = UnifiedEvaluator()
+        with pytest.raises(ValueError, match="Unknown variable: width"):
+            evaluator.evaluate("width > 1")
+
+        evaluator.set_context({"width": 2})
+        assert evaluator.evaluate("width > 1") == 1.0
+
+    def test_cached_errors_are_raised_on_every_call(self):
+        evaluator = UnifiedEvaluator()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid expression syntax"):
+                evaluator.evaluate("1 +")
+            with pytest.raises(ValueError, match="Function not allowed: eval"):
+                evaluator.evaluate("eval('1')")
+
+    def test_disallowed_branch_is_skipped_by_short_circuit(self):
+        evaluator = UnifiedEvaluator()
+        assert evaluator.evaluate("false and __import__('os')") == 0.0
+        assert evaluator.evaluate("1 if true else x.y") == 1.0
+        with pytest.raises(ValueError, match="Unsupported AST node: Attribute"):
+            evaluator.evaluate("0 if false else x.y")
+
+    def test_evaluate_many(self):
+        evaluator = UnifiedEvaluator()
+        evaluator.set_context({"width": 2.0, "mode": "EDIT"})
+
+        assert evaluator.evaluate_many(["width * 2", "mode == 'EDIT'", "mode"]) == [4.0, 1.0, "EDIT"]
@@ -345,6 +345,8 @@ class TestFeedbackCollector:
             confidence=0.85,
             match_type="semantic",
         )
+        # Writes are group-committed in the background
+        collector1.flush()
 
         # Create new collector from same file
         collector2 = FeedbackCollector(storage_path=storage_path, auto_save=True)
@@ -406,3 +408,111 @@ class TestFeedbackCollector:
         assert "current_entries" in info
         assert "auto_save" in info
         assert "statistics" in info
+
+
+class TestFeedbackCollectorPersistence:
+    """Tests for the append-only feedback log."""
+
+    @staticmethod
+    def _record(collector, prompt, workflow="phone_workflow"):
+        return collector.record_match(
+            prompt=prompt,
+            matched_workflow=workflow,
+            confidence=0.8,
+            match_type="semantic",
+        )
+
+    def test_records_are_appended_not_rewritten(self, tmp_path):
+        """Each flush appends only the new records."""
+        storage_path = tmp_path / "feedback.jsonl"
+        collector = FeedbackCollector(storage_path=storage_path, auto_save=False)
+
+        self._record(collector, "first")
+        collector.flush()
+        first_line = storage_path.read_text(encoding="utf-8").splitlines()[0]
+        self._record(collector, "second")
+        collector.flush()
+
+        lines = storage_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert lines[0] == first_line
+
+    def test_updates_are_replayed_on_load(self, tmp_path):
+        """Corrections and helpful flags survive a reload as update records."""
+        storage_path = tmp_path / "feedback.jsonl"
+        collector = FeedbackCollector(storage_path=storage_path, auto_save=False)
+        self._record(collector, "stool", workflow="table_workflow")
+        self._record(collector, "phone")
+        collector.record_correction(prompt="stool", original_match="table_workflow", correct_workflow="chair_workflow")
+        collector.record_helpful(prompt="phone", matched_workflow="phone_workflow", was_helpful=True)
+        collector.flush()
+
+        reloaded = FeedbackCollector(storage_path=storage_path, auto_save=False)
+
+        assert len(storage_path.read_text(encoding="utf-8").splitlines()) == 4
+        assert [e.prompt for e in reloaded._entries] == ["stool", "phone"]
+        assert reloaded._entries[0].user_correction == "chair_workflow"
+        assert reloaded._entries[0].was_helpful is False
+        assert reloaded._entries[1].was_helpful is True
+
+    def test_background_writer_group_commits(self, tmp_path):
+        """auto_save batches records written in quick succession."""
+        storage_path = tmp_path / "feedback.jsonl"
+        collector = FeedbackCollector(storage_path=storage_path, auto_save=True, flush_interval=0.05)
+
+        for i in range(5):
+            self._record(collector, f"prompt {i}")
+        writer = collector._writer
+        assert writer is not None
+        writer.join(timeout=5)
+
+        assert len(storage_path.read_text(encoding="utf-8").splitlines()) == 5
+        assert collector._writer is None
+        assert collector.get_info()["pending_writes"] == 0
+
+    def test_compaction_keeps_last_max_entries(self, tmp_path):
+        """The log is rewritten only once it exceeds the cap."""
+        storage_path = tmp_path / "feedback.jsonl"
+        collector = FeedbackCollector(storage_path=storage_path, max_entries=4, auto_save=False)
+
+        for i in range(6):
+            self._record(collector, f"prompt {i}")
+            collector.flush()
+        assert len(storage_path.read_text(encoding="utf-8").splitlines()) == 6
+
+        self._record(collector, "prompt 6")
+        collector.flush()
+
+        reloaded = FeedbackCollector(storage_path=storage_path, max_entries=4, auto_save=False)
+        assert len(storage_path.read_text(encoding="utf-8").splitlines()) == 4
+        assert [e.prompt for e in reloaded._entries] == ["prompt 3", "prompt 4", "prompt 5", "prompt 6"]
+        assert [e.prompt for e in collector._entries] == ["prompt 3", "prompt 4", "prompt 5", "prompt 6"]
+
+    def test_torn_last_line_is_skipped(self, tmp_path):
+        """A partial line from a crash is ignored and later appends stay readable."""
+        storage_path = tmp_path / "feedback.jsonl"
+        collector = FeedbackCollector(storage_path=storage_path, auto_save=False)
+        self._record(collector, "kept")
+        collector.flush()
+        with open(storage_path, "a", encoding="utf-8") as f:
+            f.write('{"timestamp": "2024-01-15T10:30:00", "prompt": "tor')
+
+        recovered = FeedbackCollector(storage_path=storage_path, auto_save=False)
+        self._record(recovered, "after crash")
+        recovered.flush()
+
+        reloaded = FeedbackCollector(storage_path=storage_path, auto_save=False)
+        assert [e.prompt for e in reloaded._entries] == ["kept", "after crash"]
+
+    def test_clear_truncates_storage(self, tmp_path):
+        """clear() drops both pending and stored records."""
+        storage_path = tmp_path / "feedback.jsonl"
+        collector = FeedbackCollector(storage_path=storage_path, auto_save=False)
+        self._record(collector, "stored")
+        collector.flush()
+        self._record(collector, "pending")
+
+        collector.clear()
+
+        assert storage_path.read_text(encoding="utf-8") == ""
+        assert FeedbackCollector(storage_path=storage_path, auto_save=False)._entries == []
@@ -314,13 +314,14 @@ class TestSceneContextAnalyzerCacheUpdate:
         analyzer = SceneContextAnalyzer(rpc_client=mock_rpc, cache_ttl=10.0)
 
         # First call - should hit RPC:
-        # 1. get_mode (mode, active_object, selected_object_names)
-        # 2. list_objects (object list)
-        # 3. inspect_object (for active object dimensions)
-        # 4. inspect_object (for active object materials/modifiers)
+        # 1. router_context probe (not supported by this addon -> legacy path)
+        # 2. get_mode (mode, active_object, selected_object_names)
+        # 3. list_objects (object list)
+        # 4. inspect_object (for active object dimensions)
+        # 5. inspect_object (for active object materials/modifiers)
         context1 = analyzer.analyze()
         first_call_count = mock_rpc.send_request.call_count
-        assert first_call_count == 4  # 4 RPC method calls
+        assert first_call_count == 5  # probe + 4 RPC method calls
 
         # Second call - should use cache but still refresh hot state (mode/selection)
         context2 = analyzer.analyze()
@@ -351,17 +352,17 @@ class TestSceneContextAnalyzerCacheUpdate:
         mock_rpc.send_request.side_effect = mock_send_request
         analyzer = SceneContextAnalyzer(rpc_client=mock_rpc, cache_ttl=0.0)
 
-        # First call - 4 RPC calls
+        # First call - router_context probe + 4 RPC calls
         analyzer.analyze()
         first_call_count = mock_rpc.send_request.call_count
 
         # Expire the cache
         analyzer._cache_timestamp = datetime.now() - timedelta(seconds=1)
 
-        # Second call should refresh - another 4 RPC calls
+        # Second call should refresh - another 4 RPC calls (no second probe)
         analyzer.analyze()
 
-        assert mock_rpc.send_request.call_count == first_call_count * 2  # 8 calls total
+        assert mock_rpc.send_request.call_count == first_call_count * 2 - 1  # 9 calls total
 
     def test_cached_edit_mode_refreshes_selection_counts(self):
         """Cached EDIT mode contexts should refresh selection counts to avoid stale has_selection."""
@@ -409,4 +410,159 @@ class TestSceneContextAnalyzerCacheUpdate:
         assert context.topology is not None
         assert context.topology.selected_verts == 4
         assert context.has_selection is True
-        assert mock_rpc.send_request.call_count == 2  # get_mode + list_selection
+        assert mock_rpc.send_request.call_count == 3  # router_context probe + get_mode + list_selection
+
+
+class TestSceneContextAnalyzerRouterContext:
+    """Test the composite scene.router_context path."""
+
+    @staticmethod
+    def _full_payload(revision=7, mode="OBJECT", **overrides):
+        payload = {
+            "revision": revision,
+            "mode": mode,
+            "active_object": "Cube",
+            "selected_object_names": ["Cube"],
+            "objects": [
+                {"name": "Cube", "type": "MESH", "location": [0.0, 0.0, 0.0]},
+                {"name": "Lamp", "type": "LIGHT", "location": [1.0, 1.0, 1.0]},
+            ],
+            "focus": {
+                "name": "Cube",
+                "type": "MESH",
+                "dimensions": [2.0, 2.0, 4.0],
+                "material_names": ["Wood"],
+                "modifier_names": ["Bevel"],
+                "topology": {"vertex_count": 8, "edge_count": 12, "face_count": 6, "triangle_count": 0},
+            },
+        }
+        payload.update(overrides)
+        return payload
+
+    def test_single_rpc_builds_full_context(self):
+        """One router_context call replaces the per-field RPCs."""
+        mock_rpc = MagicMock()
+        mock_rpc.send_request.return_value = make_rpc_response(self._full_payload())
+        analyzer = SceneContextAnalyzer(rpc_client=mock_rpc)
+
+        context = analyzer.analyze()
+
+        mock_rpc.send_request.assert_called_once_with("scene.router_context", {})
+        assert context.active_object == "Cube"
+        assert [obj.name for obj in context.objects] == ["Cube", "Lamp"]
+        assert context.objects[0].dimensions == [2.0, 2.0, 4.0]
+        assert context.objects[1].dimensions == [1.0, 1.0, 1.0]
+        assert context.materials == ["Wood"]
+        assert context.modifiers == ["Bevel"]
+        assert context.proportions is not None
+        assert context.topology is None  # OBJECT mode
+
+    def test_unchanged_revision_reuses_cached_context(self):
+        """An unchanged revision refreshes hot state only, regardless of TTL, into a new context."""
+        mock_rpc = MagicMock()
+        mock_rpc.send_request.side_effect = [
+            make_rpc_response(self._full_payload()),
+            make_rpc_response(
+                {
+                    "revision": 7,
+                    "unchanged": True,
+                    "mode": "OBJECT",
+                    "active_object": "Cube",
+                    "selected_object_names": [],
+                }
+            ),
+        ]
+        analyzer = SceneContextAnalyzer(rpc_client=mock_rpc, cache_ttl=0.0)
+
+        first = analyzer.analyze()
+        second = analyzer.analyze()
+
+        assert second is not first
+        assert first.selected_objects == ["Cube"]
+        assert first.objects[0].selected is True
+        assert second.selected_objects == []
+        assert [(obj.selected, obj.active) for obj in second.objects] == [(False, True), (False, False)]
+        assert second.materials == first.materials
+        assert mock_rpc.send_request.call_count == 2
+        assert mock_rpc.send_request.call_args_list[1].args == ("scene.router_context", {"since_revision": 7})
+
+    def test_changed_revision_rebuilds_context(self):
+        """A new revision returns a fresh context."""
+        mock_rpc = MagicMock()
+        mock_rpc.send_request.side_effect = [
+            make_rpc_response(self._full_payload(revision=7)),
+            make_rpc_response(self._full_payload(revision=8, mode="EDIT_MESH", edit_mode_vertex_count=3)),
+        ]
+        analyzer = SceneContextAnalyzer(rpc_client=mock_rpc)
+
+        first = analyzer.analyze()
+        second = analyzer.analyze()
+
+        assert second is not first
+        assert second.mode == "EDIT"
+        assert second.topology.vertices == 8
+        assert second.topology.selected_verts == 3
+
+    def test_unchanged_revision_with_new_active_object_refetches(self):
+        """Active-object changes that did not bump the revision trigger a full read."""
+        mock_rpc = MagicMock()
+        mock_rpc.send_request.side_effect = [
+            make_rpc_response(self._full_payload()),
+            make_rpc_response({"revision": 7, "unchanged": True, "mode": "OBJECT", "active_object": "Lamp"}),
+            make_rpc_response(
+                self._full_payload(active_object="Lamp", focus={"name": "Lamp", "dimensions": [0.5, 0.5, 0.5]})
+            ),
+        ]
+        analyzer = SceneContextAnalyzer(rpc_client=mock_rpc)
+
+        analyzer.analyze()
+        context = analyzer.analyze()
+
+        assert mock_rpc.send_request.call_count == 3
+        assert mock_rpc.send_request.call_args_list[2].args == ("scene.router_context", {})
+        assert context.active_object == "Lamp"
+        assert context.objects[1].dimensions == [0.5, 0.5, 0.5]
+
+    def test_unknown_command_falls_back_to_legacy_rpcs(self):
+        """Older addons are probed once, then served by the per-field RPCs."""
+        mock_rpc = MagicMock()
+        unknown_command = make_rpc_response(None, status="error")
+        unknown_command.error = "Unknown command: scene.router_context"
+
+        def mock_send_request(method, params=None):
+            if method == "scene.router_context":
+                return unknown_command
+            if method == "scene.get_mode":
+                return make_rpc_response({"mode": "OBJECT", "active_object": None, "selected_object_names": []})
+            return make_rpc_response([])
+
+        mock_rpc.send_request.side_effect = mock_send_request
+        analyzer = SceneContextAnalyzer(rpc_client=mock_rpc, cache_ttl=0.0)
+
+        analyzer.analyze()
+        analyzer.invalidate_cache()
+        analyzer.analyze()
+
+        methods = [call.args[0] for call in mock_rpc.send_request.call_args_list]
+        assert methods.count("scene.router_context") == 1
+        assert methods.count("scene.get_mode") == 2
+
+    def test_transient_error_does_not_disable_router_context(self):
+        """Connection errors fall back for one call only."""
+        mock_rpc = MagicMock()
+        error_response = make_rpc_response(None, status="error")
+        error_response.error = "Connection to Blender RPC lost"
+        mock_rpc.send_request.side_effect = [
+            error_response,
+            make_rpc_response({"mode": "OBJECT"}),
+            make_rpc_response([]),
+            make_rpc_response(self._full_payload()),
+        ]
+        analyzer = SceneContextAnalyzer(rpc_client=mock_rpc, cache_ttl=0.0)
+
+        analyzer.analyze()
+        analyzer.invalidate_cache()
+        context = analyzer.analyze()
+
+        assert context.active_object == "Cube"
+        assert mock_rpc.send_request.call_args_list[3].args[0] == "scene.router_context"
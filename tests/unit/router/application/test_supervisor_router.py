@@ -781,6 +781,30 @@ class TestEnsembleMatcherInitialization:
         # Should return same instance
         assert matcher1 is matcher2
 
+    def test_warm_up_ensemble_builds_matcher_once(self):
+        """Test warm_up_ensemble initializes the matcher ahead of routed calls."""
+        router = SupervisorRouter(config=RouterConfig())
+
+        router.warm_up_ensemble()
+        matcher = router._ensemble_matcher
+        router.warm_up_ensemble()
+
+        assert matcher is not None
+        assert router._ensemble_matcher is matcher
+
+    def test_warm_up_ensemble_raises_with_init_error(self):
+        """Test warm_up_ensemble surfaces the initialization error."""
+        router = SupervisorRouter(config=RouterConfig())
+
+        def fail():
+            router._last_ensemble_init_error = "ValueError: broken registry"
+            return False
+
+        router._initialize_ensemble = fail
+
+        with pytest.raises(RuntimeError, match="broken registry"):
+            router.warm_up_ensemble()
+
 
 class TestSetCurrentGoalEnsemble:
     """Tests for TASK-053-10: set_current_goal with ensemble matching."""
@@ -1043,3 +1067,58 @@ class TestRouterConfigEnsembleFields:
         assert restored.keyword_weight == 0.50
         assert restored.semantic_weight == 0.30
         assert restored.pattern_weight == 0.20
+
+
+class TestExecutePendingWorkflowBatching:
+    """Pending workflow execution should use one rpc.batch round trip."""
+
+    def _router_with_batch_rpc(self, batch_response):
+        rpc_client = MagicMock()
+        rpc_client.send_batch.return_value = batch_response
+        router = SupervisorRouter(config=RouterConfig(), rpc_client=rpc_client)
+        router._analyze_scene = MagicMock(return_value=SceneContext())
+        router._pending_workflow = "simple_table_workflow"
+        return router, rpc_client
+
+    def test_pending_workflow_steps_are_sent_as_single_batch(self):
+        from server.domain.models.rpc import RpcResponse
+
+        def fake_batch(commands, **kwargs):
+            return RpcResponse(
+                request_id="batch",
+                status="ok",
+                result={
+                    "results": [
+                        {"index": index, "cmd": item["cmd"], "status": "ok", "result": "done"}
+                        for index, item in enumerate(commands)
+                    ]
+                },
+            )
+
+        router, rpc_client = self._router_with_batch_rpc(None)
+        rpc_client.send_batch.side_effect = fake_batch
+
+        results = router.execute_pending_workflow({})
+
+        assert results
+        rpc_client.send_batch.assert_called_once()
+        rpc_client.send_request.assert_not_called()
+        commands = rpc_client.send_batch.call_args.args[0]
+        assert len(commands) == len(results)
+        assert all("." in command["cmd"] for command in commands)
+        assert rpc_client.send_batch.call_args.kwargs["undo_message"] == "MCP: workflow simple_table_workflow"
+        assert all(item["success"] and item["result"].status == "ok" for item in results)
+        assert router.get_pending_workflow() is None
+
+    def test_pending_workflow_batch_envelope_error_marks_all_calls_failed(self):
+        from server.domain.models.rpc import RpcResponse
+
+        router, _rpc_client = self._router_with_batch_rpc(
+            RpcResponse(request_id="batch", status="error", error="Addon execution timeout")
+        )
+
+        results = router.execute_pending_workflow({})
+
+        assert results
+        assert all(item["success"] is False for item in results)
+        assert all(item["error"] == "Addon execution timeout" for item in results)
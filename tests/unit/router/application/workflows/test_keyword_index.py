@@ -0,0 +1,65 @@
+"""
+Unit tests for the workflow trigger KeywordIndex.
+"""
+
+import random
+import re
+
+from server.router.application.workflows.keyword_index import KeywordIndex, KeywordMatch
+
+
+def _regex_matches(keyword: str, text: str) -> bool:
+    """Reference: the previous per-keyword boundary regex."""
+    normalized_keyword = keyword.strip().lower()
+    normalized_text = text.strip().lower()
+    if not normalized_keyword or not normalized_text:
+        return False
+    return re.search(rf"(?<!\w){re.escape(normalized_keyword)}(?!\w)", normalized_text) is not None
+
+
+class TestKeywordIndex:
+    """Tests for KeywordIndex."""
+
+    def test_find_all_reports_overlapping_matches_with_positions(self):
+        index = KeywordIndex([("chair", "chair"), ("office", "office chair"), ("leg", "chair leg")])
+
+        matches = index.find_all("Build an Office Chair leg")
+
+        assert matches == [
+            KeywordMatch(keyword="office chair", workflow_name="office", start=9, end=21),
+            KeywordMatch(keyword="chair", workflow_name="chair", start=16, end=21),
+            KeywordMatch(keyword="chair leg", workflow_name="leg", start=16, end=25),
+        ]
+
+    def test_word_boundaries_are_respected(self):
+        index = KeywordIndex([("screen_cutout", "screen"), ("l_shape", "l-shaped")])
+
+        assert index.first_match("capture viewport screenshot") is None
+        assert index.first_match("cut a screen, please") == "screen_cutout"
+        assert index.first_match("an l-shaped desk") == "l_shape"
+        assert index.first_match("a tall-shaped desk") is None
+
+    def test_first_match_follows_registration_order_not_position(self):
+        index = KeywordIndex([("first", "table"), ("second", "build"), ("second", "table")])
+
+        assert index.first_match("build a table") == "first"
+        assert index.first_match("build something") == "second"
+        assert index.first_match("") is None
+
+    def test_empty_and_duplicate_keywords_are_ignored(self):
+        index = KeywordIndex([("a", "  "), ("a", "Phone"), ("a", "phone "), ("b", "phone")])
+
+        assert len(index) == 1
+        assert [match.workflow_name for match in index.find_all("phone")] == ["a", "b"]
+
+    def test_matches_reference_regex_on_random_prompts(self):
+        rng = random.Random(7)
+        vocabulary = ["tab", "table", "le", "leg", "legs", "a", "ab", "chair", "x", "-", "_", " "]
+        keywords = ["table", "leg", "table leg", "ab", "a b", "x-x", "le_g", "chair legs"]
+        index = KeywordIndex([(keyword, keyword) for keyword in keywords])
+
+        for _ in range(300):
+            text = "".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 12)))
+            found = {match.keyword for match in index.find_all(text)}
+            expected = {keyword for keyword in keywords if _regex_matches(keyword, text)}
+            assert found == expected, text
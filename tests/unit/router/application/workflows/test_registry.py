@@ -142,6 +142,28 @@ class TestWorkflowRegistry:
         name = registry_with_test_workflow.find_by_keywords("create a test model")
         assert name == "test_workflow"
 
+    def test_find_keyword_matches_returns_positions(self, registry_with_test_workflow):
+        """Test that all keyword matches are returned with positions."""
+        matches = registry_with_test_workflow.find_keyword_matches("A demo with an example")
+        test_matches = [(m.keyword, m.start, m.end) for m in matches if m.workflow_name == "test_workflow"]
+        assert test_matches == [("demo", 2, 6), ("example", 15, 22)]
+
+    def test_keyword_index_rebuilt_only_when_keywords_change(self, registry_with_test_workflow):
+        """Test that the keyword index is reused until definitions change."""
+        registry = registry_with_test_workflow
+        registry.find_by_keywords("test")
+        index = registry._keyword_index
+
+        registry.load_custom_workflows(reload=True)
+        assert registry.find_by_keywords("create a test model") == "test_workflow"
+        assert registry._keyword_index is index
+
+        registry.register_definition(
+            WorkflowDefinition(name="zz_extra", description="Extra", steps=[], trigger_keywords=["zzkeyword"])
+        )
+        assert registry.find_by_keywords("a zzkeyword here") == "zz_extra"
+        assert registry._keyword_index is not index
+
     def test_expand_registered_workflow(self, registry_with_test_workflow):
         """Test expanding a registered workflow."""
         calls = registry_with_test_workflow.expand_workflow("test_workflow")
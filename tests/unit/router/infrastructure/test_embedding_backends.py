@@ -0,0 +1,111 @@
+"""Tests for pluggable embedding backends."""
+
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+import server.infrastructure.di as di
+from server.router.infrastructure import embedding_backends
+from server.router.infrastructure.embedding_backends import (
+    DEFAULT_MODEL_NAME,
+    EmbeddingBackendSpec,
+    available_embedding_backends,
+    load_embedding_model,
+    register_embedding_backend,
+)
+
+
+class _FakeSentenceTransformer:
+    def __init__(self, source, **kwargs):
+        self.source = source
+        self.kwargs = kwargs
+
+
+@pytest.fixture
+def fake_sentence_transformers(monkeypatch):
+    module = ModuleType("sentence_transformers")
+    module.SentenceTransformer = _FakeSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    return module
+
+
+class TestEmbeddingBackendSpec:
+    def test_default_backend_keeps_plain_model_name(self):
+        assert EmbeddingBackendSpec().cache_name == DEFAULT_MODEL_NAME
+
+    def test_other_backends_get_distinct_cache_names(self):
+        int8 = EmbeddingBackendSpec(backend="torch_int8")
+        onnx = EmbeddingBackendSpec(backend="onnx", model_path="/models/labse", onnx_file="onnx/model_q.onnx")
+        local_fp32 = EmbeddingBackendSpec(model_path="/models/labse")
+
+        assert int8.cache_name == f"{DEFAULT_MODEL_NAME}#torch_int8"
+        assert onnx.cache_name == "/models/labse#onnx:onnx/model_q.onnx"
+        assert local_fp32.cache_name == "/models/labse#torch"
+
+
+class TestLoadEmbeddingModel:
+    def test_builtin_backends_are_registered(self):
+        assert {"torch", "torch_int8", "onnx"} <= set(available_embedding_backends())
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown embedding backend 'tpu'"):
+            load_embedding_model(EmbeddingBackendSpec(backend="tpu"))
+
+    def test_custom_backend_can_be_registered(self, monkeypatch):
+        monkeypatch.setattr(embedding_backends, "_BACKENDS", dict(embedding_backends._BACKENDS))
+        model = SimpleNamespace(encode=lambda *args, **kwargs: None)
+        register_embedding_backend("stub", lambda spec: model)
+
+        assert load_embedding_model(EmbeddingBackendSpec(backend="stub")) is model
+
+    def test_torch_backend_loads_sentence_transformer(self, fake_sentence_transformers):
+        model = load_embedding_model(EmbeddingBackendSpec(local_files_only=True))
+
+        assert model.source == DEFAULT_MODEL_NAME
+        assert model.kwargs == {"local_files_only": True}
+
+    def test_onnx_backend_loads_local_export_on_cpu(self, fake_sentence_transformers):
+        spec = EmbeddingBackendSpec(backend="onnx", model_path="/models/labse", onnx_file="onnx/model_q.onnx")
+
+        model = load_embedding_model(spec)
+
+        assert model.source == "/models/labse"
+        assert model.kwargs["backend"] == "onnx"
+        assert model.kwargs["device"] == "cpu"
+        assert model.kwargs["model_kwargs"] == {"provider": "CPUExecutionProvider", "file_name": "onnx/model_q.onnx"}
+
+    def test_torch_int8_backend_quantizes_linear_and_embedding_layers(self, monkeypatch):
+        torch = pytest.importorskip("torch")
+
+        class _TinyModel(torch.nn.Sequential):
+            def __init__(self, source, **kwargs):
+                super().__init__(torch.nn.Embedding(100, 16), torch.nn.Linear(16, 8))
+
+        module = ModuleType("sentence_transformers")
+        module.SentenceTransformer = _TinyModel
+        monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+
+        model = load_embedding_model(EmbeddingBackendSpec(backend="torch_int8"))
+
+        assert type(model[0]) is not torch.nn.Embedding
+        assert type(model[1]) is not torch.nn.Linear
+
+
+def test_di_builds_backend_spec_from_config(monkeypatch):
+    monkeypatch.setattr(
+        di,
+        "get_config",
+        lambda: SimpleNamespace(
+            ROUTER_EMBEDDING_BACKEND="onnx",
+            ROUTER_EMBEDDING_MODEL_PATH="/models/labse",
+            ROUTER_EMBEDDING_ONNX_FILE="onnx/model_q.onnx",
+        ),
+    )
+    monkeypatch.setenv("HF_HUB_OFFLINE", "1")
+
+    spec = di.get_embedding_backend_spec()
+
+    assert spec == EmbeddingBackendSpec(
+        backend="onnx", model_path="/models/labse", onnx_file="onnx/model_q.onnx", local_files_only=True
+    )
+    assert di.get_embedding_model_name() == "/models/labse#onnx:onnx/model_q.onnx"
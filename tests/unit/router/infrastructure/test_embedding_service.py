@@ -0,0 +1,217 @@
+"""
+Unit tests for the shared batched/cached EmbeddingService.
+"""
+
+import hashlib
+import threading
+
+import numpy as np
+import pytest
+from server.router.application.classifier.intent_classifier import IntentClassifier
+from server.router.application.classifier.workflow_intent_classifier import WorkflowIntentClassifier
+from server.router.infrastructure.embedding_service import EmbeddingService, encode_texts, normalize_text
+
+
+class FakeModel:
+    """SentenceTransformer stand-in returning deterministic 8-dim vectors."""
+
+    def __init__(self, gate=None, started=None):
+        self.calls = []
+        self._gate = gate
+        self._started = started
+
+    def encode(self, sentences, batch_size=32, convert_to_numpy=True, normalize_embeddings=False, **kwargs):
+        texts = [sentences] if isinstance(sentences, str) else list(sentences)
+        self.calls.append(texts)
+        if self._started is not None:
+            self._started.set()
+        if self._gate is not None and len(self.calls) == 1:
+            self._gate.wait(timeout=5.0)
+        rows = []
+        for text in texts:
+            digest = hashlib.sha256(text.encode("utf-8")).digest()
+            rows.append(np.frombuffer(digest[:8], dtype=np.uint8).astype(np.float32))
+        matrix = np.stack(rows)
+        if normalize_embeddings:
+            matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix[0] if isinstance(sentences, str) else matrix
+
+
+class TestEmbeddingService:
+    def test_normalize_text_collapses_whitespace_but_keeps_case(self):
+        assert normalize_text("  Create\ta   Cube \n") == "Create a Cube"
+
+    def test_repeated_text_is_served_from_lru(self, tmp_path):
+        model = FakeModel()
+        service = EmbeddingService(model, cache_dir=tmp_path)
+
+        first = service.encode("create a cube", normalize_embeddings=True)
+        second = service.encode("  create   a cube ", normalize_embeddings=True)
+
+        assert first.shape == (8,)
+        np.testing.assert_array_equal(first, second)
+        assert model.calls == [["create a cube"]]
+        assert service.get_stats()["lru_hits"] == 1
+
+    def test_list_encode_deduplicates_and_preserves_order(self, tmp_path):
+        model = FakeModel()
+        service = EmbeddingService(model, cache_dir=tmp_path)
+
+        matrix = service.encode(["b", "a", "b"], normalize_embeddings=True)
+
+        assert matrix.shape == (3, 8)
+        np.testing.assert_array_equal(matrix[0], matrix[2])
+        assert model.calls == [["b", "a"]]
+
+    def test_processes_sharing_the_cache_dir_never_mix_keys_and_vectors(self, tmp_path):
+        first = EmbeddingService(FakeModel(), cache_dir=tmp_path)
+        second = EmbeddingService(FakeModel(), cache_dir=tmp_path)
+        first.encode(["alpha"], normalize_embeddings=True, persist=True)
+        expected = second.encode(["beta"], normalize_embeddings=True, persist=True)
+
+        restarted_model = FakeModel()
+        restarted = EmbeddingService(restarted_model, cache_dir=tmp_path)
+        loaded = restarted.encode(["beta"], normalize_embeddings=True)
+
+        np.testing.assert_allclose(loaded, expected)
+        assert restarted_model.calls == []
+        assert [path.suffix for path in tmp_path.iterdir()] == [".npz"]
+
+    def test_persisted_vectors_survive_restart(self, tmp_path):
+        service = EmbeddingService(FakeModel(), cache_dir=tmp_path)
+        expected = service.encode(["tool one", "tool two"], normalize_embeddings=True, persist=True)
+        service.encode("user prompt", normalize_embeddings=True)
+
+        restarted_model = FakeModel()
+        restarted = EmbeddingService(restarted_model, cache_dir=tmp_path)
+        loaded = restarted.encode(["tool one", "tool two"], normalize_embeddings=True)
+        restarted.encode("user prompt", normalize_embeddings=True)
+
+        np.testing.assert_allclose(loaded, expected)
+        assert restarted_model.calls == [["user prompt"]]
+        assert restarted.get_stats()["disk_hits"] == 2
+        assert restarted.get_stats()["disk_cache_size"] == 2
+
+    def test_normalization_flag_is_part_of_the_cache_key(self, tmp_path):
+        model = FakeModel()
+        service = EmbeddingService(model, cache_dir=None)
+
+        raw = service.encode("cube")
+        normalized = service.encode("cube", normalize_embeddings=True)
+
+        assert len(model.calls) == 2
+        assert not np.allclose(raw, normalized)
+
+    def test_concurrent_requests_are_coalesced_into_one_model_call(self, tmp_path):
+        gate = threading.Event()
+        started = threading.Event()
+        model = FakeModel(gate=gate, started=started)
+        service = EmbeddingService(model, cache_dir=None)
+        results = {}
+
+        def worker(text):
+            results[text] = service.encode(text, normalize_embeddings=True)
+
+        leader = threading.Thread(target=worker, args=("first",))
+        leader.start()
+        assert started.wait(timeout=5.0)
+        followers = [threading.Thread(target=worker, args=(f"text {i}",)) for i in range(3)]
+        for thread in followers:
+            thread.start()
+        while len(service._queue) < 3:
+            threading.Event().wait(0.01)
+        gate.set()
+        for thread in [leader, *followers]:
+            thread.join(timeout=5.0)
+
+        assert len(model.calls) == 2
+        assert sorted(model.calls[1]) == ["text 0", "text 1", "text 2"]
+        assert set(results) == {"first", "text 0", "text 1", "text 2"}
+        assert service.get_stats()["coalesced_requests"] == 2
+
+    def test_model_errors_propagate_to_callers(self):
+        class BrokenModel:
+            def encode(self, *args, **kwargs):
+                raise RuntimeError("model offline")
+
+        service = EmbeddingService(BrokenModel(), cache_dir=None)
+
+        with pytest.raises(RuntimeError, match="model offline"):
+            service.encode("cube")
+
+    def test_encode_texts_accepts_plain_models(self):
+        model = FakeModel()
+
+        matrix = encode_texts(model, ["a", "b"], persist=True)
+
+        assert matrix.shape == (2, 8)
+        assert model.calls == [["a", "b"]]
+
+
+class _RecordingStore:
+    def __init__(self):
+        self.records = []
+
+    def upsert(self, records):
+        self.records.extend(records)
+        return len(records)
+
+    def get_content_hashes(self, namespace):
+        return {}
+
+    def delete(self, ids, namespace):
+        return 0
+
+
+def test_intent_classifier_embeds_all_tools_in_one_persisted_batch(tmp_path):
+    model = FakeModel()
+    service = EmbeddingService(model, cache_dir=tmp_path)
+    store = _RecordingStore()
+    classifier = IntentClassifier(vector_store=store, model=service)
+    classifier._tool_texts = {
+        "mesh_extrude_region": ["extrude faces"],
+        "mesh_bevel": ["bevel edges"],
+    }
+
+    classifier._compute_and_store_embeddings({"mesh_bevel": {"category": "mesh"}})
+
+    assert len(model.calls) == 1
+    assert [record.id for record in store.records] == ["mesh_extrude_region", "mesh_bevel"]
+    assert store.records[1].metadata["category"] == "mesh"
+    assert service.get_stats()["persisted"] == 2
+
+
+def test_workflow_classifier_embeds_all_workflow_texts_in_one_batch(tmp_path):
+    model = FakeModel()
+    store = _RecordingStore()
+    classifier = WorkflowIntentClassifier(vector_store=store, model=EmbeddingService(model, cache_dir=tmp_path))
+    workflows = {
+        "table_workflow": {"sample_prompts": ["make a table"], "description": "Simple table", "category": "furniture"},
+        "chair_workflow": {"sample_prompts": ["make a chair"], "description": "Simple chair"},
+    }
+
+    classifier._compute_and_store_embeddings(workflows)
+
+    assert len(model.calls) == 1
+    assert len(store.records) == len(model.calls[0])
+    assert {record.metadata["workflow_id"] for record in store.records} == {"table_workflow", "chair_workflow"}
+
+
+@pytest.mark.parametrize(("configured", "expected"), [("", None), ("~/embeddings", "embeddings")])
+def test_di_embedding_service_uses_configured_cache_dir(monkeypatch, tmp_path, configured, expected):
+    import server.infrastructure.di as di
+    from server.infrastructure.config import get_config
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("ROUTER_EMBEDDING_CACHE_DIR", configured)
+    monkeypatch.setattr(di, "get_config", get_config)
+    monkeypatch.setattr(di, "_embedding_service_instance", None)
+    monkeypatch.setattr(di, "get_labse_model", FakeModel)
+    monkeypatch.setattr(di, "get_embedding_model_name", lambda: "labse")
+
+    service = di.get_embedding_service()
+
+    if expected is None:
+        assert service._disk is None
+    else:
+        assert service._disk._cache_dir == tmp_path / expected
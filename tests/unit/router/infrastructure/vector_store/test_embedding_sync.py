@@ -0,0 +1,190 @@
+"""
+Unit tests for content-hash based incremental embedding sync.
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+from server.router.application.classifier import intent_classifier as intent_module
+from server.router.application.classifier import workflow_intent_classifier as workflow_module
+from server.router.application.classifier.intent_classifier import IntentClassifier
+from server.router.application.classifier.workflow_intent_classifier import WorkflowIntentClassifier
+from server.router.domain.interfaces.i_vector_store import VectorNamespace, VectorRecord
+from server.router.infrastructure.vector_store.embedding_sync import (
+    CONTENT_HASH_KEY,
+    apply_embedding_sync,
+    plan_embedding_sync,
+)
+from server.router.infrastructure.vector_store.lance_store import LanceVectorStore
+
+
+class FakeModel:
+    """SentenceTransformer stand-in returning deterministic 768-dim unit vectors."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, sentences, convert_to_numpy=True, normalize_embeddings=False, **kwargs):
+        texts = [sentences] if isinstance(sentences, str) else list(sentences)
+        self.calls.append(texts)
+        rows = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "little")
+            row = np.random.default_rng(seed).standard_normal(768).astype(np.float32)
+            rows.append(row / np.linalg.norm(row))
+        matrix = np.stack(rows)
+        return matrix[0] if isinstance(sentences, str) else matrix
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LanceVectorStore(db_path=tmp_path / "vectors")
+
+
+def _entries(**texts):
+    return [(record_id, text, {"category": "mesh"}) for record_id, text in texts.items()]
+
+
+def _sync(store, model, entries, model_name="labse"):
+    plan = plan_embedding_sync(store, VectorNamespace.TOOLS, entries, model_name)
+    apply_embedding_sync(store, plan, model)
+    return plan
+
+
+class TestEmbeddingSync:
+    def test_first_sync_embeds_everything_and_stores_hashes(self, store):
+        model = FakeModel()
+
+        plan = _sync(store, model, _entries(mesh_bevel="bevel edges", mesh_extrude="extrude faces"))
+
+        assert len(plan.to_embed) == 2
+        assert model.calls == [["bevel edges", "extrude faces"]]
+        hashes = store.get_content_hashes(VectorNamespace.TOOLS)
+        assert set(hashes) == {"mesh_bevel", "mesh_extrude"}
+        assert all(hashes.values())
+
+    def test_unchanged_entries_are_not_reembedded(self, store):
+        entries = _entries(mesh_bevel="bevel edges", mesh_extrude="extrude faces")
+        _sync(store, FakeModel(), entries)
+        model = FakeModel()
+
+        plan = plan_embedding_sync(store, VectorNamespace.TOOLS, entries, "labse")
+        apply_embedding_sync(store, plan, model)
+
+        assert plan.is_up_to_date
+        assert plan.unchanged == 2
+        assert model.calls == []
+
+    def test_changed_added_and_removed_entries_are_synced(self, store):
+        _sync(store, FakeModel(), _entries(mesh_bevel="bevel edges", mesh_extrude="extrude faces"))
+        model = FakeModel()
+
+        plan = _sync(store, model, _entries(mesh_bevel="bevel the edges", mesh_inset="inset faces"))
+
+        assert model.calls == [["bevel the edges", "inset faces"]]
+        assert plan.to_delete == ["mesh_extrude"]
+        assert set(store.get_content_hashes(VectorNamespace.TOOLS)) == {"mesh_bevel", "mesh_inset"}
+        assert store.count(VectorNamespace.TOOLS) == 2
+
+    def test_metadata_and_model_changes_invalidate_hashes(self, store):
+        _sync(store, FakeModel(), _entries(mesh_bevel="bevel edges"))
+
+        changed_meta = plan_embedding_sync(
+            store, VectorNamespace.TOOLS, [("mesh_bevel", "bevel edges", {"category": "modeling"})], "labse"
+        )
+        changed_model = plan_embedding_sync(store, VectorNamespace.TOOLS, _entries(mesh_bevel="bevel edges"), "other")
+
+        assert [entry[0] for entry in changed_meta.to_embed] == ["mesh_bevel"]
+        assert [entry[0] for entry in changed_model.to_embed] == ["mesh_bevel"]
+
+    def test_repeat_plans_for_unchanged_entries_skip_the_stored_hashes(self, store, monkeypatch):
+        entries = _entries(mesh_bevel="bevel edges", mesh_extrude="extrude faces")
+        _sync(store, FakeModel(), entries)
+
+        def fail(namespace):
+            raise AssertionError("stored hashes read for an unchanged namespace")
+
+        monkeypatch.setattr(store, "get_content_hashes", fail)
+        plan = plan_embedding_sync(store, VectorNamespace.TOOLS, entries, "labse")
+
+        assert plan.cached
+        assert plan.is_up_to_date
+        assert plan.unchanged == 2
+
+    def test_sync_memo_is_dropped_when_entries_or_store_change(self, store):
+        entries = _entries(mesh_bevel="bevel edges", mesh_extrude="extrude faces")
+        _sync(store, FakeModel(), entries)
+
+        changed = plan_embedding_sync(store, VectorNamespace.TOOLS, _entries(mesh_bevel="bevel edges"), "labse")
+        store.clear(VectorNamespace.TOOLS)
+        cleared = plan_embedding_sync(store, VectorNamespace.TOOLS, entries, "labse")
+
+        assert not changed.cached and changed.to_delete == ["mesh_extrude"]
+        assert not cleared.cached and len(cleared.to_embed) == 2
+
+    def test_typed_hash_column_matches_legacy_metadata_blob(self, store):
+        _sync(store, FakeModel(), _entries(mesh_bevel="bevel edges"))
+        assert "content_hash" in store._typed_columns
+        typed = store.get_content_hashes(VectorNamespace.TOOLS)
+
+        store._typed_columns = frozenset(store._typed_columns - {"content_hash"})
+
+        assert typed["mesh_bevel"]
+        assert store.get_content_hashes(VectorNamespace.TOOLS) == typed
+
+    def test_records_without_hash_are_reembedded(self, store):
+        store.upsert(
+            [
+                VectorRecord(
+                    id="mesh_bevel",
+                    namespace=VectorNamespace.TOOLS,
+                    vector=[0.1] * 768,
+                    text="bevel edges",
+                    metadata={"category": "mesh"},
+                )
+            ]
+        )
+
+        plan = plan_embedding_sync(store, VectorNamespace.TOOLS, _entries(mesh_bevel="bevel edges"), "labse")
+
+        assert store.get_content_hashes(VectorNamespace.TOOLS) == {"mesh_bevel": ""}
+        assert plan.to_embed[0][2][CONTENT_HASH_KEY]
+
+
+def test_intent_classifier_reembeds_only_edited_tool_metadata(store, monkeypatch):
+    monkeypatch.setattr(intent_module, "EMBEDDINGS_AVAILABLE", True)
+    metadata = {
+        "mesh_bevel": {"sample_prompts": ["bevel edges"], "category": "mesh"},
+        "mesh_extrude_region": {"sample_prompts": ["extrude faces"], "category": "mesh"},
+    }
+    IntentClassifier(vector_store=store, model=FakeModel()).load_tool_embeddings(metadata)
+
+    metadata["mesh_bevel"]["sample_prompts"] = ["bevel edges", "round corners"]
+    model = FakeModel()
+    classifier = IntentClassifier(vector_store=store, model=model)
+    classifier.load_tool_embeddings(metadata)
+
+    assert classifier.is_loaded()
+    assert len(model.calls) == 1
+    assert model.calls[0] == [" ".join(classifier._tool_texts["mesh_bevel"])]
+
+
+def test_workflow_classifier_skips_model_when_workflows_unchanged(store, monkeypatch):
+    monkeypatch.setattr(workflow_module, "EMBEDDINGS_AVAILABLE", True)
+    workflows = {"table_workflow": {"sample_prompts": ["make a table"], "description": "Simple table"}}
+    WorkflowIntentClassifier(vector_store=store, model=FakeModel()).load_workflow_embeddings(workflows)
+
+    model = FakeModel()
+    classifier = WorkflowIntentClassifier(vector_store=store, model=model)
+    classifier.load_workflow_embeddings(workflows)
+
+    assert classifier.is_loaded()
+    assert model.calls == []
+
+    del workflows["table_workflow"]
+    workflows["chair_workflow"] = {"sample_prompts": ["make a chair"]}
+    classifier.load_workflow_embeddings(workflows)
+
+    stored_ids = set(store.get_content_hashes(VectorNamespace.WORKFLOWS))
+    assert stored_ids == {"chair_workflow__sample_prompt__0", "chair_workflow__name__1"}
@@ -8,6 +8,7 @@ TASK-047-2
 
 import shutil
 import tempfile
+import warnings
 from pathlib import Path
 
 import pytest
@@ -829,3 +830,154 @@ class TestLanceVectorStoreWeightedSearchScoring:
             # Calculate expected final score
             expected = result.raw_score * result.source_weight * result.language_boost
             assert abs(result.final_score - expected) < 0.001
+
+
+@pytest.mark.skipif(not LANCEDB_AVAILABLE, reason="LanceDB not installed")
+class TestLanceVectorStoreFilterPushdown:
+    """Tests for typed metadata columns and WHERE-clause pushdown."""
+
+    @staticmethod
+    def _parameter_record(index, parameter_name, workflow_name="table_workflow", vector=None):
+        return VectorRecord(
+            id=f"param_{index}",
+            namespace=VectorNamespace.PARAMETERS,
+            vector=vector or [1.0] + [0.0] * 767,
+            text=f"prompt {index}",
+            metadata={"parameter_name": parameter_name, "workflow_name": workflow_name},
+        )
+
+    def test_new_table_has_typed_columns(self, store):
+        """Fresh tables expose the hot metadata keys as typed columns."""
+        stats = store.get_stats()
+
+        assert "parameter_name" in stats["filter_columns"]
+        assert "workflow_name" in stats["filter_columns"]
+        assert "workflow_id" in stats["filter_columns"]
+
+    def test_scalar_indexes_use_the_current_index_api(self, store):
+        """Rebuilding filter indexes emits no lancedb deprecation warnings."""
+        store.upsert([self._parameter_record(0, "leg_angle")])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            store._ensure_scalar_indexes(replace=True)
+
+        indexed = {column for index in store._require_table().list_indices() for column in index.columns}
+        assert {"parameter_name", "workflow_name"} <= indexed
+
+    def test_filter_finds_match_beyond_python_window(self, store):
+        """Pushed-down filters are not limited to the top_k * 10 nearest rows."""
+        records = [self._parameter_record(i, "leg_angle") for i in range(30)]
+        # The only matching row is also the least similar one
+        records.append(self._parameter_record(99, "leg_width", vector=[0.0, 1.0] + [0.0] * 766))
+        store.upsert(records)
+
+        results = store.search(
+            query_vector=[1.0] + [0.0] * 767,
+            namespace=VectorNamespace.PARAMETERS,
+            top_k=1,
+            metadata_filter={"parameter_name": "leg_width", "workflow_name": "table_workflow"},
+        )
+
+        assert [r.id for r in results] == ["param_99"]
+
+    def test_filter_values_are_escaped(self, store):
+        """Quotes in filter values cannot break or widen the WHERE clause."""
+        store.upsert(
+            [
+                self._parameter_record(1, "o'brien"),
+                self._parameter_record(2, "other"),
+            ]
+        )
+
+        matched = store.search(
+            query_vector=[1.0] + [0.0] * 767,
+            namespace=VectorNamespace.PARAMETERS,
+            top_k=5,
+            metadata_filter={"parameter_name": "o'brien"},
+        )
+        injected = store.search(
+            query_vector=[1.0] + [0.0] * 767,
+            namespace=VectorNamespace.PARAMETERS,
+            top_k=5,
+            metadata_filter={"parameter_name": "x' OR '1'='1"},
+        )
+
+        assert [r.id for r in matched] == ["param_1"]
+        assert injected == []
+
+    def test_untyped_filter_keys_still_filter_in_python(self, store):
+        """Keys without a typed column keep the Python-side filter."""
+        store.upsert(
+            [
+                VectorRecord(
+                    id="a",
+                    namespace=VectorNamespace.TOOLS,
+                    vector=[1.0] + [0.0] * 767,
+                    text="a",
+                    metadata={"category": "mesh", "count": 2},
+                ),
+                VectorRecord(
+                    id="b",
+                    namespace=VectorNamespace.TOOLS,
+                    vector=[1.0] + [0.0] * 767,
+                    text="b",
+                    metadata={"category": "scene", "count": 2},
+                ),
+            ]
+        )
+
+        results = store.search(
+            query_vector=[1.0] + [0.0] * 767,
+            namespace=VectorNamespace.TOOLS,
+            top_k=5,
+            metadata_filter={"category": "scene", "count": 2},
+        )
+
+        assert [r.id for r in results] == ["b"]
+
+    def test_legacy_table_is_migrated(self, temp_db_path):
+        """Tables without typed columns are rewritten on open, keeping their rows."""
+        import json
+
+        import lancedb
+        import pyarrow as pa
+
+        legacy_schema = pa.schema(
+            [
+                pa.field("id", pa.string()),
+                pa.field("namespace", pa.string()),
+                pa.field("vector", pa.list_(pa.float32(), 768)),
+                pa.field("text", pa.string()),
+                pa.field("metadata", pa.large_binary()),
+            ]
+        )
+        db = lancedb.connect(str(temp_db_path))
+        db.create_table(
+            LanceVectorStore.TABLE_NAME,
+            data=[
+                {
+                    "id": "legacy_param",
+                    "namespace": VectorNamespace.PARAMETERS.value,
+                    "vector": [1.0] + [0.0] * 767,
+                    "text": "legacy prompt",
+                    "metadata": json.dumps(
+                        {"parameter_name": "leg_angle", "workflow_name": "table_workflow", "content_hash": "abc"}
+                    ).encode("utf-8"),
+                }
+            ],
+            schema=legacy_schema,
+        )
+
+        store = LanceVectorStore(db_path=temp_db_path)
+
+        assert store.count(VectorNamespace.PARAMETERS) == 1
+        assert "parameter_name" in store.get_stats()["filter_columns"]
+        results = store.search(
+            query_vector=[1.0] + [0.0] * 767,
+            namespace=VectorNamespace.PARAMETERS,
+            top_k=1,
+            metadata_filter={"parameter_name": "leg_angle", "workflow_name": "table_workflow"},
+        )
+        assert [r.id for r in results] == ["legacy_param"]
+        assert results[0].metadata["content_hash"] == "abc"
@@ -102,17 +102,21 @@ def test_ensure_table_reuses_existing_table_when_create_races(tmp_path, caplog):
 def test_fallback_weighted_search_and_stats(tmp_path):
     store = LanceVectorStore(db_path=tmp_path)
     store._use_fallback = True
-    store._fallback_store["wf:1"] = VectorRecord(
-        id="wf_embedding",
-        namespace=VectorNamespace.WORKFLOWS,
-        vector=[1.0] * 768,
-        text="create chair",
-        metadata={
-            "workflow_id": "chair_workflow",
-            "source_type": "sample_prompt",
-            "source_weight": 1.0,
-            "language": "en",
-        },
+    store._upsert_fallback(
+        [
+            VectorRecord(
+                id="wf_embedding",
+                namespace=VectorNamespace.WORKFLOWS,
+                vector=[1.0] * 768,
+                text="create chair",
+                metadata={
+                    "workflow_id": "chair_workflow",
+                    "source_type": "sample_prompt",
+                    "source_weight": 1.0,
+                    "language": "en",
+                },
+            )
+        ]
     )
 
     results = store.search_workflows_weighted([1.0] * 768, query_language="en", top_k=3, min_score=0.0)
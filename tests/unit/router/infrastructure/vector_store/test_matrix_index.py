@@ -0,0 +1,143 @@
+"""
+Unit tests for the matrix-backed in-memory vector index.
+"""
+
+import numpy as np
+import pytest
+from server.router.domain.interfaces.i_vector_store import VectorNamespace, VectorRecord
+from server.router.infrastructure.vector_store.lance_store import (
+    LANCEDB_AVAILABLE,
+    LanceVectorStore,
+    parse_vector_namespaces,
+)
+from server.router.infrastructure.vector_store.matrix_index import VectorMatrix
+
+
+def _record(id_, vector, namespace=VectorNamespace.TOOLS, **metadata):
+    return VectorRecord(id=id_, namespace=namespace, vector=list(vector), text=f"text {id_}", metadata=metadata)
+
+
+def _reference_search(records, query, top_k, threshold, metadata_filter=None):
+    """Previous per-record fallback loop."""
+    query = np.array(query) / (np.linalg.norm(query) or 1.0)
+    results = []
+    for record in records:
+        if metadata_filter and any(record.metadata.get(k) != v for k, v in metadata_filter.items()):
+            continue
+        vec = np.array(record.vector)
+        vec = vec / (np.linalg.norm(vec) or 1.0)
+        score = float(np.dot(query, vec))
+        if score >= threshold:
+            results.append((record.id, score))
+    results.sort(key=lambda item: item[1], reverse=True)
+    return results[:top_k]
+
+
+@pytest.fixture
+def random_records():
+    rng = np.random.default_rng(3)
+    return [_record(f"tool_{i}", rng.normal(size=16), category="mesh" if i % 2 else "scene") for i in range(60)]
+
+
+class TestVectorMatrix:
+    """Tests for VectorMatrix."""
+
+    def test_search_matches_reference_loop(self, random_records):
+        matrix = VectorMatrix(random_records)
+        rng = np.random.default_rng(4)
+
+        for _ in range(10):
+            query = rng.normal(size=16)
+            for top_k, threshold, metadata_filter in [
+                (5, -1.0, None),
+                (7, 0.1, {"category": "mesh"}),
+                (100, 0.0, None),
+            ]:
+                got = matrix.search([query], top_k, threshold, metadata_filter)[0]
+                expected = _reference_search(random_records, query, top_k, threshold, metadata_filter)
+                assert [r.id for r in got] == [item[0] for item in expected]
+                assert [r.score for r in got] == pytest.approx([item[1] for item in expected], abs=1e-5)
+
+    def test_batch_search_equals_single_queries(self, random_records):
+        matrix = VectorMatrix(random_records)
+        queries = np.random.default_rng(5).normal(size=(4, 16)).tolist()
+
+        batch = matrix.search(queries, top_k=3)
+
+        assert [[r.id for r in results] for results in batch] == [
+            [r.id for r in matrix.search([query], top_k=3)[0]] for query in queries
+        ]
+
+    def test_ties_keep_insertion_order(self):
+        matrix = VectorMatrix([_record(name, [1.0, 0.0]) for name in ["a", "b", "c", "d"]])
+
+        assert [r.id for r in matrix.search([[1.0, 0.0]], top_k=2)[0]] == ["a", "b"]
+
+    def test_clip_negative_and_empty_matrix(self):
+        matrix = VectorMatrix([_record("neg", [-1.0, 0.0])])
+
+        assert matrix.search([[1.0, 0.0]], top_k=1, threshold=-2.0)[0][0].score == pytest.approx(-1.0)
+        assert matrix.search([[1.0, 0.0]], top_k=1, clip_negative=True)[0][0].score == 0.0
+        assert VectorMatrix([]).search([[1.0, 0.0], [0.0, 1.0]]) == [[], []]
+
+    def test_weighted_search_keeps_best_row_per_workflow(self):
+        ns = VectorNamespace.WORKFLOWS
+        matrix = VectorMatrix(
+            [
+                _record("chair_en", [1.0, 0.0], ns, workflow_id="chair", source_weight=1.0, language="en"),
+                _record(
+                    "chair_kw", [1.0, 0.1], ns, workflow_id="chair", source_weight=0.8, source_type="trigger_keyword"
+                ),
+                _record("table_pl", [1.0, 0.0], ns, workflow_id="table", source_weight=1.0, language="pl"),
+                _record("lamp_en", [0.0, 1.0], ns, workflow_id="lamp", source_weight=1.0, language="en"),
+            ]
+        )
+
+        results = matrix.search_workflows_weighted([[1.0, 0.0]], query_language="en", top_k=5, min_score=0.5)[0]
+
+        assert [(r.workflow_id, r.matched_text) for r in results] == [
+            ("chair", "text chair_en"),
+            ("table", "text table_pl"),
+        ]
+        assert results[1].language_boost == 0.9
+        assert results[1].final_score == pytest.approx(0.9)
+        assert results[0].source_weight == 1.0
+
+
+class TestLanceVectorStoreMatrixServing:
+    """Tests for fallback and in-memory namespace serving in LanceVectorStore."""
+
+    def test_fallback_matrix_is_rebuilt_after_writes(self, tmp_path):
+        store = LanceVectorStore(db_path=tmp_path)
+        store._use_fallback = True
+        store.upsert([_record("a", [1.0, 0.0]), _record("b", [0.0, 1.0])])
+
+        assert store.search([1.0, 0.0], VectorNamespace.TOOLS, top_k=1)[0].id == "a"
+        store.delete(["a"], VectorNamespace.TOOLS)
+        assert [r.id for r in store.search([1.0, 0.0], VectorNamespace.TOOLS, top_k=2)] == ["b"]
+        assert [[r.id for r in batch] for batch in store.search_batch([[0.0, 1.0]], VectorNamespace.TOOLS)] == [["b"]]
+
+    @pytest.mark.skipif(not LANCEDB_AVAILABLE, reason="LanceDB not installed")
+    def test_memory_namespace_mirrors_lancedb(self, tmp_path):
+        store = LanceVectorStore(db_path=tmp_path, memory_namespaces=[VectorNamespace.TOOLS])
+        rng = np.random.default_rng(6)
+        vectors = rng.normal(size=(3, LanceVectorStore.VECTOR_DIM))
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        store.upsert([_record(f"tool_{i}", vector, category="mesh") for i, vector in enumerate(vectors)])
+
+        results = store.search(vectors[1].tolist(), VectorNamespace.TOOLS, top_k=2)
+
+        assert VectorNamespace.TOOLS in store._memory_mirrors
+        assert results[0].id == "tool_1"
+        assert results[0].score == pytest.approx(1.0, abs=1e-5)
+        assert results[0].metadata == {"category": "mesh"}
+        assert store.get_stats()["memory_namespaces"] == ["tools"]
+
+        store.delete(["tool_1"], VectorNamespace.TOOLS)
+        assert VectorNamespace.TOOLS not in store._memory_mirrors
+        assert "tool_1" not in [r.id for r in store.search(vectors[1].tolist(), VectorNamespace.TOOLS, top_k=3)]
+
+
+def test_parse_vector_namespaces_skips_unknown_entries():
+    assert parse_vector_namespaces(" Tools, bogus ,workflows,") == [VectorNamespace.TOOLS, VectorNamespace.WORKFLOWS]
+    assert parse_vector_namespaces("") == []
@@ -549,3 +549,49 @@ def test_vision_harness_fixture_only_reference_understanding_keeps_backend_path_
     assert '"status": "fixture_only"' in output
     assert '"fixture_only_mode": "reference-understanding"' in output
     assert '"mode": "reference_understanding"' in output
+
+
+def test_run_benchmarks_measures_flows_against_in_process_simulated_addon():
+    module = _load_script("run_benchmarks")
+
+    report = module.run_benchmarks(
+        ["scene_relation_graph", "mesh_get_large_reads", "mesh_get_large_reads_rows"],
+        iterations=2,
+        warmup=0,
+        main_thread_latency_ms=0.0,
+        object_count=6,
+        mesh_resolution=8,
+        in_process=True,
+    )
+
+    assert report["profile"] == {"main_thread_latency_ms": 0.0, "object_count": 6, "mesh_resolution": 8}
+    relation = report["flows"]["scene_relation_graph"]
+    assert relation["status"] == "ok", relation
+    assert relation["commands"]["scene.measure_relations_bulk"] == 1
+    assert relation["commands"]["scene.assert_symmetry"] == 2
+    columns = report["flows"]["mesh_get_large_reads"]
+    rows = report["flows"]["mesh_get_large_reads_rows"]
+    assert columns["rpc_count"] == rows["rpc_count"] == 3
+    assert 0 < columns["bytes"] < rows["bytes"]
+    assert columns["p50_ms"] <= columns["p95_ms"]
+
+    thresholds = module.thresholds_from_report(report)
+    assert module.compare_to_thresholds(report, thresholds) == []
+
+
+def test_run_benchmarks_threshold_comparison_flags_regressions():
+    module = _load_script("run_benchmarks")
+
+    assert module.percentile([5.0, 1.0, 3.0, 2.0, 4.0], 50) == 3.0
+    assert module.percentile([float(value) for value in range(1, 21)], 95) == 19.0
+
+    thresholds = {
+        "tolerance": {"p95_ms": 0.5, "p95_ms_slack": 0.0, "rpc_count": 0.0, "bytes": 0.1},
+        "flows": {"flow": {"p95_ms": 100.0, "rpc_count": 10, "bytes": 1000}},
+    }
+    within = {"flows": {"flow": {"status": "ok", "p95_ms": 149.0, "rpc_count": 10, "bytes": 1100}}}
+    regressed = {"flows": {"flow": {"status": "ok", "p95_ms": 151.0, "rpc_count": 11, "bytes": 1101}}}
+
+    assert module.compare_to_thresholds(within, thresholds) == []
+    messages = module.compare_to_thresholds(regressed, thresholds)
+    assert [message.split(":")[1].split()[0] for message in messages] == ["p95_ms", "rpc_count", "bytes"]
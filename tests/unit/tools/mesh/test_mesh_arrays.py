@@ -0,0 +1,196 @@
+"""Tests for vectorized (foreach_get / NumPy) mesh column reads."""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+if "bpy" not in sys.modules:
+    sys.modules["bpy"] = MagicMock()
+if "bmesh" not in sys.modules:
+    sys.modules["bmesh"] = MagicMock()
+
+import bmesh
+import bpy
+from blender_addon.application.handlers.mesh import MeshHandler
+from blender_addon.application.handlers.mesh_arrays import (
+    edge_columns,
+    face_columns,
+    gather_loops,
+    loop_normal_columns,
+    normalize_layout,
+    shape_key_columns,
+    vertex_columns,
+    world_space_mesh_arrays,
+)
+
+
+class FakeCollection:
+    """Minimal bpy_prop_collection stand-in supporting `foreach_get`."""
+
+    def __init__(self, **props):
+        self._props = {name: np.asarray(values) for name, values in props.items()}
+        self._count = len(next(iter(self._props.values()))) if self._props else 0
+
+    def __len__(self):
+        return self._count
+
+    def foreach_get(self, prop, out):
+        out[:] = self._props[prop].reshape(-1)
+
+
+def _lists(columns):
+    return {name: np.asarray(values).tolist() for name, values in columns.items()}
+
+
+def _quad_pair_mesh():
+    """Two quads sharing edge (1, 2): verts 0-1-2-3 and 1-4-5-2."""
+    loop_verts = [0, 1, 2, 3, 1, 4, 5, 2]
+    loop_edges = [0, 1, 2, 3, 4, 5, 6, 1]
+    return SimpleNamespace(
+        vertices=FakeCollection(
+            co=[[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]],
+            select=[True, True, False, False, False, True],
+        ),
+        edges=FakeCollection(
+            vertices=[[0, 1], [1, 2], [2, 3], [3, 0], [1, 4], [4, 5], [5, 2]],
+            select=[True, False, False, False, False, False, False],
+            use_seam=[False, True, False, False, False, False, False],
+            use_edge_sharp=[False] * 7,
+        ),
+        loops=FakeCollection(vertex_index=loop_verts, edge_index=loop_edges),
+        polygons=FakeCollection(
+            loop_start=[0, 4],
+            loop_total=[4, 4],
+            select=[False, True],
+            normal=[[0, 0, 1], [0, 0, 1]],
+            center=[[0.5, 0.5, 0], [1.5, 0.5, 0]],
+            area=[1.0, 1.0],
+            material_index=[0, 1],
+        ),
+        corner_normals=FakeCollection(vector=[[0, 0, 1]] * 8),
+        attributes={},
+    )
+
+
+def test_normalize_layout_rejects_unknown_values():
+    assert normalize_layout(None) == "rows"
+    assert normalize_layout("COLUMNS") == "columns"
+    with pytest.raises(ValueError, match="layout must be one of"):
+        normalize_layout("packed")
+
+
+def test_gather_loops_expands_face_loop_ranges():
+    assert gather_loops([4, 0], [3, 2]).tolist() == [4, 5, 6, 0, 1]
+    assert gather_loops([], []).tolist() == []
+
+
+def test_vertex_columns_page_selected_vertices():
+    result = vertex_columns(_quad_pair_mesh(), selected_only=True, offset=1, limit=1)
+
+    assert result["vertex_count"] == 6
+    assert result["selected_count"] == 3
+    assert result["filtered_count"] == 3
+    assert result["has_more"] is True
+    assert result["strides"] == {"position": 3}
+    assert _lists(result["columns"]) == {"index": [1], "position": [1.0, 0.0, 0.0], "selected": [True]}
+
+
+def test_edge_columns_derive_boundary_and_manifold_flags_from_loop_edges():
+    columns = _lists(edge_columns(_quad_pair_mesh(), selected_only=False, offset=0, limit=None)["columns"])
+
+    assert columns["verts"][:4] == [0, 1, 1, 2]
+    assert columns["is_manifold"] == [False, True, False, False, False, False, False]
+    assert columns["is_boundary"] == [True, False, True, True, True, True, True]
+    assert columns["is_seam"][1] is True
+    assert columns["crease"] == [0.0] * 7
+
+
+def test_face_columns_flatten_face_verts_with_loop_totals():
+    result = face_columns(_quad_pair_mesh(), selected_only=True, offset=0, limit=None)
+    columns = _lists(result["columns"])
+
+    assert result["returned_count"] == 1
+    assert columns["index"] == [1]
+    assert columns["loop_total"] == [4]
+    assert columns["verts"] == [1, 4, 5, 2]
+    assert columns["center"] == [1.5, 0.5, 0.0]
+    assert columns["material_index"] == [1]
+
+
+def test_loop_normal_columns_use_corner_normals_and_face_selection():
+    result = loop_normal_columns(_quad_pair_mesh(), selected_only=True, offset=0, limit=None)
+    columns = _lists(result["columns"])
+
+    assert result["loop_count"] == 8
+    assert result["selected_count"] == 4
+    assert columns["loop_index"] == [4, 5, 6, 7]
+    assert columns["vert"] == [1, 4, 5, 2]
+    assert columns["normal"] == [0.0, 0.0, 1.0] * 4
+
+
+def test_world_space_mesh_arrays_apply_matrix_world():
+    mesh = SimpleNamespace(
+        vertices=FakeCollection(co=[[0, 0, 0], [1, 0, 0], [0, 1, 0]]),
+        loop_triangles=FakeCollection(vertices=[[0, 1, 2]]),
+        polygons=FakeCollection(center=[[1, 1, 0]]),
+    )
+    matrix = [[0, -1, 0, 10], [1, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+
+    vertices, triangles, centers = world_space_mesh_arrays(mesh, matrix)
+
+    assert vertices == [(10.0, 0.0, 0.0), (10.0, 1.0, 0.0), (9.0, 0.0, 0.0)]
+    assert triangles == [(0, 1, 2)]
+    assert centers == [(9.0, 1.0, 0.0)]
+
+
+def test_get_vertex_data_columns_layout_skips_edit_mode_switch():
+    obj = MagicMock()
+    obj.type = "MESH"
+    obj.mode = "OBJECT"
+    obj.data = _quad_pair_mesh()
+    bpy.data.objects = {"Pair": obj}
+    bpy.ops.object.mode_set = MagicMock()
+    bmesh.from_edit_mesh = MagicMock()
+
+    result = MeshHandler().get_vertex_data("Pair", layout="columns")
+
+    bpy.ops.object.mode_set.assert_not_called()
+    bmesh.from_edit_mesh.assert_not_called()
+    assert result["object_name"] == "Pair"
+    assert result["layout"] == "columns"
+    assert result["returned_count"] == 6
+    assert "vertices" not in result
+
+
+def test_get_face_data_columns_layout_syncs_edit_mode_changes_first():
+    obj = MagicMock()
+    obj.type = "MESH"
+    obj.mode = "EDIT"
+    obj.data = _quad_pair_mesh()
+    bpy.data.objects = {"Pair": obj}
+    bpy.ops.object.mode_set = MagicMock()
+
+    result = MeshHandler().get_face_data("Pair", layout="columns", limit=1)
+
+    obj.update_from_editmode.assert_called_once_with()
+    bpy.ops.object.mode_set.assert_not_called()
+    assert result["has_more"] is True
+    assert result["columns"]["verts"].tolist() == [0, 1, 2, 3]
+
+
+def test_shape_key_columns_report_only_moved_vertices_per_key():
+    basis = SimpleNamespace(name="Basis", value=0.0, data=FakeCollection(co=[[0, 0, 0], [1, 0, 0], [0, 1, 0]]))
+    smile = SimpleNamespace(name="Smile", value=0.5, data=FakeCollection(co=[[0, 0, 0], [1, 0, 0.25], [0, 1, 0]]))
+
+    result = shape_key_columns([basis, smile], include_deltas=True, offset=0, limit=None)
+    columns = _lists(result["columns"])
+
+    assert result["shape_key_count"] == 2
+    assert result["strides"] == {"delta": 3}
+    assert columns["name"] == ["Basis", "Smile"]
+    assert columns["delta_total"] == [0, 1]
+    assert columns["delta_vert"] == [1]
+    assert columns["delta"] == [0.0, 0.0, 0.25]
@@ -52,7 +52,7 @@ class TestMeshInspectMega:
             )
         )
 
-        mock_vertices.assert_called_once_with(self.mock_ctx, "Cube", True, None, None)
+        mock_vertices.assert_called_once_with(self.mock_ctx, "Cube", True, None, None, "rows")
         assert isinstance(result, MeshInspectResponseContract)
         assert result.action == "vertices"
         assert result.returned == 2
@@ -76,7 +76,7 @@ class TestMeshInspectMega:
         }
         result = asyncio.run(callable_mesh_inspect(self.mock_ctx, action="edges", object_name="Cube"))
 
-        mock_edges.assert_called_once_with(self.mock_ctx, "Cube", False, None, None)
+        mock_edges.assert_called_once_with(self.mock_ctx, "Cube", False, None, None, "rows")
         assert isinstance(result, MeshInspectResponseContract)
         assert result.action == "edges"
 
@@ -98,7 +98,7 @@ class TestMeshInspectMega:
         }
         result = asyncio.run(callable_mesh_inspect(self.mock_ctx, action="faces", object_name="Cube"))
 
-        mock_faces.assert_called_once_with(self.mock_ctx, "Cube", False, None, None)
+        mock_faces.assert_called_once_with(self.mock_ctx, "Cube", False, None, None, "rows")
         assert isinstance(result, MeshInspectResponseContract)
         assert result.action == "faces"
 
@@ -128,7 +128,7 @@ class TestMeshInspectMega:
             )
         )
 
-        mock_uvs.assert_called_once_with(self.mock_ctx, "Cube", "UVMap", True, None, None)
+        mock_uvs.assert_called_once_with(self.mock_ctx, "Cube", "UVMap", True, None, None, "rows")
         assert isinstance(result, MeshInspectResponseContract)
         assert result.action == "uvs"
 
@@ -150,7 +150,7 @@ class TestMeshInspectMega:
         }
         result = asyncio.run(callable_mesh_inspect(self.mock_ctx, action="normals", object_name="Cube"))
 
-        mock_normals.assert_called_once_with(self.mock_ctx, "Cube", False, None, None)
+        mock_normals.assert_called_once_with(self.mock_ctx, "Cube", False, None, None, "rows")
         assert isinstance(result, MeshInspectResponseContract)
         assert result.action == "normals"
 
@@ -180,7 +180,7 @@ class TestMeshInspectMega:
             )
         )
 
-        mock_attrs.assert_called_once_with(self.mock_ctx, "Cube", "Col", True, None, None)
+        mock_attrs.assert_called_once_with(self.mock_ctx, "Cube", "Col", True, None, None, "rows")
         assert isinstance(result, MeshInspectResponseContract)
         assert result.action == "attributes"
 
@@ -209,7 +209,7 @@ class TestMeshInspectMega:
             )
         )
 
-        mock_shape_keys.assert_called_once_with(self.mock_ctx, "Cube", True, None, None)
+        mock_shape_keys.assert_called_once_with(self.mock_ctx, "Cube", True, None, None, "rows")
         assert isinstance(result, MeshInspectResponseContract)
         assert result.action == "shape_keys"
 
@@ -0,0 +1,65 @@
+"""
+Unit tests for the shared addon background-job snapshot stream.
+"""
+
+import asyncio
+import threading
+
+from server.application.services.background_jobs import (
+    JobSnapshotStream,
+    close_job_snapshots,
+    subscribe_job_snapshots,
+)
+from server.domain.models.rpc import RpcResponse
+
+
+class PushRpc:
+    def __init__(self, ack):
+        self.ack = ack
+        self.unsubscribed = []
+
+    def subscribe_background_job(self, job_id, on_event, *, timeout_seconds=None):
+        self.on_event = on_event
+        return self.ack
+
+    def unsubscribe_background_job(self, subscription_id):
+        self.unsubscribed.append(subscription_id)
+
+
+def test_blocking_wait_returns_only_the_newest_pushed_snapshot():
+    stream = JobSnapshotStream()
+    stream.on_event({"status": "running", "progress_current": 1})
+    stream.on_event({"status": "running", "progress_current": 2})
+
+    assert stream.next_snapshot(1.0) == {"status": "running", "progress_current": 2}
+    assert stream.next_snapshot(0.01) is None
+
+
+def test_async_wait_wakes_on_push_from_another_thread():
+    async def scenario():
+        stream = JobSnapshotStream(asyncio.get_running_loop())
+        threading.Timer(0.05, stream.on_event, args=({"status": "completed"},)).start()
+        return await stream.next_snapshot_async(5.0)
+
+    assert asyncio.run(scenario()) == {"status": "completed"}
+
+
+def test_lost_stream_is_no_longer_active():
+    rpc = PushRpc(RpcResponse(request_id="sub-1", status="ok", result={"status": "running"}))
+    stream = subscribe_job_snapshots(rpc, "job-1", timeout_seconds=1.0)
+
+    assert stream.active
+    assert stream.initial_snapshot == {"status": "running"}
+    rpc.on_event(None)
+
+    assert stream.next_snapshot(1.0) is None
+    assert not stream.active
+    close_job_snapshots(rpc, stream)
+    assert rpc.unsubscribed == ["sub-1"]
+
+
+def test_subscription_is_skipped_when_the_addon_cannot_push():
+    rpc = PushRpc(RpcResponse(request_id="sub-1", status="error", error="Unknown command"))
+
+    assert subscribe_job_snapshots(rpc, "job-1", timeout_seconds=1.0) is None
+    assert subscribe_job_snapshots(object(), "job-1", timeout_seconds=1.0) is None
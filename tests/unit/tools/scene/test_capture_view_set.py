@@ -0,0 +1,138 @@
+"""
+Unit tests for the addon-side scene.capture_view_set job.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+if "bpy" not in sys.modules:
+    sys.modules["bpy"] = MagicMock()
+
+from blender_addon.application.handlers.job_utils import JobCancelledError
+from blender_addon.application.handlers.scene import SceneHandler
+
+
+class _Objects:
+    def __init__(self, objects):
+        self._objects = {obj.name: obj for obj in objects}
+
+    def __iter__(self):
+        return iter(self._objects.values())
+
+    def __contains__(self, name):
+        return name in self._objects
+
+    def get(self, name):
+        return self._objects.get(name)
+
+
+def _object(name, hide_viewport=False, hide_render=False):
+    obj = MagicMock()
+    obj.name = name
+    obj.hide_viewport = hide_viewport
+    obj.hide_render = hide_render
+    return obj
+
+
+def _presets(tmp_path=None):
+    return [
+        {"name": "context_wide", "width": 640, "height": 480, "shading": "SOLID"},
+        {
+            "name": "target_front",
+            "width": 640,
+            "height": 480,
+            "shading": "SOLID",
+            "focus_target": True,
+            "isolate_target": True,
+            "standard_view": "FRONT",
+            "output_path": str(tmp_path / "front.jpg") if tmp_path else None,
+        },
+        {
+            "name": "target_oblique",
+            "width": 640,
+            "height": 480,
+            "focus_target": True,
+            "isolate_target": True,
+            "orbit_horizontal": 35.0,
+            "orbit_vertical": 15.0,
+        },
+    ]
+
+
+class TestCaptureViewSet:
+    def setup_method(self):
+        self.mock_bpy = sys.modules["bpy"]
+        self.housing = _object("Housing")
+        self.panel = _object("Panel", hide_viewport=True, hide_render=True)
+        self.lamp = _object("Lamp", hide_render=True)
+        self.mock_bpy.data.objects = _Objects([self.housing, self.panel, self.lamp])
+
+        self.handler = SceneHandler()
+        self.view_state = {"available": True, "view_location": [0.0, 0.0, 0.0]}
+        self.handler.get_view_state = MagicMock(return_value=self.view_state)
+        self.handler.restore_view_state = MagicMock(return_value="restored")
+        self.handler.set_standard_view = MagicMock(return_value="view ok")
+        self.handler.camera_focus = MagicMock(return_value="focus ok")
+        self.handler.camera_orbit = MagicMock(return_value="orbit ok")
+        self.viewport_calls = []
+
+        def fake_get_viewport(**kwargs):
+            self.viewport_calls.append(kwargs)
+            self.visible_during_render = {obj.name: not obj.hide_viewport for obj in self.mock_bpy.data.objects}
+            if kwargs.get("output_path"):
+                return {"path": kwargs["output_path"], "size": 3, "sha256": "abc", "media_type": "image/jpeg"}
+            return "aW1n"
+
+        self.handler.get_viewport = MagicMock(side_effect=fake_get_viewport)
+
+    def test_renders_every_preset_and_restores_state_once_per_view(self, tmp_path):
+        progress = []
+
+        result = self.handler.capture_view_set(
+            _presets(tmp_path),
+            target_object="Housing",
+            progress_callback=lambda current, total, message: progress.append((current, total)),
+        )
+
+        assert result["view_count"] == 3
+        assert [item["name"] for item in result["captures"]] == ["context_wide", "target_front", "target_oblique"]
+        assert result["captures"][0]["image_base64"] == "aW1n"
+        assert result["captures"][1]["path"] == str(tmp_path / "front.jpg")
+        assert [call["focus_target"] for call in self.viewport_calls] == [None, "Housing", "Housing"]
+        assert self.viewport_calls[1]["output_path"] == str(tmp_path / "front.jpg")
+        self.handler.set_standard_view.assert_called_once_with("FRONT")
+        self.handler.camera_orbit.assert_called_once_with(
+            angle_horizontal=35.0, angle_vertical=15.0, target_object="Housing"
+        )
+        assert self.visible_during_render == {"Housing": True, "Panel": False, "Lamp": False}
+        assert progress == [(0, 3), (1, 3), (2, 3), (3, 3)]
+        # Restored between views and once at the end.
+        assert self.handler.restore_view_state.call_count == 3
+        assert (self.panel.hide_viewport, self.panel.hide_render) == (True, True)
+        assert (self.lamp.hide_viewport, self.lamp.hide_render) == (False, True)
+
+    def test_missing_output_directory_falls_back_to_inline_image(self, tmp_path):
+        presets = _presets(tmp_path / "missing")
+
+        result = self.handler.capture_view_set(presets, target_object="Housing")
+
+        assert self.viewport_calls[1]["output_path"] is None
+        assert result["captures"][1]["image_base64"] == "aW1n"
+
+    def test_cancellation_restores_state_before_raising(self):
+        cancelled = iter([False, True])
+
+        with pytest.raises(JobCancelledError):
+            self.handler.capture_view_set(
+                _presets(), target_object="Housing", is_cancelled=lambda: next(cancelled, True)
+            )
+
+        assert len(self.viewport_calls) == 1
+        assert (self.lamp.hide_viewport, self.lamp.hide_render) == (False, True)
+        self.handler.restore_view_state.assert_called_with(self.view_state)
+
+    def test_rejects_empty_preset_list(self):
+        with pytest.raises(ValueError, match="non-empty list"):
+            self.handler.capture_view_set([])
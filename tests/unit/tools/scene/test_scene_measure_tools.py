@@ -224,3 +224,76 @@ def test_get_evaluated_mesh_data_clears_temp_mesh_on_empty_geometry(vertices, tr
 
     assert result is None
     obj_eval.to_mesh_clear.assert_called_once_with()
+
+
+def test_measure_relations_bulk_shares_evaluated_meshes_and_bvh_trees_across_pairs(monkeypatch):
+    mock_bpy = sys.modules["bpy"]
+    body = _make_box("Body", (0.0, 0.0, 0.0), (1.0, 1.0, 1.0), (0.5, 0.5, 0.5))
+    head = _make_box("Head", (0.0, 0.0, 1.5), (1.0, 1.0, 2.5), (0.5, 0.5, 2.0))
+    tail = _make_box("Tail", (2.0, 0.0, 0.0), (3.0, 1.0, 1.0), (2.5, 0.5, 0.5))
+    for obj in (body, head, tail):
+        obj.type = "MESH"
+
+    mock_bpy.data.objects = MagicMock()
+    mock_bpy.data.objects.get.side_effect = {"Body": body, "Head": head, "Tail": tail}.get
+
+    class _FakeTree:
+        def overlap(self, other):
+            return []
+
+        def find_nearest(self, point):
+            return ((0.0, 0.0, 0.0), None, 0, 0.5)
+
+    built_trees = []
+
+    class _FakeBVHTree:
+        @staticmethod
+        def FromPolygons(vertices, triangles, all_triangles=True):
+            built_trees.append(vertices)
+            return _FakeTree()
+
+    monkeypatch.setitem(sys.modules, "mathutils.bvhtree", SimpleNamespace(BVHTree=_FakeBVHTree))
+
+    handler = SceneHandler()
+    evaluated = []
+    released = []
+
+    def _fake_mesh_data(obj):
+        evaluated.append(obj.name)
+        return {
+            "object_name": obj.name,
+            "vertices": [(0.0, 0.0, 0.0)],
+            "triangles": [(0, 0, 0)],
+            "sample_points": [(0.0, 0.0, 0.0)],
+        }
+
+    monkeypatch.setattr(handler, "_get_evaluated_mesh_data", _fake_mesh_data)
+    monkeypatch.setattr(
+        handler, "_release_evaluated_mesh_data", lambda payload: released.append(payload["object_name"])
+    )
+
+    result = handler.measure_relations_bulk(
+        [
+            {"from_object": "Head", "to_object": "Body"},
+            {"from_object": "Body", "to_object": "Tail"},
+            {"from_object": "Body", "to_object": "Missing"},
+        ]
+    )
+
+    assert result["pair_count"] == 3
+    assert result["evaluated_mesh_count"] == 3
+    assert sorted(evaluated) == ["Body", "Head", "Tail"]
+    assert len(built_trees) == 3
+    assert sorted(released) == ["Body", "Head", "Tail"]
+    assert handler._mesh_scope is None
+
+    head_body, body_tail, missing = result["pairs"]
+    assert head_body["gap"]["measurement_basis"] == "mesh_surface"
+    assert head_body["gap"]["relation"] == "separated"
+    assert head_body["alignment"]["axes"] == ["X", "Y", "Z"]
+    assert head_body["overlap"]["relation"] == "disjoint"
+    assert head_body["contact_assertion"]["passed"] is False
+    assert head_body["error"] is None
+    assert body_tail["gap"]["gap"] == 0.5
+    assert missing["gap"] is None
+    assert "Missing" in missing["error"]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from blender_addon.application.handlers.mesh_cache import EvaluatedMeshCache, estimate_mesh_data_bytes
+from blender_addon.application.handlers.scene import SceneHandler
+
+
+def _mesh_payload(name: str, vertex_count: int = 3, data_name: str | None = None) -> dict:
+    return {
+        "object_name": name,
+        "data_name": data_name or f"{name}Mesh",
+        "vertices": [(float(index), 0.0, 0.0) for index in range(vertex_count)],
+        "triangles": [(0, 1, 2)],
+        "sample_points": [(0.0, 0.0, 0.0)],
+    }
+
+
+def test_mesh_cache_hits_until_fingerprint_changes():
+    cache = EvaluatedMeshCache(budget_bytes=1024 * 1024)
+    payload = _mesh_payload("Body")
+
+    cache.put("Body", ("matrix-a", 3), payload)
+
+    assert cache.get("Body", ("matrix-a", 3)) is payload
+    assert cache.get("Body", ("matrix-b", 3)) is None
+    assert cache.get("Body", ("matrix-a", 3)) is None
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["stale"] == 1
+    assert stats["entries"] == 0
+
+
+def test_mesh_cache_evicts_least_recently_used_entries_over_budget():
+    entry_size = estimate_mesh_data_bytes(_mesh_payload("A"))
+    cache = EvaluatedMeshCache(budget_bytes=entry_size * 2)
+
+    cache.put("A", 1, _mesh_payload("A"))
+    cache.put("B", 1, _mesh_payload("B"))
+    assert cache.get("A", 1) is not None
+    cache.put("C", 1, _mesh_payload("C"))
+
+    assert cache.get("B", 1) is None
+    assert cache.get("A", 1) is not None
+    assert cache.get("C", 1) is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["estimated_bytes"] == entry_size * 2
+
+    cache.put("Huge", 1, _mesh_payload("Huge", vertex_count=10_000))
+    assert cache.get("Huge", 1) is None
+
+
+def test_mesh_cache_depsgraph_update_invalidates_changed_objects_and_mesh_data():
+    cache = EvaluatedMeshCache(budget_bytes=1024 * 1024)
+    for name in ("Body", "Head", "Tail"):
+        cache.put(name, 1, _mesh_payload(name))
+
+    body = SimpleNamespace(name="Body", id_type="OBJECT")
+    tail_mesh = SimpleNamespace(name="TailMesh", id_type="MESH")
+    head = SimpleNamespace(name="Head", id_type="OBJECT")
+    depsgraph = SimpleNamespace(
+        updates=[
+            SimpleNamespace(id=SimpleNamespace(original=body), is_updated_geometry=False, is_updated_transform=True),
+            SimpleNamespace(id=tail_mesh, is_updated_geometry=True, is_updated_transform=False),
+            SimpleNamespace(id=head, is_updated_geometry=False, is_updated_transform=False),
+        ]
+    )
+
+    cache.on_depsgraph_update(None, depsgraph)
+
+    assert cache.get("Body", 1) is None
+    assert cache.get("Tail", 1) is None
+    assert cache.get("Head", 1) is not None
+    assert cache.stats()["invalidations"] == 2
+
+    cache.on_load_post(None)
+    assert cache.stats()["entries"] == 0
+
+
+class _Matrix:
+    def __init__(self, offset: float = 0.0):
+        self.rows = [[1.0, 0.0, 0.0, offset], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+def _mesh_object(name: str, offset: float = 0.0):
+    obj = MagicMock()
+    obj.name = name
+    obj.type = "MESH"
+    obj.mode = "OBJECT"
+    obj.data.name = f"{name}Mesh"
+    obj.modifiers = []
+    obj_eval = MagicMock()
+    obj_eval.matrix_world = _Matrix(offset)
+    obj_eval.data.vertices = [0, 1, 2]
+    obj_eval.data.polygons = [0]
+    obj.evaluated_get.return_value = obj_eval
+    return obj
+
+
+def test_repeated_mesh_surface_relation_reuses_cached_mesh_data_and_bvh_trees(monkeypatch):
+    sys.modules["bpy"].context.evaluated_depsgraph_get.return_value = object()
+
+    class _FakeTree:
+        def overlap(self, other):
+            return []
+
+        def find_nearest(self, point):
+            return ((0.0, 0.0, 0.0), None, 0, 0.25)
+
+    built_trees = []
+
+    class _FakeBVHTree:
+        @staticmethod
+        def FromPolygons(vertices, triangles, all_triangles=True):
+            built_trees.append(vertices)
+            return _FakeTree()
+
+    monkeypatch.setitem(sys.modules, "mathutils.bvhtree", SimpleNamespace(BVHTree=_FakeBVHTree))
+
+    cache = EvaluatedMeshCache(budget_bytes=1024 * 1024)
+    handler = SceneHandler(mesh_cache=cache)
+    evaluated = []
+    released = []
+
+    def _fake_mesh_data(obj):
+        evaluated.append(obj.name)
+        return {**_mesh_payload(obj.name), "cleanup_owner": obj.name}
+
+    monkeypatch.setattr(handler, "_get_evaluated_mesh_data", _fake_mesh_data)
+    monkeypatch.setattr(
+        handler,
+        "_release_evaluated_mesh_data",
+        lambda payload: released.append(payload["cleanup_owner"]) if "cleanup_owner" in payload else None,
+    )
+
+    body = _mesh_object("Body")
+    head = _mesh_object("Head")
+
+    first = handler._measure_mesh_surface_relation(head, body, tolerance=0.0001)
+    second = handler._measure_mesh_surface_relation(head, body, tolerance=0.0001)
+
+    assert first == second
+    assert evaluated == ["Head", "Body"]
+    assert released == ["Head", "Body"]
+    assert len(built_trees) == 2
+
+    moved_body = _mesh_object("Body", offset=1.0)
+    handler._measure_mesh_surface_relation(head, moved_body, tolerance=0.0001)
+
+    assert evaluated == ["Head", "Body", "Body"]
+    assert len(built_trees) == 3
+    stats = handler.get_mesh_cache_stats(reset=True)
+    assert stats["hits"] == 3
+    assert stats["misses"] == 3
+    assert stats["stale"] == 1
+    assert handler.get_mesh_cache_stats()["hits"] == 0
+
+
+def test_mesh_cache_is_bypassed_for_edit_mode_objects(monkeypatch):
+    cache = EvaluatedMeshCache(budget_bytes=1024 * 1024)
+    handler = SceneHandler(mesh_cache=cache)
+    monkeypatch.setattr(handler, "_get_evaluated_mesh_data", lambda obj: _mesh_payload(obj.name))
+
+    body = _mesh_object("Body")
+    body.mode = "EDIT"
+
+    assert handler._load_evaluated_mesh_data(body)["object_name"] == "Body"
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["misses"] == 0
+
+
+def test_mesh_cache_handlers_are_persistent_and_removed_on_unregister(monkeypatch):
+    from blender_addon.application.handlers.mesh_cache import (
+        register_mesh_cache_handlers,
+        unregister_mesh_cache_handlers,
+    )
+
+    def persistent(callback):
+        callback.persistent = True
+        return callback
+
+    handlers = SimpleNamespace(
+        depsgraph_update_post=[], load_post=[], undo_post=[], redo_post=[], persistent=persistent
+    )
+    monkeypatch.setattr(sys.modules["bpy"], "app", SimpleNamespace(handlers=handlers))
+    cache = EvaluatedMeshCache(budget_bytes=1024 * 1024)
+    cache.put("Body", ("matrix-a", 3), _mesh_payload("Body"))
+
+    register_mesh_cache_handlers(cache)
+    registered = handlers.depsgraph_update_post + handlers.load_post + handlers.undo_post + handlers.redo_post
+    assert [callback.persistent for callback in registered] == [True, True, True, True]
+    handlers.undo_post[0](None)
+    assert cache.get("Body", ("matrix-a", 3)) is None
+    cache.put("Body", ("matrix-a", 3), _mesh_payload("Body"))
+    handlers.redo_post[0](None)
+    assert cache.get("Body", ("matrix-a", 3)) is None
+
+    unregister_mesh_cache_handlers(cache)
+    assert registered and not any(
+        (handlers.depsgraph_update_post, handlers.load_post, handlers.undo_post, handlers.redo_post)
+    )
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+# conftest.py handles bpy mocking
+from blender_addon.application.handlers.scene import SceneHandler
+from blender_addon.application.handlers.scene_revision import SceneRevisionCounter
+
+
+class _Polygons(list):
+    def foreach_get(self, attribute, buffer):
+        for index, polygon in enumerate(self):
+            buffer[index] = getattr(polygon, attribute)
+
+
+def _mesh_object(name, location=(0.0, 0.0, 0.0)):
+    mesh = SimpleNamespace(
+        vertices=[object()] * 8,
+        edges=[object()] * 13,
+        polygons=_Polygons([SimpleNamespace(loop_total=4)] * 5 + [SimpleNamespace(loop_total=3)] * 2),
+    )
+    material = SimpleNamespace(name="Wood")
+    return SimpleNamespace(
+        name=name,
+        type="MESH",
+        location=location,
+        dimensions=(2.0, 1.0, 0.5),
+        data=mesh,
+        material_slots=[SimpleNamespace(name="Wood", material=material), SimpleNamespace(name="", material=None)],
+        modifiers=[SimpleNamespace(name="Bevel", type="BEVEL", show_viewport=True, show_render=True)],
+    )
+
+
+@pytest.fixture
+def scene(monkeypatch):
+    mock_bpy = sys.modules["bpy"]
+    cube = _mesh_object("Cube")
+    lamp = SimpleNamespace(name="Lamp", type="LIGHT", location=(1.0, 2.0, 3.0))
+    context = SimpleNamespace(
+        mode="OBJECT",
+        active_object=cube,
+        selected_objects=[cube],
+        scene=SimpleNamespace(objects=[cube, lamp]),
+    )
+    monkeypatch.setattr(mock_bpy, "context", context)
+    monkeypatch.setattr(mock_bpy, "data", SimpleNamespace(objects={"Cube": cube, "Lamp": lamp}))
+    return context
+
+
+def test_router_context_returns_full_state_in_one_call(scene):
+    handler = SceneHandler(revision_counter=SceneRevisionCounter(start=41))
+
+    result = handler.router_context()
+
+    assert result["revision"] == 41
+    assert result["mode"] == "OBJECT"
+    assert result["active_object"] == "Cube"
+    assert result["selected_object_names"] == ["Cube"]
+    assert [obj["name"] for obj in result["objects"]] == ["Cube", "Lamp"]
+    assert result["focus"] == {
+        "name": "Cube",
+        "type": "MESH",
+        "dimensions": [2.0, 1.0, 0.5],
+        "material_names": ["Wood"],
+        "modifier_names": ["Bevel"],
+        "topology": {"vertex_count": 8, "edge_count": 13, "face_count": 7, "triangle_count": 2},
+    }
+    assert "unchanged" not in result
+
+
+def test_router_context_skips_heavy_parts_while_revision_is_unchanged(scene):
+    counter = SceneRevisionCounter(start=5)
+    handler = SceneHandler(revision_counter=counter)
+
+    unchanged = handler.router_context(since_revision=5)
+    counter.bump()
+    changed = handler.router_context(since_revision=5)
+
+    assert unchanged["unchanged"] is True
+    assert unchanged["selected_object_names"] == ["Cube"]
+    assert "objects" not in unchanged and "focus" not in unchanged
+    assert changed["revision"] == 6
+    assert "objects" in changed and "unchanged" not in changed
+
+
+def test_router_context_uses_edit_mesh_counts_in_edit_mode(scene, monkeypatch):
+    selected = SimpleNamespace(select=True)
+    unselected = SimpleNamespace(select=False)
+    edit_mesh = SimpleNamespace(
+        verts=[selected, selected, unselected],
+        edges=[selected, unselected],
+        faces=[SimpleNamespace(select=True, verts=[1, 2, 3])],
+    )
+    monkeypatch.setattr(sys.modules["bmesh"], "from_edit_mesh", MagicMock(return_value=edit_mesh))
+    scene.mode = "EDIT_MESH"
+    scene.edit_object = scene.active_object
+
+    result = SceneHandler(revision_counter=SceneRevisionCounter(start=1)).router_context(object_name="Cube")
+
+    assert result["edit_mode_vertex_count"] == 2
+    assert result["edit_mode_edge_count"] == 1
+    assert result["edit_mode_face_count"] == 1
+    assert result["focus"]["topology"] == {"vertex_count": 3, "edge_count": 2, "face_count": 1, "triangle_count": 1}
+
+
+def test_scene_revision_counter_bumps_monotonically():
+    counter = SceneRevisionCounter(start=10)
+
+    counter.bump(None, None)
+    counter.bump()
+
+    assert counter.value == 12
+    assert SceneRevisionCounter().value > 10**12  # seeded from wall-clock milliseconds
@@ -400,3 +400,103 @@ def test_build_scope_graph_can_allow_internal_scene_scope():
     assert scope["scope_kind"] == "scene"
     assert scope["object_names"] == []
     assert scope["object_count"] == 0
+
+
+class BulkFakeReader(FakeReader):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bulk_calls: list[list[dict]] = []
+
+    def measure_relations_bulk(
+        self, pairs: list[dict], tolerance: float = 0.0001, max_gap: float = 0.0001, allow_overlap: bool = False
+    ) -> dict:
+        self.bulk_calls.append(pairs)
+        results = []
+        for pair in pairs:
+            from_object, to_object = pair["from_object"], pair["to_object"]
+            results.append(
+                {
+                    "from_object": from_object,
+                    "to_object": to_object,
+                    "gap": self.measure_gap(from_object, to_object),
+                    "alignment": self.measure_alignment(from_object, to_object, ["X", "Y", "Z"], "CENTER"),
+                    "overlap": self.measure_overlap(from_object, to_object),
+                    "contact_assertion": self.assert_contact(from_object, to_object),
+                    "error": None,
+                }
+            )
+        return {"pairs": results, "pair_count": len(results)}
+
+    def measure_gap(self, from_object: str, to_object: str, tolerance: float = 0.0001) -> dict:
+        if "Wing" in {from_object, to_object} and not self.bulk_calls:
+            raise AssertionError("per-pair reads should not run when the bulk path is available")
+        return super().measure_gap(from_object, to_object, tolerance)
+
+
+def test_build_relation_graph_uses_bulk_reader_path_with_per_pair_parity():
+    scope_graph = {
+        "scope_kind": "object_set",
+        "primary_target": "Body",
+        "object_names": ["Body", "Head", "Wing"],
+        "object_count": 3,
+        "object_roles": [
+            {"object_name": "Body", "role": "anchor_core"},
+            {"object_name": "Head", "role": "attached_mass"},
+            {"object_name": "Wing", "role": "structural_peer"},
+        ],
+    }
+    bulk_reader = BulkFakeReader()
+
+    bulk_graph = SpatialGraphService().build_relation_graph(
+        reader=bulk_reader, scope_graph=scope_graph, include_truth_payloads=True, include_guided_pairs=True
+    )
+    per_pair_graph = SpatialGraphService().build_relation_graph(
+        reader=FakeReader(), scope_graph=scope_graph, include_truth_payloads=True, include_guided_pairs=True
+    )
+
+    assert len(bulk_reader.bulk_calls) == 1
+    assert [(pair["from_object"], pair["to_object"]) for pair in bulk_reader.bulk_calls[0]] == [
+        ("Head", "Body"),
+        ("Body", "Wing"),
+    ]
+    assert bulk_graph == per_pair_graph
+
+
+def test_build_relation_graph_maps_bulk_pair_errors_and_falls_back_on_bulk_failure():
+    scope_graph = {
+        "scope_kind": "object_set",
+        "primary_target": "Body",
+        "object_names": ["Body", "Base"],
+        "object_count": 2,
+        "object_roles": [
+            {"object_name": "Body", "role": "anchor_core"},
+            {"object_name": "Base", "role": "support_base"},
+        ],
+    }
+
+    class _PairErrorReader(FakeReader):
+        def measure_relations_bulk(self, pairs, tolerance=0.0001, max_gap=0.0001, allow_overlap=False):
+            return {
+                "pairs": [
+                    {
+                        **pair,
+                        "gap": None,
+                        "alignment": None,
+                        "overlap": None,
+                        "contact_assertion": None,
+                        "error": "boom",
+                    }
+                    for pair in pairs
+                ]
+            }
+
+    class _UnavailableBulkReader(FakeReader):
+        def measure_relations_bulk(self, pairs, tolerance=0.0001, max_gap=0.0001, allow_overlap=False):
+            raise RuntimeError("Blender Error: Unknown command 'scene.measure_relations_bulk'")
+
+    errored = SpatialGraphService().build_relation_graph(reader=_PairErrorReader(), scope_graph=scope_graph)
+    fallback = SpatialGraphService().build_relation_graph(reader=_UnavailableBulkReader(), scope_graph=scope_graph)
+
+    assert errored["pairs"][0]["error"] == "Blender Error: boom"
+    assert fallback["pairs"][0]["error"] is None
+    assert fallback["summary"]["support_pairs"] == 1
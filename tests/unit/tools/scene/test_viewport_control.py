@@ -1,3 +1,4 @@
+import hashlib
 import sys
 import unittest
 from unittest.mock import MagicMock, mock_open, patch
@@ -244,6 +245,34 @@ class TestViewportControl(unittest.TestCase):
                 view_name="TOP",
             )
 
+    @patch("os.path.isdir", return_value=True)
+    @patch("os.path.getsize")
+    @patch("os.path.exists")
+    @patch("builtins.open", new_callable=mock_open, read_data=b"img_data")
+    @patch("tempfile.mkdtemp")
+    @patch("os.remove")
+    def test_output_path_writes_shared_file_and_returns_checksum(
+        self, mock_remove, mock_mkdtemp, mock_open, mock_exists, mock_getsize, mock_isdir
+    ):
+        mock_exists.return_value = True
+        mock_getsize.return_value = 8
+
+        result = self.handler.get_viewport(output_path="/shared/blender-ai-mcp/shot.jpg")
+
+        self.assertEqual(result["path"], "/shared/blender-ai-mcp/shot.jpg")
+        self.assertEqual(result["size"], 8)
+        self.assertEqual(result["sha256"], hashlib.sha256(b"img_data").hexdigest())
+        self.assertEqual(result["media_type"], "image/jpeg")
+        self.assertEqual(self.render_mock.filepath, "/tmp/old.png")
+        mock_mkdtemp.assert_not_called()
+        mock_remove.assert_not_called()
+
+    def test_output_path_requires_jpg_in_existing_directory(self):
+        with self.assertRaisesRegex(ValueError, "must end with '.jpg'"):
+            self.handler.get_viewport(output_path="/tmp/shot.png")
+        with self.assertRaisesRegex(ValueError, "directory does not exist"):
+            self.handler.get_viewport(output_path="/definitely/missing/dir/shot.jpg")
+
     def test_view_diagnostics_user_view_adjustments_restore_state(self):
         self.handler.set_standard_view = MagicMock(return_value="view ok")
         self.handler.camera_focus = MagicMock(return_value="focus ok")
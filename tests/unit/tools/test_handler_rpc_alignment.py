@@ -3,8 +3,10 @@ from __future__ import annotations
 from typing import Any
 
 import pytest
+import server.application.tool_handlers.scene_handler as scene_handler_module
 from server.application.tool_handlers.collection_handler import CollectionToolHandler
 from server.application.tool_handlers.material_handler import MaterialToolHandler
+from server.application.tool_handlers.mesh_handler import MeshToolHandler
 from server.application.tool_handlers.scene_handler import SceneToolHandler
 from server.application.tool_handlers.uv_handler import UVToolHandler
 from server.domain.interfaces.rpc import IRpcClient
@@ -25,6 +27,8 @@ class DummyRpc(IRpcClient):
         rpc_timeout_seconds: float | None = None,
     ) -> RpcResponse:
         self.calls.append((cmd, args))
+        if cmd not in self._responses:
+            return RpcResponse(request_id="req-1", status="error", error=f"Unknown command: {cmd}")
         return self._responses[cmd]
 
 
@@ -234,7 +238,17 @@ def test_scene_spatial_graph_handlers_reuse_existing_scene_truth_rpc_commands():
         ("scene.get_bounding_box", {"object_name": "Head", "world_space": True}),
         ("scene.get_bounding_box", {"object_name": "Body", "world_space": True}),
     ]
+    # The addon here does not know the bulk command, so the graph falls back to per-pair reads.
     assert rpc.calls[8:] == [
+        (
+            "scene.measure_relations_bulk",
+            {
+                "pairs": [{"from_object": "Head", "to_object": "Body"}],
+                "tolerance": 0.0001,
+                "max_gap": 0.0001,
+                "allow_overlap": False,
+            },
+        ),
         ("scene.measure_gap", {"from_object": "Head", "to_object": "Body", "tolerance": 0.0001}),
         (
             "scene.measure_alignment",
@@ -485,6 +499,165 @@ def test_scene_standard_view_handler_aligns_with_rpc_command():
     assert rpc.calls == [("scene.set_standard_view", {"view_name": "FRONT"})]
 
 
+class JobRpc(DummyRpc):
+    def __init__(self, snapshots: list[dict[str, Any]], result: dict[str, Any]) -> None:
+        super().__init__({})
+        self._snapshots = snapshots
+        self._result = result
+
+    def launch_background_job(self, cmd, args=None, *, timeout_seconds=None):
+        self.calls.append(("rpc.launch_job", {"cmd": cmd, "args": args, "timeout_seconds": timeout_seconds}))
+        return _ok({"job_id": "job-1", "status": "queued", "progress_current": 0, "progress_total": 1})
+
+    def get_background_job_status(self, job_id, *, timeout_seconds=None):
+        self.calls.append(("rpc.get_job", {"job_id": job_id}))
+        return _ok(self._snapshots.pop(0))
+
+    def collect_background_job_result(self, job_id, *, timeout_seconds=None):
+        self.calls.append(("rpc.collect_job", {"job_id": job_id}))
+        return _ok({"job_id": job_id, "status": "completed", "result": self._result})
+
+
+def test_scene_capture_view_set_runs_one_background_job_and_reports_progress():
+    rpc = JobRpc(
+        [
+            {"status": "running", "progress_current": 1, "progress_total": 2, "status_message": "Rendering"},
+            {"status": "completed", "progress_current": 2, "progress_total": 2},
+        ],
+        {"view_count": 2, "captures": [{"name": "a"}, {"name": "b"}]},
+    )
+    handler = SceneToolHandler(rpc)
+    progress = []
+
+    result = handler.capture_view_set(
+        [{"name": "a"}, {"name": "b"}],
+        target_object="Cube",
+        timeout_seconds=30.0,
+        progress_callback=lambda current, total, message: progress.append((current, total, message)),
+    )
+
+    assert result["view_count"] == 2
+    assert [cmd for cmd, _args in rpc.calls] == ["rpc.launch_job", "rpc.get_job", "rpc.get_job", "rpc.collect_job"]
+    assert rpc.calls[0][1] == {
+        "cmd": "scene.capture_view_set",
+        "args": {"presets": [{"name": "a"}, {"name": "b"}], "target_object": "Cube", "isolate_objects": None},
+        "timeout_seconds": 30.0,
+    }
+    assert progress == [(0.0, 1, None), (1.0, 2, "Rendering")]
+
+
+def test_scene_capture_view_set_raises_when_job_fails():
+    rpc = JobRpc([{"status": "failed", "error": "No 3D viewport"}], {})
+    handler = SceneToolHandler(rpc)
+
+    with pytest.raises(RuntimeError, match="No 3D viewport"):
+        handler.capture_view_set([{"name": "a"}])
+
+
+class PushJobRpc(JobRpc):
+    def __init__(self, pushed: list[dict[str, Any] | None], result: dict[str, Any]) -> None:
+        super().__init__([{"status": "completed", "progress_current": 2, "progress_total": 2}], result)
+        self._pushed = pushed
+
+    def subscribe_background_job(self, job_id, on_event, *, timeout_seconds=None):
+        self.calls.append(("rpc.subscribe_job", {"job_id": job_id}))
+        for snapshot in self._pushed:
+            on_event(snapshot)
+        return RpcResponse(
+            request_id="sub-1",
+            status="ok",
+            result={"job_id": job_id, "status": "running", "progress_current": 0, "progress_total": 2},
+        )
+
+    def unsubscribe_background_job(self, subscription_id):
+        self.calls.append(("unsubscribe", {"subscription_id": subscription_id}))
+
+    def cancel_background_job(self, job_id):
+        self.calls.append(("rpc.cancel_job", {"job_id": job_id}))
+        return _ok({"job_id": job_id, "status": "cancelled"})
+
+
+def test_scene_capture_view_set_waits_on_pushed_job_snapshots():
+    rpc = PushJobRpc(
+        [
+            {"status": "running", "progress_current": 1, "progress_total": 2, "status_message": "Rendering"},
+            {"status": "completed", "progress_current": 2, "progress_total": 2},
+        ],
+        {"view_count": 2, "captures": [{"name": "a"}, {"name": "b"}]},
+    )
+    handler = SceneToolHandler(rpc)
+    progress = []
+
+    result = handler.capture_view_set(
+        [{"name": "a"}, {"name": "b"}],
+        progress_callback=lambda current, total, message: progress.append((current, total, message)),
+    )
+
+    assert result["view_count"] == 2
+    assert [cmd for cmd, _args in rpc.calls] == [
+        "rpc.launch_job",
+        "rpc.subscribe_job",
+        "unsubscribe",
+        "rpc.collect_job",
+    ]
+    assert progress == [(0.0, 2, None)]
+
+
+def test_scene_capture_view_set_polls_after_push_stream_is_lost(monkeypatch):
+    monkeypatch.setattr(scene_handler_module, "JOB_POLL_INTERVAL_SECONDS", 0.0)
+    rpc = PushJobRpc([None], {"view_count": 1, "captures": [{"name": "a"}]})
+    handler = SceneToolHandler(rpc)
+
+    result = handler.capture_view_set([{"name": "a"}])
+
+    assert result["view_count"] == 1
+    assert [cmd for cmd, _args in rpc.calls] == [
+        "rpc.launch_job",
+        "rpc.subscribe_job",
+        "rpc.get_job",
+        "unsubscribe",
+        "rpc.collect_job",
+    ]
+
+
+def test_scene_capture_view_set_cancels_the_job_past_its_deadline(monkeypatch):
+    monkeypatch.setattr(scene_handler_module, "_JOB_DEADLINE_GRACE_SECONDS", 0.0)
+    monkeypatch.setattr(scene_handler_module, "JOB_PUSH_FALLBACK_POLL_SECONDS", 0.01)
+    rpc = PushJobRpc([], {})
+    rpc._snapshots = [{"status": "running"}] * 100
+    handler = SceneToolHandler(rpc)
+
+    with pytest.raises(RuntimeError, match="did not finish in time"):
+        handler.capture_view_set([{"name": "a"}], timeout_seconds=0.05)
+
+    commands = [cmd for cmd, _args in rpc.calls]
+    assert commands[-2:] == ["rpc.cancel_job", "unsubscribe"]
+    assert "rpc.collect_job" not in commands
+
+
+def test_scene_viewport_file_handler_forwards_output_path_to_get_viewport():
+    payload = {"path": "/tmp/shot.jpg", "size": 12, "sha256": "ab" * 32, "media_type": "image/jpeg"}
+    rpc = DummyRpc({"scene.get_viewport": _ok(payload)})
+    handler = SceneToolHandler(rpc)
+
+    result = handler.get_viewport_file("/tmp/shot.jpg", width=640, height=480, focus_target="Cube")
+
+    assert result == payload
+    assert rpc.calls == [
+        (
+            "scene.get_viewport",
+            {
+                "width": 640,
+                "height": 480,
+                "shading": "SOLID",
+                "camera_name": None,
+                "focus_target": "Cube",
+                "output_path": "/tmp/shot.jpg",
+            },
+        )
+    ]
+
+
 def test_scene_configure_handlers_align_with_rpc_commands():
     rpc = DummyRpc(
         {
@@ -507,3 +680,52 @@ def test_scene_configure_handlers_align_with_rpc_commands():
         ("scene.configure_color_management", {"settings": {"view_transform": "AgX"}}),
         ("scene.configure_world", {"settings": {"world_name": "Studio"}}),
     ]
+
+
+def test_scene_measure_relations_bulk_handler_aligns_with_rpc_command():
+    rpc = DummyRpc({"scene.measure_relations_bulk": _ok({"pairs": [], "pair_count": 0})})
+    handler = SceneToolHandler(rpc)
+
+    result = handler.measure_relations_bulk([{"from_object": "Head", "to_object": "Body", "extra": "ignored"}])
+
+    assert result == {"pairs": [], "pair_count": 0}
+    assert rpc.calls == [
+        (
+            "scene.measure_relations_bulk",
+            {
+                "pairs": [{"from_object": "Head", "to_object": "Body"}],
+                "tolerance": 0.0001,
+                "max_gap": 0.0001,
+                "allow_overlap": False,
+            },
+        )
+    ]
+
+
+def test_scene_mesh_cache_stats_handler_aligns_with_rpc_command():
+    rpc = DummyRpc({"scene.get_mesh_cache_stats": _ok({"enabled": True, "hits": 4, "misses": 2})})
+    handler = SceneToolHandler(rpc)
+
+    result = handler.get_mesh_cache_stats(reset=True)
+
+    assert result["hits"] == 4
+    assert rpc.calls == [("scene.get_mesh_cache_stats", {"reset": True})]
+
+
+def test_mesh_introspection_handlers_forward_columns_layout_only_when_requested():
+    rpc = DummyRpc(
+        {
+            "mesh.get_vertex_data": _ok({"object_name": "Cube", "vertices": []}),
+            "mesh.get_face_data": _ok({"object_name": "Cube", "layout": "columns", "columns": {}}),
+        }
+    )
+    handler = MeshToolHandler(rpc)
+
+    handler.get_vertex_data("Cube")
+    result = handler.get_face_data("Cube", limit=10, layout="columns")
+
+    assert result["layout"] == "columns"
+    assert rpc.calls == [
+        ("mesh.get_vertex_data", {"object_name": "Cube", "selected_only": False}),
+        ("mesh.get_face_data", {"object_name": "Cube", "selected_only": False, "limit": 10, "layout": "columns"}),
+    ]